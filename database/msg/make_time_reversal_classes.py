@@ -0,0 +1,64 @@
+import numpy as np
+import spglib
+
+# (determinant, trace) of rotations, which do not depend on the basis
+ROTATION_CLASSES = [
+    (1, 3),
+    (1, -1),
+    (1, 0),
+    (1, 1),
+    (1, 2),
+    (-1, -3),
+    (-1, 1),
+    (-1, 0),
+    (-1, -1),
+    (-1, -2),
+]
+
+
+def get_time_reversal_classes(uni_number):
+    """Return numbers of cosets of pure translations with time reversal.
+
+    The cosets are counted for each class of rotations. Different settings of
+    the same magnetic space group only differ in the number of pure
+    translations, so that the numbers of cosets do not depend on the setting.
+    """
+    msg = spglib.get_magnetic_symmetry_from_database(uni_number)
+    rotations = msg["rotations"]
+    time_reversals = msg["time_reversals"]
+    is_identity = (rotations == np.eye(3, dtype=int)).all(axis=(1, 2))
+    num_pure_trans = np.count_nonzero(is_identity & ~time_reversals)
+
+    counts = [0] * len(ROTATION_CLASSES)
+    for rot, timerev in zip(rotations, time_reversals):
+        if not timerev:
+            continue
+        key = (round(np.linalg.det(rot)), np.trace(rot))
+        counts[ROTATION_CLASSES.index(key)] += 1
+    assert all(count % num_pure_trans == 0 for count in counts)
+    return [count // num_pure_trans for count in counts]
+
+
+if __name__ == "__main__":
+    """
+    Create `magnetic_spacegroup.c:magnetic_spacegroup_time_reversal_classes`
+        magnetic_spacegroup_time_reversal_classes[uni_number][10] = {
+            numbers of cosets of pure translations with time reversal for
+            rotations of (det, trace) = (1, 3), (1, -1), (1, 0), (1, 1), (1, 2),
+            (-1, -3), (-1, 1), (-1, 0), (-1, -1), (-1, -2)
+        }
+    """
+    contents = []
+    contents.append(
+        "static const int magnetic_spacegroup_time_reversal_classes[][10] = {"
+    )
+    contents.append("    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* dummy */")
+    for uni_number in range(1, 1651 + 1):
+        counts = ", ".join(
+            str(count) for count in get_time_reversal_classes(uni_number)
+        )
+        contents.append(f"    {{{counts}}}, /* {uni_number:4d} */")
+    contents.append("};")
+
+    for line in contents:
+        print(line)
@@ -182,6 +182,9 @@ typedef struct {
     double std_rotation_matrix[3][3];
     /* Intermediate datum in symmetry search */
     double primitive_lattice[3][3];
+    /* Atom permutations[i * n_atoms + j] onto which the i-th operation */
+    /* maps the atom j */
+    int *permutations;
 } SpglibMagneticDataset;
 
 typedef struct {
@@ -193,6 +196,17 @@ typedef struct {
     int type;
 } SpglibMagneticSpacegroupType;
 
+/* Irreducible grid points of a uniform mesh. ``star_address`` lists */
+/* the grid addresses of the star of each irreducible grid point one */
+/* after another, ``weights[i]`` addresses for the i-th point, and is */
+/* NULL unless requested. */
+typedef struct {
+    size_t n_ir_grid_points;
+    int (*ir_grid_address)[3];
+    int *weights;
+    int (*star_address)[3];
+} SpglibIrGridPoints;
+
 SPG_API const char *spg_get_version(void);
 SPG_API const char *spg_get_version_full(void);
 SPG_API const char *spg_get_commit(void);
@@ -224,6 +238,19 @@ SPG_API SpglibMagneticDataset *spgms_get_magnetic_dataset(
     int const is_axial, double const symprec, double const angle_tolerance,
     double const mag_symprec);
 
+/* Magnetic datasets of ``num_configs`` configurations of site tensors on */
+/* the same crystal structure, where ``tensors`` has the site tensors of */
+/* the configurations one after another. The symmetry operations ignoring */
+/* site tensors are searched only once. ``datasets[i]`` is NULL if the */
+/* search failed for the i-th configuration, and ``error_codes[i]`` is the */
+/* error of the i-th configuration. Return 0 if failed. */
+SPG_API int spgms_get_magnetic_datasets(
+    SpglibMagneticDataset *datasets[], SpglibError error_codes[],
+    double const lattice[3][3], double const position[][3], int const types[],
+    double const *tensors, int const tensor_rank, int const num_atom,
+    int const num_configs, int const is_axial, double const symprec,
+    double const angle_tolerance, double const mag_symprec);
+
 SPG_API SpglibDataset *spgat_get_dataset(double const lattice[3][3],
                                          double const position[][3],
                                          int const types[], int const num_atom,
@@ -257,6 +284,21 @@ SPG_API int spgat_get_symmetry(int rotation[][3][3], double translation[][3],
                                int const num_atom, double const symprec,
                                double const angle_tolerance);
 
+/* Find symmetry operations and symmetrically equivalent atoms without */
+/* building the full dataset, i.e., Wyckoff positions and standardized cell */
+/* are not computed. The results are the same as rotations, translations, */
+/* and equivalent_atoms of SpglibDataset. */
+SPG_API int spg_get_symmetry_with_equivalent_atoms(
+    int rotation[][3][3], double translation[][3], int equivalent_atoms[],
+    int const max_size, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec);
+
+SPG_API int spgat_get_symmetry_with_equivalent_atoms(
+    int rotation[][3][3], double translation[][3], int equivalent_atoms[],
+    int const max_size, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec,
+    double const angle_tolerance);
+
 /* Find symmetry operations with collinear spins on atoms. */
 SPG_API int spg_get_symmetry_with_collinear_spin(
     int rotation[][3][3], double translation[][3], int equivalent_atoms[],
@@ -350,6 +392,53 @@ spg_get_magnetic_spacegroup_type_from_symmetry(int const rotations[][3][3],
                                                double const lattice[3][3],
                                                double const symprec);
 
+/* Symmetry operations applied to all atoms or sites at once. */
+/* ``rotated_positions[i * num_atom + j]`` is the fractional position j */
+/* transformed by the i-th operation, rotation * position + translation, */
+/* without reduction to the unit cell. */
+SPG_API void spg_get_rotated_positions(double rotated_positions[][3],
+                                       int const rotation[][3][3],
+                                       double const translation[][3],
+                                       int const num_operations,
+                                       double const position[][3],
+                                       int const num_atom);
+/* ``permutations[i * num_atom + j]`` is the atom onto which the i-th */
+/* operation maps the atom j within ``symprec``. Return 0 if an atom is */
+/* not mapped onto an atom of the same type. */
+SPG_API int spg_get_symmetry_permutations(
+    int permutations[], int const rotation[][3][3],
+    double const translation[][3], int const num_operations,
+    double const lattice[3][3], double const position[][3], int const types[],
+    int const num_atom, double const symprec);
+/* Cartesian vectors and rank-2 tensors of ``num_sites`` sites averaged */
+/* over the operations given by their rotations with respect to */
+/* ``lattice``. The site j rotated by the i-th operation contributes to */
+/* the site ``permutations[i * num_sites + j]``, e.g., obtained by */
+/* ``spg_get_symmetry_permutations``, or to the site j itself if */
+/* ``permutations`` is NULL. Return 0 if failed. */
+SPG_API int spg_symmetrize_vectors(
+    double symmetrized[][3], double const vectors[][3], int const num_sites,
+    int const rotation[][3][3], int const num_operations,
+    double const lattice[3][3], int const permutations[]);
+SPG_API int spg_symmetrize_tensors(
+    double symmetrized[][3][3], double const tensors[][3][3],
+    int const num_sites, int const rotation[][3][3], int const num_operations,
+    double const lattice[3][3], int const permutations[]);
+/* Configurations of ``num_values`` values on ``num_sites`` sites which */
+/* are inequivalent under a group of ``num_permutations`` permutations of */
+/* the sites, e.g., collinear magnetic configurations inequivalent under */
+/* the space group. A configuration is given by the indices of the values */
+/* on the sites, and the lexicographically smallest one of each orbit is */
+/* written to ``configurations`` with the size of the orbit in */
+/* ``multiplicities``. At most ``max_configs`` configurations are searched */
+/* from ``cursor`` on, which is advanced to resume the search, and */
+/* ``cursor[0]`` becomes ``num_values`` after the last one. Start with all */
+/* zeros. Return the number of configurations written, or -1 if failed. */
+SPG_API int spg_get_inequivalent_configurations(
+    int configurations[], int multiplicities[], int cursor[],
+    int const max_configs, int const permutations[], int const num_permutations,
+    int const num_sites, int const num_values);
+
 SPG_DEPRECATED("Use the variables from SpglibDataset (n_operations)")
 SPG_API int spg_get_multiplicity(double const lattice[3][3],
                                  double const position[][3], int const types[],
@@ -493,6 +582,26 @@ SPG_API int spg_get_grid_point_from_address(int const grid_address[3],
 SPG_API size_t spg_get_dense_grid_point_from_address(int const grid_address[3],
                                                      int const mesh[3]);
 
+/* Array versions of the translations between grid addresses, grid */
+/* addresses in the double mesh (grid_address * 2 + (shift != 0)), and */
+/* grid point indices for ``num_addresses`` (``num_grid_points``) */
+/* points at once. Grid addresses from grid point indices are given */
+/* in the same way as ``grid_address`` of ``spg_get_ir_reciprocal_mesh``. */
+SPG_API void spg_get_dense_grid_points_from_addresses(
+    size_t grid_points[], int const grid_address[][3],
+    size_t const num_addresses, int const mesh[3]);
+SPG_API void spg_get_dense_grid_points_from_double_addresses(
+    size_t grid_points[], int const address_double[][3],
+    size_t const num_addresses, int const mesh[3]);
+SPG_API void spg_get_double_grid_addresses(int address_double[][3],
+                                           int const grid_address[][3],
+                                           size_t const num_addresses,
+                                           int const mesh[3],
+                                           int const is_shift[3]);
+SPG_API void spg_get_grid_addresses_from_grid_points(
+    int grid_address[][3], size_t const grid_points[],
+    size_t const num_grid_points, int const mesh[3]);
+
 /* Irreducible reciprocal grid points are searched from uniform */
 /* mesh grid points specified by ``mesh`` and ``is_shift``. */
 /* ``mesh`` stores three integers. Reciprocal primitive vectors */
@@ -520,6 +629,17 @@ SPG_API size_t spg_get_dense_ir_reciprocal_mesh(
     double const lattice[3][3], double const position[][3], int const types[],
     int const num_atom, double const symprec);
 
+/* Only irreducible grid points of the mesh and their weights are */
+/* returned, which are the same as the grid points that */
+/* ``ir_mapping_table`` of ``spg_get_ir_reciprocal_mesh`` points to. */
+/* Arrays of the size of the mesh are not allocated unless the stars */
+/* are requested by setting ``with_star`` 1. Return NULL if failed. */
+SPG_API SpglibIrGridPoints *spg_get_ir_grid_points(
+    int const mesh[3], int const is_shift[3], int const is_time_reversal,
+    int const with_star, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec);
+SPG_API void spg_free_ir_grid_points(SpglibIrGridPoints *ir_grid_points);
+
 /* The irreducible k-points are searched from unique k-point mesh */
 /* grids from real space lattice vectors and rotation matrices of */
 /* symmetry operations in real space with stabilizers. The */
@@ -537,6 +657,43 @@ SPG_API size_t spg_get_dense_stabilized_reciprocal_mesh(
     int const is_shift[3], int const is_time_reversal, int const num_rot,
     int const rotations[][3][3], int const num_q, double const qpoints[][3]);
 
+/* ``ir_mapping_table`` of ``spg_get_dense_stabilized_reciprocal_mesh`` */
+/* is computed only for ``num_grid_points`` grid points starting from */
+/* the grid point index ``start``, i.e., ``ir_mapping_table[i]`` is */
+/* the irreducible grid point of the grid point ``start + i``, whose */
+/* address is stored in ``grid_address[i]`` unless ``grid_address`` is */
+/* NULL. A mesh can be processed by parts with memory bounded by the */
+/* size of the part. Return 0 if failed. */
+SPG_API int spg_get_dense_ir_mapping_table_range(
+    int grid_address[][3], size_t ir_mapping_table[], size_t const start,
+    size_t const num_grid_points, int const mesh[3], int const is_shift[3],
+    int const is_time_reversal, int const num_rot, int const rotations[][3][3],
+    int const num_q, double const qpoints[][3]);
+
+/* The point group in reciprocal space ``rot_reciprocal`` of the rotation */
+/* matrices ``rotations`` in real space as used by */
+/* ``spg_get_stabilized_reciprocal_mesh``. It is expanded by the time */
+/* reversal if ``is_time_reversal`` is 1 and restricted to the stabilizers */
+/* of the ``num_q`` k-points ``qpoints`` within ``symprec`` if ``num_q`` is */
+/* positive. ``rot_reciprocal`` has to have space for ``2 * num_rot`` */
+/* rotations. The number of rotations is returned. Return 0 if failed. */
+SPG_API int spg_get_reciprocal_point_group(
+    int rot_reciprocal[][3][3], int const num_rot, int const rotations[][3][3],
+    int const is_time_reversal, int const num_q, double const qpoints[][3],
+    double const symprec);
+
+/* Same as ``spg_get_dense_ir_reciprocal_mesh`` and */
+/* ``spg_get_ir_grid_points`` for the point group in reciprocal space */
+/* ``rot_reciprocal``, e.g., obtained by */
+/* ``spg_get_reciprocal_point_group``, so that the symmetry search is */
+/* done once for many meshes. */
+SPG_API size_t spg_get_dense_ir_reciprocal_mesh_from_point_group(
+    int grid_address[][3], size_t ir_mapping_table[], int const mesh[3],
+    int const is_shift[3], int const num_rot, int const rot_reciprocal[][3][3]);
+SPG_API SpglibIrGridPoints *spg_get_ir_grid_points_from_point_group(
+    int const mesh[3], int const is_shift[3], int const with_star,
+    int const num_rot, int const rot_reciprocal[][3][3]);
+
 /* Rotation operations in reciprocal space ``rot_reciprocal`` are applied */
 /* to a grid address ``address_orig`` and resulting grid points are stored
  * in */
@@ -557,6 +714,26 @@ SPG_API void spg_get_dense_BZ_grid_points_by_rotations(
     int const rot_reciprocal[][3][3], int const mesh[3], int const is_shift[3],
     size_t const bz_map[]);
 
+/* Table of grid points obtained by applying the rotation operations in */
+/* reciprocal space ``rot_reciprocal`` to ``num_addresses`` grid addresses */
+/* at once. ``rot_grid_points[i * num_addresses + j]`` is the grid point of */
+/* ``grid_address[j]`` rotated by ``rot_reciprocal[i]``. If */
+/* ``grid_address`` is NULL, the grid addresses of the grid points 0, 1, */
+/* ..., ``num_addresses - 1`` of the mesh are used, i.e. the whole mesh */
+/* with ``num_addresses = prod(mesh)``. */
+SPG_API void spg_get_dense_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const grid_address[][3],
+    size_t const num_addresses, int const num_rot,
+    int const rot_reciprocal[][3][3], int const mesh[3], int const is_shift[3]);
+/* Same as above for the grid addresses ``bz_grid_address`` and */
+/* ``bz_map`` obtained by ``spg_relocate_dense_BZ_grid_address``. The */
+/* rotated grid points are mapped by ``bz_map`` to BZ grid points. */
+SPG_API void spg_get_dense_BZ_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const bz_grid_address[][3],
+    size_t const num_addresses, int const num_rot,
+    int const rot_reciprocal[][3][3], int const mesh[3], int const is_shift[3],
+    size_t const bz_map[]);
+
 /* Grid addresses are relocated inside Brillouin zone. */
 /* Number of ir-grid-points inside Brillouin zone is returned. */
 /* It is assumed that the following arrays have the shapes of */
@@ -37,14 +37,27 @@ PYBIND11_MODULE(_spglib, module) {
     py::class_<Magmoms>(module, "Magmoms").def(py::init<array_double>());
     py::implicitly_convertible<array_double, Magmoms>();
     py::class_<Atoms>(module, "Atoms").def(py::init<Positions, AtomTypes>());
+    py::class_<Dataset>(module, "Dataset")
+        .def("field", &Dataset::field, "")
+        .def("fields", &Dataset::fields, "");
 
     module.def("version_tuple", spglib::version_tuple, "");
     module.def("version_string", spglib::version_string, "");
     module.def("version_full", spglib::version_full, "");
     module.def("commit", spglib::commit, "");
     module.def("dataset", spglib::dataset, "");
+    module.def("datasets", spglib::datasets, "");
     module.def("layer_dataset", spglib::layer_dataset, "");
-    module.def("magnetic_dataset", spglib::magnetic_dataset, "");
+    module.def("magnetic_dataset", spglib::magnetic_dataset, "",
+               py::arg("lattice"), py::arg("positions"), py::arg("atom_types"),
+               py::arg("magmoms"), py::arg("tensor_rank"), py::arg("is_axial"),
+               py::arg("symprec"), py::arg("angle_tolerance"),
+               py::arg("mag_symprec"), py::arg("with_permutations") = false);
+    module.def("magnetic_datasets", spglib::magnetic_datasets, "",
+               py::arg("lattice"), py::arg("positions"), py::arg("atom_types"),
+               py::arg("magmoms"), py::arg("tensor_rank"), py::arg("is_axial"),
+               py::arg("symprec"), py::arg("angle_tolerance"),
+               py::arg("mag_symprec"), py::arg("with_permutations") = false);
     module.def("spacegroup_type", spglib::spacegroup_type, "");
     module.def("spacegroup_type_from_symmetry",
                spglib::spacegroup_type_from_symmetry, "");
@@ -52,6 +65,16 @@ PYBIND11_MODULE(_spglib, module) {
                "");
     module.def("magnetic_spacegroup_type_from_symmetry",
                spglib::magnetic_spacegroup_type_from_symmetry, "");
+    module.def("rotated_positions", spglib::rotated_positions, "");
+    module.def("symmetry_permutations", spglib::symmetry_permutations, "");
+    module.def("symmetrize_vectors", spglib::symmetrize_vectors, "",
+               py::arg("vectors"), py::arg("rotations"), py::arg("lattice"),
+               py::arg("permutations") = py::none());
+    module.def("symmetrize_tensors", spglib::symmetrize_tensors, "",
+               py::arg("tensors"), py::arg("rotations"), py::arg("lattice"),
+               py::arg("permutations") = py::none());
+    module.def("inequivalent_configurations",
+               spglib::inequivalent_configurations, "");
     module.def("symmetry_from_database", spglib::symmetry_from_database, "");
     module.def("magnetic_symmetry_from_database",
                spglib::magnetic_symmetry_from_database, "");
@@ -59,31 +82,48 @@ PYBIND11_MODULE(_spglib, module) {
     module.def("standardize_cell", spglib::standardize_cell, "");
     module.def("refine_cell", spglib::refine_cell, "");
     module.def("symmetry", spglib::symmetry, "");
+    module.def("symmetry_with_equivalent_atoms",
+               spglib::symmetry_with_equivalent_atoms, "");
     module.def("symmetry_with_collinear_spin",
                spglib::symmetry_with_collinear_spin, "");
     module.def("symmetry_with_site_tensors", spglib::symmetry_with_site_tensors,
                "");
     module.def("primitive", spglib::primitive, "");
     module.def("grid_point_from_address", spglib::grid_point_from_address, "");
+    module.def("grid_points_from_addresses", spglib::grid_points_from_addresses,
+               "");
+    module.def("grid_points_from_double_addresses",
+               spglib::grid_points_from_double_addresses, "");
+    module.def("double_grid_addresses", spglib::double_grid_addresses, "");
+    module.def("grid_addresses_from_grid_points",
+               spglib::grid_addresses_from_grid_points, "");
     module.def(
         "ir_reciprocal_mesh",
         py::overload_cast<array_int, array_int, array_int, array_int, py::int_,
                           Lattice const &, Positions const &, AtomTypes const &,
-                          py::float_>(spglib::ir_reciprocal_mesh),
+                          py::float_, py::int_>(spglib::ir_reciprocal_mesh),
         "", py::arg("grid_address"), py::arg("grid_mapping_table").noconvert(),
         py::arg("mesh"), py::arg("is_shift"), py::arg("is_time_reversal"),
         py::arg("lattice"), py::arg("positions"), py::arg("atom_types"),
-        py::arg("symprec"));
+        py::arg("symprec"), py::arg("num_threads") = 1);
     module.def("ir_reciprocal_mesh",
                py::overload_cast<array_int, array_size_t, array_int, array_int,
                                  py::int_, Lattice const &, Positions const &,
-                                 AtomTypes const &, py::float_>(
+                                 AtomTypes const &, py::float_, py::int_>(
                    spglib::ir_reciprocal_mesh),
                "", py::arg("grid_address"),
                py::arg("grid_mapping_table").noconvert(), py::arg("mesh"),
                py::arg("is_shift"), py::arg("is_time_reversal"),
                py::arg("lattice"), py::arg("positions"), py::arg("atom_types"),
-               py::arg("symprec"));
+               py::arg("symprec"), py::arg("num_threads") = 1);
+    module.def("ir_grid_points", spglib::ir_grid_points, "");
+    module.def("reciprocal_point_group", spglib::reciprocal_point_group, "");
+    module.def("ir_reciprocal_mesh_from_point_group",
+               spglib::ir_reciprocal_mesh_from_point_group, "",
+               py::arg("grid_address"), py::arg("ir_mapping_table").noconvert(),
+               py::arg("mesh"), py::arg("is_shift"), py::arg("rot_reciprocal"));
+    module.def("ir_grid_points_from_point_group",
+               spglib::ir_grid_points_from_point_group, "");
     module.def("stabilized_reciprocal_mesh",
                py::overload_cast<array_int, array_int, array_int, array_int,
                                  py::int_, Rotations const &, array_double>(
@@ -100,10 +140,24 @@ PYBIND11_MODULE(_spglib, module) {
                py::arg("grid_mapping_table").noconvert(), py::arg("mesh"),
                py::arg("is_shift"), py::arg("is_time_reversal"),
                py::arg("rotations"), py::arg("qpoints"));
+    module.def("ir_mapping_table_range", spglib::ir_mapping_table_range, "",
+               py::arg("ir_mapping_table").noconvert(), py::arg("start"),
+               py::arg("mesh"), py::arg("is_shift"),
+               py::arg("is_time_reversal"), py::arg("rotations"),
+               py::arg("qpoints"));
     module.def("grid_points_by_rotations", spglib::grid_points_by_rotations,
                "");
     module.def("BZ_grid_points_by_rotations",
                spglib::BZ_grid_points_by_rotations, "");
+    module.def(
+        "grid_point_table_by_rotations", spglib::grid_point_table_by_rotations,
+        "", py::arg("grid_address"), py::arg("rot_reciprocal"), py::arg("mesh"),
+        py::arg("is_shift"), py::arg("num_threads") = 1);
+    module.def("BZ_grid_point_table_by_rotations",
+               spglib::BZ_grid_point_table_by_rotations, "",
+               py::arg("bz_grid_address"), py::arg("rot_reciprocal"),
+               py::arg("mesh"), py::arg("is_shift"), py::arg("bz_map"),
+               py::arg("num_threads") = 1);
     module.def("BZ_grid_address", spglib::BZ_grid_address, "");
     module.def("delaunay_reduce", spglib::delaunay_reduce, "");
     module.def("niggli_reduce", spglib::niggli_reduce, "");
@@ -3,6 +3,14 @@
 
 #include <spglib.h>
 
+#include <algorithm>
+#include <atomic>
+#include <cstdint>
+#include <memory>
+#include <system_error>
+#include <thread>
+#include <vector>
+
 #include "py_bindings.h"
 
 using namespace spglib;
@@ -127,103 +135,153 @@ py::str spglib::commit() { return spg_get_commit(); }
 static auto wyckoffs_index_to_letter =
     "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ";
 
-py::dict Dataset_to_dict(SpglibDataset *dataset) {
-    py::dict dict{};
-    dict["number"] = dataset->spacegroup_number;
-    dict["hall_number"] = dataset->hall_number;
-    dict["international"] = dataset->international_symbol;
-    dict["hall"] = dataset->hall_symbol;
-    dict["choice"] = dataset->choice;
-    {
-        array_double transformation_matrix({3, 3});
-        array_double origin_shift(3);
-        for (auto i = 0; i < 3; i++) {
-            for (auto j = 0; j < 3; j++)
-                transformation_matrix.mutable_at(i, j) =
-                    dataset->transformation_matrix[i][j];
-            origin_shift.mutable_at(i) = dataset->origin_shift[i];
-        }
-        dict["transformation_matrix"] = transformation_matrix;
-        dict["origin_shift"] = origin_shift;
-    }
-    {
-        array_int rotations({dataset->n_operations, 3, 3});
-        array_double translations({dataset->n_operations, 3});
-        for (auto ind_oper = 0; ind_oper < dataset->n_operations; ind_oper++)
-            for (auto i = 0; i < 3; i++) {
-                for (auto j = 0; j < 3; j++)
-                    rotations.mutable_at(ind_oper, i, j) =
-                        dataset->rotations[ind_oper][i][j];
-                translations.mutable_at(ind_oper, i) =
-                    dataset->translations[ind_oper][i];
-            }
-        dict["rotations"] = rotations;
-        dict["translations"] = translations;
-    }
-    {
+struct spglib::DatasetHolder {
+    std::unique_ptr<SpglibDataset, void (*)(SpglibDataset *)> dataset;
+    explicit DatasetHolder(SpglibDataset *_dataset)
+        : dataset{_dataset, spg_free_dataset} {}
+};
+
+// Read-only array over a buffer of the dataset without copying it. The array
+// keeps the dataset alive until the array and all its views are gone.
+template <typename T>
+py::array_t<T> dataset_view(std::shared_ptr<DatasetHolder const> const &holder,
+                            std::vector<py::ssize_t> shape, T const *data) {
+    py::capsule base(
+        new std::shared_ptr<DatasetHolder const>(holder), [](void *ptr) {
+            delete static_cast<std::shared_ptr<DatasetHolder const> *>(ptr);
+        });
+    py::array_t<T> array(std::move(shape), data, base);
+    array.attr("setflags")(py::arg("write") = false);
+    return array;
+}
+
+// Decode one field of the dataset into a python object.
+py::object Dataset_field(std::shared_ptr<DatasetHolder const> const &holder,
+                         std::string_view name) {
+    auto const dataset = holder->dataset.get();
+    py::ssize_t const n_operations = dataset->n_operations;
+    py::ssize_t const n_atoms = dataset->n_atoms;
+    py::ssize_t const n_std_atoms = dataset->n_std_atoms;
+    if (name == "number") return py::int_(dataset->spacegroup_number);
+    if (name == "hall_number") return py::int_(dataset->hall_number);
+    if (name == "international") return py::str(dataset->international_symbol);
+    if (name == "hall") return py::str(dataset->hall_symbol);
+    if (name == "choice") return py::str(dataset->choice);
+    if (name == "transformation_matrix")
+        return dataset_view(holder, {3, 3},
+                            &dataset->transformation_matrix[0][0]);
+    if (name == "origin_shift")
+        return dataset_view(holder, {3}, dataset->origin_shift);
+    if (name == "rotations")
+        return dataset_view(holder, {n_operations, 3, 3},
+                            &dataset->rotations[0][0][0]);
+    if (name == "translations")
+        return dataset_view(holder, {n_operations, 3},
+                            &dataset->translations[0][0]);
+    if (name == "wyckoffs") {
         py::list wyckoffs(dataset->n_atoms);
-        py::list site_symmetry_symbols(dataset->n_atoms);
-        array_int crystallographic_orbits(dataset->n_atoms);
-        array_int equiv_atoms(dataset->n_atoms);
-        array_double primitive_lattice({3, 3});
-        array_int mapping_to_primitive(dataset->n_atoms);
-        array_double std_lattice({3, 3});
-        for (auto ind_atom = 0; ind_atom < dataset->n_atoms; ind_atom++) {
+        for (auto ind_atom = 0; ind_atom < dataset->n_atoms; ind_atom++)
             wyckoffs[ind_atom] =
                 wyckoffs_index_to_letter[dataset->wyckoffs[ind_atom]];
+        return std::move(wyckoffs);
+    }
+    if (name == "site_symmetry_symbols") {
+        py::list site_symmetry_symbols(dataset->n_atoms);
+        for (auto ind_atom = 0; ind_atom < dataset->n_atoms; ind_atom++)
             site_symmetry_symbols[ind_atom] =
                 dataset->site_symmetry_symbols[ind_atom];
-            crystallographic_orbits.mutable_at(ind_atom) =
-                dataset->crystallographic_orbits[ind_atom];
-            equiv_atoms.mutable_at(ind_atom) =
-                dataset->equivalent_atoms[ind_atom];
-            mapping_to_primitive.mutable_at(ind_atom) =
-                dataset->mapping_to_primitive[ind_atom];
-        }
+        return std::move(site_symmetry_symbols);
+    }
+    if (name == "crystallographic_orbits")
+        return dataset_view(holder, {n_atoms},
+                            dataset->crystallographic_orbits);
+    if (name == "equivalent_atoms")
+        return dataset_view(holder, {n_atoms}, dataset->equivalent_atoms);
+    if (name == "primitive_lattice") {
+        // Transposed, so it is copied.
+        array_double primitive_lattice({3, 3});
         for (auto i = 0; i < 3; i++)
-            for (auto j = 0; j < 3; j++) {
-                // Transposed
+            for (auto j = 0; j < 3; j++)
                 primitive_lattice.mutable_at(i, j) =
                     dataset->primitive_lattice[j][i];
-                // Transposed
-                std_lattice.mutable_at(i, j) = dataset->std_lattice[j][i];
-            }
-        dict["wyckoffs"] = wyckoffs;
-        dict["site_symmetry_symbols"] = site_symmetry_symbols;
-        dict["crystallographic_orbits"] = crystallographic_orbits;
-        dict["equivalent_atoms"] = equiv_atoms;
-        dict["primitive_lattice"] = primitive_lattice;
-        dict["mapping_to_primitive"] = mapping_to_primitive;
-        dict["std_lattice"] = std_lattice;
+        primitive_lattice.attr("setflags")(py::arg("write") = false);
+        return std::move(primitive_lattice);
     }
-    {
-        array_int std_types(dataset->n_std_atoms);
-        array_double std_positions({dataset->n_std_atoms, 3});
-        array_double std_rotations({3, 3});
-        array_int std_mapping_to_primitive(dataset->n_std_atoms);
-        for (auto ind_atom = 0; ind_atom < dataset->n_std_atoms; ind_atom++) {
-            std_types.mutable_at(ind_atom) = dataset->std_types[ind_atom];
-            for (auto i = 0; i < 3; i++)
-                std_positions.mutable_at(ind_atom, i) =
-                    dataset->std_positions[ind_atom][i];
-            std_mapping_to_primitive.mutable_at(ind_atom) =
-                dataset->std_mapping_to_primitive[ind_atom];
-        }
+    if (name == "mapping_to_primitive")
+        return dataset_view(holder, {n_atoms}, dataset->mapping_to_primitive);
+    if (name == "std_lattice") {
+        // Transposed, so it is copied.
+        array_double std_lattice({3, 3});
         for (auto i = 0; i < 3; i++)
             for (auto j = 0; j < 3; j++)
-                std_rotations.mutable_at(i, j) =
-                    dataset->std_rotation_matrix[i][j];
-        dict["std_types"] = std_types;
-        dict["std_positions"] = std_positions;
-        dict["std_rotation_matrix"] = std_rotations;
-        dict["std_mapping_to_primitive"] = std_mapping_to_primitive;
+                std_lattice.mutable_at(i, j) = dataset->std_lattice[j][i];
+        std_lattice.attr("setflags")(py::arg("write") = false);
+        return std::move(std_lattice);
     }
-    dict["pointgroup"] = dataset->pointgroup_symbol;
+    if (name == "std_types")
+        return dataset_view(holder, {n_std_atoms}, dataset->std_types);
+    if (name == "std_positions")
+        return dataset_view(holder, {n_std_atoms, 3},
+                            &dataset->std_positions[0][0]);
+    if (name == "std_rotation_matrix")
+        return dataset_view(holder, {3, 3},
+                            &dataset->std_rotation_matrix[0][0]);
+    if (name == "std_mapping_to_primitive")
+        return dataset_view(holder, {n_std_atoms},
+                            dataset->std_mapping_to_primitive);
+    if (name == "pointgroup") return py::str(dataset->pointgroup_symbol);
+    throw spglib::SpglibError("Unknown field of SpglibDataset");
+}
+
+static char const *const dataset_field_names[] = {
+    "number",
+    "hall_number",
+    "international",
+    "hall",
+    "choice",
+    "transformation_matrix",
+    "origin_shift",
+    "rotations",
+    "translations",
+    "wyckoffs",
+    "site_symmetry_symbols",
+    "crystallographic_orbits",
+    "equivalent_atoms",
+    "primitive_lattice",
+    "mapping_to_primitive",
+    "std_lattice",
+    "std_types",
+    "std_positions",
+    "std_rotation_matrix",
+    "std_mapping_to_primitive",
+    "pointgroup",
+};
+
+py::dict Dataset_to_dict(std::shared_ptr<DatasetHolder const> const &holder) {
+    py::dict dict{};
+    for (auto name : dataset_field_names)
+        dict[name] = Dataset_field(holder, name);
+    return dict;
+}
+
+Dataset make_dataset(SpglibDataset *dataset) {
+    return Dataset(std::make_shared<DatasetHolder const>(dataset));
+}
+
+Dataset::Dataset(std::shared_ptr<DatasetHolder const> _holder)
+    : holder{std::move(_holder)} {}
+py::object Dataset::field(std::string const &name) const {
+    return Dataset_field(holder, name);
+}
+py::dict Dataset::fields(std::vector<std::string> const &names) const {
+    py::dict dict{};
+    for (auto const &name : names)
+        dict[name.c_str()] = Dataset_field(holder, name);
     return dict;
 }
 
 py::dict MagneticDataset_to_dict(SpglibMagneticDataset *dataset,
-                                 int tensor_rank) {
+                                 int tensor_rank, bool with_permutations) {
     py::dict dict{};
     dict["uni_number"] = dataset->uni_number;
     dict["msg_type"] = dataset->msg_type;
@@ -314,6 +372,17 @@ py::dict MagneticDataset_to_dict(SpglibMagneticDataset *dataset,
         dict["std_rotation_matrix"] = std_rotations;
         dict["primitive_lattice"] = primitive_lattice;
     }
+    if (with_permutations && dataset->permutations != nullptr) {
+        array_int permutations({dataset->n_operations, dataset->n_atoms});
+        std::copy_n(dataset->permutations,
+                    dataset->n_operations * dataset->n_atoms,
+                    permutations.mutable_data());
+        // Read-only as the permutations of SpglibDataset.
+        permutations.attr("setflags")(py::arg("write") = false);
+        dict["permutations"] = permutations;
+    } else {
+        dict["permutations"] = py::none();
+    }
     return dict;
 }
 
@@ -348,55 +417,211 @@ py::dict MagneticSpacegroupType_to_dict(
     return dict;
 }
 
-py::dict spglib::dataset(Lattice const &lattice, Positions const &positions,
-                         AtomTypes const &atom_types, py::int_ hall_number,
-                         py::float_ symprec, py::float_ angle_tolerance) {
-    auto dataset = spgat_get_dataset_with_hall_number(
-        lattice.data(), positions.data(), atom_types.data(), atom_types.n_atoms,
-        hall_number, symprec, angle_tolerance);
+// The bindings below only touch python objects while holding the GIL. The
+// numpy buffers are pinned by the (wrapped) array_t arguments for the whole
+// call, so the GIL is released around every call into the C library that
+// does real work (the database lookups are left alone) and concurrent calls
+// from a thread pool run in parallel. Spglib keeps its error state in
+// thread-local storage, so it is read back on the calling thread.
+Dataset spglib::dataset(Lattice const &lattice, Positions const &positions,
+                        AtomTypes const &atom_types, py::int_ hall_number,
+                        py::float_ symprec, py::float_ angle_tolerance) {
+    auto const c_hall_number = static_cast<int>(hall_number);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    SpglibDataset *dataset;
+    {
+        py::gil_scoped_release release;
+        dataset = spgat_get_dataset_with_hall_number(
+            lattice.data(), positions.data(), atom_types.data(),
+            atom_types.n_atoms, c_hall_number, c_symprec, c_angle_tolerance);
+    }
     if (dataset == nullptr) throw Spglib_classic_exception();
-    auto array = Dataset_to_dict(dataset);
-    spg_free_dataset(dataset);
-    return array;
+    return make_dataset(dataset);
+}
+// Number of threads for num_tasks tasks. With 0 the number of hardware
+// threads is used.
+size_t get_num_threads(py::int_ num_threads, size_t num_tasks) {
+    auto c_num_threads = static_cast<size_t>(std::max(int(num_threads), 0));
+    if (c_num_threads == 0)
+        c_num_threads = std::max(std::thread::hardware_concurrency(), 1u);
+    return std::max(std::min(c_num_threads, num_tasks), size_t{1});
+}
+
+// Run work in num_threads threads including the calling one.
+template <typename F>
+void run_in_threads(F &work, size_t num_threads) {
+    std::vector<std::thread> workers;
+    try {
+        for (size_t i = 1; i < num_threads; i++) workers.emplace_back(work);
+    } catch (std::system_error const &) {
+        // Continue with the threads that could be started
+    }
+    work();
+    for (auto &worker : workers) worker.join();
+}
+
+py::list spglib::datasets(array_double lattices, array_double positions,
+                          array_int atom_types, array_size_t offsets,
+                          py::int_ hall_number, py::float_ symprec,
+                          py::float_ angle_tolerance, py::int_ num_threads) {
+    if (lattices.ndim() != 3 || lattices.shape(1) != 3 ||
+        lattices.shape(2) != 3)
+        throw SpglibError("Lattices is not a nx3x3 array");
+    if (positions.ndim() != 2 || positions.shape(1) != 3)
+        throw SpglibError("Positions is not a nx3 matrix");
+    if (atom_types.ndim() != 1 || atom_types.shape(0) != positions.shape(0))
+        throw SpglibError("Number of Positions and Types is inconsistent");
+    auto const n_cells = static_cast<size_t>(lattices.shape(0));
+    if (offsets.ndim() != 1 || offsets.size() != lattices.shape(0) + 1)
+        throw SpglibError("Offsets does not have n_cells + 1 elements");
+    auto const offsets_ptr = offsets.data();
+    for (size_t i = 0; i < n_cells; i++)
+        if (offsets_ptr[i] > offsets_ptr[i + 1] ||
+            offsets_ptr[i + 1] > static_cast<size_t>(positions.shape(0)))
+            throw SpglibError("Offsets are not increasing within the atoms");
+
+    auto const c_hall_number = static_cast<int>(hall_number);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    auto const c_num_threads = get_num_threads(num_threads, n_cells);
+
+    auto const lattices_ptr =
+        reinterpret_cast<double const(*)[3][3]>(lattices.data());
+    auto const positions_ptr =
+        reinterpret_cast<double const(*)[3]>(positions.data());
+    auto const atom_types_ptr = atom_types.data();
+    std::vector<std::unique_ptr<SpglibDataset, void (*)(SpglibDataset *)>>
+        results;
+    results.reserve(n_cells);
+    for (size_t i = 0; i < n_cells; i++)
+        results.emplace_back(nullptr, spg_free_dataset);
+    std::vector<::SpglibError> errors(n_cells, SPGLIB_SUCCESS);
+    {
+        py::gil_scoped_release release;
+        // Cells are handed out one at a time, since their cost varies a lot.
+        std::atomic<size_t> next{0};
+        auto work = [&]() {
+            for (size_t i = next++; i < n_cells; i = next++) {
+                auto const offset = offsets_ptr[i];
+                results[i].reset(spgat_get_dataset_with_hall_number(
+                    lattices_ptr[i], positions_ptr + offset,
+                    atom_types_ptr + offset,
+                    static_cast<int>(offsets_ptr[i + 1] - offset),
+                    c_hall_number, c_symprec, c_angle_tolerance));
+                if (!results[i]) errors[i] = spg_get_error_code();
+            }
+        };
+        run_in_threads(work, c_num_threads);
+    }
+    py::list list(n_cells);
+    for (size_t i = 0; i < n_cells; i++) {
+        if (results[i]) {
+            list[i] = make_dataset(results[i].release());
+        } else {
+            auto msg = spg_get_error_message(errors[i]);
+            list[i] = py::str(msg == nullptr ? unkown_error_msg : msg);
+        }
+    }
+    return list;
 }
 py::dict spglib::layer_dataset(Lattice const &lattice,
                                Positions const &positions,
                                AtomTypes const &atom_types,
                                py::int_ aperiodic_dir, py::float_ symprec) {
-    auto dataset = spg_get_layer_dataset(lattice.data(), positions.data(),
-                                         atom_types.data(), atom_types.n_atoms,
-                                         aperiodic_dir, symprec);
+    auto const c_aperiodic_dir = static_cast<int>(aperiodic_dir);
+    auto const c_symprec = static_cast<double>(symprec);
+    SpglibDataset *dataset;
+    {
+        py::gil_scoped_release release;
+        dataset = spg_get_layer_dataset(lattice.data(), positions.data(),
+                                        atom_types.data(), atom_types.n_atoms,
+                                        c_aperiodic_dir, c_symprec);
+    }
     if (dataset == nullptr) throw Spglib_classic_exception();
-    auto array = Dataset_to_dict(dataset);
-    spg_free_dataset(dataset);
-    return array;
+    return Dataset_to_dict(std::make_shared<DatasetHolder const>(dataset));
 }
-py::dict spglib::magnetic_dataset(Lattice const &lattice,
-                                  Positions const &positions,
-                                  AtomTypes const &atom_types,
-                                  array_double magmoms, py::int_ tensor_rank,
-                                  py::bool_ is_axial, py::float_ symprec,
-                                  py::float_ angle_tolerance,
-                                  py::float_ mag_symprec) {
-    auto dataset = spgms_get_magnetic_dataset(
-        lattice.data(), positions.data(), atom_types.data(), magmoms.data(),
-        tensor_rank, positions.n_atoms, is_axial * 1, symprec, angle_tolerance,
-        mag_symprec);
+py::dict spglib::magnetic_dataset(
+    Lattice const &lattice, Positions const &positions,
+    AtomTypes const &atom_types, array_double magmoms, py::int_ tensor_rank,
+    py::bool_ is_axial, py::float_ symprec, py::float_ angle_tolerance,
+    py::float_ mag_symprec, py::bool_ with_permutations) {
+    auto const c_tensor_rank = static_cast<int>(tensor_rank);
+    auto const c_is_axial = static_cast<bool>(is_axial) * 1;
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    auto const c_mag_symprec = static_cast<double>(mag_symprec);
+    SpglibMagneticDataset *dataset;
+    {
+        py::gil_scoped_release release;
+        dataset = spgms_get_magnetic_dataset(
+            lattice.data(), positions.data(), atom_types.data(), magmoms.data(),
+            c_tensor_rank, positions.n_atoms, c_is_axial, c_symprec,
+            c_angle_tolerance, c_mag_symprec);
+    }
     if (dataset == nullptr) throw Spglib_classic_exception();
-    switch (int(tensor_rank)) {
+    switch (c_tensor_rank) {
         case 0:
         case 1:
             break;
         default:
             spg_free_magnetic_dataset(dataset);
             auto msg = std::string("Unexpected tensor_rank value: ");
-            msg += tensor_rank;
+            msg += std::to_string(c_tensor_rank);
             throw SpglibError(msg);
     }
-    auto array = MagneticDataset_to_dict(dataset, tensor_rank);
+    auto array = MagneticDataset_to_dict(dataset, c_tensor_rank,
+                                         static_cast<bool>(with_permutations));
     spg_free_magnetic_dataset(dataset);
     return array;
 }
+py::list spglib::magnetic_datasets(
+    Lattice const &lattice, Positions const &positions,
+    AtomTypes const &atom_types, array_double magmoms, py::int_ tensor_rank,
+    py::bool_ is_axial, py::float_ symprec, py::float_ angle_tolerance,
+    py::float_ mag_symprec, py::bool_ with_permutations) {
+    auto const c_tensor_rank = static_cast<int>(tensor_rank);
+    if (c_tensor_rank != 0 && c_tensor_rank != 1) {
+        auto msg = std::string("Unexpected tensor_rank value: ");
+        msg += std::to_string(c_tensor_rank);
+        throw SpglibError(msg);
+    }
+    if (magmoms.ndim() != 2 + c_tensor_rank ||
+        magmoms.shape(1) != positions.n_atoms ||
+        (c_tensor_rank == 1 && magmoms.shape(2) != 3))
+        throw SpglibError(
+            "Magmoms is not a n_configs x n_atoms (x 3) array of moments");
+    auto const n_configs = static_cast<int>(magmoms.shape(0));
+    auto const c_is_axial = static_cast<bool>(is_axial) * 1;
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    auto const c_mag_symprec = static_cast<double>(mag_symprec);
+    std::vector<SpglibMagneticDataset *> datasets(n_configs, nullptr);
+    std::vector<::SpglibError> error_codes(n_configs, SPGLIB_SUCCESS);
+    int succeeded;
+    {
+        py::gil_scoped_release release;
+        succeeded = spgms_get_magnetic_datasets(
+            datasets.data(), error_codes.data(), lattice.data(),
+            positions.data(), atom_types.data(), magmoms.data(), c_tensor_rank,
+            positions.n_atoms, n_configs, c_is_axial, c_symprec,
+            c_angle_tolerance, c_mag_symprec);
+    }
+    if (!succeeded) throw Spglib_classic_exception();
+    py::list list(n_configs);
+    for (auto i = 0; i < n_configs; i++) {
+        if (datasets[i] == nullptr) {
+            auto const error_msg = spg_get_error_message(error_codes[i]);
+            list[i] =
+                py::str(error_msg == nullptr ? unkown_error_msg : error_msg);
+            continue;
+        }
+        list[i] = MagneticDataset_to_dict(datasets[i], c_tensor_rank,
+                                          static_cast<bool>(with_permutations));
+        spg_free_magnetic_dataset(datasets[i]);
+    }
+    return list;
+}
 py::dict spglib::spacegroup_type(py::int_ hall_number) {
     auto spg_type = spg_get_spacegroup_type(hall_number);
     if (spg_type.number == 0) throw Spglib_classic_exception();
@@ -406,9 +631,14 @@ py::dict spglib::spacegroup_type_from_symmetry(Rotations const &rotations,
                                                Translations const &translations,
                                                Lattice const &lattice,
                                                py::float_ symprec) {
-    auto spg_type = spg_get_spacegroup_type_from_symmetry(
-        rotations.data(), translations.data(), rotations.n_operations,
-        lattice.data(), symprec);
+    auto const c_symprec = static_cast<double>(symprec);
+    SpglibSpacegroupType spg_type;
+    {
+        py::gil_scoped_release release;
+        spg_type = spg_get_spacegroup_type_from_symmetry(
+            rotations.data(), translations.data(), rotations.n_operations,
+            lattice.data(), c_symprec);
+    }
     if (spg_type.number == 0) throw Spglib_classic_exception();
     return SpacegroupType_to_dict(spg_type);
 }
@@ -420,12 +650,164 @@ py::dict spglib::magnetic_spacegroup_type(py::int_ uni_number) {
 py::dict spglib::magnetic_spacegroup_type_from_symmetry(
     Rotations const &rotations, Translations const &translations,
     array_int time_reversals, Lattice const &lattice, py::float_ symprec) {
-    auto msg_type = spg_get_magnetic_spacegroup_type_from_symmetry(
-        rotations.data(), translations.data(), (int *)time_reversals.data(),
-        time_reversals.size(), lattice.data(), symprec);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const num_operations = static_cast<int>(time_reversals.size());
+    SpglibMagneticSpacegroupType msg_type;
+    {
+        py::gil_scoped_release release;
+        msg_type = spg_get_magnetic_spacegroup_type_from_symmetry(
+            rotations.data(), translations.data(), (int *)time_reversals.data(),
+            num_operations, lattice.data(), c_symprec);
+    }
     if (msg_type.number == 0) throw Spglib_classic_exception();
     return MagneticSpacegroupType_to_dict(msg_type);
 }
+void check_operations(Rotations const &rotations,
+                      Translations const &translations) {
+    if (rotations.n_operations != translations.n_operations)
+        throw spglib::SpglibError(
+            "Number of Rotations and Translations is inconsistent");
+}
+array_double spglib::rotated_positions(Rotations const &rotations,
+                                       Translations const &translations,
+                                       Positions const &positions) {
+    check_operations(rotations, translations);
+    auto const n_operations = rotations.n_operations;
+    auto const n_atoms = positions.n_atoms;
+    array_double rotated_positions(
+        {py::ssize_t{n_operations}, py::ssize_t{n_atoms}, py::ssize_t{3}});
+    auto rotated_positions_ptr =
+        (double (*)[3])rotated_positions.mutable_data();
+    {
+        py::gil_scoped_release release;
+        spg_get_rotated_positions(rotated_positions_ptr, rotations.data(),
+                                  translations.data(), n_operations,
+                                  positions.data(), n_atoms);
+    }
+    return rotated_positions;
+}
+array_int spglib::symmetry_permutations(Rotations const &rotations,
+                                        Translations const &translations,
+                                        Lattice const &lattice,
+                                        Positions const &positions,
+                                        AtomTypes const &atom_types,
+                                        py::float_ symprec) {
+    check_operations(rotations, translations);
+    if (positions.n_atoms != atom_types.n_atoms)
+        throw SpglibError("Number of Positions and Types is inconsistent");
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const n_operations = rotations.n_operations;
+    auto const n_atoms = atom_types.n_atoms;
+    array_int permutations({py::ssize_t{n_operations}, py::ssize_t{n_atoms}});
+    auto permutations_ptr = permutations.mutable_data();
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spg_get_symmetry_permutations(
+            permutations_ptr, rotations.data(), translations.data(),
+            n_operations, lattice.data(), positions.data(), atom_types.data(),
+            n_atoms, c_symprec);
+    }
+    if (val == 0) throw Spglib_classic_exception();
+    return permutations;
+}
+// Pointer to the permutations of n_sites sites by the rotations, or nullptr
+// if they are not given.
+int const *get_permutations(std::optional<array_int> const &permutations,
+                            Rotations const &rotations, py::ssize_t n_sites) {
+    if (rotations.n_operations == 0)
+        throw spglib::SpglibError("No Rotations are given");
+    if (!permutations) return nullptr;
+    if (permutations->ndim() != 2 ||
+        permutations->shape(0) != rotations.n_operations ||
+        permutations->shape(1) != n_sites)
+        throw spglib::SpglibError(
+            "Permutations is not a n_operations x n_sites array");
+    return permutations->data();
+}
+array_double spglib::symmetrize_vectors(array_double vectors,
+                                        Rotations const &rotations,
+                                        Lattice const &lattice,
+                                        std::optional<array_int> permutations) {
+    if (vectors.ndim() != 2 || vectors.shape(1) != 3)
+        throw SpglibError("Vectors is not a nx3 matrix");
+    auto const n_sites = vectors.shape(0);
+    auto const permutations_ptr =
+        get_permutations(permutations, rotations, n_sites);
+    array_double symmetrized({n_sites, py::ssize_t{3}});
+    auto symmetrized_ptr = (double (*)[3])symmetrized.mutable_data();
+    auto vectors_ptr = (double const(*)[3])vectors.data();
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spg_symmetrize_vectors(symmetrized_ptr, vectors_ptr,
+                                     static_cast<int>(n_sites),
+                                     rotations.data(), rotations.n_operations,
+                                     lattice.data(), permutations_ptr);
+    }
+    if (val == 0)
+        throw SpglibError("Lattice is singular or Permutations out of range");
+    return symmetrized;
+}
+array_double spglib::symmetrize_tensors(array_double tensors,
+                                        Rotations const &rotations,
+                                        Lattice const &lattice,
+                                        std::optional<array_int> permutations) {
+    if (tensors.ndim() != 3 || tensors.shape(1) != 3 || tensors.shape(2) != 3)
+        throw SpglibError("Tensors is not a nx3x3 array");
+    auto const n_sites = tensors.shape(0);
+    auto const permutations_ptr =
+        get_permutations(permutations, rotations, n_sites);
+    array_double symmetrized({n_sites, py::ssize_t{3}, py::ssize_t{3}});
+    auto symmetrized_ptr = (double (*)[3][3])symmetrized.mutable_data();
+    auto tensors_ptr = (double const(*)[3][3])tensors.data();
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spg_symmetrize_tensors(symmetrized_ptr, tensors_ptr,
+                                     static_cast<int>(n_sites),
+                                     rotations.data(), rotations.n_operations,
+                                     lattice.data(), permutations_ptr);
+    }
+    if (val == 0)
+        throw SpglibError("Lattice is singular or Permutations out of range");
+    return symmetrized;
+}
+py::int_ spglib::inequivalent_configurations(array_int configurations,
+                                             array_int multiplicities,
+                                             array_int cursor,
+                                             array_int permutations,
+                                             py::int_ num_values) {
+    if (permutations.ndim() != 2)
+        throw SpglibError(
+            "Permutations is not a n_permutations x n_sites array");
+    auto const n_sites = permutations.shape(1);
+    if (cursor.ndim() != 1 || cursor.shape(0) != n_sites)
+        throw SpglibError("Cursor is not an array of n_sites");
+    if (configurations.ndim() != 2 || configurations.shape(1) != n_sites ||
+        multiplicities.ndim() != 1 ||
+        multiplicities.shape(0) != configurations.shape(0))
+        throw SpglibError(
+            "Configurations and Multiplicities are not n_configs x n_sites and "
+            "n_configs arrays");
+    auto const c_num_values = static_cast<int>(num_values);
+    auto configurations_ptr = configurations.mutable_data();
+    auto multiplicities_ptr = multiplicities.mutable_data();
+    auto cursor_ptr = cursor.mutable_data();
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spg_get_inequivalent_configurations(
+            configurations_ptr, multiplicities_ptr, cursor_ptr,
+            static_cast<int>(configurations.shape(0)), permutations.data(),
+            static_cast<int>(permutations.shape(0)), static_cast<int>(n_sites),
+            c_num_values);
+    }
+    if (val < 0)
+        throw SpglibError(
+            "Permutations do not include the identity or Cursor out of range");
+    return val;
+}
 py::int_ spglib::symmetry_from_database(Rotations &rotations,
                                         Translations &translations,
                                         py::int_ hall_number) {
@@ -453,9 +835,15 @@ py::int_ spglib::magnetic_symmetry_from_database(Rotations &rotations,
 py::tuple spglib::pointgroup(array_int rotations) {
     char symbol[6];
     array_int transf_matrix({3, 3});
-    auto ptg_num =
-        spg_get_pointgroup(symbol, (int (*)[3])transf_matrix.mutable_data(),
-                           (int (*)[3][3])rotations.data(), rotations.shape(0));
+    auto const num_rotations = static_cast<int>(rotations.shape(0));
+    int ptg_num;
+    {
+        auto transf_matrix_ptr = (int (*)[3])transf_matrix.mutable_data();
+        py::gil_scoped_release release;
+        ptg_num =
+            spg_get_pointgroup(symbol, transf_matrix_ptr,
+                               (int (*)[3][3])rotations.data(), num_rotations);
+    }
     if (ptg_num == 0) throw Spglib_classic_exception();
     py::list array(3);
     array[0] = symbol;
@@ -463,82 +851,214 @@ py::tuple spglib::pointgroup(array_int rotations) {
     array[2] = transf_matrix;
     return array;
 }
-py::int_ spglib::standardize_cell(Lattice &lattice, Positions &positions,
-                                  array_int atom_types, py::int_ num_atom,
-                                  py::int_ to_primative, py::int_ no_idealize,
-                                  py::float_ symprec,
-                                  py::float_ angle_tolerance) {
-    auto val = spgat_standardize_cell(
-        lattice.data(), positions.data(), atom_types.mutable_data(), num_atom,
-        to_primative, no_idealize, symprec, angle_tolerance);
+// Standardized cell of n_atoms atoms copied out of the scratch arrays.
+py::tuple make_cell(double const lattice[3][3], double const (*positions)[3],
+                    int const *types, int const n_atoms) {
+    array_double lattice_out({py::ssize_t{3}, py::ssize_t{3}});
+    array_double positions_out({py::ssize_t{n_atoms}, py::ssize_t{3}});
+    array_int types_out(py::ssize_t{n_atoms});
+    std::copy_n(&lattice[0][0], 9, lattice_out.mutable_data());
+    std::copy_n(&positions[0][0], 3 * n_atoms, positions_out.mutable_data());
+    std::copy_n(types, n_atoms, types_out.mutable_data());
+    return py::make_tuple(lattice_out, positions_out, types_out);
+}
+py::tuple spglib::standardize_cell(Lattice const &lattice,
+                                   Positions const &positions,
+                                   AtomTypes const &atom_types,
+                                   py::int_ to_primitive, py::int_ no_idealize,
+                                   py::float_ symprec,
+                                   py::float_ angle_tolerance) {
+    if (positions.n_atoms != atom_types.n_atoms)
+        throw SpglibError("Number of Positions and Types is inconsistent");
+    auto const n_atoms = atom_types.n_atoms;
+    auto const c_to_primitive = static_cast<int>(to_primitive);
+    auto const c_no_idealize = static_cast<int>(no_idealize);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    // The standardized cell has at most four times as many atoms. The scratch
+    // arrays are not initialized beyond the input atoms.
+    double std_lattice[3][3];
+    std::unique_ptr<double[][3]> std_positions(new double[4 * n_atoms][3]);
+    std::unique_ptr<int[]> std_types(new int[4 * n_atoms]);
+    std::copy_n(&lattice.data()[0][0], 9, &std_lattice[0][0]);
+    std::copy_n(&positions.data()[0][0], 3 * n_atoms, &std_positions[0][0]);
+    std::copy_n(atom_types.data(), n_atoms, std_types.get());
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spgat_standardize_cell(
+            std_lattice, std_positions.get(), std_types.get(), n_atoms,
+            c_to_primitive, c_no_idealize, c_symprec, c_angle_tolerance);
+    }
     if (val == 0) throw Spglib_classic_exception();
-    return val;
+    return make_cell(std_lattice, std_positions.get(), std_types.get(), val);
 }
-py::int_ spglib::refine_cell(Lattice &lattice, Positions &positions,
-                             AtomTypes &atom_types, py::int_ num_atom,
-                             py::float_ symprec, py::float_ angle_tolerance) {
-    auto val =
-        spgat_refine_cell(lattice.data(), positions.data(), atom_types.data(),
-                          num_atom, symprec, angle_tolerance);
-    if (val > 0)
-        // Valid value
-        return val;
-    throw Spglib_classic_exception();
+py::tuple spglib::refine_cell(Lattice const &lattice,
+                              Positions const &positions,
+                              AtomTypes const &atom_types, py::float_ symprec,
+                              py::float_ angle_tolerance) {
+    if (positions.n_atoms != atom_types.n_atoms)
+        throw SpglibError("Number of Positions and Types is inconsistent");
+    auto const n_atoms = atom_types.n_atoms;
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    // Same scratch arrays as standardize_cell
+    double std_lattice[3][3];
+    std::unique_ptr<double[][3]> std_positions(new double[4 * n_atoms][3]);
+    std::unique_ptr<int[]> std_types(new int[4 * n_atoms]);
+    std::copy_n(&lattice.data()[0][0], 9, &std_lattice[0][0]);
+    std::copy_n(&positions.data()[0][0], 3 * n_atoms, &std_positions[0][0]);
+    std::copy_n(atom_types.data(), n_atoms, std_types.get());
+    int val;
+    {
+        py::gil_scoped_release release;
+        val =
+            spgat_refine_cell(std_lattice, std_positions.get(), std_types.get(),
+                              n_atoms, c_symprec, c_angle_tolerance);
+    }
+    if (val <= 0) throw Spglib_classic_exception();
+    return make_cell(std_lattice, std_positions.get(), std_types.get(), val);
 }
 py::int_ spglib::symmetry(Rotations &rotations, Translations &translations,
                           Lattice const &lattice, Positions const &positions,
                           AtomTypes const &atom_types, py::float_ symprec,
                           py::float_ angle_tolerance) {
-    auto val = spgat_get_symmetry(rotations.data(), translations.data(),
-                                  rotations.n_operations, lattice.data(),
-                                  positions.data(), atom_types.data(),
-                                  atom_types.n_atoms, symprec, angle_tolerance);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    int val;
+    auto rotations_ptr = rotations.data();
+    auto translations_ptr = translations.data();
+    {
+        py::gil_scoped_release release;
+        val = spgat_get_symmetry(
+            rotations_ptr, translations_ptr, rotations.n_operations,
+            lattice.data(), positions.data(), atom_types.data(),
+            atom_types.n_atoms, c_symprec, c_angle_tolerance);
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
-py::int_ spglib::symmetry_with_collinear_spin(
+py::int_ spglib::symmetry_with_equivalent_atoms(
     Rotations &rotations, Translations &translations, array_int equiv_atoms,
     Lattice const &lattice, Positions const &positions,
-    AtomTypes const &atom_types, array_double magmoms, py::float_ symprec,
+    AtomTypes const &atom_types, py::float_ symprec,
     py::float_ angle_tolerance) {
-    auto val = spgat_get_symmetry_with_collinear_spin(
-        rotations.data(), translations.data(), equiv_atoms.mutable_data(),
-        equiv_atoms.size(), lattice.data(), positions.data(), atom_types.data(),
-        magmoms.data(), atom_types.n_atoms, symprec, angle_tolerance);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    if (static_cast<int>(equiv_atoms.size()) < atom_types.n_atoms)
+        throw SpglibError(
+            "Equivalent atoms array is shorter than the number of atoms");
+    auto equiv_atoms_ptr = equiv_atoms.mutable_data();
+    int val;
+    auto rotations_ptr = rotations.data();
+    auto translations_ptr = translations.data();
+    {
+        py::gil_scoped_release release;
+        val = spgat_get_symmetry_with_equivalent_atoms(
+            rotations_ptr, translations_ptr, equiv_atoms_ptr,
+            rotations.n_operations, lattice.data(), positions.data(),
+            atom_types.data(), atom_types.n_atoms, c_symprec,
+            c_angle_tolerance);
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
-py::int_ spglib::symmetry_with_site_tensors(
+py::int_ spglib::symmetry_with_collinear_spin(
     Rotations &rotations, Translations &translations, array_int equiv_atoms,
-    Lattice &primitive_lattice, array_int spin_flips, Lattice const &lattice,
-    Positions const &positions, AtomTypes const &atom_types,
-    array_double tensors, py::int_ with_time_reversal, py::int_ is_axial,
-    py::float_ symprec, py::float_ angle_tolerance, py::float_ mag_symprec) {
-    int tensor_rank = tensors.ndim() - 1;
-    int *spin_flips_ptr;
-    switch (tensor_rank) {
-        case 0:
-        case 1:
-            spin_flips_ptr = spin_flips.mutable_data();
-            break;
-        default:
-            spin_flips_ptr = nullptr;
-    }
-    auto val = spgms_get_symmetry_with_site_tensors(
-        rotations.data(), translations.data(), equiv_atoms.mutable_data(),
-        primitive_lattice.data(), spin_flips_ptr, rotations.n_operations,
-        lattice.data(), positions.data(), atom_types.data(), tensors.data(),
-        tensor_rank, atom_types.n_atoms, with_time_reversal, is_axial, symprec,
-        angle_tolerance, mag_symprec);
+    Lattice const &lattice, Positions const &positions,
+    AtomTypes const &atom_types, array_double magmoms, py::float_ symprec,
+    py::float_ angle_tolerance) {
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    auto equiv_atoms_ptr = equiv_atoms.mutable_data();
+    auto const equiv_atoms_size = static_cast<int>(equiv_atoms.size());
+    int val;
+    auto rotations_ptr = rotations.data();
+    auto translations_ptr = translations.data();
+    {
+        py::gil_scoped_release release;
+        val = spgat_get_symmetry_with_collinear_spin(
+            rotations_ptr, translations_ptr, equiv_atoms_ptr, equiv_atoms_size,
+            lattice.data(), positions.data(), atom_types.data(), magmoms.data(),
+            atom_types.n_atoms, c_symprec, c_angle_tolerance);
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
+py::dict spglib::symmetry_with_site_tensors(
+    Lattice const &lattice, Positions const &positions,
+    AtomTypes const &atom_types, array_double tensors,
+    py::int_ with_time_reversal, py::int_ is_axial, py::float_ symprec,
+    py::float_ angle_tolerance, py::float_ mag_symprec) {
+    auto const tensor_rank = static_cast<int>(tensors.ndim()) - 1;
+    if (tensor_rank != 0 && tensor_rank != 1) {
+        auto msg = std::string("Unexpected tensor_rank value: ");
+        msg += std::to_string(tensor_rank);
+        throw SpglibError(msg);
+    }
+    auto const n_atoms = atom_types.n_atoms;
+    auto const c_with_time_reversal = static_cast<int>(with_time_reversal);
+    auto const c_is_axial = static_cast<int>(is_axial);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    auto const c_mag_symprec = static_cast<double>(mag_symprec);
+    // Scratch arrays for the upper bound of the number of operations, i.e.,
+    // 48 rotations with and without time reversal per pure translation. They
+    // are not initialized, so that only the operations found are touched,
+    // and the returned arrays have the exact number of operations.
+    auto const max_size = n_atoms * 96;
+    std::unique_ptr<int[][3][3]> rotations(new int[max_size][3][3]);
+    std::unique_ptr<double[][3]> translations(new double[max_size][3]);
+    std::unique_ptr<int[]> spin_flips(new int[max_size]);
+    array_int equiv_atoms(py::ssize_t{n_atoms});
+    array_double primitive_lattice({py::ssize_t{3}, py::ssize_t{3}});
+    auto equiv_atoms_ptr = equiv_atoms.mutable_data();
+    auto primitive_lattice_ptr =
+        (double (*)[3])primitive_lattice.mutable_data();
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spgms_get_symmetry_with_site_tensors(
+            rotations.get(), translations.get(), equiv_atoms_ptr,
+            primitive_lattice_ptr, spin_flips.get(), max_size, lattice.data(),
+            positions.data(), atom_types.data(), tensors.data(), tensor_rank,
+            n_atoms, c_with_time_reversal, c_is_axial, c_symprec,
+            c_angle_tolerance, c_mag_symprec);
+    }
+    if (val == 0) throw Spglib_classic_exception();
+    array_int rotations_out({py::ssize_t{val}, py::ssize_t{3}, py::ssize_t{3}});
+    array_double translations_out({py::ssize_t{val}, py::ssize_t{3}});
+    py::array_t<bool> time_reversals(py::ssize_t{val});
+    std::copy_n(&rotations[0][0][0], 9 * val, rotations_out.mutable_data());
+    std::copy_n(&translations[0][0], 3 * val, translations_out.mutable_data());
+    auto time_reversals_ptr = time_reversals.mutable_data();
+    for (auto i = 0; i < val; i++) {
+        // spin_flips is -1 for operations with time reversal
+        time_reversals_ptr[i] = spin_flips[i] == -1;
+    }
+    py::dict dict;
+    dict["rotations"] = rotations_out;
+    dict["translations"] = translations_out;
+    dict["time_reversals"] = time_reversals;
+    dict["equivalent_atoms"] = equiv_atoms;
+    dict["primitive_lattice"] = primitive_lattice;
+    return dict;
+}
 py::int_ spglib::primitive(Lattice &lattice, Positions &positions,
                            AtomTypes &atom_types, py::float_ symprec,
                            py::float_ angle_tolerance) {
-    auto val = spgat_find_primitive(lattice.data(), positions.data(),
-                                    atom_types.data(), atom_types.n_atoms,
-                                    symprec, angle_tolerance);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_angle_tolerance = static_cast<double>(angle_tolerance);
+    int val;
+    auto lattice_ptr = lattice.data();
+    auto positions_ptr = positions.data();
+    auto atom_types_ptr = atom_types.data();
+    {
+        py::gil_scoped_release release;
+        val = spgat_find_primitive(lattice_ptr, positions_ptr, atom_types_ptr,
+                                   atom_types.n_atoms, c_symprec,
+                                   c_angle_tolerance);
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
@@ -550,16 +1070,152 @@ py::int_ spglib::grid_point_from_address(array_int grid_address,
     return spg_get_dense_grid_point_from_address(grid_address.data(),
                                                  mesh.data());
 }
+// Number of (n, 3) grid addresses
+py::ssize_t get_num_addresses(array_int const &grid_address) {
+    if (grid_address.ndim() != 2 || grid_address.shape(1) != 3)
+        throw spglib::SpglibError("Grid addresses are not a nx3 array");
+    return grid_address.shape(0);
+}
+void check_vector3(array_int const &array, std::string const &name) {
+    if (array.ndim() != 1 || array.shape(0) != 3)
+        throw spglib::SpglibError(name + " does not have 3 elements");
+}
+array_size_t spglib::grid_points_from_addresses(array_int grid_address,
+                                                array_int mesh) {
+    auto const n_addresses = get_num_addresses(grid_address);
+    check_vector3(mesh, "Mesh");
+    array_size_t grid_points(n_addresses);
+    auto grid_points_ptr = grid_points.mutable_data();
+    {
+        py::gil_scoped_release release;
+        spg_get_dense_grid_points_from_addresses(
+            grid_points_ptr, (int const(*)[3])grid_address.data(), n_addresses,
+            mesh.data());
+    }
+    return grid_points;
+}
+array_size_t spglib::grid_points_from_double_addresses(array_int address_double,
+                                                       array_int mesh) {
+    auto const n_addresses = get_num_addresses(address_double);
+    check_vector3(mesh, "Mesh");
+    array_size_t grid_points(n_addresses);
+    auto grid_points_ptr = grid_points.mutable_data();
+    {
+        py::gil_scoped_release release;
+        spg_get_dense_grid_points_from_double_addresses(
+            grid_points_ptr, (int const(*)[3])address_double.data(),
+            n_addresses, mesh.data());
+    }
+    return grid_points;
+}
+array_int spglib::double_grid_addresses(array_int grid_address, array_int mesh,
+                                        array_int is_shift) {
+    auto const n_addresses = get_num_addresses(grid_address);
+    check_vector3(mesh, "Mesh");
+    check_vector3(is_shift, "Shift");
+    array_int address_double({n_addresses, py::ssize_t{3}});
+    auto address_double_ptr = (int (*)[3])address_double.mutable_data();
+    {
+        py::gil_scoped_release release;
+        spg_get_double_grid_addresses(
+            address_double_ptr, (int const(*)[3])grid_address.data(),
+            n_addresses, mesh.data(), is_shift.data());
+    }
+    return address_double;
+}
+array_int spglib::grid_addresses_from_grid_points(array_size_t grid_points,
+                                                  array_int mesh) {
+    if (grid_points.ndim() != 1)
+        throw SpglibError("Grid points are not a 1d array");
+    check_vector3(mesh, "Mesh");
+    auto const n_grid_points = grid_points.shape(0);
+    array_int grid_address({n_grid_points, py::ssize_t{3}});
+    auto grid_address_ptr = (int (*)[3])grid_address.mutable_data();
+    {
+        py::gil_scoped_release release;
+        spg_get_grid_addresses_from_grid_points(
+            grid_address_ptr, grid_points.data(), n_grid_points, mesh.data());
+    }
+    return grid_address;
+}
+// Parallel version of spg_get_dense_ir_reciprocal_mesh. The mesh is split in
+// blocks of grid points whose mapping is computed independently of the other
+// blocks, so that the result does not depend on the number of threads nor on
+// the OpenMP build option.
+// Return 0 if failed.
+template <typename T>
+size_t ir_reciprocal_mesh_in_threads(
+    int (*grid_address)[3], T *grid_mapping_table, int const mesh[3],
+    int const is_shift[3], int const is_time_reversal,
+    double const (*lattice)[3], double const (*positions)[3],
+    int const *atom_types, int const num_atom, double const symprec,
+    size_t const num_threads) {
+    double const qpoints[1][3] = {{0, 0, 0}};
+    auto const dataset =
+        std::unique_ptr<SpglibDataset, void (*)(SpglibDataset *)>(
+            spg_get_dataset(lattice, positions, atom_types, num_atom, symprec),
+            spg_free_dataset);
+    if (!dataset) return 0;
+
+    auto const num_gp = mesh[0] * mesh[1] * static_cast<size_t>(mesh[2]);
+    // Large blocks are cheaper since the mapping of a grid point is copied
+    // from a smaller one in the same block when it is found, but several
+    // blocks per thread are needed to balance the load.
+    auto const block_size =
+        std::clamp(num_gp / (4 * num_threads), size_t{4096}, size_t{65536});
+    auto const num_blocks = (num_gp + block_size - 1) / block_size;
+    std::atomic<size_t> next{0};
+    std::atomic<bool> failed{false};
+    auto work = [&]() {
+        std::vector<size_t> block(block_size);
+        for (size_t i = next++; i < num_blocks; i = next++) {
+            auto const start = i * block_size;
+            auto const size = std::min(block_size, num_gp - start);
+            if (!spg_get_dense_ir_mapping_table_range(
+                    grid_address + start, block.data(), start, size, mesh,
+                    is_shift, is_time_reversal, dataset->n_operations,
+                    dataset->rotations, 1, qpoints)) {
+                failed = true;
+                return;
+            }
+            std::copy_n(block.begin(), size, grid_mapping_table + start);
+        }
+    };
+    run_in_threads(work, std::min(num_threads, num_blocks));
+    if (failed) return 0;
+
+    size_t num_ir = 0;
+    for (size_t i = 0; i < num_gp; i++)
+        if (static_cast<size_t>(grid_mapping_table[i]) == i) num_ir++;
+    return num_ir;
+}
 py::int_ spglib::ir_reciprocal_mesh(
     array_int grid_address, array_int grid_mapping_table, array_int mesh,
     array_int is_shift, py::int_ is_time_reversal, Lattice const &lattice,
-    Positions const &positions, AtomTypes const &atom_types,
-    py::float_ symprec) {
-    auto val = spg_get_ir_reciprocal_mesh(
-        (int (*)[3])grid_address.mutable_data(),
-        grid_mapping_table.mutable_data(), mesh.data(), is_shift.data(),
-        is_time_reversal, lattice.data(), positions.data(), atom_types.data(),
-        atom_types.n_atoms, symprec);
+    Positions const &positions, AtomTypes const &atom_types, py::float_ symprec,
+    py::int_ num_threads) {
+    auto const c_is_time_reversal = static_cast<int>(is_time_reversal);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_num_threads = get_num_threads(num_threads, SIZE_MAX);
+    auto grid_address_ptr = (int (*)[3])grid_address.mutable_data();
+    auto grid_mapping_table_ptr = grid_mapping_table.mutable_data();
+    int val;
+    {
+        py::gil_scoped_release release;
+        if (c_num_threads == 1) {
+            val = spg_get_ir_reciprocal_mesh(
+                grid_address_ptr, grid_mapping_table_ptr, mesh.data(),
+                is_shift.data(), c_is_time_reversal, lattice.data(),
+                positions.data(), atom_types.data(), atom_types.n_atoms,
+                c_symprec);
+        } else {
+            val = static_cast<int>(ir_reciprocal_mesh_in_threads(
+                grid_address_ptr, grid_mapping_table_ptr, mesh.data(),
+                is_shift.data(), c_is_time_reversal, lattice.data(),
+                positions.data(), atom_types.data(), atom_types.n_atoms,
+                c_symprec, c_num_threads));
+        }
+    }
     if (val > 0)
         // Valid value
         return val;
@@ -568,27 +1224,157 @@ py::int_ spglib::ir_reciprocal_mesh(
 py::int_ spglib::ir_reciprocal_mesh(
     array_int grid_address, array_size_t grid_mapping_table, array_int mesh,
     array_int is_shift, py::int_ is_time_reversal, Lattice const &lattice,
-    Positions const &positions, AtomTypes const &atom_types,
-    py::float_ symprec) {
-    auto val = spg_get_dense_ir_reciprocal_mesh(
-        (int (*)[3])grid_address.mutable_data(),
-        grid_mapping_table.mutable_data(), mesh.data(), is_shift.data(),
-        is_time_reversal, lattice.data(), positions.data(), atom_types.data(),
-        atom_types.n_atoms, symprec);
+    Positions const &positions, AtomTypes const &atom_types, py::float_ symprec,
+    py::int_ num_threads) {
+    auto const c_is_time_reversal = static_cast<int>(is_time_reversal);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const c_num_threads = get_num_threads(num_threads, SIZE_MAX);
+    auto grid_address_ptr = (int (*)[3])grid_address.mutable_data();
+    auto grid_mapping_table_ptr = grid_mapping_table.mutable_data();
+    size_t val;
+    {
+        py::gil_scoped_release release;
+        if (c_num_threads == 1) {
+            val = spg_get_dense_ir_reciprocal_mesh(
+                grid_address_ptr, grid_mapping_table_ptr, mesh.data(),
+                is_shift.data(), c_is_time_reversal, lattice.data(),
+                positions.data(), atom_types.data(), atom_types.n_atoms,
+                c_symprec);
+        } else {
+            val = ir_reciprocal_mesh_in_threads(
+                grid_address_ptr, grid_mapping_table_ptr, mesh.data(),
+                is_shift.data(), c_is_time_reversal, lattice.data(),
+                positions.data(), atom_types.data(), atom_types.n_atoms,
+                c_symprec, c_num_threads);
+        }
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
+// Tuple of the arrays of c_ir_grid_points, which are read-only views of the C
+// buffers freed together when the last of them is garbage collected.
+py::tuple make_ir_grid_points(SpglibIrGridPoints *c_ir_grid_points,
+                              array_int const &mesh) {
+    auto const holder = std::shared_ptr<SpglibIrGridPoints>(
+        c_ir_grid_points, spg_free_ir_grid_points);
+    auto const view = [&holder](std::vector<py::ssize_t> shape,
+                                int const *data) {
+        py::capsule base(
+            new std::shared_ptr<SpglibIrGridPoints>(holder), [](void *ptr) {
+                delete static_cast<std::shared_ptr<SpglibIrGridPoints> *>(ptr);
+            });
+        py::array_t<int> array(std::move(shape), data, base);
+        array.attr("setflags")(py::arg("write") = false);
+        return array;
+    };
+    py::ssize_t const n_ir = c_ir_grid_points->n_ir_grid_points;
+    auto ir_grid_address =
+        view({n_ir, 3}, &c_ir_grid_points->ir_grid_address[0][0]);
+    auto weights = view({n_ir}, c_ir_grid_points->weights);
+    py::object star_address = py::none();
+    if (c_ir_grid_points->star_address != nullptr) {
+        py::ssize_t const n_gp = static_cast<py::ssize_t>(mesh.at(0)) *
+                                 static_cast<py::ssize_t>(mesh.at(1)) *
+                                 static_cast<py::ssize_t>(mesh.at(2));
+        star_address = view({n_gp, 3}, &c_ir_grid_points->star_address[0][0]);
+    }
+    return py::make_tuple(ir_grid_address, weights, star_address);
+}
+py::tuple spglib::ir_grid_points(array_int mesh, array_int is_shift,
+                                 py::int_ is_time_reversal, py::int_ with_star,
+                                 Lattice const &lattice,
+                                 Positions const &positions,
+                                 AtomTypes const &atom_types,
+                                 py::float_ symprec) {
+    auto const c_is_time_reversal = static_cast<int>(is_time_reversal);
+    auto const c_with_star = static_cast<int>(with_star);
+    auto const c_symprec = static_cast<double>(symprec);
+    SpglibIrGridPoints *c_ir_grid_points;
+    {
+        py::gil_scoped_release release;
+        c_ir_grid_points = spg_get_ir_grid_points(
+            mesh.data(), is_shift.data(), c_is_time_reversal, c_with_star,
+            lattice.data(), positions.data(), atom_types.data(),
+            atom_types.n_atoms, c_symprec);
+    }
+    if (c_ir_grid_points == nullptr) throw Spglib_classic_exception();
+    return make_ir_grid_points(c_ir_grid_points, mesh);
+}
+array_int spglib::reciprocal_point_group(Rotations const &rotations,
+                                         py::int_ is_time_reversal,
+                                         array_double qpoints,
+                                         py::float_ symprec) {
+    if (qpoints.ndim() != 2 || qpoints.shape(1) != 3)
+        throw SpglibError("Qpoints are not a nx3 array");
+    auto const c_is_time_reversal = static_cast<int>(is_time_reversal);
+    auto const c_symprec = static_cast<double>(symprec);
+    auto const num_q = static_cast<int>(qpoints.shape(0));
+    std::vector<int> rot_reciprocal(rotations.n_operations * 2 * 9);
+    int size;
+    {
+        py::gil_scoped_release release;
+        size = spg_get_reciprocal_point_group(
+            (int (*)[3][3])rot_reciprocal.data(), rotations.n_operations,
+            rotations.data(), c_is_time_reversal, num_q,
+            (double const(*)[3])qpoints.data(), c_symprec);
+    }
+    if (size == 0) throw Spglib_classic_exception();
+    array_int result({py::ssize_t{size}, py::ssize_t{3}, py::ssize_t{3}});
+    std::copy_n(rot_reciprocal.begin(), size * 9, result.mutable_data());
+    return result;
+}
+py::int_ spglib::ir_reciprocal_mesh_from_point_group(
+    array_int grid_address, array_size_t ir_mapping_table, array_int mesh,
+    array_int is_shift, Rotations const &rot_reciprocal) {
+    check_vector3(mesh, "Mesh");
+    check_vector3(is_shift, "Shift");
+    auto grid_address_ptr = (int (*)[3])grid_address.mutable_data();
+    auto ir_mapping_table_ptr = ir_mapping_table.mutable_data();
+    size_t val;
+    {
+        py::gil_scoped_release release;
+        val = spg_get_dense_ir_reciprocal_mesh_from_point_group(
+            grid_address_ptr, ir_mapping_table_ptr, mesh.data(),
+            is_shift.data(), rot_reciprocal.n_operations,
+            rot_reciprocal.data());
+    }
+    if (val == 0) throw Spglib_classic_exception();
+    return val;
+}
+py::tuple spglib::ir_grid_points_from_point_group(
+    array_int mesh, array_int is_shift, Rotations const &rot_reciprocal,
+    py::int_ with_star) {
+    check_vector3(mesh, "Mesh");
+    check_vector3(is_shift, "Shift");
+    auto const c_with_star = static_cast<int>(with_star);
+    SpglibIrGridPoints *c_ir_grid_points;
+    {
+        py::gil_scoped_release release;
+        c_ir_grid_points = spg_get_ir_grid_points_from_point_group(
+            mesh.data(), is_shift.data(), c_with_star,
+            rot_reciprocal.n_operations, rot_reciprocal.data());
+    }
+    if (c_ir_grid_points == nullptr) throw Spglib_classic_exception();
+    return make_ir_grid_points(c_ir_grid_points, mesh);
+}
 py::int_ spglib::stabilized_reciprocal_mesh(array_int grid_address,
                                             array_int grid_mapping_table,
                                             array_int mesh, array_int is_shift,
                                             py::int_ is_time_reversal,
                                             Rotations const &rotations,
                                             array_double qpoints) {
-    auto val = spg_get_stabilized_reciprocal_mesh(
-        (int (*)[3])grid_address.mutable_data(),
-        grid_mapping_table.mutable_data(), mesh.data(), is_shift.data(),
-        is_time_reversal, rotations.n_operations, rotations.data(),
-        qpoints.shape(0), (double (*)[3])qpoints.data());
+    auto const c_is_time_reversal = static_cast<int>(is_time_reversal);
+    auto const num_q = static_cast<int>(qpoints.shape(0));
+    auto grid_address_ptr = (int (*)[3])grid_address.mutable_data();
+    auto grid_mapping_table_ptr = grid_mapping_table.mutable_data();
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spg_get_stabilized_reciprocal_mesh(
+            grid_address_ptr, grid_mapping_table_ptr, mesh.data(),
+            is_shift.data(), c_is_time_reversal, rotations.n_operations,
+            rotations.data(), num_q, (double (*)[3])qpoints.data());
+    }
     if (val > 0)
         // Valid value, did not error
         return val;
@@ -600,24 +1386,54 @@ py::int_ spglib::stabilized_reciprocal_mesh(array_int grid_address,
                                             py::int_ is_time_reversal,
                                             Rotations const &rotations,
                                             array_double qpoints) {
-    auto val = spg_get_dense_stabilized_reciprocal_mesh(
-        (int (*)[3])grid_address.mutable_data(),
-        grid_mapping_table.mutable_data(), mesh.data(), is_shift.data(),
-        is_time_reversal, rotations.n_operations, rotations.data(),
-        qpoints.shape(0), (double (*)[3])qpoints.data());
+    auto const c_is_time_reversal = static_cast<int>(is_time_reversal);
+    auto const num_q = static_cast<int>(qpoints.shape(0));
+    auto grid_address_ptr = (int (*)[3])grid_address.mutable_data();
+    auto grid_mapping_table_ptr = grid_mapping_table.mutable_data();
+    size_t val;
+    {
+        py::gil_scoped_release release;
+        val = spg_get_dense_stabilized_reciprocal_mesh(
+            grid_address_ptr, grid_mapping_table_ptr, mesh.data(),
+            is_shift.data(), c_is_time_reversal, rotations.n_operations,
+            rotations.data(), num_q, (double (*)[3])qpoints.data());
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
+void spglib::ir_mapping_table_range(array_size_t ir_mapping_table,
+                                    py::int_ start, array_int mesh,
+                                    array_int is_shift,
+                                    py::int_ is_time_reversal,
+                                    Rotations const &rotations,
+                                    array_double qpoints) {
+    auto const c_start = static_cast<size_t>(start);
+    auto const num_grid_points = static_cast<size_t>(ir_mapping_table.size());
+    auto const c_is_time_reversal = static_cast<int>(is_time_reversal);
+    auto const num_q = static_cast<int>(qpoints.shape(0));
+    auto ir_mapping_table_ptr = ir_mapping_table.mutable_data();
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spg_get_dense_ir_mapping_table_range(
+            nullptr, ir_mapping_table_ptr, c_start, num_grid_points,
+            mesh.data(), is_shift.data(), c_is_time_reversal,
+            rotations.n_operations, rotations.data(), num_q,
+            (double (*)[3])qpoints.data());
+    }
+    if (val == 0) throw Spglib_classic_exception();
+}
 void spglib::grid_points_by_rotations(array_size_t rot_grid_points,
                                       array_int address_orig,
                                       Rotations const &rot_reciprocal,
                                       array_int mesh, array_int is_shift) {
     // TODO: Throw if input is unexpected
     // Otherwise does not seem to have errors associated.
+    auto rot_grid_points_ptr = rot_grid_points.mutable_data();
+    py::gil_scoped_release release;
     spg_get_dense_grid_points_by_rotations(
-        rot_grid_points.mutable_data(), address_orig.data(),
-        rot_reciprocal.n_operations, rot_reciprocal.data(), mesh.data(),
-        is_shift.data());
+        rot_grid_points_ptr, address_orig.data(), rot_reciprocal.n_operations,
+        rot_reciprocal.data(), mesh.data(), is_shift.data());
 }
 void spglib::BZ_grid_points_by_rotations(array_size_t rot_grid_points,
                                          array_int address_orig,
@@ -626,10 +1442,78 @@ void spglib::BZ_grid_points_by_rotations(array_size_t rot_grid_points,
                                          array_size_t bz_map) {
     // TODO: Throw if input is unexpected
     // Otherwise does not seem to have errors associated.
+    auto rot_grid_points_ptr = rot_grid_points.mutable_data();
+    py::gil_scoped_release release;
     spg_get_dense_BZ_grid_points_by_rotations(
-        rot_grid_points.mutable_data(), address_orig.data(),
-        rot_reciprocal.n_operations, rot_reciprocal.data(), mesh.data(),
-        is_shift.data(), bz_map.data());
+        rot_grid_points_ptr, address_orig.data(), rot_reciprocal.n_operations,
+        rot_reciprocal.data(), mesh.data(), is_shift.data(), bz_map.data());
+}
+// Table of the n_points grid points of grid_address, or of the first
+// n_points grid points of the mesh if grid_address is nullptr, rotated by
+// rot_reciprocal, of shape (n_rotations, n_points). The rotations are shared
+// between the threads. The grid points are mapped by bz_map unless it is
+// nullptr.
+array_size_t grid_point_table_in_threads(
+    int const (*grid_address)[3], py::ssize_t n_points,
+    Rotations const &rot_reciprocal, array_int const &mesh,
+    array_int const &is_shift, size_t const *bz_map, py::int_ num_threads) {
+    check_vector3(is_shift, "Shift");
+    auto const n_rot = rot_reciprocal.n_operations;
+    auto const c_num_threads =
+        get_num_threads(num_threads, static_cast<size_t>(n_rot));
+    array_size_t rot_grid_points({py::ssize_t{n_rot}, n_points});
+    auto rot_grid_points_ptr = rot_grid_points.mutable_data();
+    auto rot_reciprocal_ptr = rot_reciprocal.data();
+    auto mesh_ptr = mesh.data();
+    auto is_shift_ptr = is_shift.data();
+    {
+        py::gil_scoped_release release;
+        std::atomic<int> next{0};
+        auto work = [&]() {
+            for (int i = next++; i < n_rot; i = next++) {
+                auto row = rot_grid_points_ptr + i * n_points;
+                if (bz_map == nullptr) {
+                    spg_get_dense_grid_point_table_by_rotations(
+                        row, grid_address, n_points, 1, rot_reciprocal_ptr + i,
+                        mesh_ptr, is_shift_ptr);
+                } else {
+                    spg_get_dense_BZ_grid_point_table_by_rotations(
+                        row, grid_address, n_points, 1, rot_reciprocal_ptr + i,
+                        mesh_ptr, is_shift_ptr, bz_map);
+                }
+            }
+        };
+        run_in_threads(work, c_num_threads);
+    }
+    return rot_grid_points;
+}
+array_size_t spglib::grid_point_table_by_rotations(
+    std::optional<array_int> grid_address, Rotations const &rot_reciprocal,
+    array_int mesh, array_int is_shift, py::int_ num_threads) {
+    check_vector3(mesh, "Mesh");
+    if (grid_address)
+        return grid_point_table_in_threads(
+            (int const(*)[3])grid_address->data(),
+            get_num_addresses(*grid_address), rot_reciprocal, mesh, is_shift,
+            nullptr, num_threads);
+    auto const mesh_ptr = mesh.data();
+    return grid_point_table_in_threads(
+        nullptr, py::ssize_t{mesh_ptr[0]} * mesh_ptr[1] * mesh_ptr[2],
+        rot_reciprocal, mesh, is_shift, nullptr, num_threads);
+}
+array_size_t spglib::BZ_grid_point_table_by_rotations(
+    array_int bz_grid_address, Rotations const &rot_reciprocal, array_int mesh,
+    array_int is_shift, array_size_t bz_map, py::int_ num_threads) {
+    check_vector3(mesh, "Mesh");
+    auto const mesh_ptr = mesh.data();
+    if (bz_map.ndim() != 1 || bz_map.shape(0) != py::ssize_t{mesh_ptr[0]} *
+                                                     mesh_ptr[1] * mesh_ptr[2] *
+                                                     8)
+        throw SpglibError("BZ map does not have prod(mesh * 2) elements");
+    return grid_point_table_in_threads((int const(*)[3])bz_grid_address.data(),
+                                       get_num_addresses(bz_grid_address),
+                                       rot_reciprocal, mesh, is_shift,
+                                       bz_map.data(), num_threads);
 }
 py::int_ spglib::BZ_grid_address(array_int bz_grid_address, array_size_t bz_map,
                                  array_int grid_address, array_int mesh,
@@ -637,26 +1521,50 @@ py::int_ spglib::BZ_grid_address(array_int bz_grid_address, array_size_t bz_map,
                                  array_int is_shift) {
     // TODO: Throw if input is unexpected
     // Otherwise does not seem to have errors associated.
-    return spg_relocate_dense_BZ_grid_address(
-        (int (*)[3])bz_grid_address.mutable_data(), bz_map.mutable_data(),
-        (int (*)[3])grid_address.data(), mesh.data(), reciprocal_lattice.data(),
-        is_shift.data());
+    auto bz_grid_address_ptr = (int (*)[3])bz_grid_address.mutable_data();
+    auto bz_map_ptr = bz_map.mutable_data();
+    size_t val;
+    {
+        py::gil_scoped_release release;
+        val = spg_relocate_dense_BZ_grid_address(
+            bz_grid_address_ptr, bz_map_ptr, (int (*)[3])grid_address.data(),
+            mesh.data(), reciprocal_lattice.data(), is_shift.data());
+    }
+    return val;
 }
 py::int_ spglib::delaunay_reduce(Lattice &lattice, py::float_ symprec) {
-    auto val = spg_delaunay_reduce(lattice.data(), symprec);
+    auto const c_symprec = static_cast<double>(symprec);
+    int val;
+    auto lattice_ptr = lattice.data();
+    {
+        py::gil_scoped_release release;
+        val = spg_delaunay_reduce(lattice_ptr, c_symprec);
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
 py::int_ spglib::niggli_reduce(Lattice &lattice, py::float_ eps) {
-    auto val = spg_niggli_reduce(lattice.data(), eps);
+    auto const c_eps = static_cast<double>(eps);
+    int val;
+    auto lattice_ptr = lattice.data();
+    {
+        py::gil_scoped_release release;
+        val = spg_niggli_reduce(lattice_ptr, c_eps);
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
 py::int_ spglib::hall_number_from_symmetry(Rotations const &rotations,
                                            Translations const &translations,
                                            py::float_ symprec) {
-    auto val = spg_get_hall_number_from_symmetry(
-        rotations.data(), translations.data(), rotations.n_operations, symprec);
+    auto const c_symprec = static_cast<double>(symprec);
+    int val;
+    {
+        py::gil_scoped_release release;
+        val = spg_get_hall_number_from_symmetry(
+            rotations.data(), translations.data(), rotations.n_operations,
+            c_symprec);
+    }
     if (val == 0) throw Spglib_classic_exception();
     return val;
 }
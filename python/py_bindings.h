@@ -3,7 +3,9 @@
 
 #pragma once
 
+#include <memory>
 #include <optional>
+#include <string>
 
 #include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
@@ -107,13 +109,32 @@ class SpglibError : public std::exception {
     char const *what() const noexcept override;
 };
 
+// Owner of a SpglibDataset whose fields are decoded into python objects on
+// request.
+struct DatasetHolder;
+
+class Dataset {
+    std::shared_ptr<DatasetHolder const> holder;
+
+   public:
+    explicit Dataset(std::shared_ptr<DatasetHolder const> _holder);
+    [[nodiscard]]
+    py::object field(std::string const &name) const;
+    [[nodiscard]]
+    py::dict fields(std::vector<std::string> const &names) const;
+};
+
 py::tuple version_tuple();
 py::str version_string();
 py::str version_full();
 py::str commit();
-py::dict dataset(Lattice const &lattice, Positions const &positions,
-                 AtomTypes const &atom_types, py::int_ hall_number,
-                 py::float_ symprec, py::float_ angle_tolerance);
+Dataset dataset(Lattice const &lattice, Positions const &positions,
+                AtomTypes const &atom_types, py::int_ hall_number,
+                py::float_ symprec, py::float_ angle_tolerance);
+py::list datasets(array_double lattices, array_double positions,
+                  array_int atom_types, array_size_t offsets,
+                  py::int_ hall_number, py::float_ symprec,
+                  py::float_ angle_tolerance, py::int_ num_threads);
 py::dict layer_dataset(Lattice const &lattice, Positions const &positions,
                        AtomTypes const &atom_types, py::int_ aperiodic_dir,
                        py::float_ symprec);
@@ -121,7 +142,12 @@ py::dict magnetic_dataset(Lattice const &lattice, Positions const &positions,
                           AtomTypes const &atom_types, array_double magmoms,
                           py::int_ tensor_rank, py::bool_ is_axial,
                           py::float_ symprec, py::float_ angle_tolerance,
-                          py::float_ mag_symprec);
+                          py::float_ mag_symprec, py::bool_ with_permutations);
+py::list magnetic_datasets(Lattice const &lattice, Positions const &positions,
+                           AtomTypes const &atom_types, array_double magmoms,
+                           py::int_ tensor_rank, py::bool_ is_axial,
+                           py::float_ symprec, py::float_ angle_tolerance,
+                           py::float_ mag_symprec, py::bool_ with_permutations);
 py::dict spacegroup_type(py::int_ hall_number);
 py::dict spacegroup_type_from_symmetry(Rotations const &rotations,
                                        Translations const &translations,
@@ -131,6 +157,27 @@ py::dict magnetic_spacegroup_type(py::int_ uni_number);
 py::dict magnetic_spacegroup_type_from_symmetry(
     Rotations const &rotations, Translations const &translations,
     array_int time_reversals, Lattice const &lattice, py::float_ symprec);
+array_double rotated_positions(Rotations const &rotations,
+                               Translations const &translations,
+                               Positions const &positions);
+array_int symmetry_permutations(Rotations const &rotations,
+                                Translations const &translations,
+                                Lattice const &lattice,
+                                Positions const &positions,
+                                AtomTypes const &atom_types,
+                                py::float_ symprec);
+array_double symmetrize_vectors(array_double vectors,
+                                Rotations const &rotations,
+                                Lattice const &lattice,
+                                std::optional<array_int> permutations);
+array_double symmetrize_tensors(array_double tensors,
+                                Rotations const &rotations,
+                                Lattice const &lattice,
+                                std::optional<array_int> permutations);
+py::int_ inequivalent_configurations(array_int configurations,
+                                     array_int multiplicities, array_int cursor,
+                                     array_int permutations,
+                                     py::int_ num_values);
 py::int_ symmetry_from_database(Rotations &rotations,
                                 Translations &translations,
                                 py::int_ hall_number);
@@ -140,42 +187,69 @@ py::int_ magnetic_symmetry_from_database(Rotations &rotations,
                                          py::int_ uni_number,
                                          py::int_ hall_number);
 py::tuple pointgroup(array_int rotations);
-py::int_ standardize_cell(Lattice &lattice, Positions &positions,
-                          array_int atom_types, py::int_ num_atom,
-                          py::int_ to_primative, py::int_ no_idealize,
-                          py::float_ symprec, py::float_ angle_tolerance);
-py::int_ refine_cell(Lattice &lattice, Positions &positions,
-                     AtomTypes &atom_types, py::int_ num_atom,
-                     py::float_ symprec, py::float_ angle_tolerance);
+py::tuple standardize_cell(Lattice const &lattice, Positions const &positions,
+                           AtomTypes const &atom_types, py::int_ to_primitive,
+                           py::int_ no_idealize, py::float_ symprec,
+                           py::float_ angle_tolerance);
+py::tuple refine_cell(Lattice const &lattice, Positions const &positions,
+                      AtomTypes const &atom_types, py::float_ symprec,
+                      py::float_ angle_tolerance);
 py::int_ symmetry(Rotations &rotations, Translations &translations,
                   Lattice const &lattice, Positions const &positions,
                   AtomTypes const &atom_types, py::float_ symprec,
                   py::float_ angle_tolerance);
+py::int_ symmetry_with_equivalent_atoms(
+    Rotations &rotations, Translations &translations, array_int equiv_atoms,
+    Lattice const &lattice, Positions const &positions,
+    AtomTypes const &atom_types, py::float_ symprec,
+    py::float_ angle_tolerance);
 py::int_ symmetry_with_collinear_spin(
     Rotations &rotations, Translations &translations, array_int equiv_atoms,
     Lattice const &lattice, Positions const &positions,
     AtomTypes const &atom_types, array_double magmoms, py::float_ symprec,
     py::float_ angle_tolerance);
-py::int_ symmetry_with_site_tensors(
-    Rotations &rotations, Translations &translations, array_int equiv_atoms,
-    Lattice &primitive_lattice, array_int spin_flips, Lattice const &lattice,
-    Positions const &positions, AtomTypes const &atom_types,
-    array_double tensors, py::int_ with_time_reversal, py::int_ is_axial,
-    py::float_ symprec, py::float_ angle_tolerance, py::float_ mag_symprec);
+py::dict symmetry_with_site_tensors(
+    Lattice const &lattice, Positions const &positions,
+    AtomTypes const &atom_types, array_double tensors,
+    py::int_ with_time_reversal, py::int_ is_axial, py::float_ symprec,
+    py::float_ angle_tolerance, py::float_ mag_symprec);
 py::int_ primitive(Lattice &lattice, Positions &positions,
                    AtomTypes &atom_types, py::float_ symprec,
                    py::float_ angle_tolerance);
 py::int_ grid_point_from_address(array_int grid_address, array_int mesh);
+array_size_t grid_points_from_addresses(array_int grid_address, array_int mesh);
+array_size_t grid_points_from_double_addresses(array_int address_double,
+                                               array_int mesh);
+array_int double_grid_addresses(array_int grid_address, array_int mesh,
+                                array_int is_shift);
+array_int grid_addresses_from_grid_points(array_size_t grid_points,
+                                          array_int mesh);
 py::int_ ir_reciprocal_mesh(array_int grid_address,
                             array_int grid_mapping_table, array_int mesh,
                             array_int is_shift, py::int_ is_time_reversal,
                             Lattice const &lattice, Positions const &positions,
-                            AtomTypes const &atom_types, py::float_ symprec);
+                            AtomTypes const &atom_types, py::float_ symprec,
+                            py::int_ num_threads);
 py::int_ ir_reciprocal_mesh(array_int grid_address,
                             array_size_t grid_mapping_table, array_int mesh,
                             array_int is_shift, py::int_ is_time_reversal,
                             Lattice const &lattice, Positions const &positions,
-                            AtomTypes const &atom_types, py::float_ symprec);
+                            AtomTypes const &atom_types, py::float_ symprec,
+                            py::int_ num_threads);
+py::tuple ir_grid_points(array_int mesh, array_int is_shift,
+                         py::int_ is_time_reversal, py::int_ with_star,
+                         Lattice const &lattice, Positions const &positions,
+                         AtomTypes const &atom_types, py::float_ symprec);
+array_int reciprocal_point_group(Rotations const &rotations,
+                                 py::int_ is_time_reversal,
+                                 array_double qpoints, py::float_ symprec);
+py::int_ ir_reciprocal_mesh_from_point_group(array_int grid_address,
+                                             array_size_t ir_mapping_table,
+                                             array_int mesh, array_int is_shift,
+                                             Rotations const &rot_reciprocal);
+py::tuple ir_grid_points_from_point_group(array_int mesh, array_int is_shift,
+                                          Rotations const &rot_reciprocal,
+                                          py::int_ with_star);
 py::int_ stabilized_reciprocal_mesh(array_int grid_address,
                                     array_int grid_mapping_table,
                                     array_int mesh, array_int is_shift,
@@ -188,6 +262,10 @@ py::int_ stabilized_reciprocal_mesh(array_int grid_address,
                                     py::int_ is_time_reversal,
                                     Rotations const &rotations,
                                     array_double qpoints);
+void ir_mapping_table_range(array_size_t ir_mapping_table, py::int_ start,
+                            array_int mesh, array_int is_shift,
+                            py::int_ is_time_reversal,
+                            Rotations const &rotations, array_double qpoints);
 void grid_points_by_rotations(array_size_t rot_grid_points,
                               array_int address_orig,
                               Rotations const &rot_reciprocal, array_int mesh,
@@ -197,6 +275,12 @@ void BZ_grid_points_by_rotations(array_size_t rot_grid_points,
                                  Rotations const &rot_reciprocal,
                                  array_int mesh, array_int is_shift,
                                  array_size_t bz_map);
+array_size_t grid_point_table_by_rotations(
+    std::optional<array_int> grid_address, Rotations const &rot_reciprocal,
+    array_int mesh, array_int is_shift, py::int_ num_threads);
+array_size_t BZ_grid_point_table_by_rotations(
+    array_int bz_grid_address, Rotations const &rot_reciprocal, array_int mesh,
+    array_int is_shift, array_size_t bz_map, py::int_ num_threads);
 py::int_ BZ_grid_address(array_int bz_grid_address, array_size_t bz_map,
                          array_int grid_address, array_int mesh,
                          Lattice const &reciprocal_lattice, array_int is_shift);
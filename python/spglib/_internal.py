@@ -5,11 +5,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import numpy as np
 from numpy._typing import ArrayLike
 
 from . import _spglib
 from .error import _set_no_error, _set_or_throw_error
+from .kpoints import _iter_ir_mapping_table
 from .spg import SpgCell, SpglibDataset
 from .utils import _expand_cell
 
@@ -18,9 +21,16 @@ __all__ = [
     "get_symmetry_layerdataset",
     "get_layergroup",
     "get_grid_point_from_address",
+    "get_grid_points_from_addresses",
+    "get_grid_points_from_double_addresses",
+    "get_double_grid_addresses",
+    "get_grid_addresses_from_grid_points",
     "get_stabilized_reciprocal_mesh",
+    "iter_stabilized_reciprocal_mesh",
     "get_grid_points_by_rotations",
     "get_BZ_grid_points_by_rotations",
+    "get_grid_point_table_by_rotations",
+    "get_BZ_grid_point_table_by_rotations",
     "relocate_BZ_grid_address",
 ]
 
@@ -139,6 +149,154 @@ def get_grid_point_from_address(
         return None
 
 
+def get_grid_points_from_addresses(
+    grid_address: ArrayLike[np.intc],
+    mesh: ArrayLike[np.intc],
+) -> np.ndarray | None:
+    """Return grid point indices of many grid addresses at once.
+
+    Array version of :func:`get_grid_point_from_address`.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    grid_address : array_like
+        dtype='intc', shape=(n, 3)
+    mesh : array_like
+        dtype='intc', shape=(3,)
+
+    Returns
+    -------
+    grid_points : ndarray
+        dtype='uintp', shape=(n,)
+
+    """
+    _set_no_error()
+
+    try:
+        return _spglib.grid_points_from_addresses(
+            np.array(grid_address, dtype="intc", order="C"),
+            np.array(mesh, dtype="intc"),
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
+def get_grid_points_from_double_addresses(
+    address_double: ArrayLike[np.intc],
+    mesh: ArrayLike[np.intc],
+) -> np.ndarray | None:
+    """Return grid point indices of many grid addresses in the double mesh.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    address_double : array_like
+        Grid addresses in the double mesh, ``grid_address * 2 + is_shift``.
+        dtype='intc', shape=(n, 3)
+    mesh : array_like
+        dtype='intc', shape=(3,)
+
+    Returns
+    -------
+    grid_points : ndarray
+        dtype='uintp', shape=(n,)
+
+    """
+    _set_no_error()
+
+    try:
+        return _spglib.grid_points_from_double_addresses(
+            np.array(address_double, dtype="intc", order="C"),
+            np.array(mesh, dtype="intc"),
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
+def get_double_grid_addresses(
+    grid_address: ArrayLike[np.intc],
+    mesh: ArrayLike[np.intc],
+    is_shift: ArrayLike[np.intc] | None = None,
+) -> np.ndarray | None:
+    """Return grid addresses in the double mesh of many grid addresses at once.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    grid_address : array_like
+        dtype='intc', shape=(n, 3)
+    mesh : array_like
+        dtype='intc', shape=(3,)
+    is_shift : array_like, optional
+        [0, 0, 0] gives Gamma center mesh and value 1 gives half mesh shift.
+        Default is None which equals to [0, 0, 0].
+        dtype='intc', shape=(3,)
+
+    Returns
+    -------
+    address_double : ndarray
+        ``grid_address * 2 + is_shift`` reduced into the double mesh.
+        dtype='intc', shape=(n, 3)
+
+    """
+    _set_no_error()
+
+    if is_shift is None:
+        is_shift = [0, 0, 0]
+    try:
+        return _spglib.double_grid_addresses(
+            np.array(grid_address, dtype="intc", order="C"),
+            np.array(mesh, dtype="intc"),
+            np.array(is_shift, dtype="intc"),
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
+def get_grid_addresses_from_grid_points(
+    grid_points: ArrayLike[np.uintp],
+    mesh: ArrayLike[np.intc],
+) -> np.ndarray | None:
+    """Return grid addresses of many grid point indices at once.
+
+    Inverse of :func:`get_grid_points_from_addresses`, where the grid addresses
+    are given in the same way as ``grid_address`` of
+    :func:`spglib.kpoints.get_ir_reciprocal_mesh`.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    grid_points : array_like
+        dtype='uintp', shape=(n,)
+    mesh : array_like
+        dtype='intc', shape=(3,)
+
+    Returns
+    -------
+    grid_address : ndarray
+        dtype='intc', shape=(n, 3)
+
+    """
+    _set_no_error()
+
+    try:
+        return _spglib.grid_addresses_from_grid_points(
+            np.array(grid_points, dtype="uintp"),
+            np.array(mesh, dtype="intc"),
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
 def get_stabilized_reciprocal_mesh(
     mesh: ArrayLike[np.intc],
     rotations: ArrayLike[np.intc],
@@ -216,6 +374,74 @@ def get_stabilized_reciprocal_mesh(
     return mapping_table, grid_address
 
 
+def iter_stabilized_reciprocal_mesh(
+    mesh: ArrayLike[np.intc],
+    rotations: ArrayLike[np.intc],
+    is_shift: ArrayLike[np.intc] | None = None,
+    is_time_reversal: bool = True,
+    qpoints: ArrayLike[np.double] | None = None,
+    chunk_size: int = 1,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Iterate over the k-point map to the irreducible k-points by chunks.
+
+    Chunks of ``grid_mapping_table`` of :func:`get_stabilized_reciprocal_mesh`
+    with ``is_dense=True`` are yielded in the order of the grid points. See
+    :func:`spglib.kpoints.iter_ir_reciprocal_mesh`.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    mesh : array_like
+        Uniform sampling mesh numbers.
+        dtype='intc', shape=(3,)
+    rotations : array_like
+        Rotation matrices with respect to real space basis vectors.
+        dtype='intc', shape=(rotations, 3)
+    is_shift : array_like
+        [0, 0, 0] gives Gamma center mesh and value 1 gives  half mesh shift.
+        dtype='intc', shape=(3,)
+    is_time_reversal : bool
+        Time reversal symmetry is included or not.
+    qpoints : array_like
+        q-points used as stabilizer(s) given in reciprocal space with respect
+        to reciprocal basis vectors.
+        dtype='double', shape=(qpoints ,3) or (3,)
+    chunk_size : int, optional
+        Number of slabs of ``mesh[0] * mesh[1]`` grid points in each chunk.
+        Default is 1.
+
+    Yields
+    ------
+    grid_points : ndarray
+        Grid point indices of the chunk.
+        dtype='uintp', shape=(num_grid_points,)
+    ir_grid_points : ndarray
+        Irreducible grid points which the grid points are mapped to.
+        dtype='uintp', shape=(num_grid_points,)
+
+    Raises
+    ------
+    ValueError
+        If ``chunk_size`` is not positive.
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    _set_no_error()
+
+    if qpoints is None:
+        qpoints = np.array([[0, 0, 0]], dtype="double", order="C")
+    else:
+        qpoints = np.array(qpoints, dtype="double", order="C")
+        if qpoints.shape == (3,):
+            qpoints = np.array([qpoints], dtype="double", order="C")
+
+    yield from _iter_ir_mapping_table(
+        mesh, rotations, is_shift, is_time_reversal, qpoints, chunk_size
+    )
+
+
 def get_grid_points_by_rotations(
     address_orig: ArrayLike[np.intc],
     reciprocal_rotations: ArrayLike[np.intc],
@@ -347,6 +573,139 @@ def get_BZ_grid_points_by_rotations(
         return np.array(rot_grid_points, dtype="intc")
 
 
+def get_grid_point_table_by_rotations(
+    grid_address: ArrayLike[np.intc] | None,
+    reciprocal_rotations: ArrayLike[np.intc],
+    mesh: ArrayLike[np.intc],
+    is_shift: ArrayLike[np.intc] | None = None,
+    num_threads: int = 1,
+) -> np.ndarray | None:
+    """Return grid points obtained after rotating many grid addresses at once.
+
+    Array version of :func:`get_grid_points_by_rotations`.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    grid_address : array_like or None
+        Grid addresses to be rotated. With None, the grid addresses of all the
+        grid points of the mesh are rotated in the order of the grid points.
+        dtype='intc', shape=(n_points, 3)
+    reciprocal_rotations : array_like
+        Rotation matrices {R} with respect to reciprocal basis vectors.
+        Defined by q'=Rq.
+        dtype='intc', shape=(rotations, 3, 3)
+    mesh : array_like
+        dtype='intc', shape=(3,)
+    is_shift : array_like, optional
+        With (1) or without (0) half grid shifts with respect to grid intervals
+        sampled along reciprocal basis vectors. Default is None, which
+        gives [0, 0, 0].
+    num_threads : int, optional
+        Number of threads among which the rotations are distributed. With 0,
+        the number of hardware threads is used. Default is 1.
+
+    Returns
+    -------
+    rot_grid_points : ndarray
+        ``rot_grid_points[i, j]`` is the grid point of the grid address ``j``
+        rotated by ``reciprocal_rotations[i]``.
+        dtype='uintp', shape=(rotations, n_points)
+
+    """
+    _set_no_error()
+
+    if is_shift is None:
+        _is_shift = np.zeros(3, dtype="intc")
+    else:
+        _is_shift = np.array(is_shift, dtype="intc")
+
+    if grid_address is None:
+        _grid_address = None
+    else:
+        _grid_address = np.array(grid_address, dtype="intc", order="C")
+
+    try:
+        return _spglib.grid_point_table_by_rotations(
+            _grid_address,
+            np.array(reciprocal_rotations, dtype="intc", order="C"),
+            np.array(mesh, dtype="intc"),
+            _is_shift,
+            num_threads,
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
+def get_BZ_grid_point_table_by_rotations(
+    bz_grid_address: ArrayLike[np.intc],
+    reciprocal_rotations: ArrayLike[np.intc],
+    mesh: ArrayLike[np.intc],
+    bz_map: ArrayLike[np.uintp],
+    is_shift: ArrayLike[np.intc] | None = None,
+    num_threads: int = 1,
+) -> np.ndarray | None:
+    """Return BZ grid points obtained after rotating many grid addresses at once.
+
+    Array version of :func:`get_BZ_grid_points_by_rotations`.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    bz_grid_address : array_like
+        Grid addresses to be rotated, e.g. those returned by
+        :func:`relocate_BZ_grid_address`.
+        dtype='intc', shape=(n_points, 3)
+    reciprocal_rotations : array_like
+        Rotation matrices {R} with respect to reciprocal basis vectors.
+        Defined by q'=Rq.
+        dtype='intc', shape=(rotations, 3, 3)
+    mesh : array_like
+        dtype='intc', shape=(3,)
+    bz_map : array_like
+        Map from the grid points of the doubled mesh to the BZ grid points
+        returned by :func:`relocate_BZ_grid_address`.
+        dtype='uintp', shape=(prod(mesh * 2),)
+    is_shift : array_like, optional
+        With (1) or without (0) half grid shifts with respect to grid intervals
+        sampled along reciprocal basis vectors. Default is None, which
+        gives [0, 0, 0].
+    num_threads : int, optional
+        Number of threads among which the rotations are distributed. With 0,
+        the number of hardware threads is used. Default is 1.
+
+    Returns
+    -------
+    rot_grid_points : ndarray
+        ``rot_grid_points[i, j]`` is the BZ grid point of the grid address
+        ``j`` rotated by ``reciprocal_rotations[i]``.
+        dtype='uintp', shape=(rotations, n_points)
+
+    """
+    _set_no_error()
+
+    if is_shift is None:
+        _is_shift = np.zeros(3, dtype="intc")
+    else:
+        _is_shift = np.array(is_shift, dtype="intc")
+
+    try:
+        return _spglib.BZ_grid_point_table_by_rotations(
+            np.array(bz_grid_address, dtype="intc", order="C"),
+            np.array(reciprocal_rotations, dtype="intc", order="C"),
+            np.array(mesh, dtype="intc"),
+            _is_shift,
+            np.ascontiguousarray(bz_map, dtype="uintp"),
+            num_threads,
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
 def relocate_BZ_grid_address(
     grid_address: ArrayLike[np.intc],
     mesh: ArrayLike[np.intc],
@@ -14,6 +14,11 @@ def version_tuple() -> tuple[int, int, int]: ...
 def version_string() -> str: ...
 def version_full() -> str: ...
 def commit() -> str: ...
+
+class Dataset:
+    def field(self, name: str) -> typing.Any: ...
+    def fields(self, names: list[str]) -> dict[str, typing.Any]: ...
+
 def dataset(
     lattice: np.ndarray,
     positions: np.ndarray,
@@ -21,7 +26,17 @@ def dataset(
     hall_number: int,
     symprec: float,
     angle_tolerance: float,
-) -> dict[str, typing.Any] | None: ...
+) -> Dataset: ...
+def datasets(
+    lattices: np.ndarray,
+    positions: np.ndarray,
+    atom_types: np.ndarray,
+    offsets: np.ndarray,
+    hall_number: int,
+    symprec: float,
+    angle_tolerance: float,
+    num_threads: int,
+) -> list[Dataset | str]: ...
 def layer_dataset(
     lattice: np.ndarray,
     positions: np.ndarray,
@@ -39,7 +54,20 @@ def magnetic_dataset(
     symprec: float,
     angle_tolerance: float,
     mag_symprec: float,
+    with_permutations: bool = False,
 ) -> dict[str, typing.Any] | None: ...
+def magnetic_datasets(
+    lattice: np.ndarray,
+    positions: np.ndarray,
+    atom_types: np.ndarray,
+    magmoms: np.ndarray,
+    tensor_rank: int,
+    is_axial: bool,
+    symprec: float,
+    angle_tolerance: float,
+    mag_symprec: float,
+    with_permutations: bool = False,
+) -> list[dict[str, typing.Any] | str]: ...
 def spacegroup_type(hall_number: int) -> dict[str, typing.Any] | None: ...
 def spacegroup_type_from_symmetry(
     rotations: np.ndarray, translations: np.ndarray, lattice: np.ndarray, symprec: float
@@ -52,6 +80,36 @@ def magnetic_spacegroup_type_from_symmetry(
     lattice: np.ndarray,
     symprec: float,
 ) -> dict[str, typing.Any] | None: ...
+def rotated_positions(
+    rotations: np.ndarray, translations: np.ndarray, positions: np.ndarray
+) -> np.ndarray: ...
+def symmetry_permutations(
+    rotations: np.ndarray,
+    translations: np.ndarray,
+    lattice: np.ndarray,
+    positions: np.ndarray,
+    atom_types: np.ndarray,
+    symprec: float,
+) -> np.ndarray: ...
+def symmetrize_vectors(
+    vectors: np.ndarray,
+    rotations: np.ndarray,
+    lattice: np.ndarray,
+    permutations: np.ndarray | None = None,
+) -> np.ndarray: ...
+def symmetrize_tensors(
+    tensors: np.ndarray,
+    rotations: np.ndarray,
+    lattice: np.ndarray,
+    permutations: np.ndarray | None = None,
+) -> np.ndarray: ...
+def inequivalent_configurations(
+    configurations: np.ndarray,
+    multiplicities: np.ndarray,
+    cursor: np.ndarray,
+    permutations: np.ndarray,
+    num_values: int,
+) -> int: ...
 def symmetry_from_database(
     rotations: np.ndarray,
     translations: np.ndarray,
@@ -69,20 +127,18 @@ def standardize_cell(
     lattice: np.ndarray,
     positions: np.ndarray,
     atom_types: np.ndarray,
-    num_atom: int,
     to_primitive: int,
     no_idealize: int,
     symprec: float,
     angle_tolerance: float,
-) -> int | None: ...
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]: ...
 def refine_cell(
     lattice: np.ndarray,
     positions: np.ndarray,
     atom_types: np.ndarray,
-    num_atom: int,
     symprec: float,
     angle_tolerance: float,
-) -> int | None: ...
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]: ...
 def symmetry(
     rotations: np.ndarray,
     translations: np.ndarray,
@@ -92,6 +148,16 @@ def symmetry(
     symprec: float,
     angle_tolerance: float,
 ) -> int | None: ...
+def symmetry_with_equivalent_atoms(
+    rotations: np.ndarray,
+    translations: np.ndarray,
+    equiv_atoms: np.ndarray,
+    lattice: np.ndarray,
+    positions: np.ndarray,
+    atom_types: np.ndarray,
+    symprec: float,
+    angle_tolerance: float,
+) -> int | None: ...
 @deprecated("Not used")
 def symmetry_with_collinear_spin(
     rotations: np.ndarray,
@@ -105,11 +171,6 @@ def symmetry_with_collinear_spin(
     angle_tolerance: float,
 ) -> int | None: ...
 def symmetry_with_site_tensors(
-    rotations: np.ndarray,
-    translations: np.ndarray,
-    equiv_atoms: np.ndarray,
-    primitive_lattice: np.ndarray,
-    spin_flips: np.ndarray,
     lattice: np.ndarray,
     positions: np.ndarray,
     atom_types: np.ndarray,
@@ -119,7 +180,7 @@ def symmetry_with_site_tensors(
     symprec: float,
     angle_tolerance: float,
     mag_symprec: float,
-) -> int | None: ...
+) -> dict[str, np.ndarray]: ...
 def primitive(
     lattice: np.ndarray,
     positions: np.ndarray,
@@ -131,6 +192,23 @@ def grid_point_from_address(
     grid_address: np.ndarray,
     mesh: np.ndarray,
 ) -> int | None: ...
+def grid_points_from_addresses(
+    grid_address: np.ndarray,
+    mesh: np.ndarray,
+) -> np.ndarray: ...
+def grid_points_from_double_addresses(
+    address_double: np.ndarray,
+    mesh: np.ndarray,
+) -> np.ndarray: ...
+def double_grid_addresses(
+    grid_address: np.ndarray,
+    mesh: np.ndarray,
+    is_shift: np.ndarray,
+) -> np.ndarray: ...
+def grid_addresses_from_grid_points(
+    grid_points: np.ndarray,
+    mesh: np.ndarray,
+) -> np.ndarray: ...
 def ir_reciprocal_mesh(
     grid_address: np.ndarray,
     grid_mapping_table: np.ndarray,
@@ -141,7 +219,37 @@ def ir_reciprocal_mesh(
     positions: np.ndarray,
     atom_types: np.ndarray,
     symprec: float,
+    num_threads: int = 1,
 ) -> int | None: ...
+def ir_grid_points(
+    mesh: np.ndarray,
+    is_shift: np.ndarray,
+    is_time_reversal: int,
+    with_star: int,
+    lattice: np.ndarray,
+    positions: np.ndarray,
+    atom_types: np.ndarray,
+    symprec: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]: ...
+def reciprocal_point_group(
+    rotations: np.ndarray,
+    is_time_reversal: int,
+    qpoints: np.ndarray,
+    symprec: float,
+) -> np.ndarray: ...
+def ir_reciprocal_mesh_from_point_group(
+    grid_address: np.ndarray,
+    ir_mapping_table: np.ndarray,
+    mesh: np.ndarray,
+    is_shift: np.ndarray,
+    rot_reciprocal: np.ndarray,
+) -> int: ...
+def ir_grid_points_from_point_group(
+    mesh: np.ndarray,
+    is_shift: np.ndarray,
+    rot_reciprocal: np.ndarray,
+    with_star: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray | None]: ...
 def stabilized_reciprocal_mesh(
     grid_address: np.ndarray,
     grid_mapping_table: np.ndarray,
@@ -151,6 +259,15 @@ def stabilized_reciprocal_mesh(
     rotations: np.ndarray,
     qpoints: np.ndarray,
 ) -> int | None: ...
+def ir_mapping_table_range(
+    ir_mapping_table: np.ndarray,
+    start: int,
+    mesh: np.ndarray,
+    is_shift: np.ndarray,
+    is_time_reversal: int,
+    rotations: np.ndarray,
+    qpoints: np.ndarray,
+) -> None: ...
 def grid_points_by_rotations(
     rot_grid_points: np.ndarray,
     address_orig: np.ndarray,
@@ -166,6 +283,21 @@ def BZ_grid_points_by_rotations(
     is_shift: np.ndarray,
     bz_map: np.ndarray,
 ) -> None: ...
+def grid_point_table_by_rotations(
+    grid_address: np.ndarray | None,
+    rot_reciprocal: np.ndarray,
+    mesh: np.ndarray,
+    is_shift: np.ndarray,
+    num_threads: int = 1,
+) -> np.ndarray: ...
+def BZ_grid_point_table_by_rotations(
+    bz_grid_address: np.ndarray,
+    rot_reciprocal: np.ndarray,
+    mesh: np.ndarray,
+    is_shift: np.ndarray,
+    bz_map: np.ndarray,
+    num_threads: int = 1,
+) -> np.ndarray: ...
 def BZ_grid_address(
     bz_grid_address: np.ndarray,
     bz_map: np.ndarray,
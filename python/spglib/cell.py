@@ -56,20 +56,13 @@ def standardize_cell(
     """
     _set_no_error()
 
-    lattice, _positions, _numbers, _ = _expand_cell(cell)
-
-    # Atomic positions have to be specified by scaled positions for spglib.
-    num_atom = len(_positions)
-    positions = np.zeros((num_atom * 4, 3), dtype="double", order="C")
-    positions[:num_atom] = _positions
-    numbers = np.zeros(num_atom * 4, dtype="intc")
-    numbers[:num_atom] = _numbers
+    lattice, positions, numbers, _ = _expand_cell(cell)
+
     try:
-        num_atom_std = _spglib.standardize_cell(
+        std_lattice, std_positions, std_numbers = _spglib.standardize_cell(
             lattice,
             positions,
             numbers,
-            num_atom,
             int(to_primitive * 1),
             int(no_idealize * 1),
             float(symprec),
@@ -79,9 +72,9 @@ def standardize_cell(
         _set_or_throw_error(exc)
         return None
     return (
-        np.array(lattice.T, dtype="double", order="C"),
-        np.array(positions[:num_atom_std], dtype="double", order="C"),
-        np.array(numbers[:num_atom_std], dtype="intc"),
+        np.array(std_lattice.T, dtype="double", order="C"),
+        std_positions,
+        std_numbers,
     )
 
 
@@ -105,20 +98,13 @@ def refine_cell(
     """
     _set_no_error()
 
-    lattice, _positions, _numbers, _ = _expand_cell(cell)
+    lattice, positions, numbers, _ = _expand_cell(cell)
 
-    # Atomic positions have to be specified by scaled positions for spglib.
-    num_atom = len(_positions)
-    positions = np.zeros((num_atom * 4, 3), dtype="double", order="C")
-    positions[:num_atom] = _positions
-    numbers = np.zeros(num_atom * 4, dtype="intc")
-    numbers[:num_atom] = _numbers
     try:
-        num_atom_std = _spglib.refine_cell(
+        std_lattice, std_positions, std_numbers = _spglib.refine_cell(
             lattice,
             positions,
             numbers,
-            num_atom,
             float(symprec),
             float(angle_tolerance),
         )
@@ -126,9 +112,9 @@ def refine_cell(
         _set_or_throw_error(exc)
         return None
     return (
-        np.array(lattice.T, dtype="double", order="C"),
-        np.array(positions[:num_atom_std], dtype="double", order="C"),
-        np.array(numbers[:num_atom_std], dtype="intc"),
+        np.array(std_lattice.T, dtype="double", order="C"),
+        std_positions,
+        std_numbers,
     )
 
 
@@ -5,15 +5,22 @@
 
 from __future__ import annotations
 
+import dataclasses
+from collections.abc import Iterator
+
 import numpy as np
-from numpy.typing import ArrayLike
+from numpy.typing import ArrayLike, NDArray
 
 from . import _spglib
 from .error import _set_no_error, _set_or_throw_error
+from .spg import SpglibDataset, get_symmetry
 from .utils import Cell, _expand_cell
 
 __all__ = [
+    "ReciprocalSymmetry",
+    "get_ir_grid_points",
     "get_ir_reciprocal_mesh",
+    "iter_ir_reciprocal_mesh",
 ]
 
 
@@ -24,6 +31,7 @@ def get_ir_reciprocal_mesh(
     is_time_reversal: bool = True,
     symprec: float = 1e-5,
     is_dense: bool = False,
+    num_threads: int = 1,
 ) -> tuple[np.ndarray, np.ndarray]:
     """Return k-points mesh and k-point map to the irreducible k-points.
 
@@ -47,6 +55,12 @@ def get_ir_reciprocal_mesh(
     is_dense : bool, optional
         grid_mapping_table is returned with dtype='uintp' if True. Otherwise
         its dtype='intc'. Default is False.
+    num_threads : int, optional
+        Number of threads used. With ``0`` the number of hardware threads is
+        used. The result doesn't depend on the number of threads. Default is
+        1.
+
+        .. versionadded:: 2.8.0
 
     Returns
     -------
@@ -83,8 +97,400 @@ def get_ir_reciprocal_mesh(
             positions,
             numbers,
             float(symprec),
+            int(num_threads),
         )
     except Exception as exc:
         _set_or_throw_error(exc)
         return None
     return grid_mapping_table, grid_address
+
+
+def get_ir_grid_points(
+    mesh: ArrayLike[np.intc],
+    cell: Cell,
+    is_shift: ArrayLike[np.intc] | None = None,
+    is_time_reversal: bool = True,
+    symprec: float = 1e-5,
+    with_star: bool = False,
+) -> tuple[np.ndarray, ...] | None:
+    """Return irreducible k-points of a mesh and their weights.
+
+    The irreducible k-points are the same as those that ``grid_mapping_table``
+    of :func:`get_ir_reciprocal_mesh` points to, but arrays of the size of the
+    mesh are not allocated unless ``with_star`` is True. The returned arrays
+    are read-only views of the memory of the C library.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    mesh : array_like
+        Uniform sampling mesh numbers.
+        dtype='intc', shape=(3,)
+    cell : spglib cell tuple
+        Crystal structure.
+    is_shift : array_like, optional
+        [0, 0, 0] gives Gamma center mesh and value 1 gives half mesh shift.
+        Default is None which equals to [0, 0, 0].
+        dtype='intc', shape=(3,)
+    is_time_reversal : bool, optional
+        Whether time reversal symmetry is included or not. Default is True.
+    symprec : float, optional
+        Symmetry tolerance in distance. Default is 1e-5.
+    with_star : bool, optional
+        Whether the star of each irreducible k-point is returned. Default is
+        False.
+
+    Returns
+    -------
+    ir_grid_address : ndarray
+        Addresses of the irreducible grid points in ascending order of their
+        grid point indices.
+        dtype='intc', shape=(num_ir, 3)
+    weights : ndarray
+        Number of grid points in the star of each irreducible grid point.
+        dtype='intc', shape=(num_ir,)
+    star_address : ndarray
+        Only returned if ``with_star`` is True. Addresses of the stars of the
+        irreducible grid points one after another, i.e., the star of the i-th
+        irreducible grid point is
+        ``np.split(star_address, np.cumsum(weights)[:-1])[i]``, whose first
+        element is the irreducible grid point itself.
+        dtype='intc', shape=(prod(mesh), 3)
+
+    """
+    _set_no_error()
+
+    lattice, positions, numbers, _ = _expand_cell(cell)
+
+    if is_shift is None:
+        is_shift = [0, 0, 0]
+    try:
+        ir_grid_address, weights, star_address = _spglib.ir_grid_points(
+            np.array(mesh, dtype="intc"),
+            np.array(is_shift, dtype="intc"),
+            int(is_time_reversal * 1),
+            int(with_star * 1),
+            lattice,
+            positions,
+            numbers,
+            float(symprec),
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+    if with_star:
+        return ir_grid_address, weights, star_address
+    return ir_grid_address, weights
+
+
+def iter_ir_reciprocal_mesh(
+    mesh: ArrayLike[np.intc],
+    cell: Cell,
+    is_shift: ArrayLike[np.intc] | None = None,
+    is_time_reversal: bool = True,
+    symprec: float = 1e-5,
+    chunk_size: int = 1,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Iterate over the k-point map to the irreducible k-points by chunks.
+
+    Chunks of ``grid_mapping_table`` of :func:`get_ir_reciprocal_mesh` with
+    ``is_dense=True`` are yielded in the order of the grid points, so that
+    memory is bounded by the chunk size instead of the size of the mesh.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    mesh : array_like
+        Uniform sampling mesh numbers.
+        dtype='intc', shape=(3,)
+    cell : spglib cell tuple
+        Crystal structure.
+    is_shift : array_like, optional
+        [0, 0, 0] gives Gamma center mesh and value 1 gives half mesh shift.
+        Default is None which equals to [0, 0, 0].
+        dtype='intc', shape=(3,)
+    is_time_reversal : bool, optional
+        Whether time reversal symmetry is included or not. Default is True.
+    symprec : float, optional
+        Symmetry tolerance in distance. Default is 1e-5.
+    chunk_size : int, optional
+        Number of slabs of ``mesh[0] * mesh[1]`` grid points, i.e., grid
+        points sharing the third element of the address, in each chunk.
+        Default is 1.
+
+    Yields
+    ------
+    grid_points : ndarray
+        Grid point indices of the chunk.
+        dtype='uintp', shape=(num_grid_points,)
+    ir_grid_points : ndarray
+        Irreducible grid points which the grid points are mapped to.
+        dtype='uintp', shape=(num_grid_points,)
+
+    Nothing is yielded when the symmetry search failed.
+
+    Raises
+    ------
+    ValueError
+        If ``chunk_size`` is not positive.
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    symmetry = get_symmetry(cell, symprec=symprec)
+    if symmetry is None:
+        return
+    yield from _iter_ir_mapping_table(
+        mesh,
+        symmetry["rotations"],
+        is_shift,
+        is_time_reversal,
+        np.zeros((1, 3), dtype="double"),
+        chunk_size,
+    )
+
+
+def _iter_ir_mapping_table(
+    mesh: ArrayLike[np.intc],
+    rotations: ArrayLike[np.intc],
+    is_shift: ArrayLike[np.intc] | None,
+    is_time_reversal: bool,
+    qpoints: np.ndarray,
+    chunk_size: int,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    mesh = np.array(mesh, dtype="intc")
+    if is_shift is None:
+        is_shift = [0, 0, 0]
+    is_shift = np.array(is_shift, dtype="intc")
+    rotations = np.array(rotations, dtype="intc", order="C")
+    num_gp = int(np.prod(mesh, dtype="int64"))
+    num_gp_per_chunk = int(mesh[0]) * int(mesh[1]) * chunk_size
+    for start in range(0, num_gp, num_gp_per_chunk):
+        stop = min(start + num_gp_per_chunk, num_gp)
+        ir_grid_points = np.empty(stop - start, dtype="uintp")
+        try:
+            _spglib.ir_mapping_table_range(
+                ir_grid_points,
+                start,
+                mesh,
+                is_shift,
+                int(is_time_reversal * 1),
+                rotations,
+                qpoints,
+            )
+        except Exception as exc:
+            _set_or_throw_error(exc)
+            return
+        yield np.arange(start, stop, dtype="uintp"), ir_grid_points
+
+
+@dataclasses.dataclass(eq=False, frozen=True)
+class ReciprocalSymmetry:
+    """Point group in reciprocal space reused to reduce many meshes.
+
+    The crystal symmetry is searched once when the object is created, and
+    :meth:`get_ir_reciprocal_mesh` and :meth:`get_ir_grid_points` only reduce
+    the mesh by :attr:`reciprocal_rotations`, e.g., in a convergence study
+    with respect to the mesh. Create it with :meth:`from_cell`,
+    :meth:`from_dataset` or :meth:`from_rotations`.
+
+    .. versionadded:: 2.8.0
+    """
+
+    reciprocal_rotations: NDArray[np.intc]
+    """Rotation matrices of the point group with respect to reciprocal basis
+    vectors, including the time reversal and restricted to the stabilizers of
+    :attr:`qpoints`. Defined by q'=Rq.
+
+    shape=(n_rotations, 3, 3), order='C', dtype='intc'
+    """
+    is_time_reversal: bool
+    """Whether the time reversal symmetry is included."""
+    qpoints: NDArray[np.double] | None
+    """k-points whose stabilizers are kept, or None."""
+
+    @classmethod
+    def from_rotations(
+        cls,
+        rotations: ArrayLike[np.intc],
+        is_time_reversal: bool = True,
+        qpoints: ArrayLike[np.double] | None = None,
+        qpoint_tolerance: float = 1e-5,
+    ) -> ReciprocalSymmetry | None:
+        """Create from the rotation parts of symmetry operations.
+
+        Parameters
+        ----------
+        rotations : array_like
+            Rotation matrices of the symmetry operations in real space.
+            Duplicates, e.g., from centring translations, are ignored.
+            dtype='intc', shape=(n_operations, 3, 3)
+        is_time_reversal : bool, optional
+            Whether time reversal symmetry is included or not. Default is True.
+        qpoints : array_like, optional
+            Only the stabilizers of these k-points in reduced coordinates are
+            kept as in :func:`get_stabilized_reciprocal_mesh`. Default is None.
+            dtype='double', shape=(n_qpoints, 3) or (3,)
+        qpoint_tolerance : float, optional
+            Tolerance of the stabilizers of ``qpoints``. Default is 1e-5.
+
+        """
+        _set_no_error()
+
+        if qpoints is None:
+            _qpoints = np.zeros((0, 3), dtype="double")
+        else:
+            _qpoints = np.array(qpoints, dtype="double", order="C")
+            if _qpoints.shape == (3,):
+                _qpoints = np.array([_qpoints], dtype="double", order="C")
+        try:
+            reciprocal_rotations = _spglib.reciprocal_point_group(
+                np.array(rotations, dtype="intc", order="C"),
+                int(is_time_reversal * 1),
+                _qpoints,
+                float(qpoint_tolerance),
+            )
+        except Exception as exc:
+            _set_or_throw_error(exc)
+            return None
+        reciprocal_rotations.flags.writeable = False
+        if qpoints is None:
+            _qpoints = None
+        else:
+            _qpoints.flags.writeable = False
+        return cls(
+            reciprocal_rotations=reciprocal_rotations,
+            is_time_reversal=bool(is_time_reversal),
+            qpoints=_qpoints,
+        )
+
+    @classmethod
+    def from_dataset(
+        cls,
+        dataset: SpglibDataset,
+        is_time_reversal: bool = True,
+        qpoints: ArrayLike[np.double] | None = None,
+        qpoint_tolerance: float = 1e-5,
+    ) -> ReciprocalSymmetry | None:
+        """Create from the symmetry operations of a dataset.
+
+        See :meth:`from_rotations` for the parameters.
+        """
+        return cls.from_rotations(
+            dataset.rotations,
+            is_time_reversal=is_time_reversal,
+            qpoints=qpoints,
+            qpoint_tolerance=qpoint_tolerance,
+        )
+
+    @classmethod
+    def from_cell(
+        cls,
+        cell: Cell,
+        symprec: float = 1e-5,
+        is_time_reversal: bool = True,
+        qpoints: ArrayLike[np.double] | None = None,
+        qpoint_tolerance: float = 1e-5,
+    ) -> ReciprocalSymmetry | None:
+        """Create from the symmetry searched from a crystal structure.
+
+        ``symprec`` is the symmetry tolerance in distance as in
+        :func:`get_symmetry`. See :meth:`from_rotations` for the other
+        parameters.
+        """
+        symmetry = get_symmetry(cell, symprec=symprec)
+        if symmetry is None:
+            return None
+        return cls.from_rotations(
+            symmetry["rotations"],
+            is_time_reversal=is_time_reversal,
+            qpoints=qpoints,
+            qpoint_tolerance=qpoint_tolerance,
+        )
+
+    def get_ir_reciprocal_mesh(
+        self,
+        mesh: ArrayLike[np.intc],
+        is_shift: ArrayLike[np.intc] | None = None,
+        is_dense: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray] | None:
+        """Return k-points mesh and k-point map to the irreducible k-points.
+
+        Same as :func:`get_ir_reciprocal_mesh` without searching the symmetry.
+
+        Parameters
+        ----------
+        mesh : array_like
+            Uniform sampling mesh numbers.
+            dtype='intc', shape=(3,)
+        is_shift : array_like, optional
+            [0, 0, 0] gives Gamma center mesh and value 1 gives half mesh
+            shift. Default is None which equals to [0, 0, 0].
+            dtype='intc', shape=(3,)
+        is_dense : bool, optional
+            grid_mapping_table is returned with dtype='uintp' if True.
+            Otherwise its dtype='intc'. Default is False.
+
+        Returns
+        -------
+        grid_mapping_table : ndarray
+            Grid point mapping table to ir-gird-points.
+            dtype='intc' or 'uintp', shape=(prod(mesh),)
+        grid_address : ndarray
+            Address of all grid points.
+            dtype='intc', shape=(prod(mesh), 3)
+
+        """
+        _set_no_error()
+
+        grid_mapping_table = np.zeros(np.prod(mesh), dtype="uintp")
+        grid_address = np.zeros((np.prod(mesh), 3), dtype="intc")
+        if is_shift is None:
+            is_shift = [0, 0, 0]
+        try:
+            _spglib.ir_reciprocal_mesh_from_point_group(
+                grid_address,
+                grid_mapping_table,
+                np.array(mesh, dtype="intc"),
+                np.array(is_shift, dtype="intc"),
+                self.reciprocal_rotations,
+            )
+        except Exception as exc:
+            _set_or_throw_error(exc)
+            return None
+        if is_dense:
+            return grid_mapping_table, grid_address
+        return np.array(grid_mapping_table, dtype="intc"), grid_address
+
+    def get_ir_grid_points(
+        self,
+        mesh: ArrayLike[np.intc],
+        is_shift: ArrayLike[np.intc] | None = None,
+        with_star: bool = False,
+    ) -> tuple[np.ndarray, ...] | None:
+        """Return irreducible k-points of a mesh and their weights.
+
+        Same as :func:`get_ir_grid_points` without searching the symmetry.
+        See there for the parameters and the returned arrays.
+        """
+        _set_no_error()
+
+        if is_shift is None:
+            is_shift = [0, 0, 0]
+        try:
+            ir_grid_address, weights, star_address = (
+                _spglib.ir_grid_points_from_point_group(
+                    np.array(mesh, dtype="intc"),
+                    np.array(is_shift, dtype="intc"),
+                    self.reciprocal_rotations,
+                    int(with_star * 1),
+                )
+            )
+        except Exception as exc:
+            _set_or_throw_error(exc)
+            return None
+        if with_star:
+            return ir_grid_address, weights, star_address
+        return ir_grid_address, weights
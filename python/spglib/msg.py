@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import dataclasses
+from collections.abc import Iterator
 from typing import Any
 
 import numpy as np
@@ -13,7 +14,8 @@ from numpy.typing import ArrayLike, NDArray
 
 from . import _spglib
 from ._compat.typing import TypeAlias
-from .error import _set_no_error, _set_or_throw_error
+from .error import SpglibError, _set_no_error, _set_or_throw_error
+from .spg import SpgCell, get_symmetry, get_symmetry_permutations
 from .utils import DictInterface, Lattice, Magmoms, Numbers, Positions, _expand_cell
 
 __all__ = [
@@ -24,7 +26,9 @@ __all__ = [
     "get_magnetic_spacegroup_type_from_symmetry",
     "get_magnetic_symmetry",
     "get_magnetic_symmetry_dataset",
+    "get_magnetic_symmetry_datasets",
     "get_magnetic_symmetry_from_database",
+    "iter_magnetic_configurations",
 ]
 
 MsgCell: TypeAlias = tuple[Lattice, Positions, Numbers, Magmoms]
@@ -144,6 +148,15 @@ class SpglibMagneticDataset(DictInterface):
 
     shape: (3, 3)
     """
+    permutations: NDArray[np.intc] | None = None
+    """Index of the atom onto which each operation maps each atom, as found in the
+    symmetry search. Only given when ``with_permutations=True``. The array is
+    read-only as :attr:`SpglibDataset.permutations`.
+
+    shape: (n_operations, n_atoms)
+
+    .. versionadded:: 2.8.0
+    """
 
 
 @dataclasses.dataclass(eq=True, frozen=True)
@@ -275,18 +288,6 @@ def get_magnetic_symmetry(
     if magmoms is None:
         raise TypeError("Specify magnetic moments in cell.")
 
-    max_size = len(positions) * 96
-    rotations = np.zeros((max_size, 3, 3), dtype="intc", order="C")
-    translations = np.zeros((max_size, 3), dtype="double", order="C")
-    equivalent_atoms = np.zeros(len(magmoms), dtype="intc")
-    primitive_lattice = np.zeros((3, 3), dtype="double", order="C")
-    # (magmoms.ndim - 1) has to be equal to the rank of physical
-    # tensors, e.g., ndim=1 for collinear, ndim=2 for non-collinear.
-    if magmoms.ndim == 1 or magmoms.ndim == 2:
-        spin_flips = np.zeros(max_size, dtype="intc")
-    else:
-        spin_flips = None
-
     # Infer is_axial value from tensor_rank to keep backward compatibility
     if is_axial is None:
         if magmoms.ndim == 1:
@@ -295,12 +296,7 @@ def get_magnetic_symmetry(
             is_axial = True  # Non-collinear spin
 
     try:
-        num_sym = _spglib.symmetry_with_site_tensors(
-            rotations,
-            translations,
-            equivalent_atoms,
-            primitive_lattice,
-            spin_flips,
+        symmetry = _spglib.symmetry_with_site_tensors(
             lattice,
             positions,
             numbers,
@@ -314,20 +310,12 @@ def get_magnetic_symmetry(
     except Exception as exc:
         _set_or_throw_error(exc, _throw)
         return None
-    spin_flips = np.array(spin_flips[:num_sym], dtype="intc", order="C")
-    # True for time reversal operation, False for ordinary operation
-    time_reversals = spin_flips == -1
-    return {
-        "rotations": np.array(rotations[:num_sym], dtype="intc", order="C"),
-        "translations": np.array(translations[:num_sym], dtype="double", order="C"),
-        "time_reversals": time_reversals,
-        "equivalent_atoms": equivalent_atoms,
-        "primitive_lattice": np.array(
-            np.transpose(primitive_lattice),
-            dtype="double",
-            order="C",
-        ),
-    }
+    symmetry["primitive_lattice"] = np.array(
+        np.transpose(symmetry["primitive_lattice"]),
+        dtype="double",
+        order="C",
+    )
+    return symmetry
 
 
 def get_magnetic_symmetry_dataset(
@@ -336,6 +324,7 @@ def get_magnetic_symmetry_dataset(
     symprec: float = 1e-5,
     angle_tolerance: float = -1.0,
     mag_symprec: float = -1.0,
+    with_permutations: bool = False,
 ) -> SpglibMagneticDataset | None:
     """Search magnetic symmetry dataset from an input cell. If it fails, return None.
 
@@ -343,6 +332,11 @@ def get_magnetic_symmetry_dataset(
     ----------
     cell, is_axial, symprec, angle_tolerance, mag_symprec:
         See :func:`get_magnetic_symmetry`.
+    with_permutations : bool
+        If True, the atom permutations found in the symmetry search are kept as
+        :attr:`SpglibMagneticDataset.permutations` at no extra cost.
+
+        .. versionadded:: 2.8.0
 
     Returns
     -------
@@ -377,6 +371,7 @@ def get_magnetic_symmetry_dataset(
             float(symprec),
             float(angle_tolerance),
             float(mag_symprec),
+            bool(with_permutations),
         )
     except Exception as exc:
         _set_or_throw_error(exc)
@@ -384,6 +379,197 @@ def get_magnetic_symmetry_dataset(
     return SpglibMagneticDataset(**spg_ds)
 
 
+def get_magnetic_symmetry_datasets(
+    cell: SpgCell,
+    magmoms: ArrayLike[np.double],
+    is_axial: bool | None = None,
+    symprec: float = 1e-5,
+    angle_tolerance: float = -1.0,
+    mag_symprec: float = -1.0,
+    with_permutations: bool = False,
+) -> list[SpglibMagneticDataset | SpglibError] | None:
+    """Search magnetic symmetry datasets of many magnetic configurations at once.
+
+    All configurations share the crystal structure ``cell``, so that its space
+    group operations and the atom permutations they induce are searched only
+    once. Each configuration then only needs to select the operations which
+    keep its magnetic moments.
+
+    Parameters
+    ----------
+    cell : tuple
+        Crystal structure given as ``(lattice, positions, numbers)``. See
+        :func:`get_symmetry`.
+    magmoms : array_like (n_configs, num_atoms) or (n_configs, num_atoms, 3)
+        Collinear or non-collinear magnetic moments of each configuration.
+    is_axial, symprec, angle_tolerance, mag_symprec:
+        See :func:`get_magnetic_symmetry`.
+    with_permutations : bool
+        See :func:`get_magnetic_symmetry_dataset`.
+
+    Returns
+    -------
+    datasets : list[:class:`SpglibMagneticDataset` | :class:`SpglibError`] | None
+        Dataset of each configuration in the order of ``magmoms``. When the
+        search fails for a configuration, its entry is the
+        :class:`SpglibError` that would have been raised for it. If the
+        crystal structure itself is invalid, return None.
+
+    Notes
+    -----
+    .. versionadded:: 2.8.0
+
+    """
+    _set_no_error()
+
+    try:
+        lattice, positions, numbers, _ = _expand_cell(cell)
+        magmoms = np.array(magmoms, dtype="double", order="C")
+        tensor_rank = magmoms.ndim - 2
+
+        # If is_axial is not specified, select collinear or non-collinear spin cases
+        if is_axial is None:
+            is_axial = tensor_rank == 1
+
+        spg_ds_list = _spglib.magnetic_datasets(
+            lattice,
+            positions,
+            numbers,
+            magmoms,
+            int(tensor_rank),
+            bool(is_axial),
+            float(symprec),
+            float(angle_tolerance),
+            float(mag_symprec),
+            bool(with_permutations),
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+    return [
+        SpglibError(spg_ds)
+        if isinstance(spg_ds, str)
+        else SpglibMagneticDataset(**spg_ds)
+        for spg_ds in spg_ds_list
+    ]
+
+
+def iter_magnetic_configurations(
+    cell: SpgCell,
+    sites: ArrayLike[np.intc] | None = None,
+    values: ArrayLike[np.double] = (1.0, -1.0),
+    symprec: float = 1e-5,
+    angle_tolerance: float = -1.0,
+    chunk_size: int = 1024,
+) -> Iterator[tuple[NDArray[np.double], NDArray[np.intc]]]:
+    """Iterate over collinear magnetic configurations inequivalent by symmetry.
+
+    Each of the magnetic ``sites`` takes one of the moments in ``values``, and
+    the configurations mapped onto each other by the space group operations of
+    ``cell`` are counted once. The smallest configuration of each orbit, where
+    moments are ordered as in ``values`` and sites as in ``sites``, is
+    yielded with the size of its orbit. Configurations are visited in this
+    order natively, and all configurations sharing a prefix which a
+    permutation of the sites maps onto a smaller one are skipped at once, so
+    that neither all the configurations nor the yielded ones are stored.
+
+    Operations mapping a magnetic site onto a non-magnetic one are ignored,
+    i.e., the configurations are inequivalent under the subgroup keeping
+    ``sites``.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    cell : tuple
+        Crystal structure given as ``(lattice, positions, numbers)``. See
+        :func:`get_symmetry`.
+    sites : array_like, optional
+        Indices of the magnetic atoms. Default is None, i.e., all atoms.
+        dtype='intc', shape=(num_sites,)
+    values : array_like, optional
+        Allowed collinear moments. Default is ``(1.0, -1.0)``.
+        dtype='double', shape=(num_values,)
+    symprec, angle_tolerance:
+        See :func:`get_symmetry`.
+    chunk_size : int, optional
+        Maximum number of configurations in each chunk. Default is 1024.
+
+    Yields
+    ------
+    magmoms : ndarray
+        Moments of the atoms of the configurations, which are zero on the
+        atoms not in ``sites``. They can be passed to
+        :func:`get_magnetic_symmetry_datasets` as they are.
+        dtype='double', shape=(num_configs, num_atoms)
+    multiplicities : ndarray
+        Number of configurations equivalent to each configuration.
+        dtype='intc', shape=(num_configs,)
+
+    Nothing is yielded when the symmetry search failed.
+
+    Raises
+    ------
+    ValueError
+        If ``chunk_size`` is not positive, or ``sites`` are not distinct
+        indices of atoms of ``cell``.
+
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    num_atoms = len(_expand_cell(cell)[1])
+    if sites is None:
+        sites = np.arange(num_atoms, dtype="intc")
+    else:
+        sites = np.array(sites, dtype="intc").reshape(-1)
+        if ((sites < 0) | (sites >= num_atoms)).any():
+            raise ValueError(
+                f"sites must be indices of atoms from 0 to {num_atoms - 1}"
+            )
+        if len(np.unique(sites)) != len(sites):
+            raise ValueError("sites must be unique")
+    values = np.array(values, dtype="double")
+
+    symmetry = get_symmetry(cell, symprec=symprec, angle_tolerance=angle_tolerance)
+    if symmetry is None:
+        return
+    permutations = get_symmetry_permutations(
+        cell, symmetry["rotations"], symmetry["translations"], symprec=symprec
+    )
+    if permutations is None:
+        return
+
+    site_indices = np.full(num_atoms, -1, dtype="intc")
+    site_indices[sites] = np.arange(len(sites), dtype="intc")
+    site_permutations = site_indices[permutations[:, sites]]
+    # Operations inducing the same permutation of the sites are counted once
+    site_permutations = np.unique(
+        site_permutations[(site_permutations >= 0).all(axis=1)], axis=0
+    )
+    site_permutations = np.array(site_permutations, dtype="intc", order="C")
+
+    cursor = np.zeros(len(sites), dtype="intc")
+    configurations = np.empty((chunk_size, len(sites)), dtype="intc")
+    multiplicities = np.empty(chunk_size, dtype="intc")
+    while True:
+        try:
+            num_configs = _spglib.inequivalent_configurations(
+                configurations,
+                multiplicities,
+                cursor,
+                site_permutations,
+                len(values),
+            )
+        except Exception as exc:
+            _set_or_throw_error(exc)
+            return
+        if num_configs == 0:
+            return
+        magmoms = np.zeros((num_configs, num_atoms), dtype="double")
+        magmoms[:, sites] = values[configurations[:num_configs]]
+        yield magmoms, multiplicities[:num_configs].copy()
+
+
 def get_magnetic_spacegroup_type(uni_number: int) -> MagneticSpaceGroupType | None:
     """Translate UNI number to magnetic space group type information.
 
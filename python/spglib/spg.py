@@ -6,7 +6,11 @@
 from __future__ import annotations
 
 import dataclasses
+import hashlib
+import threading
 import warnings
+from collections import OrderedDict
+from collections.abc import Sequence
 from typing import Any, cast
 
 import numpy as np
@@ -17,20 +21,29 @@ import spglib
 from . import _spglib
 from ._compat.typing import TypeAlias
 from ._compat.warnings import deprecated
-from .error import _set_no_error, _set_or_throw_error
+from .error import SpglibError, _set_no_error, _set_or_throw_error
 from .utils import Cell, DictInterface, Lattice, Numbers, Positions, _expand_cell
 
 __all__ = [
     "SpgCell",
     "SpglibDataset",
     "SpaceGroupType",
+    "DatasetCacheInfo",
     "get_symmetry",
     "get_symmetry_dataset",
+    "get_symmetry_datasets",
     "get_spacegroup",
     "get_spacegroup_type",
     "get_spacegroup_type_from_symmetry",
     "get_symmetry_from_database",
     "get_hall_number_from_symmetry",
+    "get_rotated_positions",
+    "get_symmetry_permutations",
+    "symmetrize_vectors",
+    "symmetrize_tensors",
+    "set_dataset_cache_size",
+    "get_dataset_cache_info",
+    "clear_dataset_cache",
 ]
 
 
@@ -48,6 +61,8 @@ class SpglibDataset(DictInterface):
     .. versionadded:: 1.9.4
         The member 'choice' is added.
     .. versionadded:: 2.5.0
+    .. versionchanged:: 2.8.0
+        The arrays are read-only views of the memory of the C library.
     """
 
     number: int
@@ -185,6 +200,76 @@ class SpglibDataset(DictInterface):
     standardized cell."""
     pointgroup: str
     """Pointgroup symbol in Hermann-Mauguin notation."""
+    permutations: NDArray[np.intc] | None = None
+    """Index of the atom onto which each operation maps each atom, i.e.,
+    ``rotations[i] @ positions[j] + translations[i]`` overlaps with
+    ``positions[permutations[i, j]]`` modulo lattice translations.
+
+    Only given when the dataset is searched with ``with_permutations=True``.
+
+    shape=(n_operations, n_atoms), order='C', dtype='intc'
+
+    .. versionadded:: 2.8.0
+    """
+
+    # Fields decoded from the native dataset on first access. The other fields
+    # are cheap and decoded when the dataset is created.
+    _lazy_fields = (
+        "wyckoffs",
+        "site_symmetry_symbols",
+        "crystallographic_orbits",
+        "std_lattice",
+        "std_positions",
+        "std_types",
+        "std_rotation_matrix",
+        "std_mapping_to_primitive",
+    )
+
+    @classmethod
+    def _from_native(
+        cls,
+        native: _spglib.Dataset,
+        permutations: NDArray[np.intc] | None = None,
+    ) -> SpglibDataset:
+        """Create a dataset whose expensive fields are decoded on first access."""
+        dataset = object.__new__(cls)
+        names = [
+            field.name
+            for field in dataclasses.fields(cls)
+            if field.name not in cls._lazy_fields and field.name != "permutations"
+        ]
+        for name, value in native.fields(names).items():
+            object.__setattr__(dataset, name, value)
+        object.__setattr__(dataset, "permutations", permutations)
+        object.__setattr__(dataset, "_native", native)
+        return dataset
+
+    def __getattr__(self, name: str) -> Any:
+        """Decode a lazy field from the native dataset on first access."""
+        # Only called for attributes not found, i.e., fields not decoded yet.
+        # Another thread may decode the same field or release the native
+        # dataset concurrently, so the instance dict is checked again.
+        native = self.__dict__.get("_native")
+        if name in self._lazy_fields:
+            if native is not None:
+                value = self.__dict__.setdefault(name, native.field(name))
+                if all(field in self.__dict__ for field in self._lazy_fields):
+                    # The native dataset is not needed any more.
+                    self.__dict__.pop("_native", None)
+                return value
+            if name in self.__dict__:
+                return self.__dict__[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Return the state with all lazy fields decoded for pickling."""
+        for name in self._lazy_fields:
+            getattr(self, name)
+        state = dict(self.__dict__)
+        state.pop("_native", None)
+        return state
 
 
 @dataclasses.dataclass(eq=True, frozen=True)
@@ -224,6 +309,99 @@ class SpaceGroupType(DictInterface):
     """Arithmetic crystal class symbol"""
 
 
+@dataclasses.dataclass(eq=True, frozen=True)
+class DatasetCacheInfo(DictInterface):
+    """Statistics of the cache of :func:`get_symmetry_dataset`.
+
+    .. versionadded:: 2.8.0
+    """
+
+    hits: int
+    """Number of datasets returned from the cache"""
+    misses: int
+    """Number of datasets searched while the cache is enabled"""
+    maxsize: int
+    """Maximum number of cached datasets. The cache is disabled if 0."""
+    currsize: int
+    """Number of cached datasets"""
+
+
+class _DatasetCache:
+    """Bounded LRU cache of :class:`SpglibDataset` shared by all threads."""
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._datasets: OrderedDict[bytes, SpglibDataset] = OrderedDict()
+        self._lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(
+        lattice: np.ndarray,
+        positions: np.ndarray,
+        numbers: np.ndarray,
+        symprec: float,
+        angle_tolerance: float,
+        hall_number: int,
+        with_permutations: bool = False,
+    ) -> bytes:
+        # The arrays are already converted by _expand_cell, so the same cell
+        # always gives the same bytes.
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(np.array([symprec, angle_tolerance], dtype="double").tobytes())
+        digest.update(
+            np.array(
+                [hall_number, len(numbers), with_permutations], dtype="int64"
+            ).tobytes()
+        )
+        for array in (lattice, positions, numbers):
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.digest()
+
+    def get(self, key: bytes) -> SpglibDataset | None:
+        with self._lock:
+            dataset = self._datasets.get(key)
+            if dataset is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._datasets.move_to_end(key)
+            return dataset
+
+    def put(self, key: bytes, dataset: SpglibDataset) -> None:
+        # The arrays of datasets are read-only, so they are safely shared.
+        with self._lock:
+            self._datasets[key] = dataset
+            self._datasets.move_to_end(key)
+            while len(self._datasets) > self.maxsize:
+                self._datasets.popitem(last=False)
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._datasets) > maxsize:
+                self._datasets.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._datasets.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> DatasetCacheInfo:
+        with self._lock:
+            return DatasetCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                maxsize=self.maxsize,
+                currsize=len(self._datasets),
+            )
+
+
+_dataset_cache = _DatasetCache()
+
+
 def get_symmetry(
     cell: Cell,
     symprec: float = 1e-5,
@@ -353,24 +531,34 @@ def get_symmetry(
     """
     _set_no_error()
 
-    _, _, _, magmoms = _expand_cell(cell)
+    lattice, positions, numbers, magmoms = _expand_cell(cell)
 
     if magmoms is None:
-        # Get symmetry operations without on-site tensors (i.e. normal crystal)
+        # Get symmetry operations without on-site tensors (i.e. normal crystal).
+        # Wyckoff positions and standardized cell of the dataset are not
+        # computed.
+        max_size = len(positions) * 48
+        rotations = np.empty((max_size, 3, 3), dtype="intc", order="C")
+        translations = np.empty((max_size, 3), dtype="double", order="C")
+        equivalent_atoms = np.empty(len(positions), dtype="intc")
         try:
-            dataset = get_symmetry_dataset(
-                cast(SpgCell, cell),
-                symprec=symprec,
-                angle_tolerance=angle_tolerance,
-                _throw=True,
+            num_sym = _spglib.symmetry_with_equivalent_atoms(
+                rotations,
+                translations,
+                equivalent_atoms,
+                lattice,
+                positions,
+                numbers,
+                float(symprec),
+                float(angle_tolerance),
             )
         except Exception as exc:
             _set_or_throw_error(exc)
             return None
         return {
-            "rotations": dataset.rotations,
-            "translations": dataset.translations,
-            "equivalent_atoms": dataset.equivalent_atoms,
+            "rotations": np.array(rotations[:num_sym], dtype="intc", order="C"),
+            "translations": np.array(translations[:num_sym], dtype="double", order="C"),
+            "equivalent_atoms": equivalent_atoms,
         }
     else:
         warnings.warn(
@@ -398,6 +586,7 @@ def get_symmetry_dataset(
     symprec: float = 1e-5,
     angle_tolerance: float = -1.0,
     hall_number: int = 0,
+    with_permutations: bool = False,
     _throw: bool = False,
 ) -> SpglibDataset | None:
     """Search symmetry dataset from an input cell.
@@ -427,6 +616,12 @@ def get_symmetry_dataset(
         the basis vectors of user's input (the `cell` argument).
 
         See also :ref:`dataset_spg_get_dataset_spacegroup_type`.
+    with_permutations : bool
+        If True, the atom permutations of the found symmetry operations are
+        given as :attr:`SpglibDataset.permutations`. The atoms are mapped with
+        the same indexed search as :func:`get_symmetry_permutations`.
+
+        .. versionadded:: 2.8.0
 
     Returns
     -------
@@ -439,6 +634,21 @@ def get_symmetry_dataset(
 
     lattice, positions, numbers, _ = _expand_cell(cell)
 
+    key = None
+    if _dataset_cache.maxsize > 0:
+        key = _dataset_cache.key(
+            lattice,
+            positions,
+            numbers,
+            float(symprec),
+            float(angle_tolerance),
+            int(hall_number),
+            bool(with_permutations),
+        )
+        dataset = _dataset_cache.get(key)
+        if dataset is not None:
+            return dataset
+
     try:
         spg_ds = _spglib.dataset(
             lattice,
@@ -448,11 +658,172 @@ def get_symmetry_dataset(
             float(symprec),
             float(angle_tolerance),
         )
+        permutations = None
+        if with_permutations:
+            permutations = _spglib.symmetry_permutations(
+                spg_ds.field("rotations"),
+                spg_ds.field("translations"),
+                lattice,
+                positions,
+                numbers,
+                float(symprec),
+            )
+            permutations.flags.writeable = False
     except Exception as exc:
         _set_or_throw_error(exc, _throw)
         return None
 
-    return SpglibDataset(**spg_ds)
+    dataset = SpglibDataset._from_native(spg_ds, permutations)
+    if key is not None:
+        _dataset_cache.put(key, dataset)
+    return dataset
+
+
+def get_symmetry_datasets(
+    cells: Sequence[SpgCell] | tuple[ArrayLike, ArrayLike, ArrayLike],
+    symprec: float = 1e-5,
+    angle_tolerance: float = -1.0,
+    hall_number: int = 0,
+    num_threads: int = 0,
+    *,
+    offsets: ArrayLike | None = None,
+    _throw: bool = False,
+) -> list[SpglibDataset | SpglibError] | None:
+    """Search symmetry datasets of many cells at once.
+
+    The cells are processed by a thread pool inside the compiled module, which
+    avoids the per-call overhead of :func:`get_symmetry_dataset` when screening
+    many (small) structures.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    cells : Sequence[SpgCell] | tuple
+        Crystal structures, each given as the ``cell`` of :func:`get_symmetry`.
+
+        If ``offsets`` is given, a tuple of concatenated arrays
+        ``(lattices, positions, numbers)`` instead, with
+        ``shape=(n_cells, 3, 3)``, ``shape=(n_atoms_total, 3)`` and
+        ``shape=(n_atoms_total,)`` respectively.
+    symprec, angle_tolerance, hall_number:
+        See :func:`get_symmetry_dataset`. The same values are used for all cells.
+    num_threads : int
+        Number of threads used. With ``0`` (default) the number of hardware
+        threads is used.
+    offsets : array_like, optional
+        shape=(n_cells + 1,). Atoms of the i-th cell are
+        ``positions[offsets[i]:offsets[i+1]]``.
+
+    Returns
+    -------
+    datasets: list[:class:`SpglibDataset` | :class:`SpglibError`] | None
+        One entry per cell in the input order. If the search fails for a cell,
+        its entry is the (not raised) :class:`SpglibError` describing the
+        failure, and the other cells are not affected. If the input as a whole
+        is malformed, None is returned.
+
+    """
+    _set_no_error(_throw)
+
+    try:
+        if offsets is None:
+            results: list[SpglibDataset | SpglibError | None] = [None] * len(cells)
+            indices = []
+            expanded_cells = []
+            for i, cell in enumerate(cells):
+                try:
+                    expanded_cells.append(_expand_cell(cast(SpgCell, cell)))
+                except SpglibError as exc:
+                    results[i] = exc
+                    continue
+                indices.append(i)
+            lattices = np.array(
+                [cell[0] for cell in expanded_cells], dtype="double"
+            ).reshape(-1, 3, 3)
+            positions = np.concatenate(
+                [cell[1] for cell in expanded_cells] + [np.zeros((0, 3))]
+            )
+            numbers = np.concatenate(
+                [cell[2] for cell in expanded_cells] + [np.zeros(0, dtype="intc")]
+            )
+            _offsets = np.zeros(len(expanded_cells) + 1, dtype="uintp")
+            np.cumsum([len(cell[2]) for cell in expanded_cells], out=_offsets[1:])
+        else:
+            indices = list(range(len(offsets) - 1))  # type: ignore[arg-type]
+            results = [None] * len(indices)
+            lattices = np.array(
+                np.swapaxes(cells[0], 1, 2),  # type: ignore[arg-type]
+                dtype="double",
+                order="C",
+            )
+            positions = np.array(cells[1], dtype="double", order="C")
+            numbers = np.array(cells[2], dtype="intc")
+            _offsets = np.array(offsets, dtype="uintp")
+        spg_ds_list = _spglib.datasets(
+            lattices,
+            positions,
+            numbers,
+            _offsets,
+            int(hall_number),
+            float(symprec),
+            float(angle_tolerance),
+            int(num_threads),
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc, _throw)
+        return None
+
+    for i, spg_ds in zip(indices, spg_ds_list):
+        if isinstance(spg_ds, str):
+            results[i] = SpglibError(spg_ds)
+        else:
+            results[i] = SpglibDataset._from_native(spg_ds)
+    return cast("list[SpglibDataset | SpglibError]", results)
+
+
+def set_dataset_cache_size(maxsize: int) -> None:
+    """Enable, resize or disable the cache of :func:`get_symmetry_dataset`.
+
+    When enabled, datasets are cached by the input cell, ``symprec``,
+    ``angle_tolerance`` and ``hall_number``, and the least recently used ones
+    are dropped when more than ``maxsize`` are cached. A cell is found in the
+    cache only if its lattice, positions and types are exactly equal to those
+    of the cached one. :func:`get_symmetry` does not build datasets and
+    does not use the cache.
+
+    The same dataset object may be returned to different callers.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached datasets. The cache is disabled with ``0``
+        (default).
+
+    """
+    if maxsize < 0:
+        raise ValueError("maxsize has to be non-negative.")
+    _dataset_cache.resize(int(maxsize))
+
+
+def get_dataset_cache_info() -> DatasetCacheInfo:
+    """Return hit and miss statistics of the cache of :func:`get_symmetry_dataset`.
+
+    .. versionadded:: 2.8.0
+    """
+    return _dataset_cache.info()
+
+
+def clear_dataset_cache() -> None:
+    """Remove all cached datasets and reset the statistics.
+
+    The size of the cache set by :func:`set_dataset_cache_size` is kept.
+
+    .. versionadded:: 2.8.0
+    """
+    _dataset_cache.clear()
 
 
 def get_spacegroup(
@@ -580,6 +951,211 @@ def get_spacegroup_type_from_symmetry(
     return SpaceGroupType(**spg_type)
 
 
+def get_rotated_positions(
+    rotations: ArrayLike[np.intc],
+    translations: ArrayLike[np.double],
+    positions: ArrayLike[np.double],
+    wrap: bool = False,
+) -> NDArray[np.double] | None:
+    """Return fractional positions transformed by all symmetry operations.
+
+    The positions are transformed in one pass over the operations and
+    positions, i.e., ``rotated_positions[i, j]`` is
+    ``rotations[i] @ positions[j] + translations[i]``.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    rotations : array_like
+        Matrix parts of symmetry operations.
+        shape=(n_operations, 3, 3), order='C', dtype='intc'
+    translations : array_like
+        Vector parts of symmetry operations.
+        shape=(n_operations, 3), order='C', dtype='double'
+    positions : array_like
+        Positions in fractional coordinates.
+        shape=(n_positions, 3), order='C', dtype='double'
+    wrap : bool
+        If True, the transformed positions are reduced to [0, 1).
+
+    Returns
+    -------
+    rotated_positions : ndarray
+        shape=(n_operations, n_positions, 3), dtype='double'
+
+    """
+    r = np.array(rotations, dtype="intc", order="C")
+    t = np.array(translations, dtype="double", order="C")
+    pos = np.array(positions, dtype="double", order="C")
+
+    _set_no_error()
+
+    try:
+        rotated_positions = _spglib.rotated_positions(r, t, pos)
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+    if wrap:
+        rotated_positions -= np.floor(rotated_positions)
+    return rotated_positions
+
+
+def get_symmetry_permutations(
+    cell: Cell,
+    rotations: ArrayLike[np.intc],
+    translations: ArrayLike[np.double],
+    symprec: float = 1e-5,
+) -> NDArray[np.intc] | None:
+    """Return the atoms onto which symmetry operations map the atoms of a cell.
+
+    ``permutations[i, j]`` is the index of the atom onto which the i-th
+    operation maps the j-th atom. The atoms are looked up in a spatial index
+    of the cell, so that the cost is linear in the number of atoms.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    cell : tuple
+        See :func:`get_symmetry`. Optional data are ignored.
+    rotations : array_like
+        Matrix parts of symmetry operations of the cell.
+        shape=(n_operations, 3, 3), order='C', dtype='intc'
+    translations : array_like
+        Vector parts of symmetry operations of the cell.
+        shape=(n_operations, 3), order='C', dtype='double'
+    symprec : float
+        See :func:`get_symmetry`.
+
+    Returns
+    -------
+    permutations : ndarray or None
+        shape=(n_operations, n_atoms), dtype='intc'
+
+        None is returned when an atom is not mapped onto an atom of the same
+        type.
+
+    """
+    lattice, positions, numbers, _ = _expand_cell(cell)
+    r = np.array(rotations, dtype="intc", order="C")
+    t = np.array(translations, dtype="double", order="C")
+
+    _set_no_error()
+
+    try:
+        return _spglib.symmetry_permutations(
+            r, t, lattice, positions, numbers, float(symprec)
+        )
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
+def symmetrize_vectors(
+    vectors: ArrayLike[np.double],
+    lattice: ArrayLike[np.double],
+    rotations: ArrayLike[np.intc],
+    permutations: ArrayLike[np.intc] | None = None,
+) -> NDArray[np.double] | None:
+    """Return Cartesian vectors of sites averaged over symmetry operations.
+
+    The vector of the j-th site rotated by the i-th operation contributes to
+    the site ``permutations[i, j]``, which gives, e.g., symmetrized forces on
+    atoms with the permutations of :func:`get_symmetry_permutations`. Without
+    ``permutations`` each vector is averaged over the rotations by itself.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    vectors : array_like
+        Vectors in Cartesian coordinates.
+        shape=(n_sites, 3), order='C', dtype='double'
+    lattice : array_like
+        Basis vectors a, b, c given in row vectors, with respect to which
+        ``rotations`` are given.
+        shape=(3, 3), order='C', dtype='double'
+    rotations : array_like
+        Matrix parts of symmetry operations.
+        shape=(n_operations, 3, 3), order='C', dtype='intc'
+    permutations : array_like, optional
+        shape=(n_operations, n_sites), order='C', dtype='intc'
+
+    Returns
+    -------
+    symmetrized : ndarray
+        shape=(n_sites, 3), dtype='double'
+
+    """
+    v = np.array(vectors, dtype="double", order="C")
+    _lattice = np.array(np.transpose(lattice), dtype="double", order="C")
+    r = np.array(rotations, dtype="intc", order="C")
+    perm = (
+        None
+        if permutations is None
+        else np.array(permutations, dtype="intc", order="C")
+    )
+
+    _set_no_error()
+
+    try:
+        return _spglib.symmetrize_vectors(v, r, _lattice, perm)
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
+def symmetrize_tensors(
+    tensors: ArrayLike[np.double],
+    lattice: ArrayLike[np.double],
+    rotations: ArrayLike[np.intc],
+    permutations: ArrayLike[np.intc] | None = None,
+) -> NDArray[np.double] | None:
+    """Return Cartesian rank-2 tensors of sites averaged over symmetry operations.
+
+    Same as :func:`symmetrize_vectors` for tensors, e.g., Born effective
+    charges, which are rotated as ``R @ tensor @ R.T`` by a rotation ``R`` in
+    Cartesian coordinates.
+
+    .. versionadded:: 2.8.0
+
+    Parameters
+    ----------
+    tensors : array_like
+        Tensors in Cartesian coordinates.
+        shape=(n_sites, 3, 3), order='C', dtype='double'
+    lattice : array_like
+        See :func:`symmetrize_vectors`.
+    rotations : array_like
+        See :func:`symmetrize_vectors`.
+    permutations : array_like, optional
+        See :func:`symmetrize_vectors`.
+
+    Returns
+    -------
+    symmetrized : ndarray
+        shape=(n_sites, 3, 3), dtype='double'
+
+    """
+    tensor = np.array(tensors, dtype="double", order="C")
+    _lattice = np.array(np.transpose(lattice), dtype="double", order="C")
+    r = np.array(rotations, dtype="intc", order="C")
+    perm = (
+        None
+        if permutations is None
+        else np.array(permutations, dtype="intc", order="C")
+    )
+
+    _set_no_error()
+
+    try:
+        return _spglib.symmetrize_tensors(tensor, r, _lattice, perm)
+    except Exception as exc:
+        _set_or_throw_error(exc)
+        return None
+
+
 def get_symmetry_from_database(hall_number: int) -> dict[str, Any] | None:
     """Return symmetry operations corresponding to a Hall symbol. If fails, return None.
 
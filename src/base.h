@@ -9,4 +9,19 @@
     #define SPG_API_TEST
 #endif
 
+// Windows does not support _Thread_local. Use appropriate aliases
+// Reference: https://stackoverflow.com/a/18298965
+// (thread_local is a keyword in C++)
+#if !defined(thread_local) && !defined(__cplusplus)
+    #if __STDC_VERSION__ >= 201112 && !defined __STDC_NO_THREADS__
+        #define thread_local _Thread_local
+    #elif defined _MSC_VER
+        #define thread_local __declspec(thread)
+    #elif defined __GNUC__
+        #define thread_local __thread
+    #else
+        #error "Cannot define thread_local"
+    #endif
+#endif
+
 #endif  // SPGLIB_BASE_H
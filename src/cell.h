@@ -36,8 +36,8 @@ typedef struct {
 SPG_API_TEST Cell *cel_alloc_cell(int const size,
                                   SiteTensorType const tensor_rank);
 SPG_API_TEST void cel_free_cell(Cell *cell);
-void cel_set_cell(Cell *cell, double const lattice[3][3],
-                  double const position[][3], int const types[]);
+SPG_API_TEST void cel_set_cell(Cell *cell, double const lattice[3][3],
+                               double const position[][3], int const types[]);
 SPG_API_TEST void cel_set_layer_cell(Cell *cell, double const lattice[3][3],
                                      double const position[][3],
                                      int const types[],
@@ -11,44 +11,154 @@
 #include "primitive.h"
 #include "refinement.h"
 #include "spacegroup.h"
+#include "symmetry.h"
 
 #define REDUCE_RATE_OUTER 0.9
 #define NUM_ATTEMPT_OUTER 10
 #define REDUCE_RATE 0.95
 #define ANGLE_REDUCE_RATE 0.95
 #define NUM_ATTEMPT 20
+/* Same as in prm_get_primitive */
+#define PRIMITIVE_REDUCE_RATE 0.95
+#define PRIMITIVE_NUM_ATTEMPT 20
 
-static DataContainer *get_spacegroup_and_primitive(Cell const *cell,
+#define PRIMITIVE_FAILED 1
+#define SPACEGROUP_FAILED 2
+
+/* Tolerances are reduced by repeated multiplications with the same */
+/* factor in get_spacegroup_and_primitive and in the search of primitive */
+/* cell, so the same tolerances appear again and again in later attempts. */
+/* Results at exactly equal tolerances are reused from this context. */
+typedef struct {
+    double tolerance;
+    double angle_tolerance;
+    int status;
+} FailedAttempt;
+
+typedef struct {
+    /* Pure translations by tolerance */
+    int num_pure_trans;
+    double pure_trans_tolerance[PRIMITIVE_NUM_ATTEMPT];
+    VecDBL *pure_trans[PRIMITIVE_NUM_ATTEMPT];
+
+    /* Failures of primitive and spacegroup searches by tolerances */
+    int num_failed;
+    FailedAttempt failed[NUM_ATTEMPT * (PRIMITIVE_NUM_ATTEMPT + 1)];
+
+    /* Counters */
+    int num_attempts;
+    int num_pure_trans_searches;
+    int num_primitive_searches;
+    int num_spacegroup_searches;
+    int num_reused;
+} RetryContext;
+
+static DataContainer *determine(Cell const *cell, int const hall_number,
+                                double const symprec,
+                                double const angle_symprec,
+                                int const is_symmetry_only);
+static DataContainer *get_spacegroup_and_primitive(RetryContext *context,
+                                                   Cell const *cell,
                                                    int const hall_number,
                                                    double const symprec,
                                                    double const angle_symprec);
+static Primitive *get_primitive(RetryContext *context, Cell const *cell,
+                                double const symprec,
+                                double const angle_tolerance);
+static VecDBL const *get_pure_translation(RetryContext *context,
+                                          Cell const *cell,
+                                          double const symprec);
+static void release_pure_translations(RetryContext *context,
+                                      double const max_tolerance);
+static int get_failed_status(RetryContext const *context,
+                             double const tolerance,
+                             double const angle_tolerance);
+static void set_failed_status(RetryContext *context, double const tolerance,
+                              double const angle_tolerance, int const status);
 
 DataContainer *det_determine_all(Cell const *cell, int const hall_number,
                                  double const symprec,
                                  double const angle_symprec) {
+    return determine(cell, hall_number, symprec, angle_symprec, 0);
+}
+
+/* Only symmetry operations and equivalent atoms are determined in */
+/* container->exact_structure. Wyckoff positions and standardized cell */
+/* are not computed. */
+DataContainer *det_determine_symmetry(Cell const *cell, double const symprec,
+                                      double const angle_symprec) {
+    return determine(cell, 0, symprec, angle_symprec, 1);
+}
+
+void det_free_container(DataContainer *container) {
+    if (container != NULL) {
+        if (container->spacegroup != NULL) {
+            free(container->spacegroup);
+            container->spacegroup = NULL;
+        }
+        if (container->primitive != NULL) {
+            prm_free_primitive(container->primitive);
+            container->primitive = NULL;
+        }
+        if (container->exact_structure != NULL) {
+            ref_free_exact_structure(container->exact_structure);
+            container->exact_structure = NULL;
+        }
+        free(container);
+    }
+}
+
+static DataContainer *determine(Cell const *cell, int const hall_number,
+                                double const symprec,
+                                double const angle_symprec,
+                                int const is_symmetry_only) {
     int attempt;
     double tolerance;
     DataContainer *container;
+    RetryContext *context;
 
     container = NULL;
+    context = NULL;
 
     if (hall_number > 530) {
         return NULL;
     }
 
+    if ((context = (RetryContext *)malloc(sizeof(RetryContext))) == NULL) {
+        warning_memory("context");
+        return NULL;
+    }
+    context->num_pure_trans = 0;
+    context->num_attempts = 0;
+    context->num_pure_trans_searches = 0;
+    context->num_primitive_searches = 0;
+    context->num_spacegroup_searches = 0;
+    context->num_reused = 0;
+
     tolerance = symprec;
     for (attempt = 0; attempt < NUM_ATTEMPT_OUTER; attempt++) {
+        /* Tolerances of different outer attempts hardly coincide. */
+        release_pure_translations(context, 0);
+        context->num_failed = 0;
         if ((container = get_spacegroup_and_primitive(
-                 cell, hall_number, tolerance, angle_symprec)) != NULL) {
-            if ((container->exact_structure =
-                     ref_get_exact_structure_and_symmetry(
-                         container->spacegroup, container->primitive->cell,
-                         cell, container->primitive->mapping_table,
-                         container->primitive->tolerance)) != NULL) {
+                 context, cell, hall_number, tolerance, angle_symprec)) !=
+            NULL) {
+            if (is_symmetry_only) {
+                container->exact_structure = ref_get_exact_symmetry(
+                    container->spacegroup, container->primitive->cell, cell,
+                    container->primitive->mapping_table,
+                    container->primitive->tolerance);
+            } else {
+                container->exact_structure =
+                    ref_get_exact_structure_and_symmetry(
+                        container->spacegroup, container->primitive->cell, cell,
+                        container->primitive->mapping_table,
+                        container->primitive->tolerance);
+            }
+            if (container->exact_structure != NULL) {
                 goto found;
             }
-            debug_print(
-                "spglib: ref_get_exact_structure_and_symmetry failed.\n");
+            debug_print("spglib: refinement of symmetry failed.\n");
             det_free_container(container);
             container = NULL;
         }
@@ -56,29 +166,26 @@ DataContainer *det_determine_all(Cell const *cell, int const hall_number,
     }
 
 found:
-    return container;
-}
+    debug_print("determine: %d outer and %d inner attempts\n",
+                attempt < NUM_ATTEMPT_OUTER ? attempt + 1 : attempt,
+                context->num_attempts);
+    debug_print("  pure translation searches: %d\n",
+                context->num_pure_trans_searches);
+    debug_print("  primitive searches: %d\n", context->num_primitive_searches);
+    debug_print("  spacegroup searches: %d\n",
+                context->num_spacegroup_searches);
+    debug_print("  reused results: %d\n", context->num_reused);
 
-void det_free_container(DataContainer *container) {
-    if (container != NULL) {
-        if (container->spacegroup != NULL) {
-            free(container->spacegroup);
-            container->spacegroup = NULL;
-        }
-        if (container->primitive != NULL) {
-            prm_free_primitive(container->primitive);
-            container->primitive = NULL;
-        }
-        if (container->exact_structure != NULL) {
-            ref_free_exact_structure(container->exact_structure);
-            container->exact_structure = NULL;
-        }
-        free(container);
-    }
+    release_pure_translations(context, 0);
+    free(context);
+    context = NULL;
+
+    return container;
 }
 
 /* NULL is returned if failed */
-static DataContainer *get_spacegroup_and_primitive(Cell const *cell,
+static DataContainer *get_spacegroup_and_primitive(RetryContext *context,
+                                                   Cell const *cell,
                                                    int const hall_number,
                                                    double const symprec,
                                                    double const angle_symprec) {
@@ -103,17 +210,26 @@ static DataContainer *get_spacegroup_and_primitive(Cell const *cell,
     angle_tolerance = angle_symprec;
 
     for (attempt = 0; attempt < NUM_ATTEMPT; attempt++) {
-        if ((container->primitive =
-                 prm_get_primitive(cell, tolerance, angle_tolerance)) != NULL) {
+        context->num_attempts++;
+
+        /* Pure translations at larger tolerances are not used any more. */
+        release_pure_translations(context, tolerance);
+
+        if ((container->primitive = get_primitive(context, cell, tolerance,
+                                                  angle_tolerance)) != NULL) {
             debug_print("primitive lattice\n");
             debug_print_matrix_d3(container->primitive->cell->lattice);
 
+            context->num_spacegroup_searches++;
             if ((container->spacegroup = spa_search_spacegroup(
                      container->primitive, hall_number,
                      container->primitive->tolerance,
                      container->primitive->angle_tolerance)) != NULL) {
                 goto found;
             }
+            set_failed_status(context, container->primitive->tolerance,
+                              container->primitive->angle_tolerance,
+                              SPACEGROUP_FAILED);
 
             prm_free_primitive(container->primitive);
             container->primitive = NULL;
@@ -136,3 +252,159 @@ static DataContainer *get_spacegroup_and_primitive(Cell const *cell,
 found:
     return container;
 }
+
+/* Equivalent to prm_get_primitive, but pure translations and failures */
+/* found in earlier attempts are reused. NULL is also returned when the */
+/* spacegroup search is known to fail for the primitive cell found. */
+/* Return NULL if failed */
+static Primitive *get_primitive(RetryContext *context, Cell const *cell,
+                                double const symprec,
+                                double const angle_tolerance) {
+    int attempt, status;
+    double tolerance;
+    Primitive *primitive;
+    VecDBL const *pure_trans;
+
+    debug_print("get_primitive (tolerance = %f):\n", symprec);
+
+    primitive = NULL;
+    pure_trans = NULL;
+
+    if ((primitive = prm_alloc_primitive(cell->size)) == NULL) {
+        return NULL;
+    }
+
+    tolerance = symprec;
+    for (attempt = 0; attempt < PRIMITIVE_NUM_ATTEMPT; attempt++) {
+        status = get_failed_status(context, tolerance, angle_tolerance);
+        if (status == SPACEGROUP_FAILED) {
+            context->num_reused++;
+            break;
+        }
+
+        if (status == PRIMITIVE_FAILED) {
+            context->num_reused++;
+        } else {
+            if ((pure_trans = get_pure_translation(context, cell, tolerance)) !=
+                NULL) {
+                context->num_primitive_searches++;
+                if (prm_get_primitive_with_pure_trans(primitive, cell,
+                                                      pure_trans, tolerance,
+                                                      angle_tolerance)) {
+                    return primitive;
+                }
+            }
+            set_failed_status(context, tolerance, angle_tolerance,
+                              PRIMITIVE_FAILED);
+        }
+
+        tolerance *= PRIMITIVE_REDUCE_RATE;
+        debug_print("spglib: Reduce tolerance to %f ", tolerance);
+    }
+
+    prm_free_primitive(primitive);
+    primitive = NULL;
+
+    return NULL;
+}
+
+/* Return NULL if failed */
+static VecDBL const *get_pure_translation(RetryContext *context,
+                                          Cell const *cell,
+                                          double const symprec) {
+    int i;
+    VecDBL *pure_trans;
+
+    for (i = 0; i < context->num_pure_trans; i++) {
+        if (context->pure_trans_tolerance[i] == symprec) {
+            context->num_reused++;
+            return context->pure_trans[i];
+        }
+    }
+
+    context->num_pure_trans_searches++;
+    if ((pure_trans = sym_get_pure_translation(cell, symprec)) == NULL) {
+        return NULL;
+    }
+
+    /* Not expected to be full, but start over if so. */
+    if (context->num_pure_trans == PRIMITIVE_NUM_ATTEMPT) {
+        release_pure_translations(context, 0);
+    }
+
+    /* Tolerances are kept in descending order. */
+    i = context->num_pure_trans;
+    while (i > 0 && context->pure_trans_tolerance[i - 1] < symprec) {
+        context->pure_trans_tolerance[i] = context->pure_trans_tolerance[i - 1];
+        context->pure_trans[i] = context->pure_trans[i - 1];
+        i--;
+    }
+    context->pure_trans_tolerance[i] = symprec;
+    context->pure_trans[i] = pure_trans;
+    context->num_pure_trans++;
+
+    return pure_trans;
+}
+
+/* Release pure translations found at tolerances larger than */
+/* max_tolerance. All are released if max_tolerance is 0. */
+static void release_pure_translations(RetryContext *context,
+                                      double const max_tolerance) {
+    int i, num_released;
+
+    num_released = 0;
+    while (num_released < context->num_pure_trans &&
+           (max_tolerance == 0 ||
+            context->pure_trans_tolerance[num_released] > max_tolerance)) {
+        mat_free_VecDBL(context->pure_trans[num_released]);
+        context->pure_trans[num_released] = NULL;
+        num_released++;
+    }
+
+    for (i = num_released; i < context->num_pure_trans; i++) {
+        context->pure_trans_tolerance[i - num_released] =
+            context->pure_trans_tolerance[i];
+        context->pure_trans[i - num_released] = context->pure_trans[i];
+    }
+    context->num_pure_trans -= num_released;
+}
+
+/* Return 0 if no failure is recorded. */
+static int get_failed_status(RetryContext const *context,
+                             double const tolerance,
+                             double const angle_tolerance) {
+    int i;
+
+    for (i = 0; i < context->num_failed; i++) {
+        if (context->failed[i].tolerance == tolerance &&
+            context->failed[i].angle_tolerance == angle_tolerance) {
+            return context->failed[i].status;
+        }
+    }
+
+    return 0;
+}
+
+static void set_failed_status(RetryContext *context, double const tolerance,
+                              double const angle_tolerance, int const status) {
+    int i;
+
+    for (i = 0; i < context->num_failed; i++) {
+        if (context->failed[i].tolerance == tolerance &&
+            context->failed[i].angle_tolerance == angle_tolerance) {
+            context->failed[i].status = status;
+            return;
+        }
+    }
+
+    /* Not to be recorded any more if full. */
+    if (context->num_failed ==
+        sizeof(context->failed) / sizeof(context->failed[0])) {
+        return;
+    }
+
+    context->failed[context->num_failed].tolerance = tolerance;
+    context->failed[context->num_failed].angle_tolerance = angle_tolerance;
+    context->failed[context->num_failed].status = status;
+    context->num_failed++;
+}
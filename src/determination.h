@@ -19,6 +19,8 @@ typedef struct {
 DataContainer *det_determine_all(Cell const *cell, int const hall_number,
                                  double const symprec,
                                  double const angle_symprec);
+DataContainer *det_determine_symmetry(Cell const *cell, double const symprec,
+                                      double const angle_symprec);
 void det_free_container(DataContainer *container);
 
 #endif
@@ -12,6 +12,9 @@ static size_t get_grid_point_double_mesh(int const address_double[3],
                                          int const mesh[3]);
 static size_t get_grid_point_single_mesh(int const address[3],
                                          int const mesh[3]);
+static void get_grid_address_single_mesh(int address[3],
+                                         size_t const grid_point,
+                                         int const mesh[3]);
 static void modulo_i3(int v[3], int const m[3]);
 static void reduce_grid_address(int address[3], int const mesh[3]);
 static void reduce_grid_address_double(int address[3], int const mesh[3]);
@@ -30,6 +33,12 @@ size_t kgd_get_dense_grid_point_double_mesh(int const address_double[3],
     return get_grid_point_double_mesh(address_double, mesh);
 }
 
+void kgd_get_grid_address_from_index(int address[3], size_t const grid_point,
+                                     int const mesh[3]) {
+    get_grid_address_single_mesh(address, grid_point, mesh);
+    reduce_grid_address(address, mesh);
+}
+
 void kgd_get_grid_address_double_mesh(int address_double[3],
                                       int const address[3], int const mesh[3],
                                       int const is_shift[3]) {
@@ -41,6 +50,41 @@ void kgd_get_grid_address_double_mesh(int address_double[3],
     reduce_grid_address_double(address_double, mesh);
 }
 
+void kgd_get_dense_grid_points_double_mesh(size_t grid_points[],
+                                           int const address_double[][3],
+                                           size_t const num_addresses,
+                                           int const mesh[3]) {
+    size_t i;
+
+    for (i = 0; i < num_addresses; i++) {
+        grid_points[i] = get_grid_point_double_mesh(address_double[i], mesh);
+    }
+}
+
+void kgd_get_grid_addresses_double_mesh(int address_double[][3],
+                                        int const address[][3],
+                                        size_t const num_addresses,
+                                        int const mesh[3],
+                                        int const is_shift[3]) {
+    size_t i;
+
+    for (i = 0; i < num_addresses; i++) {
+        kgd_get_grid_address_double_mesh(address_double[i], address[i], mesh,
+                                         is_shift);
+    }
+}
+
+void kgd_get_grid_addresses_from_indices(int address[][3],
+                                         size_t const grid_points[],
+                                         size_t const num_grid_points,
+                                         int const mesh[3]) {
+    size_t i;
+
+    for (i = 0; i < num_grid_points; i++) {
+        kgd_get_grid_address_from_index(address[i], grid_points[i], mesh);
+    }
+}
+
 static void get_all_grid_addresses(int grid_address[][3], int const mesh[3]) {
     int i, j, k;
     size_t grid_point;
@@ -93,6 +137,21 @@ static size_t get_grid_point_single_mesh(int const address[3],
 #endif
 }
 
+/* Inverse of get_grid_point_single_mesh */
+static void get_grid_address_single_mesh(int address[3],
+                                         size_t const grid_point,
+                                         int const mesh[3]) {
+#ifndef GRID_ORDER_XYZ
+    address[0] = grid_point % mesh[0];
+    address[1] = (grid_point / mesh[0]) % mesh[1];
+    address[2] = grid_point / (mesh[0] * (size_t)(mesh[1]));
+#else
+    address[2] = grid_point % mesh[2];
+    address[1] = (grid_point / mesh[2]) % mesh[1];
+    address[0] = grid_point / (mesh[1] * (size_t)(mesh[2]));
+#endif
+}
+
 static void modulo_i3(int v[3], int const m[3]) {
     int i;
 
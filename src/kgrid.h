@@ -47,8 +47,23 @@ int kgd_get_grid_point_double_mesh(int const address_double[3],
                                    int const mesh[3]);
 size_t kgd_get_dense_grid_point_double_mesh(int const address_double[3],
                                             int const mesh[3]);
+void kgd_get_grid_address_from_index(int address[3], size_t const grid_point,
+                                     int const mesh[3]);
 void kgd_get_grid_address_double_mesh(int address_double[3],
                                       int const address[3], int const mesh[3],
                                       int const is_shift[3]);
+void kgd_get_dense_grid_points_double_mesh(size_t grid_points[],
+                                           int const address_double[][3],
+                                           size_t const num_addresses,
+                                           int const mesh[3]);
+void kgd_get_grid_addresses_double_mesh(int address_double[][3],
+                                        int const address[][3],
+                                        size_t const num_addresses,
+                                        int const mesh[3],
+                                        int const is_shift[3]);
+void kgd_get_grid_addresses_from_indices(int address[][3],
+                                         size_t const grid_points[],
+                                         size_t const num_grid_points,
+                                         int const mesh[3]);
 
 #endif
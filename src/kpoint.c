@@ -4,6 +4,7 @@
 
 #include "kpoint.h"
 
+#include <math.h>
 #include <stddef.h>
 #include <stdlib.h>
 
@@ -60,9 +61,39 @@ static size_t get_dense_ir_reciprocal_mesh_distortion(
     int grid_address[][3], size_t ir_mapping_table[], int const mesh[3],
     int const is_shift[3], MatINT const *rot_reciprocal);
 static size_t get_dense_num_ir(size_t ir_mapping_table[], int const mesh[3]);
+static IrGridPoints *alloc_ir_grid_points(size_t const capacity,
+                                          size_t const num_star);
+static int resize_ir_grid_points(IrGridPoints *ir_grid_points,
+                                 size_t const capacity);
+static int get_ir_orbit(size_t orbit[], size_t const grid_point,
+                        int const address_double[3], int const mesh[3],
+                        int const is_shift[3], MatINT const *rot_reciprocal,
+                        long const divisor[3]);
+static size_t get_ir_grid_point(size_t const ir_mapping_table[],
+                                size_t const start, size_t const grid_point,
+                                int const address_double[3], int const mesh[3],
+                                int const is_shift[3],
+                                MatINT const *rot_reciprocal,
+                                long const divisor[3]);
+static int get_rotated_grid_point(size_t *grid_point_rot, int const rot[3][3],
+                                  int const address_double[3],
+                                  int const mesh[3], int const is_shift[3],
+                                  long const divisor[3]);
+static void get_dense_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const grid_address[][3],
+    size_t const num_addresses, int const (*rot_reciprocal)[3][3],
+    int const num_rot, int const mesh[3], int const is_shift[3],
+    size_t const bz_map[]);
 static size_t relocate_dense_BZ_grid_address(
     int bz_grid_address[][3], size_t bz_map[], int const grid_address[][3],
     int const mesh[3], double const rec_lattice[3][3], int const is_shift[3]);
+static void get_BZ_search_order(int search_order[], double search_vectors[][3],
+                                double search_lengths[],
+                                double const rec_lattice[3][3]);
+static double get_BZ_distance(double q_vector[3], int const grid_address[3],
+                              int const search[3], int const mesh[3],
+                              double const rec_lattice[3][3],
+                              int const is_shift[3]);
 static double get_tolerance_for_BZ_reduction(double const rec_lattice[3][3],
                                              int const mesh[3]);
 static int check_mesh_symmetry(int const mesh[3], int const is_shift[3],
@@ -121,6 +152,174 @@ size_t kpt_get_dense_irreducible_reciprocal_mesh(int grid_address[][3],
     return num_ir;
 }
 
+/* Irreducible grid points are enumerated as the smallest grid point */
+/* index in each orbit, which are the same as those pointed by */
+/* ir_mapping_table of kpt_get_dense_irreducible_reciprocal_mesh, */
+/* without allocating arrays of the size of the mesh except for */
+/* star_address. Return NULL if failed. */
+IrGridPoints *kpt_get_ir_grid_points(int const mesh[3], int const is_shift[3],
+                                     MatINT const *rot_reciprocal,
+                                     int const with_star) {
+    size_t i, num_gp, num_star, capacity;
+    int j, num_orbit;
+    int address[3], address_double[3];
+    long divisor[3];
+    long *divisor_ptr;
+    size_t *orbit;
+    IrGridPoints *ir_grid_points;
+
+    orbit = NULL;
+    ir_grid_points = NULL;
+
+    num_gp = mesh[0] * mesh[1] * (size_t)(mesh[2]);
+
+    /* Grid points of a mesh that doesn't follow the symmetry can be */
+    /* mapped outside of the mesh. See */
+    /* get_dense_ir_reciprocal_mesh_distortion. */
+    if (check_mesh_symmetry(mesh, is_shift, rot_reciprocal)) {
+        divisor_ptr = NULL;
+    } else {
+        for (j = 0; j < 3; j++) {
+            divisor[j] = mesh[(j + 1) % 3] * mesh[(j + 2) % 3];
+        }
+        divisor_ptr = divisor;
+    }
+
+    if ((orbit = (size_t *)malloc(sizeof(size_t) * rot_reciprocal->size)) ==
+        NULL) {
+        warning_memory("orbit");
+        return NULL;
+    }
+
+    /* Number of orbits is at least num_gp / (order of point group). */
+    capacity = num_gp / rot_reciprocal->size + 1;
+    if ((ir_grid_points =
+             alloc_ir_grid_points(capacity, with_star ? num_gp : 0)) == NULL) {
+        goto err;
+    }
+
+    num_star = 0;
+    for (i = 0; i < num_gp; i++) {
+        kgd_get_grid_address_from_index(address, i, mesh);
+        kgd_get_grid_address_double_mesh(address_double, address, mesh,
+                                         is_shift);
+        num_orbit = get_ir_orbit(orbit, i, address_double, mesh, is_shift,
+                                 rot_reciprocal, divisor_ptr);
+        if (num_orbit == 0) {
+            continue;
+        }
+
+        if (ir_grid_points->size == capacity) {
+            capacity *= 2;
+            if (!resize_ir_grid_points(ir_grid_points, capacity)) {
+                goto err;
+            }
+        }
+        mat_copy_vector_i3(ir_grid_points->grid_address[ir_grid_points->size],
+                           address);
+        ir_grid_points->weights[ir_grid_points->size] = num_orbit;
+        ir_grid_points->size++;
+
+        if (with_star) {
+            for (j = 0; j < num_orbit; j++) {
+                kgd_get_grid_address_from_index(
+                    ir_grid_points->star_address[num_star], orbit[j], mesh);
+                num_star++;
+            }
+        }
+    }
+
+    if (!resize_ir_grid_points(ir_grid_points, ir_grid_points->size)) {
+        goto err;
+    }
+
+    free(orbit);
+    orbit = NULL;
+
+    return ir_grid_points;
+
+err:
+    if (ir_grid_points != NULL) {
+        kpt_free_ir_grid_points(ir_grid_points);
+        ir_grid_points = NULL;
+    }
+    free(orbit);
+    orbit = NULL;
+    return NULL;
+}
+
+void kpt_free_ir_grid_points(IrGridPoints *ir_grid_points) {
+    free(ir_grid_points->grid_address);
+    ir_grid_points->grid_address = NULL;
+    free(ir_grid_points->weights);
+    ir_grid_points->weights = NULL;
+    free(ir_grid_points->star_address);
+    ir_grid_points->star_address = NULL;
+    free(ir_grid_points);
+}
+
+/* ir_mapping_table of kpt_get_dense_stabilized_reciprocal_mesh is */
+/* computed only for the grid points from start to */
+/* start + num_grid_points - 1. Each element is the smallest grid */
+/* point in the orbit, which doesn't depend on the other grid points, */
+/* so a mesh can be processed by parts. grid_address of the same */
+/* grid points is also stored unless it is NULL. Return 0 if failed. */
+int kpt_get_dense_ir_mapping_table_range(
+    int grid_address[][3], size_t ir_mapping_table[], size_t const start,
+    size_t const num_grid_points, int const mesh[3], int const is_shift[3],
+    int const is_time_reversal, MatINT const *rotations, size_t const num_q,
+    double const qpoints[][3]) {
+    size_t i;
+    int j;
+    int address[3], address_double[3];
+    long divisor[3];
+    long *divisor_ptr;
+    MatINT *rot_reciprocal, *rot_reciprocal_q;
+    double tolerance;
+
+    rot_reciprocal = NULL;
+    rot_reciprocal_q = NULL;
+
+    if ((rot_reciprocal =
+             get_point_group_reciprocal(rotations, is_time_reversal)) == NULL) {
+        return 0;
+    }
+    tolerance = 0.01 / (mesh[0] + mesh[1] + mesh[2]);
+    if ((rot_reciprocal_q = get_point_group_reciprocal_with_q(
+             rot_reciprocal, tolerance, num_q, qpoints)) == NULL) {
+        mat_free_MatINT(rot_reciprocal);
+        rot_reciprocal = NULL;
+        return 0;
+    }
+
+    if (check_mesh_symmetry(mesh, is_shift, rot_reciprocal_q)) {
+        divisor_ptr = NULL;
+    } else {
+        for (j = 0; j < 3; j++) {
+            divisor[j] = mesh[(j + 1) % 3] * mesh[(j + 2) % 3];
+        }
+        divisor_ptr = divisor;
+    }
+
+    for (i = 0; i < num_grid_points; i++) {
+        kgd_get_grid_address_from_index(address, start + i, mesh);
+        kgd_get_grid_address_double_mesh(address_double, address, mesh,
+                                         is_shift);
+        ir_mapping_table[i] = get_ir_grid_point(
+            ir_mapping_table, start, start + i, address_double, mesh, is_shift,
+            rot_reciprocal_q, divisor_ptr);
+        if (grid_address != NULL) {
+            mat_copy_vector_i3(grid_address[i], address);
+        }
+    }
+
+    mat_free_MatINT(rot_reciprocal_q);
+    rot_reciprocal_q = NULL;
+    mat_free_MatINT(rot_reciprocal);
+    rot_reciprocal = NULL;
+    return 1;
+}
+
 int kpt_get_stabilized_reciprocal_mesh(
     int grid_address[][3], int ir_mapping_table[], int const mesh[3],
     int const is_shift[3], int const is_time_reversal, MatINT const *rotations,
@@ -214,6 +413,25 @@ void kpt_get_dense_BZ_grid_points_by_rotations(
     }
 }
 
+void kpt_get_dense_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const grid_address[][3],
+    size_t const num_addresses, int const (*rot_reciprocal)[3][3],
+    int const num_rot, int const mesh[3], int const is_shift[3]) {
+    get_dense_grid_point_table_by_rotations(rot_grid_points, grid_address,
+                                            num_addresses, rot_reciprocal,
+                                            num_rot, mesh, is_shift, NULL);
+}
+
+void kpt_get_dense_BZ_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const bz_grid_address[][3],
+    size_t const num_addresses, int const (*rot_reciprocal)[3][3],
+    int const num_rot, int const mesh[3], int const is_shift[3],
+    size_t const bz_map[]) {
+    get_dense_grid_point_table_by_rotations(rot_grid_points, bz_grid_address,
+                                            num_addresses, rot_reciprocal,
+                                            num_rot, mesh, is_shift, bz_map);
+}
+
 int kpt_relocate_BZ_grid_address(int bz_grid_address[][3], int bz_map[],
                                  int const grid_address[][3], int const mesh[3],
                                  double const rec_lattice[3][3],
@@ -551,19 +769,253 @@ static size_t get_dense_num_ir(size_t ir_mapping_table[], int const mesh[3]) {
     return num_ir;
 }
 
+/* Return NULL if failed */
+static IrGridPoints *alloc_ir_grid_points(size_t const capacity,
+                                          size_t const num_star) {
+    IrGridPoints *ir_grid_points;
+
+    if ((ir_grid_points = (IrGridPoints *)malloc(sizeof(IrGridPoints))) ==
+        NULL) {
+        warning_memory("ir_grid_points");
+        return NULL;
+    }
+
+    ir_grid_points->size = 0;
+    ir_grid_points->grid_address = NULL;
+    ir_grid_points->weights = NULL;
+    ir_grid_points->star_address = NULL;
+
+    if ((ir_grid_points->grid_address =
+             (int (*)[3])malloc(sizeof(int[3]) * capacity)) == NULL) {
+        warning_memory("ir_grid_points->grid_address");
+        goto err;
+    }
+
+    if ((ir_grid_points->weights = (int *)malloc(sizeof(int) * capacity)) ==
+        NULL) {
+        warning_memory("ir_grid_points->weights");
+        goto err;
+    }
+
+    if (num_star > 0) {
+        if ((ir_grid_points->star_address =
+                 (int (*)[3])malloc(sizeof(int[3]) * num_star)) == NULL) {
+            warning_memory("ir_grid_points->star_address");
+            goto err;
+        }
+    }
+
+    return ir_grid_points;
+
+err:
+    kpt_free_ir_grid_points(ir_grid_points);
+    return NULL;
+}
+
+/* Return 0 if failed */
+static int resize_ir_grid_points(IrGridPoints *ir_grid_points,
+                                 size_t const capacity) {
+    int (*grid_address)[3];
+    int *weights;
+
+    /* Keep at least one element since realloc with size 0 may free. */
+    if ((grid_address = (int (*)[3])realloc(
+             ir_grid_points->grid_address,
+             sizeof(int[3]) * (capacity > 0 ? capacity : 1))) == NULL) {
+        warning_memory("ir_grid_points->grid_address");
+        return 0;
+    }
+    ir_grid_points->grid_address = grid_address;
+
+    if ((weights = (int *)realloc(
+             ir_grid_points->weights,
+             sizeof(int) * (capacity > 0 ? capacity : 1))) == NULL) {
+        warning_memory("ir_grid_points->weights");
+        return 0;
+    }
+    ir_grid_points->weights = weights;
+
+    return 1;
+}
+
+/* Distinct grid points in the orbit of grid_point are stored in */
+/* ascending order. Return 0 if the orbit contains a grid point */
+/* smaller than grid_point, i.e., grid_point is not irreducible. */
+/* Otherwise the number of the grid points in the orbit is returned. */
+static int get_ir_orbit(size_t orbit[], size_t const grid_point,
+                        int const address_double[3], int const mesh[3],
+                        int const is_shift[3], MatINT const *rot_reciprocal,
+                        long const divisor[3]) {
+    int i, j, k, num_orbit;
+    size_t grid_point_rot;
+
+    num_orbit = 0;
+    for (i = 0; i < rot_reciprocal->size; i++) {
+        if (!get_rotated_grid_point(&grid_point_rot, rot_reciprocal->mat[i],
+                                    address_double, mesh, is_shift, divisor)) {
+            continue;
+        }
+        if (grid_point_rot < grid_point) {
+            return 0;
+        }
+        for (j = 0; j < num_orbit; j++) {
+            if (orbit[j] >= grid_point_rot) {
+                break;
+            }
+        }
+        if (j < num_orbit && orbit[j] == grid_point_rot) {
+            continue;
+        }
+        for (k = num_orbit; k > j; k--) {
+            orbit[k] = orbit[k - 1];
+        }
+        orbit[j] = grid_point_rot;
+        num_orbit++;
+    }
+
+    return num_orbit;
+}
+
+/* Return the smallest grid point in the orbit of grid_point. */
+/* ir_mapping_table[j - start] has to be known for the grid points */
+/* start <= j < grid_point, which is used as the answer as soon as such */
+/* j is found in the orbit. Otherwise all the orbit is searched. */
+static size_t get_ir_grid_point(size_t const ir_mapping_table[],
+                                size_t const start, size_t const grid_point,
+                                int const address_double[3], int const mesh[3],
+                                int const is_shift[3],
+                                MatINT const *rot_reciprocal,
+                                long const divisor[3]) {
+    int i;
+    size_t ir_grid_point, grid_point_rot;
+
+    ir_grid_point = grid_point;
+    for (i = 0; i < rot_reciprocal->size; i++) {
+        if (!get_rotated_grid_point(&grid_point_rot, rot_reciprocal->mat[i],
+                                    address_double, mesh, is_shift, divisor)) {
+            continue;
+        }
+        if (grid_point_rot < grid_point && grid_point_rot >= start) {
+            return ir_mapping_table[grid_point_rot - start];
+        }
+        if (grid_point_rot < ir_grid_point) {
+            ir_grid_point = grid_point_rot;
+        }
+    }
+
+    return ir_grid_point;
+}
+
+/* When divisor is NULL, the mesh is assumed to follow the symmetry. */
+/* Otherwise the rotated point is checked to be on the mesh the same */
+/* way as get_dense_ir_reciprocal_mesh_distortion. */
+/* Return 0 if the rotated point is not on the mesh. */
+static int get_rotated_grid_point(size_t *grid_point_rot, int const rot[3][3],
+                                  int const address_double[3],
+                                  int const mesh[3], int const is_shift[3],
+                                  long const divisor[3]) {
+    int i;
+    int address_double_rot[3];
+    long long_address_double_rot[3];
+
+    if (divisor == NULL) {
+        mat_multiply_matrix_vector_i3(address_double_rot, rot, address_double);
+    } else {
+        for (i = 0; i < 3; i++) {
+            long_address_double_rot[i] =
+                rot[i][0] * (address_double[0] * divisor[0]) +
+                rot[i][1] * (address_double[1] * divisor[1]) +
+                rot[i][2] * (address_double[2] * divisor[2]);
+        }
+        for (i = 0; i < 3; i++) {
+            if (long_address_double_rot[i] % divisor[i]) {
+                return 0;
+            }
+            address_double_rot[i] = long_address_double_rot[i] / divisor[i];
+            if ((address_double_rot[i] % 2 != 0 && is_shift[i] == 0) ||
+                (address_double_rot[i] % 2 == 0 && is_shift[i] == 1)) {
+                return 0;
+            }
+        }
+    }
+
+    *grid_point_rot =
+        kgd_get_dense_grid_point_double_mesh(address_double_rot, mesh);
+
+    return 1;
+}
+
+/* rot_grid_points[i * num_addresses + j] is the grid point of the */
+/* grid address j rotated by rot_reciprocal[i]. The grid addresses are */
+/* those of the grid points 0, 1, ..., num_addresses - 1 of the mesh if */
+/* grid_address is NULL. Grid points of the mesh doubled in each */
+/* direction are mapped by bz_map unless bz_map is NULL. */
+static void get_dense_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const grid_address[][3],
+    size_t const num_addresses, int const (*rot_reciprocal)[3][3],
+    int const num_rot, int const mesh[3], int const is_shift[3],
+    size_t const bz_map[]) {
+    int i, k;
+    size_t j;
+    int address[3], address_double_orig[3], address_double[3], bzmesh[3];
+    size_t *row;
+
+    for (k = 0; k < 3; k++) {
+        bzmesh[k] = mesh[k] * 2;
+    }
+
+    for (i = 0; i < num_rot; i++) {
+        row = rot_grid_points + i * num_addresses;
+        for (j = 0; j < num_addresses; j++) {
+            if (grid_address == NULL) {
+                kgd_get_grid_address_from_index(address, j, mesh);
+            } else {
+                for (k = 0; k < 3; k++) {
+                    address[k] = grid_address[j][k];
+                }
+            }
+            for (k = 0; k < 3; k++) {
+                address_double_orig[k] = address[k] * 2 + is_shift[k];
+            }
+            mat_multiply_matrix_vector_i3(address_double, rot_reciprocal[i],
+                                          address_double_orig);
+            if (bz_map == NULL) {
+                row[j] =
+                    kgd_get_dense_grid_point_double_mesh(address_double, mesh);
+            } else {
+                row[j] = bz_map[kgd_get_dense_grid_point_double_mesh(
+                    address_double, bzmesh)];
+            }
+        }
+    }
+}
+
+/* The translations of bz_search_space are tried by increasing length. */
+/* A translation is skipped if the distance estimated from the Cartesian */
+/* vectors is beyond the shortest one plus the tolerance, and the search */
+/* stops when the length of the translation alone guarantees it. The */
+/* margin of twice the tolerance covers the rounding errors of the */
+/* estimate, so that the result is the same as with all the translations. */
 static size_t relocate_dense_BZ_grid_address(
     int bz_grid_address[][3], size_t bz_map[], int const grid_address[][3],
     int const mesh[3], double const rec_lattice[3][3], int const is_shift[3]) {
-    double tolerance, min_distance;
-    double q_vector[3], distance[KPT_NUM_BZ_SEARCH_SPACE];
+    double tolerance, min_distance, q_length, max_distance, estimate;
+    double q_vector[3], q_vector_search[3];
+    double distance[KPT_NUM_BZ_SEARCH_SPACE];
+    double search_vectors[KPT_NUM_BZ_SEARCH_SPACE][3];
+    double search_lengths[KPT_NUM_BZ_SEARCH_SPACE];
+    int search_order[KPT_NUM_BZ_SEARCH_SPACE];
+    int candidates[KPT_NUM_BZ_SEARCH_SPACE];
     int bzmesh[3], bz_address_double[3];
     size_t i, boundary_num_gp, total_num_gp, bzgp, gp, num_bzmesh;
-    int j, k, min_index;
+    int j, k, l, min_index, num_candidates;
 
     tolerance = get_tolerance_for_BZ_reduction(rec_lattice, mesh);
     for (j = 0; j < 3; j++) {
         bzmesh[j] = mesh[j] * 2;
     }
+    get_BZ_search_order(search_order, search_vectors, search_lengths,
+                        rec_lattice);
 
     num_bzmesh = bzmesh[0] * bzmesh[1] * (size_t)(bzmesh[2]);
     for (i = 0; i < num_bzmesh; i++) {
@@ -576,27 +1028,55 @@ static size_t relocate_dense_BZ_grid_address(
     /* Multithreading doesn't work for this loop since gp calculated */
     /* with boundary_num_gp is unstable to store bz_grid_address. */
     for (i = 0; i < total_num_gp; i++) {
-        for (j = 0; j < KPT_NUM_BZ_SEARCH_SPACE; j++) {
+        /* search_order[0] is the null translation. */
+        distance[0] =
+            get_BZ_distance(q_vector, grid_address[i], bz_search_space[0], mesh,
+                            rec_lattice, is_shift);
+        min_distance = distance[0];
+        candidates[0] = 0;
+        num_candidates = 1;
+        q_length = sqrt(distance[0]);
+
+        for (j = 1; j < KPT_NUM_BZ_SEARCH_SPACE; j++) {
+            l = search_order[j];
+            max_distance = min_distance + 2 * tolerance;
+            if (search_lengths[l] > q_length &&
+                (search_lengths[l] - q_length) *
+                        (search_lengths[l] - q_length) >
+                    max_distance) {
+                break;
+            }
+            estimate = distance[0] + search_lengths[l] * search_lengths[l];
             for (k = 0; k < 3; k++) {
-                q_vector[k] =
-                    ((grid_address[i][k] + bz_search_space[j][k] * mesh[k]) *
-                         2 +
-                     is_shift[k]) /
-                    ((double)mesh[k]) / 2;
+                estimate += 2 * q_vector[k] * search_vectors[l][k];
+            }
+            if (estimate > max_distance) {
+                continue;
+            }
+
+            distance[l] = get_BZ_distance(q_vector_search, grid_address[i],
+                                          bz_search_space[l], mesh, rec_lattice,
+                                          is_shift);
+            if (distance[l] < min_distance) {
+                min_distance = distance[l];
             }
-            mat_multiply_matrix_vector_d3(q_vector, rec_lattice, q_vector);
-            distance[j] = mat_norm_squared_d3(q_vector);
+            /* Candidates are kept in the order of bz_search_space. */
+            for (k = num_candidates; k > 0 && candidates[k - 1] > l; k--) {
+                candidates[k] = candidates[k - 1];
+            }
+            candidates[k] = l;
+            num_candidates++;
         }
-        min_distance = distance[0];
-        min_index = 0;
-        for (j = 1; j < KPT_NUM_BZ_SEARCH_SPACE; j++) {
-            if (distance[j] < min_distance) {
-                min_distance = distance[j];
-                min_index = j;
+
+        min_index = candidates[0];
+        for (j = 1; j < num_candidates; j++) {
+            if (distance[candidates[j]] < distance[min_index]) {
+                min_index = candidates[j];
             }
         }
 
-        for (j = 0; j < KPT_NUM_BZ_SEARCH_SPACE; j++) {
+        for (l = 0; l < num_candidates; l++) {
+            j = candidates[l];
             if (distance[j] < min_distance + tolerance) {
                 if (j == min_index) {
                     gp = i;
@@ -623,6 +1103,47 @@ static size_t relocate_dense_BZ_grid_address(
     return boundary_num_gp + total_num_gp;
 }
 
+/* Indices of bz_search_space sorted by the lengths of the translations in */
+/* Cartesian coordinates, which are also returned. */
+static void get_BZ_search_order(int search_order[], double search_vectors[][3],
+                                double search_lengths[],
+                                double const rec_lattice[3][3]) {
+    int i, j, k;
+    double search[3];
+
+    for (i = 0; i < KPT_NUM_BZ_SEARCH_SPACE; i++) {
+        for (j = 0; j < 3; j++) {
+            search[j] = bz_search_space[i][j];
+        }
+        mat_multiply_matrix_vector_d3(search_vectors[i], rec_lattice, search);
+        search_lengths[i] = sqrt(mat_norm_squared_d3(search_vectors[i]));
+
+        for (k = i;
+             k > 0 && search_lengths[search_order[k - 1]] > search_lengths[i];
+             k--) {
+            search_order[k] = search_order[k - 1];
+        }
+        search_order[k] = i;
+    }
+}
+
+/* Squared length of the q-vector of grid_address translated by search */
+/* times mesh, which is stored in q_vector in Cartesian coordinates. */
+static double get_BZ_distance(double q_vector[3], int const grid_address[3],
+                              int const search[3], int const mesh[3],
+                              double const rec_lattice[3][3],
+                              int const is_shift[3]) {
+    int k;
+
+    for (k = 0; k < 3; k++) {
+        q_vector[k] =
+            ((grid_address[k] + search[k] * mesh[k]) * 2 + is_shift[k]) /
+            ((double)mesh[k]) / 2;
+    }
+    mat_multiply_matrix_vector_d3(q_vector, rec_lattice, q_vector);
+    return mat_norm_squared_d3(q_vector);
+}
+
 static double get_tolerance_for_BZ_reduction(double const rec_lattice[3][3],
                                              int const mesh[3]) {
     int i, j;
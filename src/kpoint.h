@@ -9,6 +9,17 @@
 
 #include "mathfunc.h"
 
+/* Irreducible grid points of a mesh. star_address stores the grid */
+/* addresses of the orbit of each irreducible grid point one after */
+/* another, i.e., weights[i] addresses starting from the sum of the */
+/* preceding weights. star_address is NULL unless requested. */
+typedef struct {
+    size_t size;
+    int (*grid_address)[3];
+    int *weights;
+    int (*star_address)[3];
+} IrGridPoints;
+
 int kpt_get_irreducible_reciprocal_mesh(int grid_address[][3],
                                         int ir_mapping_table[],
                                         int const mesh[3],
@@ -19,6 +30,15 @@ size_t kpt_get_dense_irreducible_reciprocal_mesh(int grid_address[][3],
                                                  int const mesh[3],
                                                  int const is_shift[3],
                                                  MatINT const *rot_reciprocal);
+IrGridPoints *kpt_get_ir_grid_points(int const mesh[3], int const is_shift[3],
+                                     MatINT const *rot_reciprocal,
+                                     int const with_star);
+void kpt_free_ir_grid_points(IrGridPoints *ir_grid_points);
+int kpt_get_dense_ir_mapping_table_range(
+    int grid_address[][3], size_t ir_mapping_table[], size_t const start,
+    size_t const num_grid_points, int const mesh[3], int const is_shift[3],
+    int const is_time_reversal, MatINT const *rotations, size_t const num_q,
+    double const qpoints[][3]);
 int kpt_get_stabilized_reciprocal_mesh(
     int grid_address[][3], int ir_mapping_table[], int const mesh[3],
     int const is_shift[3], int const is_time_reversal, MatINT const *rotations,
@@ -37,6 +57,15 @@ void kpt_get_dense_BZ_grid_points_by_rotations(
     size_t rot_grid_points[], int const address_orig[3],
     int const (*rot_reciprocal)[3][3], int const num_rot, int const mesh[3],
     int const is_shift[3], size_t const bz_map[]);
+void kpt_get_dense_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const grid_address[][3],
+    size_t const num_addresses, int const (*rot_reciprocal)[3][3],
+    int const num_rot, int const mesh[3], int const is_shift[3]);
+void kpt_get_dense_BZ_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const bz_grid_address[][3],
+    size_t const num_addresses, int const (*rot_reciprocal)[3][3],
+    int const num_rot, int const mesh[3], int const is_shift[3],
+    size_t const bz_map[]);
 int kpt_relocate_BZ_grid_address(int bz_grid_address[][3], int bz_map[],
                                  int const grid_address[][3], int const mesh[3],
                                  double const rec_lattice[3][3],
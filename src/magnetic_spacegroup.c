@@ -14,6 +14,7 @@
 #include "spin.h"
 
 #define MAX_DENOMINATOR 100
+#define NUM_ROTATION_CLASSES 10
 
 static int get_reference_space_group(Spacegroup **ref_sg,
                                      MagneticSymmetry **changed_symmetry,
@@ -54,6 +55,11 @@ static int is_equal(MagneticSymmetry const *sym1, MagneticSymmetry const *sym2,
                     double const symprec);
 void get_rigid_rotation(double rigid_rot[3][3], double const lattice[3][3],
                         double const tmat[3][3], Spacegroup const *ref_sg);
+static int get_time_reversal_classes(int classes[NUM_ROTATION_CLASSES],
+                                     MagneticSymmetry const *sym_msg);
+static int is_time_reversal_classes_of_uni(
+    int const classes[NUM_ROTATION_CLASSES], int const uni_number);
+static int get_rotation_class(int const rot[3][3]);
 
 /******************************************************************************/
 
@@ -62,13 +68,14 @@ void get_rigid_rotation(double rigid_rot[3][3], double const lattice[3][3],
 MagneticDataset *msg_identify_magnetic_space_group_type(
     double const lattice[3][3], MagneticSymmetry const *magnetic_symmetry,
     double const symprec) {
-    int i, j, s, hall_number, uni_number, type, same;
+    int i, j, s, hall_number, uni_number, type, same, use_classes;
     Spacegroup *ref_sg;
     Symmetry *transformations;
     MagneticSymmetry *msg_uni, *changed_symmetry, *symmetry_cor;
     MagneticSpacegroupType msgtype, msgtype_db;
     MagneticDataset *ret;
     int uni_number_range[2];
+    int classes[NUM_ROTATION_CLASSES];
     double rigid_rot[3][3];
     double tmat[3][3], tmat_cor[3][3];
     double shift[3], shift_cor[3];
@@ -87,6 +94,10 @@ MagneticDataset *msg_identify_magnetic_space_group_type(
     if (type == 0) goto err;
     hall_number = ref_sg->hall_number;
 
+    /* Candidates whose time reversals are not in the same classes of */
+    /* rotations are skipped before decoding their operations. */
+    use_classes = get_time_reversal_classes(classes, changed_symmetry);
+
     msgdb_get_uni_candidates(uni_number_range, hall_number);
     debug_print("Search UNI number over between %d to %d\n",
                 uni_number_range[0], uni_number_range[1]);
@@ -95,9 +106,18 @@ MagneticDataset *msg_identify_magnetic_space_group_type(
         /* Check type and order */
         msgtype_db = msgdb_get_magnetic_spacegroup_type(uni_number);
         if (msgtype_db.type != type) continue;
+        if (use_classes &&
+            !is_time_reversal_classes_of_uni(classes, uni_number))
+            continue;
 
-        msg_uni = msgdb_get_spacegroup_operations(uni_number, hall_number);
-        if (msg_uni->size != changed_symmetry->size) continue;
+        if ((msg_uni = msgdb_get_spacegroup_operations(uni_number,
+                                                       hall_number)) == NULL)
+            goto err;
+        if (msg_uni->size != changed_symmetry->size) {
+            sym_free_magnetic_symmetry(msg_uni);
+            msg_uni = NULL;
+            continue;
+        }
 
         /* Correction transformation */
         /* x_uni = (tmat_cor, shift_cor) x_changed */
@@ -1046,3 +1066,1750 @@ void get_rigid_rotation(double rigid_rot[3][3], double const lattice[3][3],
     debug_print_matrix_d3(rigid_rot);
     debug_print("det = %f\n", mat_get_determinant_d3(rigid_rot));
 }
+
+/* Set numbers of cosets of pure translations with time reversal for each */
+/* class of rotations in `classes`. They do not depend on the setting. */
+/* Return 0 if the operations are not cosets of the pure translations. */
+static int get_time_reversal_classes(int classes[NUM_ROTATION_CLASSES],
+                                     MagneticSymmetry const *sym_msg) {
+    int i, rot_class, num_pure_trans;
+    int counts[NUM_ROTATION_CLASSES];
+
+    num_pure_trans = 0;
+    for (i = 0; i < NUM_ROTATION_CLASSES; i++) {
+        counts[i] = 0;
+    }
+    for (i = 0; i < sym_msg->size; i++) {
+        if ((rot_class = get_rotation_class(sym_msg->rot[i])) == -1) {
+            return 0;
+        }
+        if (sym_msg->timerev[i]) {
+            counts[rot_class]++;
+        } else if (rot_class == 0) {
+            num_pure_trans++;
+        }
+    }
+
+    if (num_pure_trans == 0) {
+        return 0;
+    }
+    for (i = 0; i < NUM_ROTATION_CLASSES; i++) {
+        if (counts[i] % num_pure_trans != 0) {
+            return 0;
+        }
+        classes[i] = counts[i] / num_pure_trans;
+    }
+    return 1;
+}
+
+/* Return index of the class of the rotation (det, trace) in */
+/* (1, 3), (1, -1), (1, 0), (1, 1), (1, 2), */
+/* (-1, -3), (-1, 1), (-1, 0), (-1, -1), (-1, -2). Return -1 if failed. */
+static int get_rotation_class(int const rot[3][3]) {
+    int det, trace;
+
+    det = mat_get_determinant_i3(rot);
+    trace = mat_get_trace_i3(rot);
+    if (det == 1) {
+        switch (trace) {
+            case 3:
+                return 0;
+            case -1:
+                return 1;
+            case 0:
+                return 2;
+            case 1:
+                return 3;
+            case 2:
+                return 4;
+        }
+    }
+    if (det == -1) {
+        switch (trace) {
+            case -3:
+                return 5;
+            case 1:
+                return 6;
+            case 0:
+                return 7;
+            case -1:
+                return 8;
+            case -2:
+                return 9;
+        }
+    }
+    return -1;
+}
+
+/* clang-format off */
+/* Numbers of cosets of pure translations with time reversal for each class */
+/* of rotations, see get_rotation_class, for each UNI number. */
+/* Generated by database/msg/make_time_reversal_classes.py */
+static const int magnetic_spacegroup_time_reversal_classes[][10] = {
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* dummy */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*    1 */
+    {1, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*    2 */
+    {1, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*    3 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*    4 */
+    {1, 0, 0, 0, 0, 1, 0, 0, 0, 0}, /*    5 */
+    {0, 0, 0, 0, 0, 1, 0, 0, 0, 0}, /*    6 */
+    {1, 0, 0, 0, 0, 1, 0, 0, 0, 0}, /*    7 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*    8 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*    9 */
+    {0, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   10 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   11 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   12 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   13 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   14 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   15 */
+    {0, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   16 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   17 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   18 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   19 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   20 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   21 */
+    {0, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   22 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   23 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 0, 0}, /*   24 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   25 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   26 */
+    {0, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   27 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   28 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   29 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   30 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   31 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   32 */
+    {0, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   33 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   34 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   35 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   36 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   37 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   38 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   39 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   40 */
+    {0, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   41 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   42 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   43 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   44 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   45 */
+    {0, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   46 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   47 */
+    {1, 0, 0, 0, 0, 0, 1, 0, 0, 0}, /*   48 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   49 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   50 */
+    {0, 1, 0, 0, 0, 1, 0, 0, 0, 0}, /*   51 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 0, 0}, /*   52 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*   53 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   54 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   55 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   56 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   57 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   58 */
+    {0, 1, 0, 0, 0, 1, 0, 0, 0, 0}, /*   59 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 0, 0}, /*   60 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*   61 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   62 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   63 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   64 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   65 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   66 */
+    {0, 1, 0, 0, 0, 1, 0, 0, 0, 0}, /*   67 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 0, 0}, /*   68 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*   69 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   70 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   71 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   72 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   73 */
+    {0, 1, 0, 0, 0, 1, 0, 0, 0, 0}, /*   74 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 0, 0}, /*   75 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*   76 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   77 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   78 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   79 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   80 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   81 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   82 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   83 */
+    {0, 1, 0, 0, 0, 1, 0, 0, 0, 0}, /*   84 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 0, 0}, /*   85 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*   86 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   87 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   88 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   89 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   90 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   91 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   92 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   93 */
+    {0, 1, 0, 0, 0, 1, 0, 0, 0, 0}, /*   94 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 0, 0}, /*   95 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*   96 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   97 */
+    {1, 1, 0, 0, 0, 1, 1, 0, 0, 0}, /*   98 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*   99 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  100 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  101 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  102 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  103 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  104 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  105 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  106 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  107 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  108 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  109 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  110 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  111 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  112 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  113 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  114 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  115 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  116 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  117 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  118 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  119 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  120 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  121 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  122 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  123 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  124 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  125 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  126 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  127 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  128 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  129 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  130 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  131 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  132 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  133 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  134 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  135 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  136 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  137 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  138 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  139 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  140 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  141 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  142 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  143 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  144 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  145 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  146 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  147 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  148 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  149 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  150 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  151 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  152 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 0, 0}, /*  153 */
+    {1, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /*  154 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  155 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  156 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  157 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  158 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  159 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  160 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  161 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  162 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  163 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  164 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  165 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  166 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  167 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  168 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  169 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  170 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  171 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  172 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  173 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  174 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  175 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  176 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  177 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  178 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  179 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  180 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  181 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  182 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  183 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  184 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  185 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  186 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  187 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  188 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  189 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  190 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  191 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  192 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  193 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  194 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  195 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  196 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  197 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  198 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  199 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  200 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  201 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  202 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  203 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  204 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  205 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  206 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  207 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  208 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  209 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  210 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  211 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  212 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  213 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  214 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  215 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  216 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  217 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  218 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  219 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  220 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  221 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  222 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  223 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  224 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  225 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  226 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  227 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  228 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  229 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  230 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  231 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  232 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  233 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  234 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  235 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  236 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  237 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  238 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  239 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  240 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  241 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  242 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  243 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  244 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  245 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  246 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  247 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  248 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  249 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  250 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  251 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  252 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  253 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  254 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  255 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  256 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  257 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  258 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  259 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  260 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  261 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  262 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  263 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  264 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  265 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  266 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  267 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  268 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  269 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  270 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  271 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  272 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  273 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  274 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  275 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  276 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  277 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  278 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  279 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  280 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  281 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  282 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  283 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  284 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  285 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  286 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  287 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  288 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  289 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  290 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  291 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  292 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  293 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  294 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  295 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  296 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  297 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  298 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  299 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  300 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  301 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  302 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  303 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  304 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  305 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  306 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  307 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  308 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  309 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  310 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  311 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  312 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  313 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  314 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  315 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  316 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  317 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  318 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  319 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  320 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  321 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  322 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  323 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  324 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  325 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  326 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  327 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  328 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  329 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  330 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  331 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  332 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  333 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  334 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  335 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  336 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  337 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  338 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  339 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  340 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  341 */
+    {0, 1, 0, 0, 0, 0, 1, 0, 0, 0}, /*  342 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 0, 0}, /*  343 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  344 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  345 */
+    {1, 1, 0, 0, 0, 0, 2, 0, 0, 0}, /*  346 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  347 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  348 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  349 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  350 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  351 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  352 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  353 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  354 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  355 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  356 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  357 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  358 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  359 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  360 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  361 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  362 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  363 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  364 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  365 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  366 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  367 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  368 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  369 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  370 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  371 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  372 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  373 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  374 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  375 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  376 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  377 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  378 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  379 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  380 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  381 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  382 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  383 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  384 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  385 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  386 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  387 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  388 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  389 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  390 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  391 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  392 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  393 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  394 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  395 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  396 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  397 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  398 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  399 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  400 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  401 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  402 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  403 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  404 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  405 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  406 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  407 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  408 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  409 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  410 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  411 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  412 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  413 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  414 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  415 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  416 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  417 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  418 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  419 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  420 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  421 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  422 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  423 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  424 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  425 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  426 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  427 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  428 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  429 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  430 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  431 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  432 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  433 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  434 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  435 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  436 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  437 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  438 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  439 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  440 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  441 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  442 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  443 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  444 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  445 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  446 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  447 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  448 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  449 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  450 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  451 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  452 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  453 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  454 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  455 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  456 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  457 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  458 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  459 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  460 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  461 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  462 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  463 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  464 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  465 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  466 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  467 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  468 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  469 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  470 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  471 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  472 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  473 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  474 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  475 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  476 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  477 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  478 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  479 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  480 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  481 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  482 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  483 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  484 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  485 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  486 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  487 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  488 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  489 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  490 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  491 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  492 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  493 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  494 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  495 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  496 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  497 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  498 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  499 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  500 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  501 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  502 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  503 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  504 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  505 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  506 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  507 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  508 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  509 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  510 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  511 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  512 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  513 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  514 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  515 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  516 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  517 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  518 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  519 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  520 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  521 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  522 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  523 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  524 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  525 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  526 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  527 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  528 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  529 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  530 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  531 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  532 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  533 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  534 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  535 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  536 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  537 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  538 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  539 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  540 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  541 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  542 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  543 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  544 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  545 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  546 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  547 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  548 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  549 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  550 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  551 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  552 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  553 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  554 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  555 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  556 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  557 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  558 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  559 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  560 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  561 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  562 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  563 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  564 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  565 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  566 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  567 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  568 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  569 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  570 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  571 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  572 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  573 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  574 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  575 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  576 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  577 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  578 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  579 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  580 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  581 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  582 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  583 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  584 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  585 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  586 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  587 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  588 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  589 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  590 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  591 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  592 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  593 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  594 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  595 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  596 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  597 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  598 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  599 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  600 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  601 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  602 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  603 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  604 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  605 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  606 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  607 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  608 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  609 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  610 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  611 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  612 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  613 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  614 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  615 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  616 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  617 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  618 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  619 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  620 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  621 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  622 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  623 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  624 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  625 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  626 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  627 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  628 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  629 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  630 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  631 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  632 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  633 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  634 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  635 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  636 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  637 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  638 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  639 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  640 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  641 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  642 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  643 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  644 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  645 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  646 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  647 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  648 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  649 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  650 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  651 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  652 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  653 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  654 */
+    {0, 2, 0, 0, 0, 1, 1, 0, 0, 0}, /*  655 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  656 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  657 */
+    {0, 0, 0, 0, 0, 1, 3, 0, 0, 0}, /*  658 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  659 */
+    {1, 3, 0, 0, 0, 1, 3, 0, 0, 0}, /*  660 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  661 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  662 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 0, 0}, /*  663 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  664 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  665 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  666 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  667 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  668 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 0, 0}, /*  669 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  670 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  671 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  672 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  673 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  674 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 0, 0}, /*  675 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  676 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  677 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  678 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  679 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  680 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 0, 0}, /*  681 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  682 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  683 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  684 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  685 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  686 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 0, 0}, /*  687 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  688 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  689 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  690 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 0, 0}, /*  691 */
+    {1, 1, 0, 2, 0, 0, 0, 0, 0, 0}, /*  692 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  693 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 2, 0}, /*  694 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 2, 0}, /*  695 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 2, 0}, /*  696 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 2, 0}, /*  697 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 2, 0}, /*  698 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  699 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 2, 0}, /*  700 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 2, 0}, /*  701 */
+    {1, 1, 0, 0, 0, 0, 0, 0, 2, 0}, /*  702 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  703 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  704 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 2, 0}, /*  705 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 2, 0}, /*  706 */
+    {0, 0, 0, 2, 0, 1, 1, 0, 0, 0}, /*  707 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  708 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  709 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  710 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  711 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  712 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 2, 0}, /*  713 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 2, 0}, /*  714 */
+    {0, 0, 0, 2, 0, 1, 1, 0, 0, 0}, /*  715 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  716 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  717 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  718 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  719 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  720 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 2, 0}, /*  721 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 2, 0}, /*  722 */
+    {0, 0, 0, 2, 0, 1, 1, 0, 0, 0}, /*  723 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  724 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  725 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  726 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  727 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  728 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 2, 0}, /*  729 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 2, 0}, /*  730 */
+    {0, 0, 0, 2, 0, 1, 1, 0, 0, 0}, /*  731 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  732 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  733 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  734 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  735 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  736 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 2, 0}, /*  737 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 2, 0}, /*  738 */
+    {0, 0, 0, 2, 0, 1, 1, 0, 0, 0}, /*  739 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  740 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  741 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  742 */
+    {0, 0, 0, 2, 0, 0, 0, 0, 2, 0}, /*  743 */
+    {0, 0, 0, 0, 0, 1, 1, 0, 2, 0}, /*  744 */
+    {0, 0, 0, 2, 0, 1, 1, 0, 0, 0}, /*  745 */
+    {1, 1, 0, 2, 0, 1, 1, 0, 2, 0}, /*  746 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  747 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  748 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  749 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  750 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  751 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  752 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  753 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  754 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  755 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  756 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  757 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  758 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  759 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  760 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  761 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  762 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  763 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  764 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  765 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  766 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  767 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  768 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  769 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  770 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  771 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  772 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  773 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  774 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  775 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  776 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  777 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  778 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  779 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  780 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  781 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  782 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  783 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  784 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  785 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  786 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  787 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  788 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  789 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  790 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  791 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  792 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  793 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  794 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  795 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  796 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  797 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  798 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  799 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  800 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  801 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  802 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  803 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  804 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  805 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  806 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  807 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  808 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  809 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  810 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  811 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  812 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  813 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  814 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  815 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  816 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  817 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  818 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  819 */
+    {0, 4, 0, 0, 0, 0, 0, 0, 0, 0}, /*  820 */
+    {0, 2, 0, 2, 0, 0, 0, 0, 0, 0}, /*  821 */
+    {1, 5, 0, 2, 0, 0, 0, 0, 0, 0}, /*  822 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  823 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  824 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  825 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  826 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  827 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  828 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  829 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  830 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  831 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  832 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  833 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  834 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  835 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  836 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  837 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  838 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  839 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  840 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  841 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  842 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  843 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  844 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  845 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  846 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  847 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  848 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  849 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  850 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  851 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  852 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  853 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  854 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  855 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  856 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  857 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  858 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  859 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  860 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  861 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  862 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  863 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  864 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  865 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  866 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  867 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  868 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  869 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  870 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  871 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  872 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  873 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  874 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  875 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  876 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  877 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  878 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  879 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  880 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  881 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  882 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  883 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  884 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  885 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  886 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  887 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  888 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  889 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  890 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  891 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  892 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  893 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  894 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  895 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  896 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  897 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  898 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  899 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  900 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  901 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  902 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  903 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  904 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  905 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  906 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  907 */
+    {0, 0, 0, 2, 0, 0, 2, 0, 0, 0}, /*  908 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 0}, /*  909 */
+    {1, 1, 0, 2, 0, 0, 4, 0, 0, 0}, /*  910 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  911 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  912 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  913 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  914 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  915 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  916 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  917 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  918 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  919 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  920 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  921 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  922 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  923 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  924 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  925 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  926 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  927 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  928 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  929 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  930 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  931 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  932 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  933 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  934 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  935 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  936 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  937 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  938 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  939 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  940 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  941 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  942 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  943 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  944 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  945 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  946 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  947 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  948 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  949 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  950 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  951 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  952 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  953 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  954 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  955 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  956 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  957 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  958 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  959 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  960 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  961 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  962 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  963 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  964 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  965 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  966 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  967 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  968 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  969 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  970 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  971 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  972 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  973 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  974 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  975 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  976 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  977 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  978 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  979 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  980 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  981 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  982 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  983 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  984 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  985 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  986 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  987 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  988 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  989 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  990 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  991 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  992 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  993 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  994 */
+    {0, 2, 0, 0, 0, 0, 0, 0, 2, 0}, /*  995 */
+    {0, 0, 0, 0, 0, 0, 2, 0, 2, 0}, /*  996 */
+    {0, 2, 0, 0, 0, 0, 2, 0, 0, 0}, /*  997 */
+    {1, 3, 0, 0, 0, 0, 2, 0, 2, 0}, /*  998 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /*  999 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1000 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1001 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1002 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1003 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1004 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1005 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1006 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1007 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1008 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1009 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1010 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1011 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1012 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1013 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1014 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1015 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1016 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1017 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1018 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1019 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1020 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1021 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1022 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1023 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1024 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1025 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1026 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1027 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1028 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1029 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1030 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1031 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1032 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1033 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1034 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1035 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1036 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1037 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1038 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1039 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1040 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1041 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1042 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1043 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1044 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1045 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1046 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1047 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1048 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1049 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1050 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1051 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1052 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1053 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1054 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1055 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1056 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1057 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1058 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1059 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1060 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1061 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1062 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1063 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1064 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1065 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1066 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1067 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1068 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1069 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1070 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1071 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1072 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1073 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1074 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1075 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1076 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1077 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1078 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1079 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1080 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1081 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1082 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1083 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1084 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1085 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1086 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1087 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1088 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1089 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1090 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1091 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1092 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1093 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1094 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1095 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1096 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1097 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1098 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1099 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1100 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1101 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1102 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1103 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1104 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1105 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1106 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1107 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1108 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1109 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1110 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1111 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1112 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1113 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1114 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1115 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1116 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1117 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1118 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1119 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1120 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1121 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1122 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1123 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1124 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1125 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1126 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1127 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1128 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1129 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1130 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1131 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1132 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1133 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1134 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1135 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1136 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1137 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1138 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1139 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1140 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1141 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1142 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1143 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1144 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1145 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1146 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1147 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1148 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1149 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1150 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1151 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1152 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1153 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1154 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1155 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1156 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1157 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1158 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1159 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1160 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1161 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1162 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1163 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1164 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1165 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1166 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1167 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1168 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1169 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1170 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1171 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1172 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1173 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1174 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1175 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1176 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1177 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1178 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1179 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1180 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1181 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1182 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1183 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1184 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1185 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1186 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1187 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1188 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1189 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1190 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1191 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1192 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1193 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1194 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1195 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1196 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1197 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1198 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1199 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1200 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1201 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1202 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1203 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1204 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1205 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1206 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1207 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1208 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1209 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1210 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1211 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1212 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1213 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1214 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1215 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1216 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1217 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1218 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1219 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1220 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1221 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1222 */
+    {0, 4, 0, 0, 0, 1, 1, 0, 2, 0}, /* 1223 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1224 */
+    {0, 2, 0, 2, 0, 0, 2, 0, 2, 0}, /* 1225 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1226 */
+    {0, 4, 0, 0, 0, 0, 4, 0, 0, 0}, /* 1227 */
+    {0, 2, 0, 2, 0, 1, 3, 0, 0, 0}, /* 1228 */
+    {0, 0, 0, 0, 0, 1, 5, 0, 2, 0}, /* 1229 */
+    {1, 5, 0, 2, 0, 1, 5, 0, 2, 0}, /* 1230 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1231 */
+    {1, 0, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1232 */
+    {1, 0, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1233 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1234 */
+    {1, 0, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1235 */
+    {1, 0, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1236 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1237 */
+    {1, 0, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1238 */
+    {1, 0, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1239 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1240 */
+    {1, 0, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1241 */
+    {1, 0, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1242 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1243 */
+    {1, 0, 2, 0, 0, 1, 0, 2, 0, 0}, /* 1244 */
+    {0, 0, 0, 0, 0, 1, 0, 2, 0, 0}, /* 1245 */
+    {1, 0, 2, 0, 0, 1, 0, 2, 0, 0}, /* 1246 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1247 */
+    {1, 0, 2, 0, 0, 1, 0, 2, 0, 0}, /* 1248 */
+    {0, 0, 0, 0, 0, 1, 0, 2, 0, 0}, /* 1249 */
+    {1, 0, 2, 0, 0, 1, 0, 2, 0, 0}, /* 1250 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1251 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1252 */
+    {0, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1253 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1254 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1255 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1256 */
+    {0, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1257 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1258 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1259 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1260 */
+    {0, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1261 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1262 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1263 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1264 */
+    {0, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1265 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1266 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1267 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1268 */
+    {0, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1269 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1270 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1271 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1272 */
+    {0, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1273 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1274 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1275 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1276 */
+    {0, 3, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1277 */
+    {1, 3, 2, 0, 0, 0, 0, 0, 0, 0}, /* 1278 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1279 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1280 */
+    {0, 0, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1281 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1282 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1283 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1284 */
+    {0, 0, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1285 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1286 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1287 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1288 */
+    {0, 0, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1289 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1290 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1291 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1292 */
+    {0, 0, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1293 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1294 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1295 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1296 */
+    {0, 0, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1297 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1298 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1299 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1300 */
+    {0, 0, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1301 */
+    {1, 0, 2, 0, 0, 0, 3, 0, 0, 0}, /* 1302 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1303 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1304 */
+    {0, 3, 0, 0, 0, 1, 0, 2, 0, 0}, /* 1305 */
+    {0, 0, 0, 0, 0, 1, 3, 2, 0, 0}, /* 1306 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1307 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1308 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1309 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1310 */
+    {0, 3, 0, 0, 0, 1, 0, 2, 0, 0}, /* 1311 */
+    {0, 0, 0, 0, 0, 1, 3, 2, 0, 0}, /* 1312 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1313 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1314 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1315 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1316 */
+    {0, 3, 0, 0, 0, 1, 0, 2, 0, 0}, /* 1317 */
+    {0, 0, 0, 0, 0, 1, 3, 2, 0, 0}, /* 1318 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1319 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1320 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1321 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1322 */
+    {0, 3, 0, 0, 0, 1, 0, 2, 0, 0}, /* 1323 */
+    {0, 0, 0, 0, 0, 1, 3, 2, 0, 0}, /* 1324 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1325 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1326 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1327 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1328 */
+    {0, 3, 0, 0, 0, 1, 0, 2, 0, 0}, /* 1329 */
+    {0, 0, 0, 0, 0, 1, 3, 2, 0, 0}, /* 1330 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1331 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1332 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1333 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1334 */
+    {0, 3, 0, 0, 0, 1, 0, 2, 0, 0}, /* 1335 */
+    {0, 0, 0, 0, 0, 1, 3, 2, 0, 0}, /* 1336 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1337 */
+    {1, 3, 2, 0, 0, 1, 3, 2, 0, 0}, /* 1338 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1339 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1340 */
+    {0, 1, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1341 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1342 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1343 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1344 */
+    {0, 1, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1345 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1346 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1347 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1348 */
+    {0, 1, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1349 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1350 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1351 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1352 */
+    {0, 1, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1353 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1354 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1355 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1356 */
+    {0, 1, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1357 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1358 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1359 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1360 */
+    {0, 1, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1361 */
+    {1, 1, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1362 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1363 */
+    {1, 0, 2, 0, 0, 0, 1, 0, 0, 2}, /* 1364 */
+    {0, 0, 0, 0, 0, 0, 1, 0, 0, 2}, /* 1365 */
+    {1, 0, 2, 0, 0, 0, 1, 0, 0, 2}, /* 1366 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1367 */
+    {1, 1, 2, 0, 2, 1, 1, 2, 0, 2}, /* 1368 */
+    {0, 1, 0, 0, 2, 1, 0, 2, 0, 0}, /* 1369 */
+    {0, 0, 0, 0, 0, 1, 1, 2, 0, 2}, /* 1370 */
+    {0, 1, 0, 0, 2, 0, 1, 0, 0, 2}, /* 1371 */
+    {1, 1, 2, 0, 2, 1, 1, 2, 0, 2}, /* 1372 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1373 */
+    {1, 1, 2, 0, 2, 1, 1, 2, 0, 2}, /* 1374 */
+    {0, 1, 0, 0, 2, 1, 0, 2, 0, 0}, /* 1375 */
+    {0, 0, 0, 0, 0, 1, 1, 2, 0, 2}, /* 1376 */
+    {0, 1, 0, 0, 2, 0, 1, 0, 0, 2}, /* 1377 */
+    {1, 1, 2, 0, 2, 1, 1, 2, 0, 2}, /* 1378 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1379 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1380 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1381 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1382 */
+    {0, 6, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1383 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1384 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1385 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1386 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1387 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1388 */
+    {0, 6, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1389 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1390 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1391 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1392 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1393 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1394 */
+    {0, 6, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1395 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1396 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1397 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1398 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1399 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1400 */
+    {0, 6, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1401 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1402 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1403 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1404 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1405 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1406 */
+    {0, 6, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1407 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1408 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1409 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1410 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1411 */
+    {0, 4, 0, 0, 2, 0, 0, 0, 0, 0}, /* 1412 */
+    {0, 6, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1413 */
+    {1, 7, 2, 0, 2, 0, 0, 0, 0, 0}, /* 1414 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1415 */
+    {1, 1, 2, 0, 2, 0, 6, 0, 0, 0}, /* 1416 */
+    {0, 1, 0, 0, 2, 0, 3, 0, 0, 0}, /* 1417 */
+    {0, 1, 0, 0, 2, 0, 3, 0, 0, 0}, /* 1418 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 0, 0}, /* 1419 */
+    {1, 1, 2, 0, 2, 0, 6, 0, 0, 0}, /* 1420 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1421 */
+    {1, 1, 2, 0, 2, 0, 6, 0, 0, 0}, /* 1422 */
+    {0, 1, 0, 0, 2, 0, 3, 0, 0, 0}, /* 1423 */
+    {0, 1, 0, 0, 2, 0, 3, 0, 0, 0}, /* 1424 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 0, 0}, /* 1425 */
+    {1, 1, 2, 0, 2, 0, 6, 0, 0, 0}, /* 1426 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1427 */
+    {1, 1, 2, 0, 2, 0, 6, 0, 0, 0}, /* 1428 */
+    {0, 1, 0, 0, 2, 0, 3, 0, 0, 0}, /* 1429 */
+    {0, 1, 0, 0, 2, 0, 3, 0, 0, 0}, /* 1430 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 0, 0}, /* 1431 */
+    {1, 1, 2, 0, 2, 0, 6, 0, 0, 0}, /* 1432 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1433 */
+    {1, 1, 2, 0, 2, 0, 6, 0, 0, 0}, /* 1434 */
+    {0, 1, 0, 0, 2, 0, 3, 0, 0, 0}, /* 1435 */
+    {0, 1, 0, 0, 2, 0, 3, 0, 0, 0}, /* 1436 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 0, 0}, /* 1437 */
+    {1, 1, 2, 0, 2, 0, 6, 0, 0, 0}, /* 1438 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1439 */
+    {1, 3, 2, 0, 0, 0, 4, 0, 0, 2}, /* 1440 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 2}, /* 1441 */
+    {0, 3, 0, 0, 0, 0, 1, 0, 0, 2}, /* 1442 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1443 */
+    {1, 3, 2, 0, 0, 0, 4, 0, 0, 2}, /* 1444 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1445 */
+    {1, 3, 2, 0, 0, 0, 4, 0, 0, 2}, /* 1446 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 2}, /* 1447 */
+    {0, 3, 0, 0, 0, 0, 1, 0, 0, 2}, /* 1448 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1449 */
+    {1, 3, 2, 0, 0, 0, 4, 0, 0, 2}, /* 1450 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1451 */
+    {1, 3, 2, 0, 0, 0, 4, 0, 0, 2}, /* 1452 */
+    {0, 3, 0, 0, 0, 0, 1, 0, 0, 2}, /* 1453 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 2}, /* 1454 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1455 */
+    {1, 3, 2, 0, 0, 0, 4, 0, 0, 2}, /* 1456 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1457 */
+    {1, 3, 2, 0, 0, 0, 4, 0, 0, 2}, /* 1458 */
+    {0, 3, 0, 0, 0, 0, 1, 0, 0, 2}, /* 1459 */
+    {0, 0, 0, 0, 0, 0, 4, 0, 0, 2}, /* 1460 */
+    {0, 3, 0, 0, 0, 0, 3, 0, 0, 0}, /* 1461 */
+    {1, 3, 2, 0, 0, 0, 4, 0, 0, 2}, /* 1462 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1463 */
+    {1, 7, 2, 0, 2, 1, 7, 2, 0, 2}, /* 1464 */
+    {0, 6, 0, 0, 0, 1, 1, 2, 0, 2}, /* 1465 */
+    {0, 4, 0, 0, 2, 1, 3, 2, 0, 0}, /* 1466 */
+    {0, 4, 0, 0, 2, 1, 3, 2, 0, 0}, /* 1467 */
+    {0, 4, 0, 0, 2, 0, 4, 0, 0, 2}, /* 1468 */
+    {0, 4, 0, 0, 2, 0, 4, 0, 0, 2}, /* 1469 */
+    {0, 6, 0, 0, 0, 0, 6, 0, 0, 0}, /* 1470 */
+    {0, 0, 0, 0, 0, 1, 7, 2, 0, 2}, /* 1471 */
+    {1, 7, 2, 0, 2, 1, 7, 2, 0, 2}, /* 1472 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1473 */
+    {1, 7, 2, 0, 2, 1, 7, 2, 0, 2}, /* 1474 */
+    {0, 6, 0, 0, 0, 1, 1, 2, 0, 2}, /* 1475 */
+    {0, 4, 0, 0, 2, 1, 3, 2, 0, 0}, /* 1476 */
+    {0, 4, 0, 0, 2, 1, 3, 2, 0, 0}, /* 1477 */
+    {0, 4, 0, 0, 2, 0, 4, 0, 0, 2}, /* 1478 */
+    {0, 4, 0, 0, 2, 0, 4, 0, 0, 2}, /* 1479 */
+    {0, 6, 0, 0, 0, 0, 6, 0, 0, 0}, /* 1480 */
+    {0, 0, 0, 0, 0, 1, 7, 2, 0, 2}, /* 1481 */
+    {1, 7, 2, 0, 2, 1, 7, 2, 0, 2}, /* 1482 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1483 */
+    {1, 7, 2, 0, 2, 1, 7, 2, 0, 2}, /* 1484 */
+    {0, 6, 0, 0, 0, 1, 1, 2, 0, 2}, /* 1485 */
+    {0, 4, 0, 0, 2, 1, 3, 2, 0, 0}, /* 1486 */
+    {0, 4, 0, 0, 2, 1, 3, 2, 0, 0}, /* 1487 */
+    {0, 4, 0, 0, 2, 0, 4, 0, 0, 2}, /* 1488 */
+    {0, 4, 0, 0, 2, 0, 4, 0, 0, 2}, /* 1489 */
+    {0, 6, 0, 0, 0, 0, 6, 0, 0, 0}, /* 1490 */
+    {0, 0, 0, 0, 0, 1, 7, 2, 0, 2}, /* 1491 */
+    {1, 7, 2, 0, 2, 1, 7, 2, 0, 2}, /* 1492 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1493 */
+    {1, 7, 2, 0, 2, 1, 7, 2, 0, 2}, /* 1494 */
+    {0, 6, 0, 0, 0, 1, 1, 2, 0, 2}, /* 1495 */
+    {0, 4, 0, 0, 2, 1, 3, 2, 0, 0}, /* 1496 */
+    {0, 4, 0, 0, 2, 1, 3, 2, 0, 0}, /* 1497 */
+    {0, 4, 0, 0, 2, 0, 4, 0, 0, 2}, /* 1498 */
+    {0, 4, 0, 0, 2, 0, 4, 0, 0, 2}, /* 1499 */
+    {0, 6, 0, 0, 0, 0, 6, 0, 0, 0}, /* 1500 */
+    {0, 0, 0, 0, 0, 1, 7, 2, 0, 2}, /* 1501 */
+    {1, 7, 2, 0, 2, 1, 7, 2, 0, 2}, /* 1502 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1503 */
+    {1, 3, 8, 0, 0, 0, 0, 0, 0, 0}, /* 1504 */
+    {1, 3, 8, 0, 0, 0, 0, 0, 0, 0}, /* 1505 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1506 */
+    {1, 3, 8, 0, 0, 0, 0, 0, 0, 0}, /* 1507 */
+    {1, 3, 8, 0, 0, 0, 0, 0, 0, 0}, /* 1508 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1509 */
+    {1, 3, 8, 0, 0, 0, 0, 0, 0, 0}, /* 1510 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1511 */
+    {1, 3, 8, 0, 0, 0, 0, 0, 0, 0}, /* 1512 */
+    {1, 3, 8, 0, 0, 0, 0, 0, 0, 0}, /* 1513 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1514 */
+    {1, 3, 8, 0, 0, 0, 0, 0, 0, 0}, /* 1515 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1516 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1517 */
+    {0, 0, 0, 0, 0, 1, 3, 8, 0, 0}, /* 1518 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1519 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1520 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1521 */
+    {0, 0, 0, 0, 0, 1, 3, 8, 0, 0}, /* 1522 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1523 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1524 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1525 */
+    {0, 0, 0, 0, 0, 1, 3, 8, 0, 0}, /* 1526 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1527 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1528 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1529 */
+    {0, 0, 0, 0, 0, 1, 3, 8, 0, 0}, /* 1530 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1531 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1532 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1533 */
+    {0, 0, 0, 0, 0, 1, 3, 8, 0, 0}, /* 1534 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1535 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1536 */
+    {0, 0, 0, 0, 0, 1, 3, 8, 0, 0}, /* 1537 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1538 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1539 */
+    {1, 3, 8, 0, 0, 1, 3, 8, 0, 0}, /* 1540 */
+    {0, 0, 0, 0, 0, 1, 3, 8, 0, 0}, /* 1541 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1542 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1543 */
+    {0, 6, 0, 6, 0, 0, 0, 0, 0, 0}, /* 1544 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1545 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1546 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1547 */
+    {0, 6, 0, 6, 0, 0, 0, 0, 0, 0}, /* 1548 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1549 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1550 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1551 */
+    {0, 6, 0, 6, 0, 0, 0, 0, 0, 0}, /* 1552 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1553 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1554 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1555 */
+    {0, 6, 0, 6, 0, 0, 0, 0, 0, 0}, /* 1556 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1557 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1558 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1559 */
+    {0, 6, 0, 6, 0, 0, 0, 0, 0, 0}, /* 1560 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1561 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1562 */
+    {0, 6, 0, 6, 0, 0, 0, 0, 0, 0}, /* 1563 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1564 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1565 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1566 */
+    {0, 6, 0, 6, 0, 0, 0, 0, 0, 0}, /* 1567 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1568 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1569 */
+    {1, 9, 8, 6, 0, 0, 0, 0, 0, 0}, /* 1570 */
+    {0, 6, 0, 6, 0, 0, 0, 0, 0, 0}, /* 1571 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1572 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1573 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 6, 0}, /* 1574 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1575 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1576 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1577 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 6, 0}, /* 1578 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1579 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1580 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1581 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 6, 0}, /* 1582 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1583 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1584 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 6, 0}, /* 1585 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1586 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1587 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1588 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 6, 0}, /* 1589 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1590 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1591 */
+    {1, 3, 8, 0, 0, 0, 6, 0, 6, 0}, /* 1592 */
+    {0, 0, 0, 0, 0, 0, 6, 0, 6, 0}, /* 1593 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1594 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1595 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1596 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1597 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1598 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1599 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1600 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1601 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1602 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1603 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1604 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1605 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1606 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1607 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1608 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1609 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1610 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1611 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1612 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1613 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1614 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1615 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1616 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1617 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1618 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1619 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1620 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1621 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1622 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1623 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1624 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1625 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1626 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1627 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1628 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1629 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1630 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1631 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1632 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1633 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1634 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1635 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1636 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1637 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1638 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1639 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1640 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1641 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1642 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1643 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1644 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1645 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1646 */
+    {0, 0, 0, 0, 0, 0, 0, 0, 0, 0}, /* 1647 */
+    {1, 9, 8, 6, 0, 1, 9, 8, 6, 0}, /* 1648 */
+    {0, 6, 0, 6, 0, 1, 3, 8, 0, 0}, /* 1649 */
+    {0, 6, 0, 6, 0, 0, 6, 0, 6, 0}, /* 1650 */
+    {0, 0, 0, 0, 0, 1, 9, 8, 6, 0}, /* 1651 */
+};
+/* clang-format on */
+
+static int is_time_reversal_classes_of_uni(
+    int const classes[NUM_ROTATION_CLASSES], int const uni_number) {
+    int i;
+
+    for (i = 0; i < NUM_ROTATION_CLASSES; i++) {
+        if (classes[i] !=
+            magnetic_spacegroup_time_reversal_classes[uni_number][i]) {
+            return 0;
+        }
+    }
+    return 1;
+}
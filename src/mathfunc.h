@@ -64,7 +64,7 @@ double mat_rem1(double const a);
 MatINT *mat_alloc_MatINT(int const size);
 void mat_free_MatINT(MatINT *matint);
 VecDBL *mat_alloc_VecDBL(int const size);
-void mat_free_VecDBL(VecDBL *vecdbl);
+SPG_API_TEST void mat_free_VecDBL(VecDBL *vecdbl);
 int mat_is_int_matrix(double const mat[3][3], double const symprec);
 
 #endif
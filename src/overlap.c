@@ -18,6 +18,10 @@
     #define SPG_POST_INCREMENT(a, b) ((a) += (b), (a) - (b))
 #endif
 
+/* Margin of the range of bins searched around a position in units of */
+/* the bin width. */
+#define BIN_MARGIN 1e-6
+
 /* deal with inline */
 #if defined(_MSC_VER)
     #define OVL_INLINE __forceinline
@@ -32,6 +36,10 @@
     #define OVL_INLINE /* empty */
 #endif
 
+/* Number of OverlapCheckers allocated in this thread. */
+/* Only used to monitor how often a cell is sorted into bins. */
+static thread_local int num_allocated_checkers = 0;
+
 /* Note: data_out and data_in MUST NOT ALIAS. */
 static void permute(void *data_out, void const *data_in, int const *perm,
                     int value_size, int n);
@@ -42,39 +50,33 @@ static void permute_int(int *data_out, int const *data_in, int const *perm,
 static void permute_double_3(double (*data_out)[3], double const (*data_in)[3],
                              int const *perm, int const n);
 
-static int ValueWithIndex_comparator(void const *pa, void const *pb);
+static OverlapChecker *overlap_checker_alloc(int size);
 
-static void *perm_argsort_work_malloc(int n);
+static int set_bins(OverlapChecker *checker, Cell const *cell,
+                    double const symprec);
 
-static void perm_argsort_work_free(void *work);
+static void sort_by_bin(OverlapChecker *checker, Cell const *cell);
 
-static int perm_argsort(int *perm, int const *types, double const *values,
-                        void *provided_work, int const n);
+static void get_bin_range(int lower[3], int num[3],
+                          OverlapChecker const *checker, double const pos[3],
+                          double const symprec);
 
-static int check_possible_overlap(OverlapChecker *checker,
-                                  double const test_trans[3],
-                                  int const rot[3][3], double const symprec);
+static int find_overlapping_atom(OverlapChecker const *checker,
+                                 double const pos[3], int const type,
+                                 int const *found, double const symprec);
 
-static int argsort_by_lattice_point_distance(
-    int *perm, double const lattice[3][3], double const (*positions)[3],
-    int const *types, double *distance_temp, void *argsort_work,
-    int const size);
+static double const (*get_rotated_positions(OverlapChecker *checker,
+                                            int const rot[3][3],
+                                            int const is_identity))[3];
 
-static OverlapChecker *overlap_checker_alloc(int size);
+static int check_possible_overlap(OverlapChecker const *checker,
+                                  double const (*pos_rotated)[3],
+                                  double const test_trans[3],
+                                  double const symprec);
 
-static int check_total_overlap_for_sorted(
-    double const lattice[3][3], double const (*pos_original)[3],
-    double const (*pos_rotated)[3], int const types_original[],
-    int const types_rotated[], int const num_pos, double const symprec);
-/* ovl_check_total_overlap ,check_total_overlap_for_sorted, layer_has_overlap */
-/* and layer_has_overlap_with_same_type are copied to get rid of some if
- * statement */
-/* I have not tested if it is better in efficiency. */
-static int check_layer_total_overlap_for_sorted(
-    double const lattice[3][3], double const (*pos_original)[3],
-    double const (*pos_rotated)[3], int const types_original[],
-    int const types_rotated[], int const num_pos, int const periodic_axes[3],
-    double const symprec);
+static int check_total_overlap(OverlapChecker *checker,
+                               double const test_trans[3], int const rot[3][3],
+                               double const symprec, int const is_identity);
 
 /* Note that some compilers apparently don't like it
  * when you have a separate prototype with a function
@@ -100,82 +102,40 @@ static OVL_INLINE int Nint(double const a) {
         return (int)(a + 0.5);
 }
 
-static OVL_INLINE int has_overlap(double const a[3], double const b[3],
-                                  double const lattice[3][3],
-                                  double const symprec) {
+/* Distance between a and b, where the differences along the */
+/* periodic axes are taken modulo lattice translations. */
+static OVL_INLINE double get_distance(double const a[3], double const b[3],
+                                      double const lattice[3][3],
+                                      int const aperiodic_axis) {
+    int k;
     double v_diff[3];
-    v_diff[0] = a[0] - b[0];
-    v_diff[2] = a[2] - b[2];
-    v_diff[1] = a[1] - b[1];
-
-    v_diff[0] -= Nint(v_diff[0]);
-    v_diff[1] -= Nint(v_diff[1]);
-    v_diff[2] -= Nint(v_diff[2]);
 
-    if (cartesian_norm(lattice, v_diff) <= symprec) {
-        return 1;
-    } else {
-        return 0;
+    for (k = 0; k < 3; k++) {
+        v_diff[k] = a[k] - b[k];
+        if (k != aperiodic_axis) {
+            v_diff[k] -= Nint(v_diff[k]);
+        }
     }
-}
 
-static OVL_INLINE int has_overlap_with_same_type(
-    double const a[3], double const b[3], int const type_a, int const type_b,
-    double const lattice[3][3], double const symprec) {
-    if (type_a == type_b) {
-        return has_overlap(a, b, lattice, symprec);
-    } else {
-        return 0;
-    }
+    return cartesian_norm(lattice, v_diff);
 }
 
-/* Modified from has_overlap */
-static OVL_INLINE int layer_has_overlap(double const a[3], double const b[3],
-                                        double const lattice[3][3],
-                                        int const periodic_axes[2],
-                                        double const symprec) {
-    double v_diff[3];
-    v_diff[0] = a[0] - b[0];
-    v_diff[1] = a[1] - b[1];
-    v_diff[2] = a[2] - b[2];
-
-    v_diff[periodic_axes[0]] -= Nint(v_diff[periodic_axes[0]]);
-    v_diff[periodic_axes[1]] -= Nint(v_diff[periodic_axes[1]]);
-
-    if (cartesian_norm(lattice, v_diff) <= symprec) {
-        return 1;
-    } else {
-        return 0;
-    }
-}
+/* Bin of a fractional coordinate along an axis with num_bins bins. */
+static OVL_INLINE int get_bin(double const x, int const num_bins) {
+    int bin;
+    double frac;
 
-static OVL_INLINE int layer_has_overlap_with_same_type(
-    double const a[3], double const b[3], int const type_a, int const type_b,
-    double const lattice[3][3], int const periodic_axes[2],
-    double const symprec) {
-    if (type_a == type_b) {
-        return layer_has_overlap(a, b, lattice, periodic_axes, symprec);
-    } else {
+    frac = x - floor(x);
+    /* Also guards against NaN */
+    if (!(frac >= 0 && frac < 1)) {
         return 0;
     }
+    bin = (int)(frac * num_bins);
+    return bin < num_bins ? bin : num_bins - 1;
 }
 
-/* ------------------------------------- */
-/*          arg-sorting                  */
-
-/* Helper type used to get sorted indices of values. */
-typedef struct {
-    double value;
-    int type;
-    int index;
-} ValueWithIndex;
-
 void ovl_overlap_checker_free(OverlapChecker *checker) {
     if (checker != NULL) {
-        if (checker->argsort_work != NULL) {
-            free(checker->argsort_work);
-            checker->argsort_work = NULL;
-        }
         if (checker->blob != NULL) {
             free(checker->blob);
             checker->blob = NULL;
@@ -184,7 +144,10 @@ void ovl_overlap_checker_free(OverlapChecker *checker) {
     }
 }
 
-OverlapChecker *ovl_overlap_checker_init(Cell const *cell) {
+/* The bins are chosen with respect to symprec, but any tolerance can be */
+/* used with the returned OverlapChecker. */
+OverlapChecker *ovl_overlap_checker_init(Cell const *cell,
+                                         double const symprec) {
     int i, lattice_rank;
     OverlapChecker *checker;
     checker = NULL;
@@ -196,22 +159,7 @@ OverlapChecker *ovl_overlap_checker_init(Cell const *cell) {
 
     mat_copy_matrix_d3(checker->lattice, cell->lattice);
 
-    /* Get the permutation that sorts the original cell. */
-    if (!argsort_by_lattice_point_distance(
-            checker->perm_temp, cell->lattice, cell->position, cell->types,
-            checker->distance_temp, checker->argsort_work, checker->size)) {
-        ovl_overlap_checker_free(checker);
-        return NULL;
-    }
-
-    /* Use the perm to sort the cell. */
-    /* The sorted cell is saved for as long as the OverlapChecker lives. */
-    permute_double_3(checker->pos_sorted, cell->position, checker->perm_temp,
-                     cell->size);
-
-    permute_int(checker->types_sorted, cell->types, checker->perm_temp,
-                cell->size);
-
+    checker->aperiodic_axis = cell->aperiodic_axis;
     lattice_rank = 0;
     for (i = 0; i < 3; i++) {
         if (i != cell->aperiodic_axis) {
@@ -220,6 +168,18 @@ OverlapChecker *ovl_overlap_checker_init(Cell const *cell) {
         }
     }
 
+    if (!set_bins(checker, cell, symprec)) {
+        ovl_overlap_checker_free(checker);
+        return NULL;
+    }
+
+    /* The sorted cell is saved for as long as the OverlapChecker lives. */
+    sort_by_bin(checker, cell);
+
+    num_allocated_checkers++;
+    debug_print("OverlapChecker allocated (%d in this thread)\n",
+                num_allocated_checkers);
+
     return checker;
 }
 
@@ -233,55 +193,7 @@ OverlapChecker *ovl_overlap_checker_init(Cell const *cell) {
 int ovl_check_total_overlap(OverlapChecker *checker, double const test_trans[3],
                             int const rot[3][3], double const symprec,
                             int const is_identity) {
-    int i, k, check;
-
-    /* Check a few atoms by brute force before continuing. */
-    /* For bad translations, this can be much cheaper than sorting. */
-    if (!check_possible_overlap(checker, test_trans, rot, symprec)) {
-        return 0;
-    }
-
-    /* Write rotated positions to 'pos_temp_1' */
-    for (i = 0; i < checker->size; i++) {
-        if (is_identity) {
-            for (k = 0; k < 3; k++) {
-                checker->pos_temp_1[i][k] = checker->pos_sorted[i][k];
-            }
-        } else {
-            mat_multiply_matrix_vector_id3(checker->pos_temp_1[i], rot,
-                                           checker->pos_sorted[i]);
-        }
-
-        for (k = 0; k < 3; k++) {
-            checker->pos_temp_1[i][k] += test_trans[k];
-        }
-    }
-
-    /* Get permutation that sorts these positions. */
-    if (!argsort_by_lattice_point_distance(
-            checker->perm_temp, checker->lattice, checker->pos_temp_1,
-            checker->types_sorted, checker->distance_temp,
-            checker->argsort_work, checker->size)) {
-        return -1;
-    }
-
-    /* Use the permutation to sort them. Write to 'pos_temp_2'. */
-    permute_double_3(checker->pos_temp_2, checker->pos_temp_1,
-                     checker->perm_temp, checker->size);
-
-    /* Do optimized check for overlap between sorted coordinates. */
-    check = check_total_overlap_for_sorted(
-        checker->lattice, checker->pos_sorted, /* pos_original */
-        checker->pos_temp_2,                   /* pos_rotated */
-        checker->types_sorted,                 /* types_original */
-        checker->types_sorted,                 /* types_original */
-        checker->size, symprec);
-    if (check == -1) {
-        /* Error! */
-        return -1;
-    }
-
-    return check;
+    return check_total_overlap(checker, test_trans, rot, symprec, is_identity);
 }
 
 /* Uses a OverlapChecker to efficiently--but thoroughly--confirm that a given
@@ -290,134 +202,71 @@ int ovl_check_total_overlap(OverlapChecker *checker, double const test_trans[3],
  * same cell, */
 /* you can create one OverlapChecker from the Cell and call this function many
  * times. */
+/* The OverlapChecker has to be made from a cell with aperiodic_axis set. */
 /* -1: Error.  0:  Not a symmetry.   1. Is a symmetry. */
 int ovl_check_layer_total_overlap(OverlapChecker *checker,
                                   double const test_trans[3],
                                   int const rot[3][3], double const symprec,
                                   int const is_identity) {
-    int i, k, check;
-
-    /* Check a few atoms by brute force before continuing. */
-    /* For bad translations, this can be much cheaper than sorting. */
-    if (!check_possible_overlap(checker, test_trans, rot, symprec)) {
-        return 0;
-    }
-
-    /* Write rotated positions to 'pos_temp_1' */
-    for (i = 0; i < checker->size; i++) {
-        if (is_identity) {
-            for (k = 0; k < 3; k++) {
-                checker->pos_temp_1[i][k] = checker->pos_sorted[i][k];
-            }
-        } else {
-            mat_multiply_matrix_vector_id3(checker->pos_temp_1[i], rot,
-                                           checker->pos_sorted[i]);
-        }
-
-        for (k = 0; k < 3; k++) {
-            checker->pos_temp_1[i][k] += test_trans[k];
-        }
-    }
-
-    /* Get permutation that sorts these positions. */
-    if (!argsort_by_lattice_point_distance(
-            checker->perm_temp, checker->lattice, checker->pos_temp_1,
-            checker->types_sorted, checker->distance_temp,
-            checker->argsort_work, checker->size)) {
-        return -1;
-    }
-
-    /* Use the permutation to sort them. Write to 'pos_temp_2'. */
-    permute_double_3(checker->pos_temp_2, checker->pos_temp_1,
-                     checker->perm_temp, checker->size);
-
-    /* Do optimized check for overlap between sorted coordinates. */
-    check = check_layer_total_overlap_for_sorted(
-        checker->lattice, checker->pos_sorted, /* pos_original */
-        checker->pos_temp_2,                   /* pos_rotated */
-        checker->types_sorted,                 /* types_original */
-        checker->types_sorted,                 /* types_original */
-        checker->size, checker->periodic_axes, symprec);
-    if (check == -1) {
-        /* Error! */
-        return -1;
-    }
-
-    return check;
-}
-
-static int ValueWithIndex_comparator(void const *pa, void const *pb) {
-    int cmp;
-    ValueWithIndex a, b;
-
-    a = *((ValueWithIndex *)pa);
-    b = *((ValueWithIndex *)pb);
-
-    /* order by atom type, then by value */
-    cmp = (b.type < a.type) - (a.type < b.type);
-    if (!cmp) {
-        cmp = (b.value < a.value) - (a.value < b.value);
-    }
-
-    return cmp;
+    return check_total_overlap(checker, test_trans, rot, symprec, is_identity);
 }
 
-static void *perm_argsort_work_malloc(int n) {
-    ValueWithIndex *work;
-
-    work = NULL;
-
-    if ((work = (ValueWithIndex *)(malloc(sizeof(ValueWithIndex) * n))) ==
-        NULL) {
-        warning_memory("work");
-        return NULL;
-    }
-    return work;
-}
-
-static void perm_argsort_work_free(void *work) { free(work); }
-
-/* Compute a permutation that sorts values first by atom type, */
-/* and then by value.  If types is NULL, all atoms are assumed */
-/* to have the same type. */
-/* */
-/* Returns 0 on failure. */
-static int perm_argsort(int *perm, int const *types, double const *values,
-                        void *provided_work, int const n) {
+/* Find the atom of the given type overlapping with 'pos' within symprec */
+/* by looking up the bins of the OverlapChecker. */
+/* Returns the index of the closest such atom in the original cell, */
+/* or -1 if there is none. */
+int ovl_find_overlapping_atom(OverlapChecker const *checker,
+                              double const pos[3], int const type,
+                              double const symprec) {
     int i;
-    ValueWithIndex *work;
-
-    work = NULL;
-
-    if (provided_work) {
-        work = (ValueWithIndex *)provided_work;
-    } else if ((work = perm_argsort_work_malloc(n)) == NULL) {
-        return 0;
-    }
-
-    /* Make array of all data for each value. */
-    for (i = 0; i < n; i++) {
-        work[i].value = values[i];
-        work[i].index = i;
-        work[i].type = types ? types[i] : 0;
-    }
 
-    /* Sort by type and value. */
-    qsort(work, n, sizeof(ValueWithIndex), &ValueWithIndex_comparator);
-
-    /* Retrieve indices.  This is the permutation. */
-    for (i = 0; i < n; i++) {
-        perm[i] = work[i].index;
-    }
+    i = find_overlapping_atom(checker, pos, type, NULL, symprec);
+    return i == -1 ? -1 : checker->index_sorted[i];
+}
 
-    if (!provided_work) {
-        perm_argsort_work_free(work);
-        work = NULL;
+/* Same as ovl_find_overlapping_atom but returns the lowest index of the */
+/* atoms within symprec instead of the closest one, i.e., the atom found */
+/* first by scanning the atoms of the original cell in order. */
+int ovl_find_first_overlapping_atom(OverlapChecker const *checker,
+                                    double const pos[3], int const type,
+                                    double const symprec) {
+    int i, i_bin, j_bin, k_bin, bin, index;
+    int lower[3], num[3];
+
+    get_bin_range(lower, num, checker, pos, symprec);
+
+    index = -1;
+    for (i_bin = 0; i_bin < num[0]; i_bin++) {
+        for (j_bin = 0; j_bin < num[1]; j_bin++) {
+            for (k_bin = 0; k_bin < num[2]; k_bin++) {
+                bin = ((lower[0] + i_bin) % checker->num_bins[0]) *
+                          checker->num_bins[1] +
+                      (lower[1] + j_bin) % checker->num_bins[1];
+                bin = bin * checker->num_bins[2] +
+                      (lower[2] + k_bin) % checker->num_bins[2];
+                for (i = checker->bin_start[bin];
+                     i < checker->bin_start[bin + 1]; i++) {
+                    if (checker->types_sorted[i] != type) {
+                        continue;
+                    }
+                    if (index != -1 && checker->index_sorted[i] > index) {
+                        continue;
+                    }
+                    if (get_distance(pos, checker->pos_sorted[i],
+                                     checker->lattice,
+                                     checker->aperiodic_axis) <= symprec) {
+                        index = checker->index_sorted[i];
+                    }
+                }
+            }
+        }
     }
 
-    return 1;
+    return index;
 }
 
+int ovl_get_num_allocated_checkers(void) { return num_allocated_checkers; }
+
 /* Permute an array. */
 /* data_out and data_in MUST NOT ALIAS. */
 static void permute(void *data_out, void const *data_in, int const *perm,
@@ -447,27 +296,30 @@ static void permute_double_3(double (*data_out)[3], double const (*data_in)[3],
 }
 
 static OverlapChecker *overlap_checker_alloc(int size) {
-    int offset_pos_temp_1, offset_pos_temp_2, offset_distance_temp;
-    int offset_perm_temp, offset_pos_sorted, offset_types_sorted,
-        offset_lattice;
-    int offset_periodic_axes;
-    int offset, blob_size;
+    int offset_found, offset_pos_sorted, offset_types_sorted, offset_lattice;
+    int offset_index_sorted, offset_bin_start, offset_periodic_axes;
+    int offset_pos_rotated;
+    int offset, blob_size, max_num_bins;
     char *chr_blob;
     OverlapChecker *checker;
 
     chr_blob = NULL;
     checker = NULL;
 
+    /* The number of bins is limited to the number of atoms. */
+    max_num_bins = size > 1 ? size : 1;
+
     /* checker->blob is going to contain lots of things. */
     /* Compute its total size and the number of bytes before each thing. */
     offset = 0;
-    offset_pos_temp_1 = SPG_POST_INCREMENT(offset, size * sizeof(double[3]));
-    offset_pos_temp_2 = SPG_POST_INCREMENT(offset, size * sizeof(double[3]));
-    offset_distance_temp = SPG_POST_INCREMENT(offset, size * sizeof(double));
-    offset_perm_temp = SPG_POST_INCREMENT(offset, size * sizeof(int));
     offset_lattice = SPG_POST_INCREMENT(offset, 9 * sizeof(double));
     offset_pos_sorted = SPG_POST_INCREMENT(offset, size * sizeof(double[3]));
+    offset_pos_rotated = SPG_POST_INCREMENT(offset, size * sizeof(double[3]));
+    offset_found = SPG_POST_INCREMENT(offset, size * sizeof(int));
     offset_types_sorted = SPG_POST_INCREMENT(offset, size * sizeof(int));
+    offset_index_sorted = SPG_POST_INCREMENT(offset, size * sizeof(int));
+    offset_bin_start =
+        SPG_POST_INCREMENT(offset, (max_num_bins + 1) * sizeof(int));
     offset_periodic_axes = SPG_POST_INCREMENT(offset, 3 * sizeof(int));
     blob_size = offset;
 
@@ -483,226 +335,296 @@ static OverlapChecker *overlap_checker_alloc(int size) {
         return NULL;
     }
 
-    if ((checker->argsort_work = perm_argsort_work_malloc(size)) == NULL) {
-        free(checker->blob);
-        checker->blob = NULL;
-        free(checker);
-        checker = NULL;
-        return NULL;
-    }
-
     checker->size = size;
+    checker->has_rot_cached = 0;
 
     /* Create the pointers to the things contained in checker->blob. */
     /* The C spec doesn't allow arithmetic directly on 'void *', */
     /* so a 'char *' is used. */
     chr_blob = (char *)checker->blob;
-    checker->pos_temp_1 = (double (*)[3])(chr_blob + offset_pos_temp_1);
-    checker->pos_temp_2 = (double (*)[3])(chr_blob + offset_pos_temp_2);
-    checker->distance_temp = (double *)(chr_blob + offset_distance_temp);
-    checker->perm_temp = (int *)(chr_blob + offset_perm_temp);
+    checker->found = (int *)(chr_blob + offset_found);
     checker->lattice = (double (*)[3])(chr_blob + offset_lattice);
     checker->pos_sorted = (double (*)[3])(chr_blob + offset_pos_sorted);
     checker->types_sorted = (int *)(chr_blob + offset_types_sorted);
+    checker->index_sorted = (int *)(chr_blob + offset_index_sorted);
+    checker->pos_rotated = (double (*)[3])(chr_blob + offset_pos_rotated);
+    checker->bin_start = (int *)(chr_blob + offset_bin_start);
     checker->periodic_axes = (int *)(chr_blob + offset_periodic_axes);
 
     return checker;
 }
 
-static int argsort_by_lattice_point_distance(
-    int *perm, double const lattice[3][3], double const (*positions)[3],
-    int const *types, double *distance_temp, void *argsort_work,
-    int const size) {
-    double diff[3];
-    int i, k;
-    double x;
-
-    /* Fill distance_temp with distances. */
-    for (i = 0; i < size; i++) {
-        /* Fractional vector to nearest lattice point. */
-        for (k = 0; k < 3; k++) {
-            x = positions[i][k];
-            diff[k] = x - mat_Nint(x);
+/* Choose the number of bins along each axis so that a bin is at least as */
+/* wide as symprec, i.e. overlapping atoms are in the same or neighboring */
+/* bins. The total number of bins is limited to the number of atoms. */
+/* Return 0 if failed. */
+static int set_bins(OverlapChecker *checker, Cell const *cell,
+                    double const symprec) {
+    int i, k, k_max, max_num_bins;
+    double inv_lattice[3][3];
+    double num_bins, width, scale;
+
+    if (!mat_inverse_matrix_d3(inv_lattice, cell->lattice, 0)) {
+        warning_print("spglib: Lattice is singular.\n");
+        return 0;
+    }
+
+    max_num_bins = cell->size > 1 ? cell->size : 1;
+    for (k = 0; k < 3; k++) {
+        checker->inv_lattice_norms[k] =
+            sqrt(inv_lattice[k][0] * inv_lattice[k][0] +
+                 inv_lattice[k][1] * inv_lattice[k][1] +
+                 inv_lattice[k][2] * inv_lattice[k][2]);
+        width = symprec * checker->inv_lattice_norms[k];
+        if (k == cell->aperiodic_axis) {
+            num_bins = 1;
+        } else if (width > 0) {
+            num_bins = floor(1 / width);
+        } else {
+            num_bins = max_num_bins;
+        }
+        if (!(num_bins >= 1)) {
+            num_bins = 1;
+        } else if (num_bins > max_num_bins) {
+            num_bins = max_num_bins;
         }
+        checker->num_bins[k] = (int)num_bins;
+    }
 
-        /* Squared distance to lattice point. */
-        mat_multiply_matrix_vector_d3(diff, lattice, diff);
-        distance_temp[i] = mat_norm_squared_d3(diff);
+    num_bins = (double)checker->num_bins[0] * checker->num_bins[1] *
+               checker->num_bins[2];
+    if (num_bins > max_num_bins) {
+        scale = cbrt(max_num_bins / num_bins);
+        for (k = 0; k < 3; k++) {
+            i = (int)(checker->num_bins[k] * scale);
+            checker->num_bins[k] = i > 1 ? i : 1;
+        }
     }
+    while (checker->num_bins[0] * checker->num_bins[1] * checker->num_bins[2] >
+           max_num_bins) {
+        k_max = 0;
+        for (k = 1; k < 3; k++) {
+            if (checker->num_bins[k] > checker->num_bins[k_max]) {
+                k_max = k;
+            }
+        }
+        checker->num_bins[k_max]--;
+    }
+
+    debug_print("OverlapChecker bins: %d %d %d\n", checker->num_bins[0],
+                checker->num_bins[1], checker->num_bins[2]);
 
-    return perm_argsort(perm, types, distance_temp, argsort_work, size);
+    return 1;
 }
 
-/* Tests if an operator COULD be a symmetry of the cell, */
-/* without the cost of sorting the rotated positions. */
-/* It only inspects a few atoms. */
-/* 0:  Not a symmetry.   1. Possible symmetry. */
-static int check_possible_overlap(OverlapChecker *checker,
-                                  double const test_trans[3],
-                                  int const rot[3][3], double const symprec) {
-    double pos_rot[3];
-    int i, i_test, k, max_search_num, search_num;
-    int type_rot, is_found;
+/* Counting sort of the atoms by bin. 'found' is used as work area. */
+static void sort_by_bin(OverlapChecker *checker, Cell const *cell) {
+    int i, k, num_bins, bin;
+    int *bin_start, *bin_of_atom;
 
-    max_search_num = 3;
-    search_num =
-        checker->size <= max_search_num ? checker->size : max_search_num;
+    bin_start = checker->bin_start;
+    bin_of_atom = checker->found;
+    num_bins =
+        checker->num_bins[0] * checker->num_bins[1] * checker->num_bins[2];
 
-    /* Check a few rotated positions. */
-    /* (this could be optimized by focusing on the min_atom_type) */
-    for (i_test = 0; i_test < search_num; i_test++) {
-        type_rot = checker->types_sorted[i_test];
-        mat_multiply_matrix_vector_id3(pos_rot, rot,
-                                       checker->pos_sorted[i_test]);
+    for (i = 0; i < num_bins + 1; i++) {
+        bin_start[i] = 0;
+    }
+    for (i = 0; i < cell->size; i++) {
+        bin = 0;
         for (k = 0; k < 3; k++) {
-            pos_rot[k] += test_trans[k];
+            bin = bin * checker->num_bins[k] +
+                  get_bin(cell->position[i][k], checker->num_bins[k]);
         }
+        bin_of_atom[i] = bin;
+        bin_start[bin + 1]++;
+    }
+    for (i = 0; i < num_bins; i++) {
+        bin_start[i + 1] += bin_start[i];
+    }
 
-        /* Brute-force search for the rotated position. */
-        /* (this could be optimized by saving the sorted ValueWithIndex data */
-        /*  for the original Cell and using it to binary search for lower and */
-        /*  upper bounds on 'i'. For now though, brute force is good enough) */
-        is_found = 0;
-        for (i = 0; i < checker->size; i++) {
-            if (has_overlap_with_same_type(pos_rot, checker->pos_sorted[i],
-                                           type_rot, checker->types_sorted[i],
-                                           checker->lattice, symprec)) {
-                is_found = 1;
-                break;
-            }
+    /* bin_start[b] is advanced to the end of bin b while filling. */
+    for (i = 0; i < cell->size; i++) {
+        checker->index_sorted[bin_start[bin_of_atom[i]]++] = i;
+    }
+    for (i = num_bins; i > 0; i--) {
+        bin_start[i] = bin_start[i - 1];
+    }
+    bin_start[0] = 0;
+
+    permute_double_3(checker->pos_sorted, cell->position, checker->index_sorted,
+                     cell->size);
+    permute_int(checker->types_sorted, cell->types, checker->index_sorted,
+                cell->size);
+}
+
+/* Range of bins to be searched along each axis, i.e., the bins of the */
+/* fractional coordinates within symprec of pos, which is usually a */
+/* single bin. The bins from lower[k] to lower[k] + num[k] - 1 modulo */
+/* num_bins[k] are searched along axis k. */
+static void get_bin_range(int lower[3], int num[3],
+                          OverlapChecker const *checker, double const pos[3],
+                          double const symprec) {
+    int k;
+    double frac, width, first, last;
+
+    for (k = 0; k < 3; k++) {
+        frac = pos[k] - floor(pos[k]);
+        width = symprec * checker->inv_lattice_norms[k];
+        /* Widened slightly to be safe against rounding at bin boundaries. */
+        first = floor((frac - width) * checker->num_bins[k] - BIN_MARGIN);
+        last = floor((frac + width) * checker->num_bins[k] + BIN_MARGIN);
+        /* Also guards against NaN */
+        if (!(last - first + 1 < checker->num_bins[k])) {
+            lower[k] = 0;
+            num[k] = checker->num_bins[k];
+        } else {
+            lower[k] = (int)first + checker->num_bins[k];
+            num[k] = (int)(last - first) + 1;
         }
+    }
+}
 
-        /* The rotated position is not in the structure! */
-        /* This symmetry operator is therefore clearly invalid. */
-        if (!is_found) {
-            return 0;
+/* Find the atom of the given type closest to 'pos' within symprec. */
+/* Atoms flagged in 'found' are skipped unless 'found' is NULL. */
+/* Returns its index in pos_sorted, or -1 if there is no such atom. */
+static int find_overlapping_atom(OverlapChecker const *checker,
+                                 double const pos[3], int const type,
+                                 int const *found, double const symprec) {
+    int i, i_bin, j_bin, k_bin, bin, index;
+    int lower[3], num[3];
+    double distance, min_distance;
+
+    get_bin_range(lower, num, checker, pos, symprec);
+
+    index = -1;
+    min_distance = symprec;
+    for (i_bin = 0; i_bin < num[0]; i_bin++) {
+        for (j_bin = 0; j_bin < num[1]; j_bin++) {
+            for (k_bin = 0; k_bin < num[2]; k_bin++) {
+                bin = ((lower[0] + i_bin) % checker->num_bins[0]) *
+                          checker->num_bins[1] +
+                      (lower[1] + j_bin) % checker->num_bins[1];
+                bin = bin * checker->num_bins[2] +
+                      (lower[2] + k_bin) % checker->num_bins[2];
+                for (i = checker->bin_start[bin];
+                     i < checker->bin_start[bin + 1]; i++) {
+                    if (checker->types_sorted[i] != type) {
+                        continue;
+                    }
+                    if (found != NULL && found[i]) {
+                        continue;
+                    }
+                    distance =
+                        get_distance(pos, checker->pos_sorted[i],
+                                     checker->lattice, checker->aperiodic_axis);
+                    if (distance <= min_distance) {
+                        min_distance = distance;
+                        index = i;
+                    }
+                }
+            }
         }
     }
 
-    return 1;
+    return index;
 }
 
-/* Optimized for the case where the max difference in index */
-/* between pos_original and pos_rotated is small. */
-/* -1: Error.  0: False.  1:  True. */
-static int check_total_overlap_for_sorted(
-    double const lattice[3][3], double const (*pos_original)[3],
-    double const (*pos_rotated)[3], int const types_original[],
-    int const types_rotated[], int const num_pos, double const symprec) {
-    int *found;
-    int i, i_orig, i_rot;
-    int search_start;
-
-    found = NULL;
-
-    if ((found = (int *)malloc(num_pos * sizeof(int))) == NULL) {
-        warning_memory("found");
-        return -1;
-    }
+/* Rotated positions of the sorted atoms. They are computed only when */
+/* the rotation differs from the previous call, so that testing many */
+/* translations with one rotation costs a single pass of rotations. */
+static double const (*get_rotated_positions(OverlapChecker *checker,
+                                            int const rot[3][3],
+                                            int const is_identity))[3] {
+    int i;
 
-    /* found[i] = 1 if pos_rotated[i] has been found in pos_original */
-    for (i = 0; i < num_pos; i++) {
-        found[i] = 0;
+    if (is_identity) {
+        return (double const(*)[3])checker->pos_sorted;
     }
 
-    search_start = 0;
-    for (i_orig = 0; i_orig < num_pos; i_orig++) {
-        /* Permanently skip positions filled near the beginning. */
-        while ((search_start < num_pos) && found[search_start]) {
-            search_start++;
+    if (!(checker->has_rot_cached &&
+          mat_check_identity_matrix_i3(checker->rot_cached, rot))) {
+        for (i = 0; i < checker->size; i++) {
+            mat_multiply_matrix_vector_id3(checker->pos_rotated[i], rot,
+                                           checker->pos_sorted[i]);
         }
+        mat_copy_matrix_i3(checker->rot_cached, rot);
+        checker->has_rot_cached = 1;
+    }
 
-        for (i_rot = search_start; i_rot < num_pos; i_rot++) {
-            /* Skip any filled positions that aren't near the beginning. */
-            if (found[i_rot]) {
-                continue;
-            }
+    return (double const(*)[3])checker->pos_rotated;
+}
 
-            if (has_overlap_with_same_type(
-                    pos_original[i_orig], pos_rotated[i_rot],
-                    types_original[i_orig], types_rotated[i_rot], lattice,
-                    symprec)) {
-                found[i_rot] = 1;
-                break;
-            }
+/* Tests if an operator COULD be a symmetry of the cell, */
+/* without the cost of transforming all positions. */
+/* It only inspects a few atoms. */
+/* 0:  Not a symmetry.   1. Possible symmetry. */
+static int check_possible_overlap(OverlapChecker const *checker,
+                                  double const (*pos_rotated)[3],
+                                  double const test_trans[3],
+                                  double const symprec) {
+    double pos[3];
+    int i_test, k, max_search_num, search_num;
+
+    max_search_num = 3;
+    search_num =
+        checker->size <= max_search_num ? checker->size : max_search_num;
+
+    /* Check a few rotated positions. */
+    for (i_test = 0; i_test < search_num; i_test++) {
+        for (k = 0; k < 3; k++) {
+            pos[k] = pos_rotated[i_test][k] + test_trans[k];
         }
 
-        if (i_rot == num_pos) {
-            /* We never hit the 'break'. */
-            /* Failure; a position in pos_original does not */
-            /* overlap with any position in pos_rotated. */
-            free(found);
-            found = NULL;
+        /* The rotated position is not in the structure! */
+        /* This symmetry operator is therefore clearly invalid. */
+        if (find_overlapping_atom(checker, pos, checker->types_sorted[i_test],
+                                  NULL, symprec) == -1) {
             return 0;
         }
     }
 
-    free(found);
-    found = NULL;
-
-    /* Success */
     return 1;
 }
 
-/* Optimized for the case where the max difference in index */
-/* between pos_original and pos_rotated is small. */
+/* Every rotated atom is matched with a distinct atom of the original cell */
+/* looked up in the bins, which costs O(N) for N atoms. */
 /* -1: Error.  0: False.  1:  True. */
-static int check_layer_total_overlap_for_sorted(
-    double const lattice[3][3], double const (*pos_original)[3],
-    double const (*pos_rotated)[3], int const types_original[],
-    int const types_rotated[], int const num_pos, int const periodic_axes[3],
-    double const symprec) {
-    int *found;
-    int i, i_orig, i_rot;
-    int search_start;
-
-    found = NULL;
-
-    if ((found = (int *)malloc(num_pos * sizeof(int))) == NULL) {
-        warning_memory("found");
-        return -1;
+static int check_total_overlap(OverlapChecker *checker,
+                               double const test_trans[3], int const rot[3][3],
+                               double const symprec, int const is_identity) {
+    int i, k, i_orig;
+    double pos[3];
+    double const(*pos_rotated)[3];
+
+    pos_rotated = get_rotated_positions(checker, rot, is_identity);
+
+    /* Check a few atoms before continuing. */
+    /* For bad translations, this is much cheaper than the full check. */
+    if (!check_possible_overlap(checker, pos_rotated, test_trans, symprec)) {
+        return 0;
     }
 
-    /* found[i] = 1 if pos_rotated[i] has been found in pos_original */
-    for (i = 0; i < num_pos; i++) {
-        found[i] = 0;
+    /* found[i] = 1 if pos_sorted[i] has been matched with a rotated atom */
+    for (i = 0; i < checker->size; i++) {
+        checker->found[i] = 0;
     }
 
-    search_start = 0;
-    for (i_orig = 0; i_orig < num_pos; i_orig++) {
-        /* Permanently skip positions filled near the beginning. */
-        while (found[search_start]) {
-            search_start++;
-        }
-
-        for (i_rot = search_start; i_rot < num_pos; i_rot++) {
-            /* Skip any filled positions that aren't near the beginning. */
-            if (found[i_rot]) {
-                continue;
-            }
-
-            if (layer_has_overlap_with_same_type(
-                    pos_original[i_orig], pos_rotated[i_rot],
-                    types_original[i_orig], types_rotated[i_rot], lattice,
-                    periodic_axes, symprec)) {
-                found[i_rot] = 1;
-                break;
-            }
+    for (i = 0; i < checker->size; i++) {
+        for (k = 0; k < 3; k++) {
+            pos[k] = pos_rotated[i][k] + test_trans[k];
         }
 
-        if (i_rot == num_pos) {
-            /* We never hit the 'break'. */
-            /* Failure; a position in pos_original does not */
-            /* overlap with any position in pos_rotated. */
-            free(found);
-            found = NULL;
+        i_orig = find_overlapping_atom(checker, pos, checker->types_sorted[i],
+                                       checker->found, symprec);
+        if (i_orig == -1) {
+            /* Failure; a rotated position does not overlap */
+            /* with any remaining position of the original cell. */
             return 0;
         }
+        checker->found[i_orig] = 1;
     }
 
-    free(found);
-    found = NULL;
-
     /* Success */
     return 1;
 }
@@ -2,37 +2,55 @@
 // This file is part of spglib.
 // SPDX-License-Identifier: BSD-3-Clause
 
+#include "base.h"
 #include "cell.h"
 #include "mathfunc.h"
 
 /* Contains pre-allocated memory and precomputed data for check_total_overlap.
  */
+/* Atoms of the original cell are hashed into a grid of bins in fractional */
+/* coordinates (a cell list), so that the atoms overlapping with a given */
+/* position are found by looking only at the neighboring bins. */
 typedef struct {
     /* Number of atoms. */
     int size;
 
     /* Pre-allocated memory for various things. */
-    void *argsort_work;
     void *blob;
 
-    /* Temp areas for writing stuff. (points into blob) */
-    double (*pos_temp_1)[3];
-    double (*pos_temp_2)[3];
+    /* Temp area for flags of atoms matched in a total overlap check. */
+    /* (points into blob) */
+    int *found;
 
-    /* Temp area for writing lattice point distances. (points into blob) */
-    double *distance_temp; /* for lattice point distances */
-    int *perm_temp;        /* for permutations during sort */
-
-    /* Sorted data of original cell. (points into blob)*/
+    /* Data of original cell sorted by bin. (points into blob)*/
     double (*lattice)[3];
     double (*pos_sorted)[3];
     int *types_sorted;
+    /* Index in the original cell of each sorted atom. */
+    int *index_sorted;
+
+    /* pos_sorted rotated by rot_cached, kept while the same rotation is */
+    /* tested with different translations. (points into blob) */
+    double (*pos_rotated)[3];
+    int rot_cached[3][3];
+    int has_rot_cached;
+
+    /* Atoms in bin b are pos_sorted[bin_start[b]:bin_start[b + 1]]. */
+    /* Bins are ordered with the index along c running fastest. */
+    int num_bins[3];
+    int *bin_start;
+
+    /* Norms of the rows of the inverse lattice, which convert a cartesian */
+    /* distance into the largest change of each fractional coordinate. */
+    double inv_lattice_norms[3];
 
     /* Using array reference to avoid redundant loop */
     int *periodic_axes;
+    int aperiodic_axis;
 } OverlapChecker;
 
-OverlapChecker *ovl_overlap_checker_init(Cell const *cell);
+OverlapChecker *ovl_overlap_checker_init(Cell const *cell,
+                                         double const symprec);
 
 int ovl_check_total_overlap(OverlapChecker *checker, double const test_trans[3],
                             int const rot[3][3], double const symprec,
@@ -43,4 +61,14 @@ int ovl_check_layer_total_overlap(OverlapChecker *checker,
                                   int const rot[3][3], double const symprec,
                                   int const is_identity);
 
+int ovl_find_overlapping_atom(OverlapChecker const *checker,
+                              double const pos[3], int const type,
+                              double const symprec);
+
+int ovl_find_first_overlapping_atom(OverlapChecker const *checker,
+                                    double const pos[3], int const type,
+                                    double const symprec);
+
 void ovl_overlap_checker_free(OverlapChecker *checker);
+
+SPG_API_TEST int ovl_get_num_allocated_checkers(void);
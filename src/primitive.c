@@ -577,7 +577,7 @@ static VecDBL *collect_pure_translations(Symmetry const *symmetry) {
     int i, num_pure_trans;
     VecDBL *pure_trans;
     VecDBL *ret_pure_trans;
-    static int identity[3][3] = {{1, 0, 0}, {0, 1, 0}, {0, 0, 1}};
+    static int const identity[3][3] = {{1, 0, 0}, {0, 1, 0}, {0, 0, 1}};
     num_pure_trans = 0;
     pure_trans = NULL;
     ret_pure_trans = NULL;
@@ -12,6 +12,7 @@
 #include "debug.h"
 #include "hall_symbol.h"
 #include "mathfunc.h"
+#include "overlap.h"
 #include "pointgroup.h"
 #include "site_symmetry.h"
 #include "spacegroup.h"
@@ -66,6 +67,20 @@ static void set_equivalent_atoms_broken_symmetry(int *equiv_atoms_cell,
                                                  Symmetry const *symmetry,
                                                  int const *mapping_table,
                                                  double const symprec);
+static int set_equivalent_atoms_by_orbits(int *equiv_atoms, Cell const *cell,
+                                          Symmetry const *symmetry,
+                                          int const *mapping_table,
+                                          double const symprec);
+static int set_equivalent_atoms_by_Wyckoff_positions(
+    int *equiv_atoms, Cell const *primitive, Cell const *cell,
+    Spacegroup const *spacegroup, Symmetry const *symmetry,
+    int const *mapping_table, double const symprec);
+static int find_orbit_root(int *parent, int const atom_index);
+static int is_in_rotation_group(int const rotations[48][3][3],
+                                int const num_rot, int const rot[3][3]);
+static int extend_rotation_group(int rotations[48][3][3], int const num_rot,
+                                 Symmetry const *symmetry,
+                                 int const *generators, int const num_gen);
 static int search_equivalent_atom(int const atom_index, Cell const *cell,
                                   Symmetry const *symmetry,
                                   double const symprec);
@@ -220,6 +235,79 @@ err:
     return NULL;
 }
 
+/* Return NULL if failed */
+/* Only symmetry and equivalent_atoms are set and the other members are */
+/* NULL. Wyckoff positions and the standardized cell are not computed. */
+/* spacegroup->bravais_lattice and spacegroup->origin_shift are overwritten */
+/* by refined ones. */
+ExactStructure *ref_get_exact_symmetry(Spacegroup *spacegroup,
+                                       Cell const *primitive, Cell const *cell,
+                                       int const *mapping_table,
+                                       double const symprec) {
+    int *equivalent_atoms;
+    Symmetry *symmetry;
+    ExactStructure *exact_structure;
+
+    equivalent_atoms = NULL;
+    symmetry = NULL;
+    exact_structure = NULL;
+
+    if (!ref_find_similar_bravais_lattice(spacegroup, symprec)) {
+        goto err;
+    }
+
+    if ((symmetry = get_refined_symmetry_operations(cell, primitive, spacegroup,
+                                                    symprec)) == NULL) {
+        goto err;
+    }
+
+    if ((equivalent_atoms = (int *)malloc(sizeof(int) * cell->size)) == NULL) {
+        warning_memory("equivalent_atoms");
+        goto err;
+    }
+
+    /* When an image of an atom is not found within symprec, the orbits are */
+    /* incomplete, and equivalent atoms are determined in the same way as */
+    /* ref_get_exact_structure_and_symmetry. */
+    if (!set_equivalent_atoms_by_orbits(equivalent_atoms, cell, symmetry,
+                                        mapping_table, symprec)) {
+        if (!set_equivalent_atoms_by_Wyckoff_positions(
+                equivalent_atoms, primitive, cell, spacegroup, symmetry,
+                mapping_table, symprec)) {
+            goto err;
+        }
+    }
+
+    if ((exact_structure = (ExactStructure *)malloc(sizeof(ExactStructure))) ==
+        NULL) {
+        warning_memory("exact_structure");
+        goto err;
+    }
+
+    exact_structure->bravais = NULL;
+    exact_structure->symmetry = symmetry;
+    exact_structure->wyckoffs = NULL;
+    exact_structure->site_symmetry_symbols = NULL;
+    exact_structure->equivalent_atoms = equivalent_atoms;
+    exact_structure->crystallographic_orbits = NULL;
+    exact_structure->std_mapping_to_primitive = NULL;
+    mat_cast_matrix_3i_to_3d(exact_structure->rotation, identity);
+
+    return exact_structure;
+
+err:
+    if (symmetry != NULL) {
+        sym_free_symmetry(symmetry);
+        symmetry = NULL;
+    }
+    if (equivalent_atoms != NULL) {
+        free(equivalent_atoms);
+        equivalent_atoms = NULL;
+    }
+
+    return NULL;
+}
+
 void ref_free_exact_structure(ExactStructure *exstr) {
     if (exstr != NULL) {
         if (exstr->symmetry != NULL) {
@@ -966,6 +1054,240 @@ static void set_equivalent_atoms_broken_symmetry(int *equiv_atoms_cell,
     }
 }
 
+/* Atoms are joined into orbits by the atoms that share an entry of */
+/* mapping_table, i.e., are related by pure translations, and by the */
+/* operations whose rotations generate the point group. Applying them to */
+/* one atom of each primitive site is enough because the other operations */
+/* are their products up to pure translations. The smallest atom index in */
+/* each orbit is its representative. */
+/* Return 0 if failed or if an image of an atom is not found. */
+static int set_equivalent_atoms_by_orbits(int *equiv_atoms, Cell const *cell,
+                                          Symmetry const *symmetry,
+                                          int const *mapping_table,
+                                          double const symprec) {
+    int i, j, k, root_i, root_j, num_prim, order, num_gen, num_rot;
+    int generators[48];
+    int rotations[48][3][3];
+    int *first_in_primitive;
+    double pos_rot[3];
+    OverlapChecker *checker;
+
+    first_in_primitive = NULL;
+    checker = NULL;
+
+    if ((first_in_primitive = (int *)malloc(sizeof(int) * cell->size)) ==
+        NULL) {
+        warning_memory("first_in_primitive");
+        return 0;
+    }
+
+    if ((checker = ovl_overlap_checker_init(cell, symprec)) == NULL) {
+        free(first_in_primitive);
+        first_in_primitive = NULL;
+        return 0;
+    }
+
+    /* equiv_atoms is used as the parent array of union-find. */
+    for (i = 0; i < cell->size; i++) {
+        first_in_primitive[i] = -1;
+    }
+    num_prim = 0;
+    for (i = 0; i < cell->size; i++) {
+        if (first_in_primitive[mapping_table[i]] == -1) {
+            first_in_primitive[mapping_table[i]] = i;
+            num_prim++;
+        }
+        equiv_atoms[i] = first_in_primitive[mapping_table[i]];
+    }
+
+    /* Rotations not generated by the generators so far become generators. */
+    /* Each rotation appears with every pure translation in symmetry. */
+    if ((symmetry->size * num_prim) % cell->size == 0) {
+        order = symmetry->size * num_prim / cell->size;
+    } else {
+        order = 48;
+    }
+    num_gen = 0;
+    num_rot = 1;
+    mat_copy_matrix_i3(rotations[0], identity);
+    for (i = 0; i < symmetry->size && num_rot < order; i++) {
+        if (is_in_rotation_group(rotations, num_rot, symmetry->rot[i])) {
+            continue;
+        }
+        generators[num_gen] = i;
+        num_gen++;
+        num_rot = extend_rotation_group(rotations, num_rot, symmetry,
+                                        generators, num_gen);
+
+        for (j = 0; j < cell->size; j++) {
+            if (first_in_primitive[mapping_table[j]] != j) {
+                continue;
+            }
+            mat_multiply_matrix_vector_id3(pos_rot, symmetry->rot[i],
+                                           cell->position[j]);
+            for (k = 0; k < 3; k++) {
+                pos_rot[k] += symmetry->trans[i][k];
+            }
+            k = ovl_find_overlapping_atom(checker, pos_rot, cell->types[j],
+                                          symprec);
+            if (k == -1) {
+                goto err;
+            }
+            root_i = find_orbit_root(equiv_atoms, j);
+            root_j = find_orbit_root(equiv_atoms, k);
+            if (root_i < root_j) {
+                equiv_atoms[root_j] = root_i;
+            } else {
+                equiv_atoms[root_i] = root_j;
+            }
+        }
+    }
+
+    for (i = 0; i < cell->size; i++) {
+        equiv_atoms[i] = find_orbit_root(equiv_atoms, i);
+    }
+
+    ovl_overlap_checker_free(checker);
+    checker = NULL;
+    free(first_in_primitive);
+    first_in_primitive = NULL;
+
+    return 1;
+
+err:
+    ovl_overlap_checker_free(checker);
+    checker = NULL;
+    free(first_in_primitive);
+    first_in_primitive = NULL;
+
+    return 0;
+}
+
+/* Equivalent atoms are obtained as a by-product of the Wyckoff positions */
+/* as done in ref_get_exact_structure_and_symmetry. */
+/* Return 0 if failed */
+static int set_equivalent_atoms_by_Wyckoff_positions(
+    int *equiv_atoms, Cell const *primitive, Cell const *cell,
+    Spacegroup const *spacegroup, Symmetry const *symmetry,
+    int const *mapping_table, double const symprec) {
+    int succeeded;
+    int *wyckoffs, *crystallographic_orbits, *std_mapping_to_primitive;
+    char (*site_symmetry_symbols)[7];
+    Cell *bravais;
+
+    succeeded = 0;
+    wyckoffs = NULL;
+    crystallographic_orbits = NULL;
+    std_mapping_to_primitive = NULL;
+    site_symmetry_symbols = NULL;
+    bravais = NULL;
+
+    if ((wyckoffs = (int *)malloc(sizeof(int) * cell->size)) == NULL) {
+        warning_memory("wyckoffs");
+        goto ret;
+    }
+
+    if ((site_symmetry_symbols =
+             (char (*)[7])malloc(sizeof(char[7]) * cell->size)) == NULL) {
+        warning_memory("site_symmetry_symbols");
+        goto ret;
+    }
+
+    if ((crystallographic_orbits = (int *)malloc(sizeof(int) * cell->size)) ==
+        NULL) {
+        warning_memory("crystallographic_orbits");
+        goto ret;
+    }
+
+    if ((std_mapping_to_primitive =
+             (int *)malloc(sizeof(int) * primitive->size * 4)) == NULL) {
+        warning_memory("std_mapping_to_primitive");
+        goto ret;
+    }
+
+    if ((bravais = get_Wyckoff_positions(
+             wyckoffs, site_symmetry_symbols, equiv_atoms,
+             crystallographic_orbits, std_mapping_to_primitive, primitive, cell,
+             spacegroup, symmetry, mapping_table, symprec)) == NULL) {
+        goto ret;
+    }
+
+    cel_free_cell(bravais);
+    bravais = NULL;
+    succeeded = 1;
+
+ret:
+    if (wyckoffs != NULL) {
+        free(wyckoffs);
+        wyckoffs = NULL;
+    }
+    if (site_symmetry_symbols != NULL) {
+        free(site_symmetry_symbols);
+        site_symmetry_symbols = NULL;
+    }
+    if (crystallographic_orbits != NULL) {
+        free(crystallographic_orbits);
+        crystallographic_orbits = NULL;
+    }
+    if (std_mapping_to_primitive != NULL) {
+        free(std_mapping_to_primitive);
+        std_mapping_to_primitive = NULL;
+    }
+
+    return succeeded;
+}
+
+static int is_in_rotation_group(int const rotations[48][3][3],
+                                int const num_rot, int const rot[3][3]) {
+    int i;
+
+    for (i = 0; i < num_rot; i++) {
+        if (mat_check_identity_matrix_i3(rotations[i], rot)) {
+            return 1;
+        }
+    }
+    return 0;
+}
+
+/* Close rotations under the multiplications by the generators. */
+/* Return the number of rotations */
+static int extend_rotation_group(int rotations[48][3][3], int const num_rot,
+                                 Symmetry const *symmetry,
+                                 int const *generators, int const num_gen) {
+    int i, j, size;
+    int rot[3][3];
+
+    size = num_rot;
+    for (i = 0; i < size; i++) {
+        for (j = 0; j < num_gen; j++) {
+            mat_multiply_matrix_i3(rot, rotations[i],
+                                   symmetry->rot[generators[j]]);
+            if (size < 48 && !is_in_rotation_group(rotations, size, rot)) {
+                mat_copy_matrix_i3(rotations[size], rot);
+                size++;
+            }
+        }
+    }
+    return size;
+}
+
+static int find_orbit_root(int *parent, int const atom_index) {
+    int root, next, i;
+
+    root = atom_index;
+    while (parent[root] != root) {
+        root = parent[root];
+    }
+    /* Path compression */
+    i = atom_index;
+    while (parent[i] != root) {
+        next = parent[i];
+        parent[i] = root;
+        i = next;
+    }
+    return root;
+}
+
 static int search_equivalent_atom(int const atom_index, Cell const *cell,
                                   Symmetry const *symmetry,
                                   double const symprec) {
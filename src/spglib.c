@@ -30,20 +30,6 @@
 #include "symmetry.h"
 #include "version.h"
 
-// Windows does not support _Thread_local. Use appropriate aliases
-// Reference: https://stackoverflow.com/a/18298965
-#ifndef thread_local
-    #if __STDC_VERSION__ >= 201112 && !defined __STDC_NO_THREADS__
-        #define thread_local _Thread_local
-    #elif defined _MSC_VER
-        #define thread_local __declspec(thread)
-    #elif defined __GNUC__
-        #define thread_local __thread
-    #else
-        #error "Cannot define thread_local"
-    #endif
-#endif
-
 /*-------*/
 /* error */
 /*-------*/
@@ -85,6 +71,16 @@ static SpglibMagneticDataset *get_magnetic_dataset(
     double const *tensors, int const tensor_rank, int const num_atom,
     int const is_axial, double const symprec, double const angle_tolerance,
     double const mag_symprec);
+static int get_magnetic_datasets(
+    SpglibMagneticDataset *datasets[], SpglibError error_codes[],
+    double const lattice[3][3], double const position[][3], int const types[],
+    double const *tensors, int const tensor_rank, int const num_atom,
+    int const num_configs, int const is_axial, double const symprec,
+    double const angle_tolerance, double const mag_symprec);
+static SpglibMagneticDataset *get_magnetic_dataset_of_cell(
+    Cell const *cell, Symmetry const *sym_nonspin,
+    int const *permutations_nonspin, int const is_axial, double const symprec,
+    double const angle_tolerance, double const mag_symprec);
 static SpglibDataset *init_dataset(void);
 static SpglibMagneticDataset *init_magnetic_dataset(void);
 static int set_dataset(SpglibDataset *dataset, Cell const *cell,
@@ -96,15 +92,19 @@ static int set_magnetic_dataset(SpglibMagneticDataset *dataset,
                                 MagneticDataset const *msgdata,
                                 int const *equivalent_atoms,
                                 double const primitive_lattice[3][3]);
-static int get_symmetry_from_dataset(
-    int rotation[][3][3], double translation[][3], int const max_size,
-    double const lattice[3][3], double const position[][3], int const types[],
-    int const num_atom, double const symprec, double const angle_tolerance);
+static int get_symmetry_with_equivalent_atoms(
+    int rotation[][3][3], double translation[][3], int equivalent_atoms[],
+    int const max_size, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec,
+    double const angle_tolerance);
 static MagneticSymmetry *get_symmetry_with_site_tensors(
     int equivalent_atoms[], int **permutations, double primitive_lattice[3][3],
-    Cell const *cell, int const with_time_reversal, int const is_axial,
-    double const symprec, double const angle_tolerance,
+    Cell const *cell, Symmetry const *sym_nonspin,
+    int const *permutations_nonspin, int const with_time_reversal,
+    int const is_axial, double const symprec, double const angle_tolerance,
     double const mag_symprec);
+static Symmetry *get_symmetry_ignoring_site_tensors(
+    Cell const *cell, double const symprec, double const angle_tolerance);
 static int get_multiplicity(double const lattice[3][3],
                             double const position[][3], int const types[],
                             int const num_atom, double const symprec,
@@ -157,6 +157,14 @@ static size_t get_dense_ir_reciprocal_mesh(
     double const lattice[3][3], double const position[][3], int const types[],
     size_t const num_atom, double const symprec, double const angle_tolerance);
 
+static SpglibIrGridPoints *get_ir_grid_points(
+    int const mesh[3], int const is_shift[3], int const is_time_reversal,
+    int const with_star, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec,
+    double const angle_tolerance);
+static SpglibIrGridPoints *get_ir_grid_points_from_point_group(
+    int const mesh[3], int const is_shift[3], int const with_star,
+    MatINT const *rot_reciprocal);
 static int get_stabilized_reciprocal_mesh(
     int grid_address[][3], int ir_mapping_table[], int const mesh[3],
     int const is_shift[3], int const is_time_reversal, int const num_rot,
@@ -264,6 +272,17 @@ SpglibMagneticDataset *spgms_get_magnetic_dataset(
                                 mag_symprec);
 }
 
+int spgms_get_magnetic_datasets(
+    SpglibMagneticDataset *datasets[], SpglibError error_codes[],
+    double const lattice[3][3], double const position[][3], int const types[],
+    double const *tensors, int const tensor_rank, int const num_atom,
+    int const num_configs, int const is_axial, double const symprec,
+    double const angle_tolerance, double const mag_symprec) {
+    return get_magnetic_datasets(
+        datasets, error_codes, lattice, position, types, tensors, tensor_rank,
+        num_atom, num_configs, is_axial, symprec, angle_tolerance, mag_symprec);
+}
+
 /* Return NULL if failed */
 SpglibDataset *spgat_get_dataset(double const lattice[3][3],
                                  double const position[][3], int const types[],
@@ -348,6 +367,10 @@ void spg_free_magnetic_dataset(SpglibMagneticDataset *dataset) {
         free(dataset->equivalent_atoms);
         dataset->equivalent_atoms = NULL;
     }
+    if (dataset->permutations != NULL) {
+        free(dataset->permutations);
+        dataset->permutations = NULL;
+    }
 
     /* Standardized crystal structure */
     if (dataset->n_std_atoms > 0) {
@@ -369,8 +392,9 @@ int spg_get_symmetry(int rotation[][3][3], double translation[][3],
                      int const max_size, double const lattice[3][3],
                      double const position[][3], int const types[],
                      int const num_atom, double const symprec) {
-    return get_symmetry_from_dataset(rotation, translation, max_size, lattice,
-                                     position, types, num_atom, symprec, -1.0);
+    return get_symmetry_with_equivalent_atoms(rotation, translation, NULL,
+                                              max_size, lattice, position,
+                                              types, num_atom, symprec, -1.0);
 }
 
 /* Return 0 if failed */
@@ -379,9 +403,30 @@ int spgat_get_symmetry(int rotation[][3][3], double translation[][3],
                        double const position[][3], int const types[],
                        int const num_atom, double const symprec,
                        double const angle_tolerance) {
-    return get_symmetry_from_dataset(rotation, translation, max_size, lattice,
-                                     position, types, num_atom, symprec,
-                                     angle_tolerance);
+    return get_symmetry_with_equivalent_atoms(
+        rotation, translation, NULL, max_size, lattice, position, types,
+        num_atom, symprec, angle_tolerance);
+}
+
+/* Return 0 if failed */
+int spg_get_symmetry_with_equivalent_atoms(
+    int rotation[][3][3], double translation[][3], int equivalent_atoms[],
+    int const max_size, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec) {
+    return get_symmetry_with_equivalent_atoms(
+        rotation, translation, equivalent_atoms, max_size, lattice, position,
+        types, num_atom, symprec, -1.0);
+}
+
+/* Return 0 if failed */
+int spgat_get_symmetry_with_equivalent_atoms(
+    int rotation[][3][3], double translation[][3], int equivalent_atoms[],
+    int const max_size, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec,
+    double const angle_tolerance) {
+    return get_symmetry_with_equivalent_atoms(
+        rotation, translation, equivalent_atoms, max_size, lattice, position,
+        types, num_atom, symprec, angle_tolerance);
 }
 
 /* Return 0 if failed */
@@ -483,11 +528,12 @@ int spgms_get_symmetry_with_site_tensors(
     cel_set_cell_with_tensors(cell, lattice, position, types, tensors);
 
     if ((magnetic_symmetry = get_symmetry_with_site_tensors(
-             equivalent_atoms, &permutations, primitive_lattice, cell,
-             with_time_reversal, is_axial, symprec, angle_tolerance,
+             equivalent_atoms, &permutations, primitive_lattice, cell, NULL,
+             NULL, with_time_reversal, is_axial, symprec, angle_tolerance,
              mag_symprec)) == NULL) {
         /* spglib_error_code is filled in get_symmetry_with_tensors */
-        return 0;
+        size = 0;
+        goto ret;
     }
 
     if (magnetic_symmetry->size > max_size) {
@@ -495,10 +541,9 @@ int spgms_get_symmetry_with_site_tensors(
                 max_size);
         fprintf(stderr, "spglib: of symmetry operations(=%d).\n",
                 magnetic_symmetry->size);
-        sym_free_magnetic_symmetry(magnetic_symmetry);
-        magnetic_symmetry = NULL;
         spglib_error_code = SPGERR_ARRAY_SIZE_SHORTAGE;
-        return 0;
+        size = 0;
+        goto ret;
     }
 
     for (i = 0; i < magnetic_symmetry->size; i++) {
@@ -508,15 +553,20 @@ int spgms_get_symmetry_with_site_tensors(
         spin_flips[i] = 1 - 2 * magnetic_symmetry->timerev[i];
     }
     size = magnetic_symmetry->size;
+    spglib_error_code = SPGLIB_SUCCESS;
 
-    sym_free_magnetic_symmetry(magnetic_symmetry);
-    magnetic_symmetry = NULL;
-    free(permutations);
-    permutations = NULL;
+ret:
+    if (magnetic_symmetry != NULL) {
+        sym_free_magnetic_symmetry(magnetic_symmetry);
+        magnetic_symmetry = NULL;
+    }
+    if (permutations != NULL) {
+        free(permutations);
+        permutations = NULL;
+    }
     cel_free_cell(cell);
     cell = NULL;
 
-    spglib_error_code = SPGLIB_SUCCESS;
     return size;
 }
 
@@ -617,6 +667,93 @@ SpglibMagneticSpacegroupType spg_get_magnetic_spacegroup_type_from_symmetry(
     return spglibtype;
 }
 
+void spg_get_rotated_positions(double rotated_positions[][3],
+                               int const rotation[][3][3],
+                               double const translation[][3],
+                               int const num_operations,
+                               double const position[][3], int const num_atom) {
+    sym_get_rotated_positions(rotated_positions, rotation, translation,
+                              num_operations, position, num_atom);
+}
+
+/* Return 0 if failed */
+int spg_get_symmetry_permutations(int permutations[],
+                                  int const rotation[][3][3],
+                                  double const translation[][3],
+                                  int const num_operations,
+                                  double const lattice[3][3],
+                                  double const position[][3], int const types[],
+                                  int const num_atom, double const symprec) {
+    int i, succeeded;
+    Cell *cell;
+    Symmetry *symmetry;
+
+    cell = NULL;
+    symmetry = NULL;
+    succeeded = 0;
+
+    if ((cell = cel_alloc_cell(num_atom, NOSPIN)) == NULL) {
+        goto ret;
+    }
+    cel_set_cell(cell, lattice, position, types);
+
+    if ((symmetry = sym_alloc_symmetry(num_operations)) == NULL) {
+        goto ret;
+    }
+    for (i = 0; i < num_operations; i++) {
+        mat_copy_matrix_i3(symmetry->rot[i], rotation[i]);
+        mat_copy_vector_d3(symmetry->trans[i], translation[i]);
+    }
+
+    succeeded = sym_get_permutations(permutations, symmetry, cell, symprec);
+
+ret:
+    if (symmetry != NULL) {
+        sym_free_symmetry(symmetry);
+        symmetry = NULL;
+    }
+    if (cell != NULL) {
+        cel_free_cell(cell);
+        cell = NULL;
+    }
+
+    if (succeeded) {
+        spglib_error_code = SPGLIB_SUCCESS;
+    } else {
+        spglib_error_code = SPGERR_SYMMETRY_OPERATION_SEARCH_FAILED;
+    }
+    return succeeded;
+}
+
+/* Return 0 if failed */
+int spg_symmetrize_vectors(double symmetrized[][3], double const vectors[][3],
+                           int const num_sites, int const rotation[][3][3],
+                           int const num_operations, double const lattice[3][3],
+                           int const permutations[]) {
+    return sym_symmetrize_vectors(symmetrized, vectors, num_sites, rotation,
+                                  num_operations, lattice, permutations);
+}
+
+/* Return 0 if failed */
+int spg_symmetrize_tensors(double symmetrized[][3][3],
+                           double const tensors[][3][3], int const num_sites,
+                           int const rotation[][3][3], int const num_operations,
+                           double const lattice[3][3],
+                           int const permutations[]) {
+    return sym_symmetrize_tensors(symmetrized, tensors, num_sites, rotation,
+                                  num_operations, lattice, permutations);
+}
+
+/* Return -1 if failed */
+int spg_get_inequivalent_configurations(
+    int configurations[], int multiplicities[], int cursor[],
+    int const max_configs, int const permutations[], int const num_permutations,
+    int const num_sites, int const num_values) {
+    return spn_get_inequivalent_configurations(
+        configurations, multiplicities, cursor, max_configs, permutations,
+        num_permutations, num_sites, num_values);
+}
+
 /* Return 0 if failed */
 int spg_get_multiplicity(double const lattice[3][3], double const position[][3],
                          int const types[], int const num_atom,
@@ -903,6 +1040,48 @@ size_t spg_get_dense_grid_point_from_address(int const grid_address[3],
     return kgd_get_dense_grid_point_double_mesh(address_double, mesh);
 }
 
+void spg_get_dense_grid_points_from_addresses(size_t grid_points[],
+                                              int const grid_address[][3],
+                                              size_t const num_addresses,
+                                              int const mesh[3]) {
+    size_t i;
+    int address_double[3];
+    int is_shift[3];
+
+    is_shift[0] = 0;
+    is_shift[1] = 0;
+    is_shift[2] = 0;
+    for (i = 0; i < num_addresses; i++) {
+        kgd_get_grid_address_double_mesh(address_double, grid_address[i], mesh,
+                                         is_shift);
+        grid_points[i] =
+            kgd_get_dense_grid_point_double_mesh(address_double, mesh);
+    }
+}
+
+void spg_get_dense_grid_points_from_double_addresses(
+    size_t grid_points[], int const address_double[][3],
+    size_t const num_addresses, int const mesh[3]) {
+    kgd_get_dense_grid_points_double_mesh(grid_points, address_double,
+                                          num_addresses, mesh);
+}
+
+void spg_get_double_grid_addresses(int address_double[][3],
+                                   int const grid_address[][3],
+                                   size_t const num_addresses,
+                                   int const mesh[3], int const is_shift[3]) {
+    kgd_get_grid_addresses_double_mesh(address_double, grid_address,
+                                       num_addresses, mesh, is_shift);
+}
+
+void spg_get_grid_addresses_from_grid_points(int grid_address[][3],
+                                             size_t const grid_points[],
+                                             size_t const num_grid_points,
+                                             int const mesh[3]) {
+    kgd_get_grid_addresses_from_indices(grid_address, grid_points,
+                                        num_grid_points, mesh);
+}
+
 int spg_get_ir_reciprocal_mesh(int grid_address[][3], int ir_mapping_table[],
                                int const mesh[3], int const is_shift[3],
                                int const is_time_reversal,
@@ -924,6 +1103,25 @@ size_t spg_get_dense_ir_reciprocal_mesh(
         lattice, position, types, num_atom, symprec, -1.0);
 }
 
+SpglibIrGridPoints *spg_get_ir_grid_points(
+    int const mesh[3], int const is_shift[3], int const is_time_reversal,
+    int const with_star, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec) {
+    return get_ir_grid_points(mesh, is_shift, is_time_reversal, with_star,
+                              lattice, position, types, num_atom, symprec,
+                              -1.0);
+}
+
+void spg_free_ir_grid_points(SpglibIrGridPoints *ir_grid_points) {
+    free(ir_grid_points->ir_grid_address);
+    ir_grid_points->ir_grid_address = NULL;
+    free(ir_grid_points->weights);
+    ir_grid_points->weights = NULL;
+    free(ir_grid_points->star_address);
+    ir_grid_points->star_address = NULL;
+    free(ir_grid_points);
+}
+
 int spg_get_stabilized_reciprocal_mesh(
     int grid_address[][3], int ir_mapping_table[], int const mesh[3],
     int const is_shift[3], int const is_time_reversal, int const num_rot,
@@ -942,6 +1140,132 @@ size_t spg_get_dense_stabilized_reciprocal_mesh(
         num_rot, rotations, num_q, qpoints);
 }
 
+int spg_get_dense_ir_mapping_table_range(
+    int grid_address[][3], size_t ir_mapping_table[], size_t const start,
+    size_t const num_grid_points, int const mesh[3], int const is_shift[3],
+    int const is_time_reversal, int const num_rot, int const rotations[][3][3],
+    int const num_q, double const qpoints[][3]) {
+    MatINT *rot_real;
+    int i, succeeded;
+
+    if ((rot_real = mat_alloc_MatINT(num_rot)) == NULL) {
+        return 0;
+    }
+
+    for (i = 0; i < num_rot; i++) {
+        mat_copy_matrix_i3(rot_real->mat[i], rotations[i]);
+    }
+
+    succeeded = kpt_get_dense_ir_mapping_table_range(
+        grid_address, ir_mapping_table, start, num_grid_points, mesh, is_shift,
+        is_time_reversal, rot_real, num_q, qpoints);
+
+    mat_free_MatINT(rot_real);
+    rot_real = NULL;
+
+    return succeeded;
+}
+
+int spg_get_reciprocal_point_group(int rot_reciprocal[][3][3],
+                                   int const num_rot,
+                                   int const rotations[][3][3],
+                                   int const is_time_reversal, int const num_q,
+                                   double const qpoints[][3],
+                                   double const symprec) {
+    int i, size;
+    MatINT *rot_real, *rot_reciprocal_all, *rot_reciprocal_q;
+
+    rot_reciprocal_all = NULL;
+    rot_reciprocal_q = NULL;
+    size = 0;
+
+    if ((rot_real = mat_alloc_MatINT(num_rot)) == NULL) {
+        return 0;
+    }
+
+    for (i = 0; i < num_rot; i++) {
+        mat_copy_matrix_i3(rot_real->mat[i], rotations[i]);
+    }
+
+    if ((rot_reciprocal_all = kpt_get_point_group_reciprocal(
+             rot_real, is_time_reversal)) == NULL) {
+        goto ret;
+    }
+    if (num_q > 0) {
+        if ((rot_reciprocal_q = kpt_get_point_group_reciprocal_with_q(
+                 rot_reciprocal_all, symprec, num_q, qpoints)) == NULL) {
+            goto ret;
+        }
+        mat_free_MatINT(rot_reciprocal_all);
+        rot_reciprocal_all = rot_reciprocal_q;
+        rot_reciprocal_q = NULL;
+    }
+
+    size = rot_reciprocal_all->size;
+    for (i = 0; i < size; i++) {
+        mat_copy_matrix_i3(rot_reciprocal[i], rot_reciprocal_all->mat[i]);
+    }
+
+ret:
+    if (rot_reciprocal_all != NULL) {
+        mat_free_MatINT(rot_reciprocal_all);
+        rot_reciprocal_all = NULL;
+    }
+    mat_free_MatINT(rot_real);
+    rot_real = NULL;
+
+    return size;
+}
+
+size_t spg_get_dense_ir_reciprocal_mesh_from_point_group(
+    int grid_address[][3], size_t ir_mapping_table[], int const mesh[3],
+    int const is_shift[3], int const num_rot,
+    int const rot_reciprocal[][3][3]) {
+    MatINT *rot;
+    int i;
+    size_t num_ir;
+
+    if ((rot = mat_alloc_MatINT(num_rot)) == NULL) {
+        return 0;
+    }
+
+    for (i = 0; i < num_rot; i++) {
+        mat_copy_matrix_i3(rot->mat[i], rot_reciprocal[i]);
+    }
+
+    num_ir = kpt_get_dense_irreducible_reciprocal_mesh(
+        grid_address, ir_mapping_table, mesh, is_shift, rot);
+
+    mat_free_MatINT(rot);
+    rot = NULL;
+
+    return num_ir;
+}
+
+SpglibIrGridPoints *spg_get_ir_grid_points_from_point_group(
+    int const mesh[3], int const is_shift[3], int const with_star,
+    int const num_rot, int const rot_reciprocal[][3][3]) {
+    MatINT *rot;
+    int i;
+    SpglibIrGridPoints *ir_grid_points;
+
+    if ((rot = mat_alloc_MatINT(num_rot)) == NULL) {
+        return NULL;
+    }
+
+    for (i = 0; i < num_rot; i++) {
+        mat_copy_matrix_i3(rot->mat[i], rot_reciprocal[i]);
+    }
+
+    ir_grid_points =
+        get_ir_grid_points_from_point_group(mesh, is_shift, with_star, rot);
+
+    mat_free_MatINT(rot);
+    rot = NULL;
+
+    return ir_grid_points;
+}
+
 void spg_get_dense_grid_points_by_rotations(size_t rot_grid_points[],
                                             int const address_orig[3],
                                             int const num_rot,
@@ -961,6 +1285,26 @@ void spg_get_dense_BZ_grid_points_by_rotations(
                                               is_shift, bz_map);
 }
 
+void spg_get_dense_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const grid_address[][3],
+    size_t const num_addresses, int const num_rot,
+    int const rot_reciprocal[][3][3], int const mesh[3],
+    int const is_shift[3]) {
+    kpt_get_dense_grid_point_table_by_rotations(rot_grid_points, grid_address,
+                                                num_addresses, rot_reciprocal,
+                                                num_rot, mesh, is_shift);
+}
+
+void spg_get_dense_BZ_grid_point_table_by_rotations(
+    size_t rot_grid_points[], int const bz_grid_address[][3],
+    size_t const num_addresses, int const num_rot,
+    int const rot_reciprocal[][3][3], int const mesh[3], int const is_shift[3],
+    size_t const bz_map[]) {
+    kpt_get_dense_BZ_grid_point_table_by_rotations(
+        rot_grid_points, bz_grid_address, num_addresses, rot_reciprocal,
+        num_rot, mesh, is_shift, bz_map);
+}
+
 int spg_relocate_BZ_grid_address(int bz_grid_address[][3], int bz_map[],
                                  int const grid_address[][3], int const mesh[3],
                                  double const rec_lattice[3][3],
@@ -1170,7 +1514,135 @@ static SpglibMagneticDataset *get_magnetic_dataset(
     double const *tensors, int const tensor_rank, int const num_atom,
     int const is_axial, double const symprec, double const angle_tolerance,
     double const mag_symprec) {
-    Cell *cell, *exact_cell, *exact_cell_std;
+    Cell *cell;
+    SpglibMagneticDataset *dataset;
+
+    cell = NULL;
+    dataset = NULL;
+
+    /* Set cell and check overlapped atoms */
+    if ((cell = cel_alloc_cell(num_atom, tensor_rank)) == NULL) {
+        spglib_error_code = SPGERR_SPACEGROUP_SEARCH_FAILED;
+        return NULL;
+    }
+    cel_set_cell_with_tensors(cell, lattice, position, types, tensors);
+    if (cel_any_overlap_with_same_type(cell, symprec)) {
+        spglib_error_code = SPGERR_ATOMS_TOO_CLOSE;
+    } else {
+        dataset = get_magnetic_dataset_of_cell(
+            cell, NULL, NULL, is_axial, symprec, angle_tolerance, mag_symprec);
+    }
+
+    cel_free_cell(cell);
+    cell = NULL;
+
+    return dataset;
+}
+
+/* Magnetic datasets of num_configs configurations of site tensors on the */
+/* same crystal structure. The symmetry operations ignoring site tensors and */
+/* the atoms mapped by them are searched once. The dataset of a */
+/* configuration failed to be searched is NULL, and error_codes has the */
+/* error of each configuration. Return 0 if the symmetry search ignoring */
+/* site tensors failed. */
+static int get_magnetic_datasets(
+    SpglibMagneticDataset *datasets[], SpglibError error_codes[],
+    double const lattice[3][3], double const position[][3], int const types[],
+    double const *tensors, int const tensor_rank, int const num_atom,
+    int const num_configs, int const is_axial, double const symprec,
+    double const angle_tolerance, double const mag_symprec) {
+    int i, num_tensors, num_succeeded, succeeded;
+    Cell *cell;
+    Symmetry *sym_nonspin;
+    int *permutations_nonspin;
+
+    cell = NULL;
+    sym_nonspin = NULL;
+    permutations_nonspin = NULL;
+    num_succeeded = 0;
+    succeeded = 0;
+
+    for (i = 0; i < num_configs; i++) {
+        datasets[i] = NULL;
+    }
+
+    if ((cell = cel_alloc_cell(num_atom, tensor_rank)) == NULL) {
+        spglib_error_code = SPGERR_SPACEGROUP_SEARCH_FAILED;
+        goto ret;
+    }
+    cel_set_cell(cell, lattice, position, types);
+    if (cel_any_overlap_with_same_type(cell, symprec)) {
+        spglib_error_code = SPGERR_ATOMS_TOO_CLOSE;
+        goto ret;
+    }
+
+    if ((sym_nonspin = get_symmetry_ignoring_site_tensors(
+             cell, symprec, angle_tolerance)) == NULL) {
+        spglib_error_code = SPGERR_SYMMETRY_OPERATION_SEARCH_FAILED;
+        goto ret;
+    }
+    /* If some atoms are not mapped, they are searched for each */
+    /* configuration as in get_magnetic_dataset. */
+    if ((permutations_nonspin = (int *)malloc(sizeof(int) * sym_nonspin->size *
+                                              num_atom)) != NULL &&
+        !sym_get_permutations(permutations_nonspin, sym_nonspin, cell,
+                              symprec)) {
+        free(permutations_nonspin);
+        permutations_nonspin = NULL;
+    }
+    succeeded = 1;
+
+    num_tensors = tensor_rank == NONCOLLINEAR ? num_atom * 3 : num_atom;
+    for (i = 0; i < num_configs; i++) {
+        cel_set_cell_with_tensors(cell, lattice, position, types,
+                                  tensors + (size_t)i * num_tensors);
+        if ((datasets[i] = get_magnetic_dataset_of_cell(
+                 cell, sym_nonspin, permutations_nonspin, is_axial, symprec,
+                 angle_tolerance, mag_symprec)) != NULL) {
+            num_succeeded++;
+        }
+        error_codes[i] = spglib_error_code;
+    }
+
+    /* Otherwise spglib_error_code is that of the last failed configuration. */
+    if (num_succeeded == num_configs) {
+        spglib_error_code = SPGLIB_SUCCESS;
+    } else {
+        for (i = num_configs - 1; i >= 0; i--) {
+            if (datasets[i] == NULL) {
+                spglib_error_code = error_codes[i];
+                break;
+            }
+        }
+    }
+
+ret:
+    if (!succeeded) {
+        for (i = 0; i < num_configs; i++) {
+            error_codes[i] = spglib_error_code;
+        }
+    }
+    if (permutations_nonspin != NULL) {
+        free(permutations_nonspin);
+        permutations_nonspin = NULL;
+    }
+    if (sym_nonspin != NULL) {
+        sym_free_symmetry(sym_nonspin);
+        sym_nonspin = NULL;
+    }
+    cel_free_cell(cell);
+    cell = NULL;
+
+    return succeeded;
+}
+
+/* Return NULL if failed. sym_nonspin and permutations_nonspin are searched */
+/* if NULL. */
+static SpglibMagneticDataset *get_magnetic_dataset_of_cell(
+    Cell const *cell, Symmetry const *sym_nonspin,
+    int const *permutations_nonspin, int const is_axial, double const symprec,
+    double const angle_tolerance, double const mag_symprec) {
+    Cell *exact_cell, *exact_cell_std;
     Spacegroup *fsg, *xsg;
     MagneticSymmetry *magnetic_symmetry, *representatives;
     MagneticDataset *msgdata;
@@ -1178,7 +1650,6 @@ static SpglibMagneticDataset *get_magnetic_dataset(
     int *equivalent_atoms, *permutations;
     double primitive_lattice[3][3];
 
-    cell = NULL;
     exact_cell = NULL;
     exact_cell_std = NULL;
     fsg = NULL;
@@ -1190,18 +1661,7 @@ static SpglibMagneticDataset *get_magnetic_dataset(
     permutations = NULL;
     equivalent_atoms = NULL;
 
-    /* Set cell and check overlapped atoms */
-    if ((cell = cel_alloc_cell(num_atom, tensor_rank)) == NULL) {
-        spglib_error_code = SPGERR_SPACEGROUP_SEARCH_FAILED;
-        goto finalize;
-    }
-    cel_set_cell_with_tensors(cell, lattice, position, types, tensors);
-    if (cel_any_overlap_with_same_type(cell, symprec)) {
-        spglib_error_code = SPGERR_ATOMS_TOO_CLOSE;
-        goto finalize;
-    }
-
-    if ((equivalent_atoms = (int *)malloc(sizeof(int) * num_atom)) == NULL) {
+    if ((equivalent_atoms = (int *)malloc(sizeof(int) * cell->size)) == NULL) {
         spglib_error_code = SPGERR_SYMMETRY_OPERATION_SEARCH_FAILED;
         goto finalize;
     }
@@ -1214,7 +1674,7 @@ static SpglibMagneticDataset *get_magnetic_dataset(
     /* Get magnetic symmetry operations of MSG */
     if ((magnetic_symmetry = get_symmetry_with_site_tensors(
              equivalent_atoms, &permutations, primitive_lattice, cell,
-             1, /* with_time_reversal */
+             sym_nonspin, permutations_nonspin, 1, /* with_time_reversal */
              is_axial, symprec, angle_tolerance, mag_symprec)) == NULL) {
         spglib_error_code = SPGERR_SYMMETRY_OPERATION_SEARCH_FAILED;
         goto finalize;
@@ -1251,13 +1711,13 @@ static SpglibMagneticDataset *get_magnetic_dataset(
         goto finalize;
     }
 
+    /* The permutations found in the symmetry search are kept. */
+    dataset->permutations = permutations;
+    permutations = NULL;
+
     spglib_error_code = SPGLIB_SUCCESS;
 
 finalize:
-    if (cell != NULL) {
-        cel_free_cell(cell);
-        cell = NULL;
-    }
     if (exact_cell != NULL) {
         cel_free_cell(exact_cell);
         exact_cell = NULL;
@@ -1372,6 +1832,7 @@ static SpglibMagneticDataset *init_magnetic_dataset(void) {
     dataset->std_types = NULL;
     dataset->std_positions = NULL;
     dataset->std_tensors = NULL;
+    dataset->permutations = NULL;
 
     for (i = 0; i < 3; i++) {
         dataset->origin_shift[i] = 0;
@@ -1682,89 +2143,114 @@ err:
 }
 
 /* Return 0 if failed */
-static int get_symmetry_from_dataset(
-    int rotation[][3][3], double translation[][3], int const max_size,
-    double const lattice[3][3], double const position[][3], int const types[],
-    int const num_atom, double const symprec, double const angle_tolerance) {
+/* Only symmetry operations and equivalent atoms are determined, which are */
+/* the same as those in the dataset. equivalent_atoms can be NULL. */
+static int get_symmetry_with_equivalent_atoms(
+    int rotation[][3][3], double translation[][3], int equivalent_atoms[],
+    int const max_size, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec,
+    double const angle_tolerance) {
     int i, num_sym;
-    SpglibDataset *dataset;
+    Cell *cell;
+    DataContainer *container;
+    Symmetry const *symmetry;
 
-    num_sym = 0;
-    dataset = NULL;
+    cell = NULL;
+    container = NULL;
 
-    if ((dataset = get_dataset(lattice, position, types, num_atom, 0, symprec,
-                               angle_tolerance)) == NULL) {
+    if ((cell = cel_alloc_cell(num_atom, NOSPIN)) == NULL) {
+        spglib_error_code = SPGERR_SPACEGROUP_SEARCH_FAILED;
         return 0;
     }
 
-    if (dataset->n_operations > max_size) {
+    cel_set_cell(cell, lattice, position, types);
+    if (cel_any_overlap_with_same_type(cell, symprec)) {
+        cel_free_cell(cell);
+        cell = NULL;
+        spglib_error_code = SPGERR_ATOMS_TOO_CLOSE;
+        return 0;
+    }
+
+    if ((container = det_determine_symmetry(cell, symprec, angle_tolerance)) ==
+        NULL) {
+        cel_free_cell(cell);
+        cell = NULL;
+        spglib_error_code = SPGERR_SPACEGROUP_SEARCH_FAILED;
+        return 0;
+    }
+
+    symmetry = container->exact_structure->symmetry;
+    if (symmetry->size > max_size) {
         fprintf(stderr, "spglib: Indicated max size(=%d) is less than number ",
                 max_size);
         fprintf(stderr, "spglib: of symmetry operations(=%d).\n",
-                dataset->n_operations);
-        goto err;
+                symmetry->size);
+        det_free_container(container);
+        container = NULL;
+        cel_free_cell(cell);
+        cell = NULL;
+        spglib_error_code = SPGERR_ARRAY_SIZE_SHORTAGE;
+        return 0;
     }
 
-    num_sym = dataset->n_operations;
+    num_sym = symmetry->size;
     for (i = 0; i < num_sym; i++) {
-        mat_copy_matrix_i3(rotation[i], dataset->rotations[i]);
-        mat_copy_vector_d3(translation[i], dataset->translations[i]);
+        mat_copy_matrix_i3(rotation[i], symmetry->rot[i]);
+        mat_copy_vector_d3(translation[i], symmetry->trans[i]);
+    }
+    if (equivalent_atoms != NULL) {
+        for (i = 0; i < num_atom; i++) {
+            equivalent_atoms[i] =
+                container->exact_structure->equivalent_atoms[i];
+        }
     }
 
-    spg_free_dataset(dataset);
-    dataset = NULL;
-    return num_sym;
+    det_free_container(container);
+    container = NULL;
+    cel_free_cell(cell);
+    cell = NULL;
 
-err:
-    spg_free_dataset(dataset);
-    dataset = NULL;
-    spglib_error_code = SPGERR_ARRAY_SIZE_SHORTAGE;
-    return 0;
+    spglib_error_code = SPGLIB_SUCCESS;
+    return num_sym;
 }
 
 /* Return NULL if failed */
 static MagneticSymmetry *get_symmetry_with_site_tensors(
     int equivalent_atoms[], int **permutations, double primitive_lattice[3][3],
-    Cell const *cell, int const with_time_reversal, int const is_axial,
-    double const symprec, double const angle_tolerance,
+    Cell const *cell, Symmetry const *sym_nonspin,
+    int const *permutations_nonspin, int const with_time_reversal,
+    int const is_axial, double const symprec, double const angle_tolerance,
     double const mag_symprec) {
     int i;
     MagneticSymmetry *magnetic_symmetry;
-    Symmetry *sym_nonspin;
-    SpglibDataset *dataset;
+    Symmetry *sym_searched;
     int *equiv_atoms;
 
     magnetic_symmetry = NULL;
-    sym_nonspin = NULL;
-    dataset = NULL;
+    sym_searched = NULL;
     equiv_atoms = NULL;
 
-    if ((dataset = get_dataset(cell->lattice, cell->position, cell->types,
-                               cell->size, 0, symprec, angle_tolerance)) ==
-        NULL) {
-        goto err;
+    /* The operations ignoring site tensors are searched if not given. */
+    if (sym_nonspin == NULL) {
+        if ((sym_searched = get_symmetry_ignoring_site_tensors(
+                 cell, symprec, angle_tolerance)) == NULL) {
+            goto err;
+        }
+        sym_nonspin = sym_searched;
+        permutations_nonspin = NULL;
     }
 
-    if ((sym_nonspin = sym_alloc_symmetry(dataset->n_operations)) == NULL) {
-        spg_free_dataset(dataset);
-        dataset = NULL;
-        goto err;
-    }
+    magnetic_symmetry = spn_get_operations_with_site_tensors(
+        &equiv_atoms, permutations, primitive_lattice, sym_nonspin,
+        permutations_nonspin, cell, with_time_reversal, is_axial, symprec,
+        angle_tolerance, mag_symprec);
 
-    for (i = 0; i < dataset->n_operations; i++) {
-        mat_copy_matrix_i3(sym_nonspin->rot[i], dataset->rotations[i]);
-        mat_copy_vector_d3(sym_nonspin->trans[i], dataset->translations[i]);
+    if (sym_searched != NULL) {
+        sym_free_symmetry(sym_searched);
+        sym_searched = NULL;
     }
-    sym_nonspin->size = dataset->n_operations;
-    spg_free_dataset(dataset);
-    dataset = NULL;
 
-    if ((magnetic_symmetry = spn_get_operations_with_site_tensors(
-             &equiv_atoms, permutations, primitive_lattice, sym_nonspin, cell,
-             with_time_reversal, is_axial, symprec, angle_tolerance,
-             mag_symprec)) == NULL) {
-        sym_free_symmetry(sym_nonspin);
-        sym_nonspin = NULL;
+    if (magnetic_symmetry == NULL) {
         goto err;
     }
 
@@ -1775,13 +2261,6 @@ static MagneticSymmetry *get_symmetry_with_site_tensors(
     free(equiv_atoms);
     equiv_atoms = NULL;
 
-    sym_free_symmetry(sym_nonspin);
-    sym_nonspin = NULL;
-
-    if (magnetic_symmetry == NULL) {
-        goto err;
-    }
-
     spglib_error_code = SPGLIB_SUCCESS;
     return magnetic_symmetry;
 
@@ -1790,6 +2269,40 @@ err:
     return NULL;
 }
 
+/* Return symmetry operations of the crystal structure ignoring site */
+/* tensors. Return NULL if failed. */
+static Symmetry *get_symmetry_ignoring_site_tensors(
+    Cell const *cell, double const symprec, double const angle_tolerance) {
+    int i;
+    Symmetry *sym_nonspin;
+    SpglibDataset *dataset;
+
+    sym_nonspin = NULL;
+    dataset = NULL;
+
+    if ((dataset = get_dataset(cell->lattice, cell->position, cell->types,
+                               cell->size, 0, symprec, angle_tolerance)) ==
+        NULL) {
+        return NULL;
+    }
+
+    if ((sym_nonspin = sym_alloc_symmetry(dataset->n_operations)) == NULL) {
+        spg_free_dataset(dataset);
+        dataset = NULL;
+        return NULL;
+    }
+
+    for (i = 0; i < dataset->n_operations; i++) {
+        mat_copy_matrix_i3(sym_nonspin->rot[i], dataset->rotations[i]);
+        mat_copy_vector_d3(sym_nonspin->trans[i], dataset->translations[i]);
+    }
+    sym_nonspin->size = dataset->n_operations;
+    spg_free_dataset(dataset);
+    dataset = NULL;
+
+    return sym_nonspin;
+}
+
 /* Return 0 if failed */
 static int get_multiplicity(double const lattice[3][3],
                             double const position[][3], int const types[],
@@ -2229,6 +2742,84 @@ static size_t get_dense_ir_reciprocal_mesh(
     return num_ir;
 }
 
+/* Return NULL if failed */
+static SpglibIrGridPoints *get_ir_grid_points(
+    int const mesh[3], int const is_shift[3], int const is_time_reversal,
+    int const with_star, double const lattice[3][3], double const position[][3],
+    int const types[], int const num_atom, double const symprec,
+    double const angle_tolerance) {
+    SpglibDataset *dataset;
+    SpglibIrGridPoints *spglib_ir_grid_points;
+    int i;
+    MatINT *rotations, *rot_reciprocal;
+
+    rotations = NULL;
+    rot_reciprocal = NULL;
+    spglib_ir_grid_points = NULL;
+
+    if ((dataset = get_dataset(lattice, position, types, num_atom, 0, symprec,
+                               angle_tolerance)) == NULL) {
+        return NULL;
+    }
+
+    if ((rotations = mat_alloc_MatINT(dataset->n_operations)) == NULL) {
+        goto ret;
+    }
+
+    for (i = 0; i < dataset->n_operations; i++) {
+        mat_copy_matrix_i3(rotations->mat[i], dataset->rotations[i]);
+    }
+    if ((rot_reciprocal = kpt_get_point_group_reciprocal(
+             rotations, is_time_reversal)) == NULL) {
+        goto ret;
+    }
+    spglib_ir_grid_points = get_ir_grid_points_from_point_group(
+        mesh, is_shift, with_star, rot_reciprocal);
+
+ret:
+    if (rot_reciprocal != NULL) {
+        mat_free_MatINT(rot_reciprocal);
+        rot_reciprocal = NULL;
+    }
+    if (rotations != NULL) {
+        mat_free_MatINT(rotations);
+        rotations = NULL;
+    }
+    spg_free_dataset(dataset);
+    dataset = NULL;
+    return spglib_ir_grid_points;
+}
+
+/* Return NULL if failed */
+static SpglibIrGridPoints *get_ir_grid_points_from_point_group(
+    int const mesh[3], int const is_shift[3], int const with_star,
+    MatINT const *rot_reciprocal) {
+    SpglibIrGridPoints *spglib_ir_grid_points;
+    IrGridPoints *ir_grid_points;
+
+    if ((ir_grid_points = kpt_get_ir_grid_points(mesh, is_shift, rot_reciprocal,
+                                                 with_star)) == NULL) {
+        return NULL;
+    }
+    if ((spglib_ir_grid_points = (SpglibIrGridPoints *)malloc(
+             sizeof(SpglibIrGridPoints))) == NULL) {
+        warning_memory("spglib_ir_grid_points");
+        kpt_free_ir_grid_points(ir_grid_points);
+        ir_grid_points = NULL;
+        return NULL;
+    }
+
+    /* Arrays are handed over without copy. */
+    spglib_ir_grid_points->n_ir_grid_points = ir_grid_points->size;
+    spglib_ir_grid_points->ir_grid_address = ir_grid_points->grid_address;
+    spglib_ir_grid_points->weights = ir_grid_points->weights;
+    spglib_ir_grid_points->star_address = ir_grid_points->star_address;
+    free(ir_grid_points);
+    ir_grid_points = NULL;
+
+    return spglib_ir_grid_points;
+}
+
 static int get_stabilized_reciprocal_mesh(
     int grid_address[][3], int map[], int const mesh[3], int const is_shift[3],
     int const is_time_reversal, int const num_rot, int const rotations[][3][3],
@@ -10,17 +10,27 @@
 #include "cell.h"
 #include "debug.h"
 #include "mathfunc.h"
+#include "overlap.h"
 #include "primitive.h"
 #include "symmetry.h"
 
 static MagneticSymmetry *get_operations(
-    Symmetry const *sym_nonspin, Cell const *cell, int const with_time_reversal,
+    int *nonspin_indices, Symmetry const *sym_nonspin,
+    int const *permutations_nonspin, Cell const *cell,
+    OverlapChecker const *checker, int const with_time_reversal,
     int const is_axial, double const symprec, double const mag_symprec);
-static int *get_symmetry_permutations(MagneticSymmetry const *magnetic_symmetry,
-                                      Cell const *cell,
-                                      int const with_time_reversal,
-                                      int const is_axial, double const symprec,
-                                      double const mag_symprec);
+static int *get_symmetry_permutations(
+    MagneticSymmetry const *magnetic_symmetry, int const *nonspin_indices,
+    int const *permutations_nonspin, Cell const *cell,
+    OverlapChecker const *checker, int const with_time_reversal,
+    int const is_axial, double const symprec, double const mag_symprec);
+static int find_overlapping_site(Cell const *cell,
+                                 OverlapChecker const *checker,
+                                 double const pos[3], int const type,
+                                 double const symprec);
+static int is_same_site_tensor(Cell const *cell, int const j,
+                               double const scalar, double const vector[3],
+                               double const mag_symprec);
 static int *get_orbits(int const *permutations, int const num_sym,
                        int const num_atoms);
 static int get_operation_sign_on_scalar(
@@ -52,22 +62,35 @@ void set_rotations_in_cartesian(double (*rotations_cart)[3][3],
                                 MagneticSymmetry const *magnetic_symmetry);
 static int is_zero(double const a, double const mag_symprec);
 static int is_zero_d3(double const a[3], double const mag_symprec);
+static int is_group_with_identity(int const permutations[],
+                                  int const num_permutations,
+                                  int const num_sites);
+static int get_prefix_to_skip(int *num_stabilizers, int const configuration[],
+                              int const permutations[],
+                              int const num_permutations, int const num_sites);
+static void increment_prefix(int configuration[], int const prefix,
+                             int const num_sites, int const num_values);
 
 /******************************************************************************/
 
 /* doc was moved to spin.h. */
 MagneticSymmetry *spn_get_operations_with_site_tensors(
     int **equivalent_atoms, int **permutations, double prim_lattice[3][3],
-    Symmetry const *sym_nonspin, Cell const *cell, int const with_time_reversal,
-    int const is_axial, double const symprec, double const angle_tolerance,
+    Symmetry const *sym_nonspin, int const *permutations_nonspin,
+    Cell const *cell, int const with_time_reversal, int const is_axial,
+    double const symprec, double const angle_tolerance,
     double const mag_symprec_) {
     int multi;
+    int *nonspin_indices;
     double mag_symprec;
     MagneticSymmetry *magnetic_symmetry;
     VecDBL *pure_trans;
+    OverlapChecker *checker;
 
+    nonspin_indices = NULL;
     magnetic_symmetry = NULL;
     pure_trans = NULL;
+    checker = NULL;
 
     // TODO: More robust way to guess mag_symprec
     if (mag_symprec_ < 0) {
@@ -76,18 +99,39 @@ MagneticSymmetry *spn_get_operations_with_site_tensors(
         mag_symprec = mag_symprec_;
     }
 
-    if ((magnetic_symmetry =
-             get_operations(sym_nonspin, cell, with_time_reversal, is_axial,
-                            symprec, mag_symprec)) == NULL) {
+    /* Atoms are hashed once and looked up by the operations below unless */
+    /* the atoms mapped by the operations are already known. */
+    if (permutations_nonspin == NULL &&
+        (checker = ovl_overlap_checker_init(cell, symprec)) == NULL) {
+        goto err;
+    }
+
+    /* Index in sym_nonspin of each magnetic symmetry operation */
+    if ((nonspin_indices =
+             (int *)malloc(sizeof(int) * 2 * sym_nonspin->size)) == NULL) {
+        goto err;
+    }
+
+    if ((magnetic_symmetry = get_operations(
+             nonspin_indices, sym_nonspin, permutations_nonspin, cell, checker,
+             with_time_reversal, is_axial, symprec, mag_symprec)) == NULL) {
         goto err;
     }
 
     /* equivalent atoms */
     if ((*permutations = get_symmetry_permutations(
-             magnetic_symmetry, cell, with_time_reversal, is_axial, symprec,
-             mag_symprec)) == NULL) {
+             magnetic_symmetry, nonspin_indices, permutations_nonspin, cell,
+             checker, with_time_reversal, is_axial, symprec, mag_symprec)) ==
+        NULL) {
         goto err;
     }
+    free(nonspin_indices);
+    nonspin_indices = NULL;
+    if (checker != NULL) {
+        ovl_overlap_checker_free(checker);
+        checker = NULL;
+    }
+
     if ((*equivalent_atoms = get_orbits(*permutations, magnetic_symmetry->size,
                                         cell->size)) == NULL) {
         goto err;
@@ -114,6 +158,14 @@ err:
         mat_free_VecDBL(pure_trans);
         pure_trans = NULL;
     }
+    if (nonspin_indices != NULL) {
+        free(nonspin_indices);
+        nonspin_indices = NULL;
+    }
+    if (checker != NULL) {
+        ovl_overlap_checker_free(checker);
+        checker = NULL;
+    }
     return NULL;
 }
 
@@ -122,7 +174,7 @@ VecDBL *spn_collect_pure_translations_from_magnetic_symmetry(
     int i, num_pure_trans;
     VecDBL *pure_trans;
     VecDBL *ret_pure_trans;
-    static int identity[3][3] = {{1, 0, 0}, {0, 1, 0}, {0, 0, 1}};
+    static int const identity[3][3] = {{1, 0, 0}, {0, 1, 0}, {0, 0, 1}};
     num_pure_trans = 0;
     pure_trans = NULL;
     ret_pure_trans = NULL;
@@ -293,6 +345,45 @@ double *spn_alloc_site_tensors(int const num_atoms, int const tensor_rank) {
     return ret;
 }
 
+/* doc was moved to spin.h. */
+int spn_get_inequivalent_configurations(
+    int configurations[], int multiplicities[], int cursor[],
+    int const max_configs, int const permutations[], int const num_permutations,
+    int const num_sites, int const num_values) {
+    int i, num_configs, num_stabilizers, prefix;
+
+    if (num_sites < 1 || num_values < 1 ||
+        !is_group_with_identity(permutations, num_permutations, num_sites)) {
+        return -1;
+    }
+    for (i = 0; i < num_sites; i++) {
+        if (cursor[i] < 0 || cursor[i] >= num_values) {
+            /* All configurations have been searched. */
+            if (i == 0 && cursor[0] == num_values) {
+                return 0;
+            }
+            return -1;
+        }
+    }
+
+    num_configs = 0;
+    while (num_configs < max_configs && cursor[0] < num_values) {
+        prefix = get_prefix_to_skip(&num_stabilizers, cursor, permutations,
+                                    num_permutations, num_sites);
+        if (prefix == 0) {
+            for (i = 0; i < num_sites; i++) {
+                configurations[(size_t)num_configs * num_sites + i] = cursor[i];
+            }
+            multiplicities[num_configs] = num_permutations / num_stabilizers;
+            num_configs++;
+            prefix = num_sites;
+        }
+        increment_prefix(cursor, prefix, num_sites, num_values);
+    }
+
+    return num_configs;
+}
+
 /******************************************************************************/
 /* Local functions                                                            */
 /******************************************************************************/
@@ -301,8 +392,13 @@ double *spn_alloc_site_tensors(int const num_atoms, int const tensor_rank) {
 /* returned MagneticSymmetry.timerev is NULL if with_time_reversal==false. */
 /* is_axial: If true, tensors with tensor_rank==1 do not change by */
 /*           spatial inversion */
+/* The index in sym_nonspin of each returned operation is set in */
+/* nonspin_indices. Atoms are mapped by permutations_nonspin of sym_nonspin */
+/* if given, otherwise they are looked up by checker. */
 static MagneticSymmetry *get_operations(
-    Symmetry const *sym_nonspin, Cell const *cell, int const with_time_reversal,
+    int *nonspin_indices, Symmetry const *sym_nonspin,
+    int const *permutations_nonspin, Cell const *cell,
+    OverlapChecker const *checker, int const with_time_reversal,
     int const is_axial, double const symprec, double const mag_symprec) {
     MagneticSymmetry *magnetic_symmetry;
     int i, j, k, sign, num_sym, found, determined, max_size;
@@ -352,19 +448,16 @@ static MagneticSymmetry *get_operations(
         sign = 0;
         for (j = 0; j < cell->size; j++) {
             /* Find atom-k overlapped with atom-j by operation-i */
-            apply_symmetry_to_position(pos, cell->position[j],
-                                       sym_nonspin->rot[i],
-                                       sym_nonspin->trans[i]);
-            for (k = 0; k < cell->size; k++) {
-                if (cel_is_overlap_with_same_type(
-                        cell->position[k], pos, cell->types[k], cell->types[j],
-                        cell->lattice, symprec)) {
-                    /* Break because cel_is_overlap_with_same_type == true */
-                    /* for only one atom. */
-                    break;
-                }
+            if (permutations_nonspin != NULL) {
+                k = permutations_nonspin[i * cell->size + j];
+            } else {
+                apply_symmetry_to_position(pos, cell->position[j],
+                                           sym_nonspin->rot[i],
+                                           sym_nonspin->trans[i]);
+                k = find_overlapping_site(cell, checker, pos, cell->types[j],
+                                          symprec);
             }
-            if (k == cell->size) {
+            if (k == -1) {
                 // Unreachable here in theory, but we rarely fail to overlap
                 // atoms possibly due to too high symprec. In that case, skip
                 // the symmetry operation.
@@ -456,6 +549,7 @@ static MagneticSymmetry *get_operations(
                 if (with_time_reversal) {
                     spin_flips[num_sym] = sign;
                 }
+                nonspin_indices[num_sym] = i;
                 num_sym++;
             } else if (with_time_reversal) {
                 /* (with_time_reversal, determined, sign) */
@@ -466,6 +560,7 @@ static MagneticSymmetry *get_operations(
                                    sym_nonspin->rot[i]);
                 mat_copy_vector_d3(trans->vec[num_sym], sym_nonspin->trans[i]);
                 spin_flips[num_sym] = 1;
+                nonspin_indices[num_sym] = i;
                 num_sym++;
 
                 /* sign=-1 */
@@ -473,6 +568,7 @@ static MagneticSymmetry *get_operations(
                                    sym_nonspin->rot[i]);
                 mat_copy_vector_d3(trans->vec[num_sym], sym_nonspin->trans[i]);
                 spin_flips[num_sym] = -1;
+                nonspin_indices[num_sym] = i;
                 num_sym++;
             } else {
                 /* (with_time_reversal, determined, sign) */
@@ -480,6 +576,7 @@ static MagneticSymmetry *get_operations(
                 mat_copy_matrix_i3(rotations->mat[num_sym],
                                    sym_nonspin->rot[i]);
                 mat_copy_vector_d3(trans->vec[num_sym], sym_nonspin->trans[i]);
+                nonspin_indices[num_sym] = i;
                 num_sym++;
             }
         }
@@ -523,17 +620,22 @@ err:
 // Return permutation tables `permutations` such that the p-th operation
 // in `magnetic_symmetry` maps site-`i` to site-`permutations[p * cell->size +
 // * i]`. If failed, return NULL.
-static int *get_symmetry_permutations(MagneticSymmetry const *magnetic_symmetry,
-                                      Cell const *cell,
-                                      int const with_time_reversal,
-                                      int const is_axial, double const symprec,
-                                      double const mag_symprec) {
+// The p-th operation is the `nonspin_indices[p]`-th operation of the
+// operations whose permutations are `permutations_nonspin`, if given.
+static int *get_symmetry_permutations(
+    MagneticSymmetry const *magnetic_symmetry, int const *nonspin_indices,
+    int const *permutations_nonspin, Cell const *cell,
+    OverlapChecker const *checker, int const with_time_reversal,
+    int const is_axial, double const symprec, double const mag_symprec) {
     int p, i, j;
     int *permutations;
     double scalar;
-    double pos[3], vector[3], diff[3];
+    double pos[3], vector[3];
     double (*rotations_cart)[3][3];
 
+    scalar = 0;
+    vector[0] = vector[1] = vector[2] = 0;
+
     rotations_cart = NULL;
     permutations = NULL;
 
@@ -572,6 +674,21 @@ static int *get_symmetry_permutations(MagneticSymmetry const *magnetic_symmetry,
                                               with_time_reversal, is_axial);
             }
 
+            /* The site tensor is compared only with the atom found at */
+            /* the position. The other atoms are scanned only if they differ, */
+            /* which happens only when several atoms overlap within symprec. */
+            if (permutations_nonspin != NULL) {
+                j = permutations_nonspin[nonspin_indices[p] * cell->size + i];
+            } else {
+                j = find_overlapping_site(cell, checker, pos, cell->types[i],
+                                          symprec);
+            }
+            if (j != -1 &&
+                is_same_site_tensor(cell, j, scalar, vector, mag_symprec)) {
+                /* Now, operation-p maps site-i to site-j */
+                permutations[p * cell->size + i] = j;
+                continue;
+            }
             for (j = 0; j < cell->size; j++) {
                 if (!cel_is_overlap_with_same_type(
                         pos, cell->position[j], cell->types[i], cell->types[j],
@@ -580,18 +697,10 @@ static int *get_symmetry_permutations(MagneticSymmetry const *magnetic_symmetry,
                 }
                 debug_print("Try to overlap site-%d (%f) with site-%d (%f)\n",
                             i, scalar, j, cell->tensors[j]);
-                if (cell->tensor_rank == COLLINEAR &&
-                    !is_zero(cell->tensors[j] - scalar, mag_symprec)) {
+                if (!is_same_site_tensor(cell, j, scalar, vector,
+                                         mag_symprec)) {
                     continue;
                 }
-                if (cell->tensor_rank == NONCOLLINEAR) {
-                    diff[0] = cell->tensors[3 * j] - vector[0];
-                    diff[1] = cell->tensors[3 * j + 1] - vector[1];
-                    diff[2] = cell->tensors[3 * j + 2] - vector[2];
-                    if (!is_zero_d3(diff, mag_symprec)) {
-                        continue;
-                    }
-                }
 
                 /* Now, operation-p maps site-i to site-j */
                 permutations[p * cell->size + i] = j;
@@ -600,7 +709,7 @@ static int *get_symmetry_permutations(MagneticSymmetry const *magnetic_symmetry,
 
             if (permutations[p * cell->size + i] == -1) {
                 debug_print("Failed to map site-%d by operation-%d\n", i, p);
-                return NULL; /* Unreachable */
+                goto err; /* Unreachable */
             }
         }
 
@@ -615,6 +724,59 @@ static int *get_symmetry_permutations(MagneticSymmetry const *magnetic_symmetry,
     rotations_cart = NULL;
 
     return permutations;
+
+err:
+    free(rotations_cart);
+    rotations_cart = NULL;
+    free(permutations);
+    permutations = NULL;
+    return NULL;
+}
+
+/* Return the lowest index of the atoms of `type` overlapping with `pos`, */
+/* or -1 if there is none. The atom is looked up in the bins of `checker` */
+/* and all atoms are scanned only if the found one is not overlapping in */
+/* the sense of cel_is_overlap_with_same_type. */
+static int find_overlapping_site(Cell const *cell,
+                                 OverlapChecker const *checker,
+                                 double const pos[3], int const type,
+                                 double const symprec) {
+    int j;
+
+    j = ovl_find_first_overlapping_atom(checker, pos, type, symprec);
+    if (j != -1 &&
+        cel_is_overlap_with_same_type(pos, cell->position[j], type,
+                                      cell->types[j], cell->lattice, symprec)) {
+        return j;
+    }
+
+    for (j = 0; j < cell->size; j++) {
+        if (cel_is_overlap_with_same_type(pos, cell->position[j], type,
+                                          cell->types[j], cell->lattice,
+                                          symprec)) {
+            return j;
+        }
+    }
+    return -1;
+}
+
+/* Return 1 if the site tensor of site-j is `scalar` (collinear) or */
+/* `vector` (non-collinear) within mag_symprec. */
+static int is_same_site_tensor(Cell const *cell, int const j,
+                               double const scalar, double const vector[3],
+                               double const mag_symprec) {
+    double diff[3];
+
+    if (cell->tensor_rank == COLLINEAR) {
+        return is_zero(cell->tensors[j] - scalar, mag_symprec);
+    }
+    if (cell->tensor_rank == NONCOLLINEAR) {
+        diff[0] = cell->tensors[3 * j] - vector[0];
+        diff[1] = cell->tensors[3 * j + 1] - vector[1];
+        diff[2] = cell->tensors[3 * j + 2] - vector[2];
+        return is_zero_d3(diff, mag_symprec);
+    }
+    return 1;
 }
 
 // Return equivalent_atoms. If failed, return NULL.
@@ -779,3 +941,91 @@ static int is_zero_d3(double const a[3], double const mag_symprec) {
     }
     return 1;
 }
+
+/* Return 1 if the permutations are of the sites and one of them is the */
+/* identity, otherwise 0. */
+static int is_group_with_identity(int const permutations[],
+                                  int const num_permutations,
+                                  int const num_sites) {
+    int i, j, has_identity, is_identity;
+    int const *perm;
+
+    has_identity = 0;
+    for (i = 0; i < num_permutations; i++) {
+        perm = permutations + (size_t)i * num_sites;
+        is_identity = 1;
+        for (j = 0; j < num_sites; j++) {
+            if (perm[j] < 0 || perm[j] >= num_sites) {
+                return 0;
+            }
+            if (perm[j] != j) {
+                is_identity = 0;
+            }
+        }
+        if (is_identity) {
+            has_identity = 1;
+        }
+    }
+    return has_identity;
+}
+
+/* The configuration is mapped by a permutation perm onto the one whose */
+/* site j has the value of the site perm[j]. Return the length of the */
+/* shortest prefix of the configuration which is enough to know that it is */
+/* mapped by a permutation onto a lexicographically smaller configuration, */
+/* so that all the configurations sharing the prefix are skipped. Return 0 */
+/* if the configuration is the smallest in its orbit, and set the number of */
+/* permutations keeping it to num_stabilizers. */
+static int get_prefix_to_skip(int *num_stabilizers, int const configuration[],
+                              int const permutations[],
+                              int const num_permutations, int const num_sites) {
+    int i, j, k, prefix, shortest;
+    int const *perm;
+
+    shortest = 0;
+    *num_stabilizers = 0;
+    for (i = 0; i < num_permutations; i++) {
+        perm = permutations + (size_t)i * num_sites;
+        prefix = 0;
+        k = 0;
+        for (j = 0; j < num_sites; j++) {
+            k = perm[j];
+            if (prefix < j + 1) {
+                prefix = j + 1;
+            }
+            if (prefix < k + 1) {
+                prefix = k + 1;
+            }
+            if (configuration[k] != configuration[j]) {
+                break;
+            }
+        }
+        if (j == num_sites) {
+            (*num_stabilizers)++;
+        } else if (configuration[k] < configuration[j] &&
+                   (shortest == 0 || prefix < shortest)) {
+            shortest = prefix;
+        }
+    }
+    return shortest;
+}
+
+/* Set the configuration to the lexicographically smallest one after all */
+/* those sharing its prefix. configuration[0] becomes num_values after the */
+/* last configuration. */
+static void increment_prefix(int configuration[], int const prefix,
+                             int const num_sites, int const num_values) {
+    int i;
+
+    for (i = prefix; i < num_sites; i++) {
+        configuration[i] = 0;
+    }
+    for (i = prefix - 1; i > 0; i--) {
+        configuration[i]++;
+        if (configuration[i] < num_values) {
+            return;
+        }
+        configuration[i] = 0;
+    }
+    configuration[0]++;
+}
@@ -17,6 +17,9 @@
  * maps site-`i` to site-`permutations[p * cell->size + i]`.
  * @param[out] prim_lattice
  * @param[in] sym_nonspin Symmetry operations with ignoring spin
+ * @param[in] permutations_nonspin such that the p-th operation in
+ * `sym_nonspin` maps site-`i` to site-`permutations_nonspin[p * cell->size +
+ * i]`. If NULL, they are searched from the positions.
  * @param[in] cell
  * @param[in] with_time_reversal true if consider time reversal operation
  * @param[in] is_axial true if site tensors are axial w.r.t. time-reversal
@@ -28,8 +31,9 @@
  */
 MagneticSymmetry *spn_get_operations_with_site_tensors(
     int **equivalent_atoms, int **permutations, double prim_lattice[3][3],
-    Symmetry const *sym_nonspin, Cell const *cell, int const with_time_reversal,
-    int const is_axial, double const symprec, double const angle_tolerance,
+    Symmetry const *sym_nonspin, int const *permutations_nonspin,
+    Cell const *cell, int const with_time_reversal, int const is_axial,
+    double const symprec, double const angle_tolerance,
     double const mag_symprec);
 VecDBL *spn_collect_pure_translations_from_magnetic_symmetry(
     MagneticSymmetry const *sym_msg);
@@ -37,5 +41,33 @@ Cell *spn_get_idealized_cell(int const *permutations, Cell const *cell,
                              MagneticSymmetry const *magnetic_symmetry,
                              int const with_time_reversal, int const is_axial);
 double *spn_alloc_site_tensors(int const num_atoms, int const tensor_rank);
+/**
+ * @brief Search configurations of values on sites which are inequivalent
+ * under permutations of the sites.
+ *
+ * A configuration is given by the indices of the values on the sites, and is
+ * searched if it is lexicographically the smallest in its orbit. The
+ * configurations are visited in lexicographic order, and all those sharing a
+ * prefix which is mapped onto a smaller one are skipped at once.
+ *
+ * @param[out] configurations `num_sites` indices of values of each searched
+ * configuration.
+ * @param[out] multiplicities Number of configurations in the orbit of each
+ * searched configuration.
+ * @param[in,out] cursor Configuration from which the search starts, which is
+ * advanced to the configuration to be searched next. `cursor[0]` becomes
+ * `num_values` after all configurations are searched.
+ * @param[in] max_configs Maximum number of configurations to be searched.
+ * @param[in] permutations Group of permutations of the sites such that the
+ * p-th permutation maps site-`i` to site-`permutations[p * num_sites + i]`.
+ * @param[in] num_permutations
+ * @param[in] num_sites
+ * @param[in] num_values
+ * @return Number of searched configurations, or -1 if failed.
+ */
+int spn_get_inequivalent_configurations(
+    int configurations[], int multiplicities[], int cursor[],
+    int const max_configs, int const permutations[], int const num_permutations,
+    int const num_sites, int const num_values);
 
 #endif
@@ -34,7 +34,8 @@ static int identity[3][3] = {{1, 0, 0}, {0, 1, 0}, {0, 0, 1}};
 
 static int get_index_with_least_atoms(Cell const *cell);
 static VecDBL *get_translation(int const rot[3][3], Cell const *cell,
-                               double const symprec, int const is_identity);
+                               OverlapChecker *checker, double const symprec,
+                               int const is_identity);
 static Symmetry *get_operations(Cell const *primitive, double const symprec,
                                 double const angle_symprec);
 static Symmetry *reduce_operation(Cell const *primitive,
@@ -43,16 +44,19 @@ static Symmetry *reduce_operation(Cell const *primitive,
                                   double const angle_symprec,
                                   int const is_pure_trans);
 static int search_translation_part(int atoms_found[], Cell const *cell,
-                                   int const rot[3][3],
+                                   OverlapChecker *checker, int const rot[3][3],
                                    int const min_atom_index,
                                    double const origin[3], double const symprec,
                                    int const is_identity);
-static int search_pure_translations(int atoms_found[], Cell const *cell,
+static int search_pure_translations(int atoms_found[],
+                                    OverlapChecker const *checker,
+                                    Cell const *cell, int const new_atom,
+                                    int const origin_atom,
                                     double const trans[3],
                                     double const symprec);
 static int is_overlap_all_atoms(double const test_trans[3], int const rot[3][3],
-                                Cell const *cell, double const symprec,
-                                int const is_identity);
+                                Cell const *cell, OverlapChecker *checker,
+                                double const symprec, int const is_identity);
 static PointSymmetry transform_pointsymmetry(
     PointSymmetry const *point_sym_prim, double const new_lattice[3][3],
     double const original_lattice[3][3]);
@@ -68,22 +72,23 @@ static int is_identity_metric(double const metric_rotated[3][3],
                               double const symprec, double const angle_symprec);
 static double get_angle(double const metric[3][3], int const i, int const j);
 
-/* get_translation, search_translation_part and search_pure_translations */
+/* get_translation and search_translation_part */
 /* are duplicated to get the if statement outside the nested loops */
 /* I have not tested if it is better in efficiency. */
 static VecDBL *get_layer_translation(int const rot[3][3], Cell const *cell,
+                                     OverlapChecker *checker,
                                      double const symprec,
                                      int const is_identity);
-static int search_layer_translation_part(int atoms_found[], Cell const *cell,
-                                         int const rot[3][3],
-                                         int const min_atom_index,
-                                         double const origin[3],
-                                         double const symprec,
-                                         int const is_identity);
-static int search_layer_pure_translations(int atoms_found[], Cell const *cell,
-                                          double const trans[3],
-                                          int const periodic_axes[2],
-                                          double const symprec);
+static int search_layer_translation_part(
+    int atoms_found[], Cell const *cell, OverlapChecker *checker,
+    int const rot[3][3], int const min_atom_index, double const origin[3],
+    double const symprec, int const is_identity);
+static int is_in_range(int const *permutations, int const num_rot,
+                       int const num_sites);
+static void get_rotation_in_cartesian(double rot_cart[3][3],
+                                      int const rot[3][3],
+                                      double const lattice[3][3],
+                                      double const inv_lattice[3][3]);
 
 /* Return NULL if failed */
 Symmetry *sym_alloc_symmetry(int const size) {
@@ -215,16 +220,27 @@ Symmetry *sym_reduce_operation(Cell const *primitive, Symmetry const *symmetry,
 VecDBL *sym_get_pure_translation(Cell const *cell, double const symprec) {
     int multi;
     VecDBL *pure_trans;
+    OverlapChecker *checker;
 
     debug_print("sym_get_pure_translation (tolerance = %f):\n", symprec);
 
     multi = 0;
     pure_trans = NULL;
+    checker = NULL;
+
+    if ((checker = ovl_overlap_checker_init(cell, symprec)) == NULL) {
+        return NULL;
+    }
+
     if (cell->aperiodic_axis == -1) {
-        pure_trans = get_translation(identity, cell, symprec, 1);
+        pure_trans = get_translation(identity, cell, checker, symprec, 1);
     } else {
-        pure_trans = get_layer_translation(identity, cell, symprec, 1);
+        pure_trans = get_layer_translation(identity, cell, checker, symprec, 1);
     }
+
+    ovl_overlap_checker_free(checker);
+    checker = NULL;
+
     if (pure_trans == NULL) {
         debug_print("spglib: get_translation failed.\n");
         return NULL;
@@ -292,6 +308,171 @@ VecDBL *sym_reduce_pure_translation(Cell const *cell, VecDBL const *pure_trans,
     return pure_trans_reduced;
 }
 
+/* Set ``rotated_positions[p * num_atom + i]`` to the position ``i`` */
+/* transformed by the p-th operation, rotation * position + translation. */
+void sym_get_rotated_positions(double (*rotated_positions)[3],
+                               int const (*rotations)[3][3],
+                               double const (*translations)[3],
+                               int const num_rot, double const (*positions)[3],
+                               int const num_atom) {
+    int p, i, k;
+    double (*pos)[3];
+
+    for (p = 0; p < num_rot; p++) {
+        pos = rotated_positions + (size_t)p * num_atom;
+        for (i = 0; i < num_atom; i++) {
+            for (k = 0; k < 3; k++) {
+                pos[i][k] = rotations[p][k][0] * positions[i][0] +
+                            rotations[p][k][1] * positions[i][1] +
+                            rotations[p][k][2] * positions[i][2] +
+                            translations[p][k];
+            }
+        }
+    }
+}
+
+/* Set ``permutations[p * cell->size + i]`` to the atom onto which the */
+/* p-th operation maps the atom i. The atom is looked up in the bins of */
+/* an OverlapChecker, so that the cost is linear in the number of atoms. */
+/* Return 0 if an atom is not mapped onto an atom of the same type. */
+int sym_get_permutations(int *permutations, Symmetry const *symmetry,
+                         Cell const *cell, double const symprec) {
+    int p, i, j, succeeded;
+    double pos[3];
+    OverlapChecker *checker;
+
+    if ((checker = ovl_overlap_checker_init(cell, symprec)) == NULL) {
+        return 0;
+    }
+
+    succeeded = 1;
+    for (p = 0; p < symmetry->size; p++) {
+        for (i = 0; i < cell->size; i++) {
+            mat_multiply_matrix_vector_id3(pos, symmetry->rot[p],
+                                           cell->position[i]);
+            for (j = 0; j < 3; j++) {
+                pos[j] += symmetry->trans[p][j];
+            }
+            j = ovl_find_overlapping_atom(checker, pos, cell->types[i],
+                                          symprec);
+            if (j == -1) {
+                debug_print("Failed to map atom %d by operation %d\n", i, p);
+                succeeded = 0;
+                goto ret;
+            }
+            permutations[(size_t)p * cell->size + i] = j;
+        }
+    }
+
+ret:
+    ovl_overlap_checker_free(checker);
+    checker = NULL;
+
+    return succeeded;
+}
+
+/* Average the Cartesian vectors over the operations given by their */
+/* rotations with respect to ``lattice``. The vector i rotated by the p-th */
+/* operation is added to ``symmetrized[permutations[p * num_vectors + i]]``, */
+/* or to ``symmetrized[i]`` if ``permutations`` is NULL. */
+/* Return 0 if the lattice is singular or a permutation is out of range. */
+int sym_symmetrize_vectors(double (*symmetrized)[3], double const (*vectors)[3],
+                           int const num_vectors, int const (*rotations)[3][3],
+                           int const num_rot, double const lattice[3][3],
+                           int const *permutations) {
+    int p, i, j, k;
+    double inv_lattice[3][3], rot_cart[3][3], vec[3];
+
+    if (num_rot < 1 || !mat_inverse_matrix_d3(inv_lattice, lattice, 0)) {
+        return 0;
+    }
+    if (permutations != NULL &&
+        !is_in_range(permutations, num_rot, num_vectors)) {
+        return 0;
+    }
+
+    for (i = 0; i < num_vectors; i++) {
+        for (k = 0; k < 3; k++) {
+            symmetrized[i][k] = 0;
+        }
+    }
+
+    for (p = 0; p < num_rot; p++) {
+        get_rotation_in_cartesian(rot_cart, rotations[p], lattice, inv_lattice);
+        for (i = 0; i < num_vectors; i++) {
+            j = permutations == NULL
+                    ? i
+                    : permutations[(size_t)p * num_vectors + i];
+            mat_multiply_matrix_vector_d3(vec, rot_cart, vectors[i]);
+            for (k = 0; k < 3; k++) {
+                symmetrized[j][k] += vec[k];
+            }
+        }
+    }
+
+    for (i = 0; i < num_vectors; i++) {
+        for (k = 0; k < 3; k++) {
+            symmetrized[i][k] /= num_rot;
+        }
+    }
+
+    return 1;
+}
+
+/* Same as sym_symmetrize_vectors for Cartesian rank-2 tensors, which are */
+/* rotated as rot_cart @ tensor @ rot_cart^T. */
+int sym_symmetrize_tensors(double (*symmetrized)[3][3],
+                           double const (*tensors)[3][3], int const num_tensors,
+                           int const (*rotations)[3][3], int const num_rot,
+                           double const lattice[3][3],
+                           int const *permutations) {
+    int p, i, j, k, l;
+    double inv_lattice[3][3], rot_cart[3][3], rot_cart_t[3][3], tensor[3][3];
+
+    if (num_rot < 1 || !mat_inverse_matrix_d3(inv_lattice, lattice, 0)) {
+        return 0;
+    }
+    if (permutations != NULL &&
+        !is_in_range(permutations, num_rot, num_tensors)) {
+        return 0;
+    }
+
+    for (i = 0; i < num_tensors; i++) {
+        for (k = 0; k < 3; k++) {
+            for (l = 0; l < 3; l++) {
+                symmetrized[i][k][l] = 0;
+            }
+        }
+    }
+
+    for (p = 0; p < num_rot; p++) {
+        get_rotation_in_cartesian(rot_cart, rotations[p], lattice, inv_lattice);
+        mat_transpose_matrix_d3(rot_cart_t, rot_cart);
+        for (i = 0; i < num_tensors; i++) {
+            j = permutations == NULL
+                    ? i
+                    : permutations[(size_t)p * num_tensors + i];
+            mat_multiply_matrix_d3(tensor, rot_cart, tensors[i]);
+            mat_multiply_matrix_d3(tensor, tensor, rot_cart_t);
+            for (k = 0; k < 3; k++) {
+                for (l = 0; l < 3; l++) {
+                    symmetrized[j][k][l] += tensor[k][l];
+                }
+            }
+        }
+    }
+
+    for (i = 0; i < num_tensors; i++) {
+        for (k = 0; k < 3; k++) {
+            for (l = 0; l < 3; l++) {
+                symmetrized[i][k][l] /= num_rot;
+            }
+        }
+    }
+
+    return 1;
+}
+
 /* Warning! Comment 1 does not seem to happen. There is nothing about input
  * cell.*/
 /* 1) Pointgroup operations of the primitive cell are obtained. */
@@ -336,12 +517,14 @@ static Symmetry *reduce_operation(Cell const *primitive,
     PointSymmetry point_symmetry;
     MatINT *rot;
     VecDBL *trans;
+    OverlapChecker *checker;
 
     debug_print("reduce_operation:\n");
 
     sym_reduced = NULL;
     rot = NULL;
     trans = NULL;
+    checker = NULL;
 
     if (is_pure_trans) {
         point_symmetry.size = 1;
@@ -364,13 +547,22 @@ static Symmetry *reduce_operation(Cell const *primitive,
         return NULL;
     }
 
+    /* One OverlapChecker is shared by all the operations. */
+    if ((checker = ovl_overlap_checker_init(primitive, symprec)) == NULL) {
+        mat_free_MatINT(rot);
+        rot = NULL;
+        mat_free_VecDBL(trans);
+        trans = NULL;
+        return NULL;
+    }
+
     num_sym = 0;
     for (i = 0; i < point_symmetry.size; i++) {
         for (j = 0; j < symmetry->size; j++) {
             if (mat_check_identity_matrix_i3(point_symmetry.rot[i],
                                              symmetry->rot[j])) {
                 if (is_overlap_all_atoms(symmetry->trans[j], symmetry->rot[j],
-                                         primitive, symprec, 0)) {
+                                         primitive, checker, symprec, 0)) {
                     mat_copy_matrix_i3(rot->mat[num_sym], symmetry->rot[j]);
                     mat_copy_vector_d3(trans->vec[num_sym], symmetry->trans[j]);
                     num_sym++;
@@ -386,6 +578,8 @@ static Symmetry *reduce_operation(Cell const *primitive,
         }
     }
 
+    ovl_overlap_checker_free(checker);
+    checker = NULL;
     mat_free_MatINT(rot);
     rot = NULL;
     mat_free_VecDBL(trans);
@@ -398,7 +592,8 @@ static Symmetry *reduce_operation(Cell const *primitive,
 /* This function is heaviest in this code. */
 /* Return NULL if failed */
 static VecDBL *get_translation(int const rot[3][3], Cell const *cell,
-                               double const symprec, int const is_identity) {
+                               OverlapChecker *checker, double const symprec,
+                               int const is_identity) {
     int i, j, k, min_atom_index, num_trans;
     int *is_found;
     double origin[3];
@@ -430,8 +625,9 @@ static VecDBL *get_translation(int const rot[3][3], Cell const *cell,
      */
     mat_multiply_matrix_vector_id3(origin, rot, cell->position[min_atom_index]);
 
-    num_trans = search_translation_part(is_found, cell, rot, min_atom_index,
-                                        origin, symprec, is_identity);
+    num_trans =
+        search_translation_part(is_found, cell, checker, rot, min_atom_index,
+                                origin, symprec, is_identity);
     if (num_trans == -1 || num_trans == 0) {
         goto ret;
     }
@@ -460,19 +656,12 @@ ret:
 
 /* Returns -1 on failure. */
 static int search_translation_part(int atoms_found[], Cell const *cell,
-                                   int const rot[3][3],
+                                   OverlapChecker *checker, int const rot[3][3],
                                    int const min_atom_index,
                                    double const origin[3], double const symprec,
                                    int const is_identity) {
-    int i, j, num_trans, is_overlap;
+    int i, j, num_trans, num_pure_trans, is_overlap;
     double trans[3];
-    OverlapChecker *checker;
-
-    checker = NULL;
-
-    if ((checker = ovl_overlap_checker_init(cell)) == NULL) {
-        return -1;
-    }
 
     num_trans = 0;
 
@@ -492,74 +681,98 @@ static int search_translation_part(int atoms_found[], Cell const *cell,
         is_overlap =
             ovl_check_total_overlap(checker, trans, rot, symprec, is_identity);
         if (is_overlap == -1) {
-            goto err;
+            return -1;
         } else if (is_overlap) {
             atoms_found[i] = 1;
             num_trans++;
             if (is_identity) {
-                num_trans +=
-                    search_pure_translations(atoms_found, cell, trans, symprec);
+                num_pure_trans =
+                    search_pure_translations(atoms_found, checker, cell, i,
+                                             min_atom_index, trans, symprec);
+                if (num_pure_trans == -1) {
+                    return -1;
+                }
+                num_trans += num_pure_trans;
             }
         }
     }
 
-    ovl_overlap_checker_free(checker);
-    checker = NULL;
     return num_trans;
-
-err:
-    ovl_overlap_checker_free(checker);
-    checker = NULL;
-    return -1;
 }
 
-static int search_pure_translations(int atoms_found[], Cell const *cell,
+/* Mark the atoms translated from the origin atom by pure translations */
+/* generated by 'trans' and the pure translations found so far. */
+/* The found translations form a group G, so the new group is enumerated */
+/* as G + m * trans for m = 1, 2, ... until m * trans falls into G. */
+/* atoms_found[new_atom] is expected to be set already for 'trans'. */
+/* Returns the number of newly found atoms, or -1 on failure. */
+static int search_pure_translations(int atoms_found[],
+                                    OverlapChecker const *checker,
+                                    Cell const *cell, int const new_atom,
+                                    int const origin_atom,
                                     double const trans[3],
                                     double const symprec) {
-    int i, j, num_trans, i_atom, initial_atom;
-    int *copy_atoms_found;
+    int i, j, k, m, num_trans, num_group;
+    int *group, *is_in_group;
     double vec[3];
 
     num_trans = 0;
+    group = NULL;
+    is_in_group = NULL;
 
-    copy_atoms_found = (int *)malloc(sizeof(int) * cell->size);
-    for (i = 0; i < cell->size; i++) {
-        copy_atoms_found[i] = atoms_found[i];
+    if (new_atom == origin_atom) {
+        return 0;
     }
 
-    for (initial_atom = 0; initial_atom < cell->size; initial_atom++) {
-        if (!copy_atoms_found[initial_atom]) {
-            continue;
-        }
+    if ((group = (int *)malloc(sizeof(int) * cell->size)) == NULL) {
+        warning_memory("group");
+        return -1;
+    }
 
-        i_atom = initial_atom;
+    if ((is_in_group = (int *)malloc(sizeof(int) * cell->size)) == NULL) {
+        warning_memory("is_in_group");
+        free(group);
+        group = NULL;
+        return -1;
+    }
 
-        for (i = 0; i < cell->size; i++) {
-            for (j = 0; j < 3; j++) {
-                vec[j] = cell->position[i_atom][j] + trans[j];
-            }
+    /* Atoms of the translations found before 'trans' */
+    num_group = 0;
+    for (i = 0; i < cell->size; i++) {
+        is_in_group[i] = (atoms_found[i] && i != new_atom) || i == origin_atom;
+        if (is_in_group[i]) {
+            group[num_group] = i;
+            num_group++;
+        }
+    }
 
-            for (j = 0; j < cell->size; j++) {
-                if (cel_is_overlap_with_same_type(
-                        vec, cell->position[j], cell->types[i_atom],
-                        cell->types[j], cell->lattice, symprec)) {
-                    if (!atoms_found[j]) {
-                        atoms_found[j] = 1;
-                        num_trans++;
-                    }
-                    i_atom = j;
+    for (m = 1; m < cell->size; m++) {
+        for (k = 0; k < 3; k++) {
+            vec[k] = cell->position[origin_atom][k] + m * trans[k];
+        }
+        j = ovl_find_overlapping_atom(checker, vec, cell->types[origin_atom],
+                                      symprec);
+        if (j == -1 || is_in_group[j]) {
+            break;
+        }
 
-                    break;
-                }
+        for (i = 0; i < num_group; i++) {
+            for (k = 0; k < 3; k++) {
+                vec[k] = cell->position[group[i]][k] + m * trans[k];
             }
-
-            if (i_atom == initial_atom) {
-                break;
+            j = ovl_find_overlapping_atom(checker, vec, cell->types[group[i]],
+                                          symprec);
+            if (j != -1 && !atoms_found[j]) {
+                atoms_found[j] = 1;
+                num_trans++;
             }
         }
     }
 
-    free(copy_atoms_found);
+    free(is_in_group);
+    is_in_group = NULL;
+    free(group);
+    group = NULL;
 
     return num_trans;
 }
@@ -568,17 +781,10 @@ static int search_pure_translations(int atoms_found[], Cell const *cell,
 /* This is a convenient wrapper around ovl_check_total_overlap. */
 /* -1: Error.  0: Not a symmetry.  1: Is a symmetry. */
 static int is_overlap_all_atoms(double const trans[3], int const rot[3][3],
-                                Cell const *cell, double const symprec,
-                                int const is_identity) {
-    OverlapChecker *checker;
+                                Cell const *cell, OverlapChecker *checker,
+                                double const symprec, int const is_identity) {
     int result;
 
-    checker = NULL;
-
-    if ((checker = ovl_overlap_checker_init(cell)) == NULL) {
-        return -1;
-    }
-
     if (cell->aperiodic_axis == -1) {
         result =
             ovl_check_total_overlap(checker, trans, rot, symprec, is_identity);
@@ -587,9 +793,6 @@ static int is_overlap_all_atoms(double const trans[3], int const rot[3][3],
                                                is_identity);
     }
 
-    ovl_overlap_checker_free(checker);
-    checker = NULL;
-
     return result;
 }
 
@@ -636,6 +839,7 @@ static int get_index_with_least_atoms(Cell const *cell) {
 /* This function is heaviest in this code. */
 /* Return NULL if failed */
 static VecDBL *get_layer_translation(int const rot[3][3], Cell const *cell,
+                                     OverlapChecker *checker,
                                      double const symprec,
                                      int const is_identity) {
     int i, j, k, min_atom_index, num_trans;
@@ -669,8 +873,9 @@ static VecDBL *get_layer_translation(int const rot[3][3], Cell const *cell,
      */
     mat_multiply_matrix_vector_id3(origin, rot, cell->position[min_atom_index]);
 
-    num_trans = search_layer_translation_part(
-        is_found, cell, rot, min_atom_index, origin, symprec, is_identity);
+    num_trans = search_layer_translation_part(is_found, cell, checker, rot,
+                                              min_atom_index, origin, symprec,
+                                              is_identity);
     if (num_trans == -1 || num_trans == 0) {
         goto ret;
     }
@@ -700,21 +905,12 @@ ret:
 }
 
 /* Returns -1 on failure. */
-static int search_layer_translation_part(int atoms_found[], Cell const *cell,
-                                         int const rot[3][3],
-                                         int const min_atom_index,
-                                         double const origin[3],
-                                         double const symprec,
-                                         int const is_identity) {
-    int i, j, num_trans, is_overlap;
+static int search_layer_translation_part(
+    int atoms_found[], Cell const *cell, OverlapChecker *checker,
+    int const rot[3][3], int const min_atom_index, double const origin[3],
+    double const symprec, int const is_identity) {
+    int i, j, num_trans, num_pure_trans, is_overlap;
     double trans[3];
-    OverlapChecker *checker;
-
-    checker = NULL;
-
-    if ((checker = ovl_overlap_checker_init(cell)) == NULL) {
-        return -1;
-    }
 
     num_trans = 0;
 
@@ -734,77 +930,22 @@ static int search_layer_translation_part(int atoms_found[], Cell const *cell,
         is_overlap = ovl_check_layer_total_overlap(checker, trans, rot, symprec,
                                                    is_identity);
         if (is_overlap == -1) {
-            goto err;
+            return -1;
         } else if (is_overlap) {
             atoms_found[i] = 1;
             num_trans++;
             if (is_identity) {
-                num_trans += search_layer_pure_translations(
-                    atoms_found, cell, trans, checker->periodic_axes, symprec);
-            }
-        }
-    }
-
-    ovl_overlap_checker_free(checker);
-    checker = NULL;
-    return num_trans;
-
-err:
-    ovl_overlap_checker_free(checker);
-    checker = NULL;
-    return -1;
-}
-
-static int search_layer_pure_translations(int atoms_found[], Cell const *cell,
-                                          double const trans[3],
-                                          int const periodic_axes[2],
-                                          double const symprec) {
-    int i, j, num_trans, i_atom, initial_atom;
-    int *copy_atoms_found;
-    double vec[3];
-
-    num_trans = 0;
-
-    copy_atoms_found = (int *)malloc(sizeof(int) * cell->size);
-    for (i = 0; i < cell->size; i++) {
-        copy_atoms_found[i] = atoms_found[i];
-    }
-
-    for (initial_atom = 0; initial_atom < cell->size; initial_atom++) {
-        if (!copy_atoms_found[initial_atom]) {
-            continue;
-        }
-
-        i_atom = initial_atom;
-
-        for (i = 0; i < cell->size; i++) {
-            for (j = 0; j < 3; j++) {
-                vec[j] = cell->position[i_atom][j] + trans[j];
-            }
-
-            for (j = 0; j < cell->size; j++) {
-                if (cel_layer_is_overlap_with_same_type(
-                        vec, cell->position[j], cell->types[i_atom],
-                        cell->types[j], cell->lattice, periodic_axes,
-                        symprec)) {
-                    if (!atoms_found[j]) {
-                        atoms_found[j] = 1;
-                        num_trans++;
-                    }
-                    i_atom = j;
-
-                    break;
+                num_pure_trans =
+                    search_pure_translations(atoms_found, checker, cell, i,
+                                             min_atom_index, trans, symprec);
+                if (num_pure_trans == -1) {
+                    return -1;
                 }
-            }
-
-            if (i_atom == initial_atom) {
-                break;
+                num_trans += num_pure_trans;
             }
         }
     }
 
-    free(copy_atoms_found);
-
     return num_trans;
 }
 
@@ -815,15 +956,24 @@ static Symmetry *get_space_group_operations(PointSymmetry const *lattice_sym,
     int i, j, num_sym, total_num_sym;
     VecDBL **trans;
     Symmetry *symmetry;
+    OverlapChecker *checker;
 
     debug_print("get_space_group_operations (tolerance = %f):\n", symprec);
 
     trans = NULL;
     symmetry = NULL;
+    checker = NULL;
+
+    /* One OverlapChecker is shared by all the rotations. */
+    if ((checker = ovl_overlap_checker_init(primitive, symprec)) == NULL) {
+        return NULL;
+    }
 
     if ((trans = (VecDBL **)malloc(sizeof(VecDBL *) * lattice_sym->size)) ==
         NULL) {
         warning_memory("trans");
+        ovl_overlap_checker_free(checker);
+        checker = NULL;
         return NULL;
     }
 
@@ -836,7 +986,7 @@ static Symmetry *get_space_group_operations(PointSymmetry const *lattice_sym,
     if (primitive->aperiodic_axis == -1) {
         for (i = 0; i < lattice_sym->size; i++) {
             if ((trans[i] = get_translation(lattice_sym->rot[i], primitive,
-                                            symprec, 0)) != NULL) {
+                                            checker, symprec, 0)) != NULL) {
                 debug_print("  match translation %d/%d; tolerance = %f\n",
                             i + 1, lattice_sym->size, symprec);
 
@@ -846,7 +996,8 @@ static Symmetry *get_space_group_operations(PointSymmetry const *lattice_sym,
     } else {
         for (i = 0; i < lattice_sym->size; i++) {
             if ((trans[i] = get_layer_translation(
-                     lattice_sym->rot[i], primitive, symprec, 0)) != NULL) {
+                     lattice_sym->rot[i], primitive, checker, symprec, 0)) !=
+                NULL) {
                 debug_print("  match translation %d/%d; tolerance = %f\n",
                             i + 1, lattice_sym->size, symprec);
 
@@ -880,6 +1031,8 @@ ret:
     }
     free(trans);
     trans = NULL;
+    ovl_overlap_checker_free(checker);
+    checker = NULL;
 
     return symmetry;
 }
@@ -1115,3 +1268,24 @@ static void set_axes(int axes[3][3], int const a1, int const a2, int const a3) {
         axes[i][2] = relative_axes[a3][i];
     }
 }
+
+static int is_in_range(int const *permutations, int const num_rot,
+                       int const num_sites) {
+    size_t i;
+
+    for (i = 0; i < (size_t)num_rot * num_sites; i++) {
+        if (permutations[i] < 0 || permutations[i] >= num_sites) {
+            return 0;
+        }
+    }
+    return 1;
+}
+
+/* rot_cart = lattice @ rot @ lattice^-1 */
+static void get_rotation_in_cartesian(double rot_cart[3][3],
+                                      int const rot[3][3],
+                                      double const lattice[3][3],
+                                      double const inv_lattice[3][3]) {
+    mat_multiply_matrix_id3(rot_cart, rot, inv_lattice);
+    mat_multiply_matrix_d3(rot_cart, lattice, rot_cart);
+}
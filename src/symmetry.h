@@ -33,12 +33,29 @@ void sym_free_magnetic_symmetry(MagneticSymmetry *symmetry);
 SPG_API_TEST Symmetry *sym_get_operation(Cell const *primitive,
                                          double const symprec,
                                          double const angle_tolerance);
-Symmetry *sym_reduce_operation(Cell const *primitive, Symmetry const *symmetry,
-                               double const symprec,
-                               double const angle_tolerance);
-VecDBL *sym_get_pure_translation(Cell const *cell, double const symprec);
+SPG_API_TEST Symmetry *sym_reduce_operation(Cell const *primitive,
+                                            Symmetry const *symmetry,
+                                            double const symprec,
+                                            double const angle_tolerance);
+SPG_API_TEST VecDBL *sym_get_pure_translation(Cell const *cell,
+                                              double const symprec);
 VecDBL *sym_reduce_pure_translation(Cell const *cell, VecDBL const *pure_trans,
                                     double const symprec,
                                     double const angle_tolerance);
+void sym_get_rotated_positions(double (*rotated_positions)[3],
+                               int const (*rotations)[3][3],
+                               double const (*translations)[3],
+                               int const num_rot, double const (*positions)[3],
+                               int const num_atom);
+int sym_get_permutations(int *permutations, Symmetry const *symmetry,
+                         Cell const *cell, double const symprec);
+int sym_symmetrize_vectors(double (*symmetrized)[3], double const (*vectors)[3],
+                           int const num_vectors, int const (*rotations)[3][3],
+                           int const num_rot, double const lattice[3][3],
+                           int const *permutations);
+int sym_symmetrize_tensors(double (*symmetrized)[3][3],
+                           double const (*tensors)[3][3], int const num_tensors,
+                           int const (*rotations)[3][3], int const num_rot,
+                           double const lattice[3][3], int const *permutations);
 
 #endif
@@ -38,6 +38,148 @@ TEST(Kpoints, test_spg_get_ir_reciprocal_mesh) {
     grid_mapping_table = NULL;
 }
 
+TEST(Kpoints, test_spg_get_ir_grid_points) {
+    double lattice[3][3] = {{4, 0, 0}, {0, 4, 0}, {0, 0, 3}};
+    double position[][3] = {
+        {0, 0, 0},     {0.5, 0.5, 0.5}, {0.3, 0.3, 0},
+        {0.7, 0.7, 0}, {0.2, 0.8, 0.5}, {0.8, 0.2, 0.5},
+    };
+    int types[] = {1, 1, 2, 2, 2, 2};
+    int num_atom = 6;
+    int mesh[] = {8, 8, 10};
+    int is_shift[] = {1, 1, 0};
+    int num_gp = mesh[0] * mesh[1] * mesh[2];
+    int num_ir, i, j, k, sum_weights;
+    int (*grid_address)[3];
+    int *grid_mapping_table;
+    SpglibIrGridPoints *ir_grid_points;
+
+    grid_address = (int (*)[3])malloc(sizeof(int[3]) * num_gp);
+    grid_mapping_table = (int *)malloc(sizeof(int) * num_gp);
+    num_ir = spg_get_ir_reciprocal_mesh(grid_address, grid_mapping_table, mesh,
+                                        is_shift, 1, lattice, position, types,
+                                        num_atom, 1e-5);
+
+    ir_grid_points = spg_get_ir_grid_points(mesh, is_shift, 1, 1, lattice,
+                                            position, types, num_atom, 1e-5);
+    ASSERT_NE(ir_grid_points, nullptr);
+    ASSERT_EQ(ir_grid_points->n_ir_grid_points, num_ir);
+
+    // Irreducible grid points and their weights are those of the mapping
+    // table, and the star of each point maps to the point.
+    j = 0;
+    sum_weights = 0;
+    for (i = 0; i < num_gp; i++) {
+        if (grid_mapping_table[i] != i) {
+            continue;
+        }
+        for (k = 0; k < 3; k++) {
+            ASSERT_EQ(ir_grid_points->ir_grid_address[j][k],
+                      grid_address[i][k]);
+        }
+        for (k = 0; k < ir_grid_points->weights[j]; k++) {
+            ASSERT_EQ(grid_mapping_table[spg_get_grid_point_from_address(
+                          ir_grid_points->star_address[sum_weights + k], mesh)],
+                      i);
+        }
+        sum_weights += ir_grid_points->weights[j];
+        j++;
+    }
+    ASSERT_EQ(sum_weights, num_gp);
+
+    spg_free_ir_grid_points(ir_grid_points);
+    ir_grid_points = NULL;
+    free(grid_address);
+    grid_address = NULL;
+    free(grid_mapping_table);
+    grid_mapping_table = NULL;
+}
+
+TEST(Kpoints, test_spg_get_reciprocal_point_group) {
+    SpglibDataset *dataset;
+    SpglibIrGridPoints *ir_grid_points;
+    double lattice[3][3] = {{4, 0, 0}, {0, 4, 0}, {0, 0, 3}};
+    double position[][3] = {
+        {0, 0, 0},     {0.5, 0.5, 0.5}, {0.3, 0.3, 0},
+        {0.7, 0.7, 0}, {0.2, 0.8, 0.5}, {0.8, 0.2, 0.5},
+    };
+    int types[] = {1, 1, 2, 2, 2, 2};
+    int num_atom = 6;
+    int mesh[] = {6, 6, 5};
+    int is_shift[] = {1, 1, 0};
+    size_t num_gp = mesh[0] * mesh[1] * mesh[2];
+    size_t i, num_ir, num_ir_ref;
+    int num_rot;
+    int (*rot_reciprocal)[3][3];
+    int (*grid_address)[3];
+    int (*grid_address_ref)[3];
+    size_t *ir_mapping_table;
+    size_t *ir_mapping_table_ref;
+    double q[] = {0, 0.5, 0};
+
+    grid_address = (int (*)[3])malloc(sizeof(int[3]) * num_gp);
+    grid_address_ref = (int (*)[3])malloc(sizeof(int[3]) * num_gp);
+    ir_mapping_table = (size_t *)malloc(sizeof(size_t) * num_gp);
+    ir_mapping_table_ref = (size_t *)malloc(sizeof(size_t) * num_gp);
+
+    dataset = spg_get_dataset(lattice, position, types, num_atom, 1e-5);
+    ASSERT_TRUE(dataset != NULL);
+    rot_reciprocal =
+        (int (*)[3][3])malloc(sizeof(int[3][3]) * dataset->n_operations * 2);
+
+    num_rot =
+        spg_get_reciprocal_point_group(rot_reciprocal, dataset->n_operations,
+                                       dataset->rotations, 1, 0, NULL, 1e-5);
+    ASSERT_EQ(num_rot, 16);
+
+    num_ir = spg_get_dense_ir_reciprocal_mesh_from_point_group(
+        grid_address, ir_mapping_table, mesh, is_shift, num_rot,
+        rot_reciprocal);
+    num_ir_ref = spg_get_dense_ir_reciprocal_mesh(
+        grid_address_ref, ir_mapping_table_ref, mesh, is_shift, 1, lattice,
+        position, types, num_atom, 1e-5);
+    ASSERT_EQ(num_ir, num_ir_ref);
+    for (i = 0; i < num_gp; i++) {
+        ASSERT_EQ(ir_mapping_table[i], ir_mapping_table_ref[i]);
+    }
+
+    ir_grid_points = spg_get_ir_grid_points_from_point_group(
+        mesh, is_shift, 0, num_rot, rot_reciprocal);
+    ASSERT_TRUE(ir_grid_points != NULL);
+    ASSERT_EQ(ir_grid_points->n_ir_grid_points, num_ir);
+    spg_free_ir_grid_points(ir_grid_points);
+    ir_grid_points = NULL;
+
+    // Stabilizers of q
+    num_rot = spg_get_reciprocal_point_group(
+        rot_reciprocal, dataset->n_operations, dataset->rotations, 1, 1,
+        (double (*)[3])q, 1e-5);
+    ASSERT_EQ(num_rot, 8);
+    num_ir = spg_get_dense_ir_reciprocal_mesh_from_point_group(
+        grid_address, ir_mapping_table, mesh, is_shift, num_rot,
+        rot_reciprocal);
+    num_ir_ref = spg_get_dense_stabilized_reciprocal_mesh(
+        grid_address_ref, ir_mapping_table_ref, mesh, is_shift, 1,
+        dataset->n_operations, dataset->rotations, 1, (double (*)[3])q);
+    ASSERT_EQ(num_ir, num_ir_ref);
+    for (i = 0; i < num_gp; i++) {
+        ASSERT_EQ(ir_mapping_table[i], ir_mapping_table_ref[i]);
+    }
+
+    spg_free_dataset(dataset);
+    dataset = NULL;
+    free(rot_reciprocal);
+    rot_reciprocal = NULL;
+    free(grid_address);
+    grid_address = NULL;
+    free(grid_address_ref);
+    grid_address_ref = NULL;
+    free(ir_mapping_table);
+    ir_mapping_table = NULL;
+    free(ir_mapping_table_ref);
+    ir_mapping_table_ref = NULL;
+}
+
 TEST(Kpoints, test_spg_get_stabilized_reciprocal_mesh) {
     SpglibDataset *dataset;
     double lattice[3][3] = {{4, 0, 0}, {0, 4, 0}, {0, 0, 3}};
@@ -82,6 +224,142 @@ TEST(Kpoints, test_spg_get_stabilized_reciprocal_mesh) {
     grid_mapping_table = NULL;
 }
 
+TEST(Kpoints, test_spg_get_dense_ir_mapping_table_range) {
+    SpglibDataset *dataset;
+    double lattice[3][3] = {{4, 0, 0}, {0, 4, 0}, {0, 0, 3}};
+    double position[][3] = {
+        {0, 0, 0},     {0.5, 0.5, 0.5}, {0.3, 0.3, 0},
+        {0.7, 0.7, 0}, {0.2, 0.8, 0.5}, {0.8, 0.2, 0.5},
+    };
+    int types[] = {1, 1, 2, 2, 2, 2};
+    int num_atom = 6;
+    int mesh[] = {6, 6, 5};
+    int is_shift[] = {1, 1, 0};
+    size_t num_gp = mesh[0] * mesh[1] * mesh[2];
+    size_t num_slab = mesh[0] * mesh[1];
+    size_t i, j;
+    int k;
+    int (*grid_address)[3];
+    int (*slab_grid_address)[3];
+    size_t *grid_mapping_table;
+    size_t *ir_mapping_table;
+    double q[] = {0, 0.5, 0};
+
+    grid_address = (int (*)[3])malloc(sizeof(int[3]) * num_gp);
+    grid_mapping_table = (size_t *)malloc(sizeof(size_t) * num_gp);
+    slab_grid_address = (int (*)[3])malloc(sizeof(int[3]) * num_slab);
+    ir_mapping_table = (size_t *)malloc(sizeof(size_t) * num_slab);
+
+    dataset = spg_get_dataset(lattice, position, types, num_atom, 1e-5);
+    ASSERT_TRUE(dataset != NULL);
+
+    spg_get_dense_stabilized_reciprocal_mesh(
+        grid_address, grid_mapping_table, mesh, is_shift, 1,
+        dataset->n_operations, dataset->rotations, 1, (double (*)[3])q);
+
+    // The mesh is processed slab by slab.
+    for (i = 0; i < num_gp; i += num_slab) {
+        ASSERT_EQ(spg_get_dense_ir_mapping_table_range(
+                      slab_grid_address, ir_mapping_table, i, num_slab, mesh,
+                      is_shift, 1, dataset->n_operations, dataset->rotations, 1,
+                      (double (*)[3])q),
+                  1);
+        for (j = 0; j < num_slab; j++) {
+            ASSERT_EQ(ir_mapping_table[j], grid_mapping_table[i + j]);
+            for (k = 0; k < 3; k++) {
+                ASSERT_EQ(slab_grid_address[j][k], grid_address[i + j][k]);
+            }
+        }
+    }
+
+    spg_free_dataset(dataset);
+    dataset = NULL;
+    free(grid_address);
+    grid_address = NULL;
+    free(grid_mapping_table);
+    grid_mapping_table = NULL;
+    free(slab_grid_address);
+    slab_grid_address = NULL;
+    free(ir_mapping_table);
+    ir_mapping_table = NULL;
+}
+
+TEST(Kpoints, test_spg_get_dense_grid_point_table_by_rotations) {
+    SpglibDataset *dataset;
+    double lattice[3][3] = {{4, 0, 0}, {0, 4, 0}, {0, 0, 3}};
+    double position[][3] = {
+        {0, 0, 0},     {0.5, 0.5, 0.5}, {0.3, 0.3, 0},
+        {0.7, 0.7, 0}, {0.2, 0.8, 0.5}, {0.8, 0.2, 0.5},
+    };
+    int types[] = {1, 1, 2, 2, 2, 2};
+    int num_atom = 6;
+    int mesh[] = {4, 4, 3};
+    int is_shift[] = {1, 1, 0};
+    size_t num_gp = mesh[0] * mesh[1] * mesh[2];
+    size_t i, j;
+    int k, l;
+    int (*rot_reciprocal)[3][3];
+    int (*grid_address)[3];
+    size_t *grid_mapping_table;
+    size_t *table;
+    size_t *table_address;
+    size_t *rot_grid_points;
+
+    dataset = spg_get_dataset(lattice, position, types, num_atom, 1e-5);
+    ASSERT_TRUE(dataset != NULL);
+
+    rot_reciprocal =
+        (int (*)[3][3])malloc(sizeof(int[3][3]) * dataset->n_operations);
+    grid_address = (int (*)[3])malloc(sizeof(int[3]) * num_gp);
+    grid_mapping_table = (size_t *)malloc(sizeof(size_t) * num_gp);
+    table = (size_t *)malloc(sizeof(size_t) * dataset->n_operations * num_gp);
+    table_address =
+        (size_t *)malloc(sizeof(size_t) * dataset->n_operations * num_gp);
+    rot_grid_points = (size_t *)malloc(sizeof(size_t) * dataset->n_operations);
+
+    for (i = 0; i < (size_t)dataset->n_operations; i++) {
+        for (k = 0; k < 3; k++) {
+            for (l = 0; l < 3; l++) {
+                rot_reciprocal[i][k][l] = dataset->rotations[i][l][k];
+            }
+        }
+    }
+    spg_get_dense_ir_reciprocal_mesh(grid_address, grid_mapping_table, mesh,
+                                     is_shift, 0, lattice, position, types,
+                                     num_atom, 1e-5);
+
+    spg_get_dense_grid_point_table_by_rotations(table, NULL, num_gp,
+                                                dataset->n_operations,
+                                                rot_reciprocal, mesh, is_shift);
+    spg_get_dense_grid_point_table_by_rotations(table_address, grid_address,
+                                                num_gp, dataset->n_operations,
+                                                rot_reciprocal, mesh, is_shift);
+    for (j = 0; j < num_gp; j++) {
+        spg_get_dense_grid_points_by_rotations(rot_grid_points, grid_address[j],
+                                               dataset->n_operations,
+                                               rot_reciprocal, mesh, is_shift);
+        for (i = 0; i < (size_t)dataset->n_operations; i++) {
+            ASSERT_EQ(table[i * num_gp + j], rot_grid_points[i]);
+            ASSERT_EQ(table_address[i * num_gp + j], rot_grid_points[i]);
+        }
+    }
+
+    spg_free_dataset(dataset);
+    dataset = NULL;
+    free(rot_reciprocal);
+    rot_reciprocal = NULL;
+    free(grid_address);
+    grid_address = NULL;
+    free(grid_mapping_table);
+    grid_mapping_table = NULL;
+    free(table);
+    table = NULL;
+    free(table_address);
+    table_address = NULL;
+    free(rot_grid_points);
+    rot_grid_points = NULL;
+}
+
 TEST(Kpoints, test_spg_relocate_BZ_grid_address) {
     double rec_lattice[3][3] = {{-0.17573761, 0.17573761, 0.17573761},
                                 {0.17573761, -0.17573761, 0.17573761},
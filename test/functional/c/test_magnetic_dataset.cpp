@@ -1,5 +1,7 @@
 #include <gtest/gtest.h>
 
+#include <cmath>
+
 extern "C" {
 #include "spglib.h"
 #include "utils.h"
@@ -120,9 +122,95 @@ TEST(MagneticDataset, test_spg_get_magnetic_dataset_type4) {
     EXPECT_EQ(spg_get_error_code(), SpglibError::SPGLIB_SUCCESS);
     show_spg_magnetic_dataset(dataset);
 
+    /* Permutations map each atom onto an atom of the same type and moment */
+    ASSERT_NE(dataset->permutations, nullptr);
+    for (int i = 0; i < dataset->n_operations; i++) {
+        double const sign = dataset->time_reversals[i] ? -1 : 1;
+        for (int j = 0; j < num_atom; j++) {
+            int const k = dataset->permutations[i * num_atom + j];
+            ASSERT_GE(k, 0);
+            ASSERT_LT(k, num_atom);
+            EXPECT_EQ(types[k], types[j]);
+            EXPECT_NEAR(spins[k], sign * spins[j], 1e-5);
+        }
+    }
+
     spg_free_magnetic_dataset(dataset);
 }
 
+TEST(MagneticDataset, test_spgms_get_magnetic_datasets) {
+    /* double Rutile structure (P4_2/mnm) */
+    double lattice[3][3] = {{5, 0, 0}, {0, 5, 0}, {0, 0, 6}};
+    double position[][3] = {
+        /* Ti (2a) */
+        {0, 0, 0},
+        {0.5, 0.5, 0.25},
+        /* O (4f) */
+        {0.3, 0.3, 0},
+        {0.7, 0.7, 0},
+        {0.2, 0.8, 0.25},
+        {0.8, 0.2, 0.25},
+        /* Ti (2a) */
+        {0, 0, 0.5},
+        {0.5, 0.5, 0.75},
+        /* O (4f) */
+        {0.3, 0.3, 0.5},
+        {0.7, 0.7, 0.5},
+        {0.2, 0.8, 0.75},
+        {0.8, 0.2, 0.75},
+    };
+    int types[] = {1, 1, 2, 2, 2, 2, 1, 1, 2, 2, 2, 2};
+    /* Configurations of collinear moments on the Ti sites */
+    double spins[][12] = {
+        {0.3, 0.3, 0, 0, 0, 0, -0.3, -0.3, 0, 0, 0, 0},
+        {0.3, 0.3, 0, 0, 0, 0, 0.3, 0.3, 0, 0, 0, 0},
+        {0.3, -0.3, 0, 0, 0, 0, 0.3, -0.3, 0, 0, 0, 0},
+    };
+    int num_atom = 12;
+    int num_configs = 3;
+    SpglibMagneticDataset *datasets[3];
+    SpglibError error_codes[3];
+    SpglibMagneticDataset *dataset;
+
+    ASSERT_TRUE(spgms_get_magnetic_datasets(
+        datasets, error_codes, lattice, position, types, spins[0],
+        0 /* tensor_rank */, num_atom, num_configs, 0 /* is_axial */, 1e-5,
+        -1.0, -1.0));
+    EXPECT_EQ(spg_get_error_code(), SpglibError::SPGLIB_SUCCESS);
+    for (int i = 0; i < num_configs; i++) {
+        EXPECT_EQ(error_codes[i], SpglibError::SPGLIB_SUCCESS);
+    }
+
+    /* Same as the search of each configuration */
+    for (int i = 0; i < num_configs; i++) {
+        dataset = spgms_get_magnetic_dataset(lattice, position, types, spins[i],
+                                             0, num_atom, 0, 1e-5, -1.0, -1.0);
+        ASSERT_NE(dataset, nullptr);
+        ASSERT_NE(datasets[i], nullptr);
+        EXPECT_EQ(datasets[i]->uni_number, dataset->uni_number);
+        ASSERT_EQ(datasets[i]->n_operations, dataset->n_operations);
+        for (int j = 0; j < dataset->n_operations; j++) {
+            EXPECT_EQ(datasets[i]->time_reversals[j],
+                      dataset->time_reversals[j]);
+        }
+        if (HasFailure()) show_spg_magnetic_dataset(datasets[i]);
+        spg_free_magnetic_dataset(dataset);
+        spg_free_magnetic_dataset(datasets[i]);
+    }
+
+    /* The error of a failed configuration is kept when later ones succeed */
+    spins[0][0] = std::nan("");
+    ASSERT_TRUE(spgms_get_magnetic_datasets(datasets, error_codes, lattice,
+                                            position, types, spins[0], 0,
+                                            num_atom, 2, 0, 1e-5, -1.0, -1.0));
+    EXPECT_EQ(datasets[0], nullptr);
+    EXPECT_NE(error_codes[0], SpglibError::SPGLIB_SUCCESS);
+    EXPECT_EQ(spg_get_error_code(), error_codes[0]);
+    ASSERT_NE(datasets[1], nullptr);
+    EXPECT_EQ(error_codes[1], SpglibError::SPGLIB_SUCCESS);
+    spg_free_magnetic_dataset(datasets[1]);
+}
+
 TEST(MagneticDataset, test_spg_get_magnetic_dataset_high_mag_symprec) {
     // https://github.com/spglib/spglib/issues/348
     double lattice[3][3] = {{4, 0, 0}, {0, 4, 0}, {0, 0, 18}};
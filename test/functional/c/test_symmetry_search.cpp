@@ -1,5 +1,7 @@
 #include <gtest/gtest.h>
 
+#include <cmath>
+
 extern "C" {
 #include "spglib.h"
 #include "utils.h"
@@ -81,3 +83,93 @@ TEST(SymmetrySearch, test_spg_get_multiplicity) {
     size = spg_get_multiplicity(lattice, position, types, num_atom, 1e-5);
     ASSERT_EQ(size, 48);
 }
+
+TEST(SymmetrySearch, test_spg_get_symmetry_permutations) {
+    double lattice[3][3] = {{4, 0, 0}, {0, 4, 0}, {0, 0, 3}};
+    double position[][3] = {{0, 0, 0},     {0.5, 0.5, 0.5}, {0.3, 0.3, 0},
+                            {0.7, 0.7, 0}, {0.2, 0.8, 0.5}, {0.8, 0.2, 0.5}};
+    int types[] = {1, 1, 2, 2, 2, 2};
+    int num_atom = 6;
+    int i, j, k, size;
+    int rotation[48][3][3], permutations[48 * 6];
+    double translation[48][3], rotated[48 * 6][3];
+    double forces[6][3] = {{0, 0, 0}, {0, 0, 0}, {0.1, 0.2, 0},
+                           {0, 0, 0}, {0, 0, 0}, {0, 0, 0}};
+    double symmetrized[6][3];
+
+    size = spg_get_symmetry_with_equivalent_atoms(rotation, translation, NULL,
+                                                  48, lattice, position, types,
+                                                  num_atom, 1e-5);
+    ASSERT_EQ(size, 16);
+
+    spg_get_rotated_positions(rotated, rotation, translation, size, position,
+                              num_atom);
+    ASSERT_EQ(
+        spg_get_symmetry_permutations(permutations, rotation, translation, size,
+                                      lattice, position, types, num_atom, 1e-5),
+        1);
+    for (i = 0; i < size; i++) {
+        for (j = 0; j < num_atom; j++) {
+            k = permutations[i * num_atom + j];
+            ASSERT_EQ(types[k], types[j]);
+            ASSERT_NEAR(
+                rotated[i * num_atom + j][2] - position[k][2],
+                std::round(rotated[i * num_atom + j][2] - position[k][2]),
+                1e-8);
+        }
+    }
+
+    /* The force on an oxygen along (1, 1, 0) is kept, and the one */
+    /* perpendicular to it vanishes. */
+    ASSERT_EQ(spg_symmetrize_vectors(symmetrized, forces, num_atom, rotation,
+                                     size, lattice, permutations),
+              1);
+    ASSERT_NEAR(symmetrized[2][0], 0.15 / 4, 1e-8);
+    ASSERT_NEAR(symmetrized[2][1], 0.15 / 4, 1e-8);
+    ASSERT_NEAR(symmetrized[3][0], -0.15 / 4, 1e-8);
+    ASSERT_NEAR(symmetrized[0][0], 0, 1e-8);
+
+    /* Out of range permutation */
+    permutations[0] = num_atom;
+    ASSERT_EQ(spg_symmetrize_vectors(symmetrized, forces, num_atom, rotation,
+                                     size, lattice, permutations),
+              0);
+}
+
+TEST(SymmetrySearch, test_spg_get_inequivalent_configurations) {
+    /* Necklaces of two colors on four sites under the cyclic group */
+    int permutations[4 * 4] = {0, 1, 2, 3, 1, 2, 3, 0, 2, 3, 0, 1, 3, 0, 1, 2};
+    int expected[6][4] = {{0, 0, 0, 0}, {0, 0, 0, 1}, {0, 0, 1, 1},
+                          {0, 1, 0, 1}, {0, 1, 1, 1}, {1, 1, 1, 1}};
+    int expected_multiplicities[6] = {1, 4, 4, 2, 4, 1};
+    int configurations[6 * 4], multiplicities[6];
+    int cursor[4] = {0, 0, 0, 0};
+    int i, j, num_configs;
+
+    /* Search in two chunks resumed from cursor */
+    num_configs = spg_get_inequivalent_configurations(
+        configurations, multiplicities, cursor, 4, permutations, 4, 4, 2);
+    ASSERT_EQ(num_configs, 4);
+    num_configs += spg_get_inequivalent_configurations(
+        configurations + 4 * 4, multiplicities + 4, cursor, 4, permutations, 4,
+        4, 2);
+    ASSERT_EQ(num_configs, 6);
+    ASSERT_EQ(cursor[0], 2);
+    for (i = 0; i < num_configs; i++) {
+        for (j = 0; j < 4; j++) {
+            EXPECT_EQ(configurations[i * 4 + j], expected[i][j]);
+        }
+        EXPECT_EQ(multiplicities[i], expected_multiplicities[i]);
+    }
+    ASSERT_EQ(
+        spg_get_inequivalent_configurations(configurations, multiplicities,
+                                            cursor, 4, permutations, 4, 4, 2),
+        0);
+
+    /* Without the identity */
+    cursor[0] = 0;
+    ASSERT_EQ(spg_get_inequivalent_configurations(configurations,
+                                                  multiplicities, cursor, 4,
+                                                  permutations + 4, 3, 4, 2),
+              -1);
+}
@@ -74,6 +74,46 @@ def get_crystal_data():
     return _get_crystal_data
 
 
+def _get_supercell(cell: TestCell, size: int | tuple[int, int, int]) -> TestCell:
+    lattice, positions, numbers = cell
+    size = np.broadcast_to(size, 3)
+    shifts = np.array(list(np.ndindex(*size)))
+    positions = (positions[None, :, :] + shifts[:, None, :]) / size
+    return (
+        np.array(lattice) * size[:, None],
+        positions.reshape(-1, 3),
+        np.tile(numbers, len(shifts)),
+    )
+
+
+@pytest.fixture(scope="session")
+def get_supercell():
+    """Get a supercell of a cell, multiplied by size along each axis."""
+    return _get_supercell
+
+
+@pytest.fixture(scope="session")
+def get_rock_salt_supercell():
+    """Get a supercell of the conventional cell of the rock-salt structure."""
+
+    def _get_rock_salt_supercell(size: int | tuple[int, int, int]) -> TestCell:
+        lattice = np.eye(3) * 5.6
+        positions = [
+            [0, 0, 0],
+            [0, 0.5, 0.5],
+            [0.5, 0, 0.5],
+            [0.5, 0.5, 0],
+            [0.5, 0.5, 0.5],
+            [0.5, 0, 0],
+            [0, 0.5, 0],
+            [0, 0, 0.5],
+        ]
+        numbers = [1] * 4 + [2] * 4
+        return _get_supercell((lattice, np.array(positions), numbers), size)
+
+    return _get_rock_salt_supercell
+
+
 # TODO: Scope here is not correct because it depends on symprec value
 @pytest.fixture(scope="session")
 def crystal_data_dataset(crystal_data: CrystalData, request: pytest.FixtureRequest):
@@ -1,9 +1,28 @@
 from __future__ import annotations
 
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pytest
-from spglib import get_symmetry_dataset
+from spglib import (
+    ReciprocalSymmetry,
+    SpglibMagneticDataset,
+    get_grid_point_table_by_rotations,
+    get_grid_points_by_rotations,
+    get_ir_grid_points,
+    get_ir_reciprocal_mesh,
+    get_magnetic_symmetry_dataset,
+    get_magnetic_symmetry_datasets,
+    get_symmetry,
+    get_symmetry_dataset,
+    get_symmetry_datasets,
+    get_symmetry_permutations,
+    iter_magnetic_configurations,
+    relocate_BZ_grid_address,
+    symmetrize_vectors,
+)
 
 if TYPE_CHECKING:
     from conftest import CrystalData
@@ -22,3 +41,339 @@ def test_get_symmetry_dataset(
         _ = get_symmetry_dataset(crystal_data.cell, symprec=1e-5)
 
     benchmark.pedantic(_get_symmetry_dataset_for_cells, rounds=4)
+
+
+@pytest.mark.benchmark(group="threading")
+@pytest.mark.parametrize("num_threads", [1, 2, 4, 8])
+def test_get_symmetry_dataset_threaded(
+    benchmark,
+    get_supercell,
+    get_crystal_data,
+    num_threads: int,
+):
+    """Benchmarking throughput of get_symmetry_dataset from a thread pool.
+
+    The bindings release the GIL, so the throughput should scale with the
+    number of threads up to the number of available cores.
+    """
+    names = [
+        "cubic/unitcell_225",
+        "hexagonal/unitcell_194",
+        "orthorhombic/unitcell_62",
+        "tetragonal/unitcell_139",
+    ]
+    cells = [get_supercell(get_crystal_data(name).cell, 2) for name in names] * 4
+
+    def _get_symmetry_dataset(cell):
+        return get_symmetry_dataset(cell, symprec=1e-5)
+
+    def _get_symmetry_dataset_for_cells():
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            _ = list(executor.map(_get_symmetry_dataset, cells))
+
+    benchmark.pedantic(_get_symmetry_dataset_for_cells, rounds=4)
+
+
+@pytest.mark.benchmark(group="batch")
+@pytest.mark.parametrize("batched", [False, True])
+def test_get_symmetry_datasets(benchmark, get_crystal_data, batched: bool):
+    """Benchmarking get_symmetry_datasets against a loop of get_symmetry_dataset."""
+    names = [
+        "cubic/unitcell_225",
+        "hexagonal/unitcell_194",
+        "orthorhombic/unitcell_62",
+        "tetragonal/unitcell_139",
+        "triclinic/unitcell_2",
+    ]
+    cells = [get_crystal_data(name).cell for name in names] * 200
+
+    def _get_symmetry_datasets_for_cells():
+        if batched:
+            _ = get_symmetry_datasets(cells, symprec=1e-5)
+        else:
+            _ = [get_symmetry_dataset(cell, symprec=1e-5) for cell in cells]
+
+    benchmark.pedantic(_get_symmetry_datasets_for_cells, rounds=4)
+
+
+@pytest.mark.benchmark(group="supercell")
+@pytest.mark.parametrize("size", [4, 8])
+def test_get_symmetry_dataset_supercell(benchmark, get_rock_salt_supercell, size: int):
+    """Benchmarking get_symmetry_dataset on large rock-salt supercells."""
+    cell = get_rock_salt_supercell(size)
+
+    def _get_symmetry_dataset_for_supercell():
+        dataset = get_symmetry_dataset(cell, symprec=1e-5)
+        assert dataset.number == 225
+
+    benchmark.pedantic(_get_symmetry_dataset_for_supercell, rounds=4)
+
+
+@pytest.mark.benchmark(group="supercell")
+@pytest.mark.parametrize("size", [4, 8])
+def test_get_symmetry_supercell(benchmark, get_rock_salt_supercell, size: int):
+    """Benchmarking get_symmetry on large rock-salt supercells.
+
+    Every rotation is tested with many candidate translations here.
+    """
+    cell = get_rock_salt_supercell(size)
+
+    def _get_symmetry_for_supercell():
+        symmetry = get_symmetry(cell, symprec=1e-5)
+        assert len(symmetry["rotations"]) == 48 * 4 * size**3
+
+    benchmark.pedantic(_get_symmetry_for_supercell, rounds=4)
+
+
+@pytest.mark.benchmark(group="magnetic-supercell")
+@pytest.mark.parametrize("size", [2, 3])
+def test_get_magnetic_symmetry_dataset_supercell(
+    benchmark, get_rock_salt_supercell, size: int
+):
+    """Benchmarking get_magnetic_symmetry_dataset on antiferromagnetic supercells.
+
+    The atoms are mapped by all operations of the nonmagnetic supercell.
+    """
+    lattice, positions, numbers = get_rock_salt_supercell(size)
+    # Moments alternating along c on the cations
+    magmoms = np.where(
+        np.array(numbers) == 1,
+        np.where(np.rint(positions[:, 2] * 2 * size) % 2, -1, 1),
+        0,
+    ).astype("double")
+    cell = (lattice, positions, numbers, magmoms)
+
+    def _get_magnetic_symmetry_dataset_for_supercell():
+        dataset = get_magnetic_symmetry_dataset(cell, symprec=1e-5)
+        assert dataset is not None
+
+    benchmark.pedantic(_get_magnetic_symmetry_dataset_for_supercell, rounds=2)
+
+
+@pytest.mark.benchmark(group="magnetic-batch")
+@pytest.mark.parametrize("batch", [False, True])
+def test_get_magnetic_symmetry_datasets(
+    benchmark, get_rock_salt_supercell, batch: bool
+):
+    """Benchmarking get_magnetic_symmetry_datasets against a loop of searches.
+
+    The batch searches the symmetry of the supercell once for all
+    configurations.
+    """
+    lattice, positions, numbers = get_rock_salt_supercell(2)
+    rng = np.random.default_rng(0)
+    magmoms = np.where(
+        np.array(numbers) == 1, rng.choice([-1.0, 1.0], (8, len(numbers))), 0.0
+    )
+
+    def _get_magnetic_symmetry_datasets():
+        if batch:
+            datasets = get_magnetic_symmetry_datasets(
+                (lattice, positions, numbers), magmoms
+            )
+        else:
+            datasets = [
+                get_magnetic_symmetry_dataset((lattice, positions, numbers, config))
+                for config in magmoms
+            ]
+        assert all(isinstance(dataset, SpglibMagneticDataset) for dataset in datasets)
+
+    benchmark.pedantic(_get_magnetic_symmetry_datasets, rounds=2)
+
+
+@pytest.mark.benchmark(group="magnetic-configurations")
+def test_iter_magnetic_configurations(benchmark, get_rock_salt_supercell):
+    """Benchmarking iter_magnetic_configurations on 32 magnetic sites.
+
+    The first chunks of the 2912042 inequivalent configurations out of
+    2**32 are enumerated.
+    """
+    lattice, positions, numbers = get_rock_salt_supercell(2)
+    sites = np.nonzero(np.array(numbers) == 1)[0]
+
+    def _iter_magnetic_configurations():
+        chunks = iter_magnetic_configurations(
+            (lattice, positions, numbers), sites, chunk_size=10000
+        )
+        num_configs = sum(len(k) for _, k in itertools.islice(chunks, 10))
+        assert num_configs == 100000
+
+    benchmark.pedantic(_iter_magnetic_configurations, rounds=2)
+
+
+@pytest.mark.benchmark(group="symmetry-only")
+@pytest.mark.parametrize("dataset", [False, True])
+def test_get_symmetry_without_dataset(
+    benchmark, get_supercell, get_crystal_data, dataset: bool
+):
+    """Benchmarking get_symmetry against get_symmetry_dataset.
+
+    get_symmetry stops after the symmetry operations and equivalent atoms,
+    and does not search Wyckoff positions nor standardize the cell.
+    """
+    names = [
+        "cubic/unitcell_225",
+        "hexagonal/unitcell_194",
+        "orthorhombic/unitcell_62",
+        "tetragonal/unitcell_139",
+        "triclinic/unitcell_2",
+    ]
+    cells = [get_supercell(get_crystal_data(name).cell, 2) for name in names]
+
+    def _get_symmetry_for_cells():
+        for cell in cells:
+            if dataset:
+                _ = get_symmetry_dataset(cell, symprec=1e-5)
+            else:
+                _ = get_symmetry(cell, symprec=1e-5)
+
+    benchmark.pedantic(_get_symmetry_for_cells, rounds=4)
+
+
+@pytest.mark.benchmark(group="kpoints")
+@pytest.mark.parametrize("sparse", [False, True])
+def test_get_ir_grid_points(benchmark, get_rock_salt_supercell, sparse: bool):
+    """Benchmarking get_ir_grid_points against get_ir_reciprocal_mesh.
+
+    get_ir_grid_points does not allocate the mapping table and the grid
+    addresses of the full mesh.
+    """
+    cell = get_rock_salt_supercell(1)
+    mesh = [100, 100, 100]
+
+    def _get_ir_grid_points():
+        if sparse:
+            _, weights = get_ir_grid_points(mesh, cell)
+            assert weights.sum() == np.prod(mesh)
+        else:
+            mapping_table, _ = get_ir_reciprocal_mesh(mesh, cell)
+            _ = np.unique(mapping_table, return_counts=True)
+
+    benchmark.pedantic(_get_ir_grid_points, rounds=4)
+
+
+@pytest.mark.benchmark(group="kpoints-threading")
+@pytest.mark.parametrize("num_threads", [1, 2, 4])
+def test_get_ir_reciprocal_mesh_threaded(
+    benchmark, get_rock_salt_supercell, num_threads: int
+):
+    """Benchmarking get_ir_reciprocal_mesh with the native thread pool."""
+    cell = get_rock_salt_supercell(1)
+    mesh = [100, 100, 100]
+
+    def _get_ir_reciprocal_mesh():
+        _ = get_ir_reciprocal_mesh(mesh, cell, num_threads=num_threads)
+
+    benchmark.pedantic(_get_ir_reciprocal_mesh, rounds=4)
+
+
+@pytest.mark.benchmark(group="kpoints-rotations")
+@pytest.mark.parametrize("batched", [False, True])
+def test_get_grid_point_table_by_rotations(
+    benchmark, get_rock_salt_supercell, batched: bool
+):
+    """Benchmarking the rotated grid point table of a whole mesh.
+
+    The table is built by one call per grid address or by a single call.
+    """
+    cell = get_rock_salt_supercell(1)
+    mesh = [20, 20, 20]
+    rotations = np.unique(get_symmetry(cell)["rotations"], axis=0)
+    rec_rots = np.array([r.T for r in rotations], dtype="intc")
+    _, grid_address = get_ir_reciprocal_mesh(mesh, cell)
+
+    def _get_grid_point_table():
+        if batched:
+            _ = get_grid_point_table_by_rotations(None, rec_rots, mesh)
+        else:
+            _ = np.transpose(
+                [
+                    get_grid_points_by_rotations(ga, rec_rots, mesh, is_dense=True)
+                    for ga in grid_address
+                ]
+            )
+
+    benchmark.pedantic(_get_grid_point_table, rounds=4)
+
+
+@pytest.mark.benchmark(group="kpoints-BZ")
+@pytest.mark.parametrize(
+    "lattice",
+    [
+        [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        [[1, 0, 0], [-0.5, 0.866, 0], [0, 0, 1.6]],
+        [[1, 0, 0], [0.9, 1, 0], [0.3, 0.7, 1.2]],
+    ],
+    ids=["cubic", "hexagonal", "triclinic"],
+)
+def test_relocate_BZ_grid_address(benchmark, lattice):
+    """Benchmarking relocate_BZ_grid_address on a 100x100x100 mesh."""
+    mesh = [100, 100, 100]
+    _, grid_address = get_ir_reciprocal_mesh(mesh, (lattice, [[0, 0, 0]], [1]))
+    reciprocal_lattice = np.linalg.inv(lattice)
+
+    def _relocate_BZ_grid_address():
+        _ = relocate_BZ_grid_address(
+            grid_address, mesh, reciprocal_lattice, is_dense=True
+        )
+
+    benchmark.pedantic(_relocate_BZ_grid_address, rounds=4)
+
+
+@pytest.mark.benchmark(group="kpoints-convergence")
+@pytest.mark.parametrize("reuse_symmetry", [False, True])
+def test_mesh_convergence(benchmark, get_rock_salt_supercell, reuse_symmetry: bool):
+    """Benchmarking the reduction of a series of meshes of the same cell.
+
+    With ReciprocalSymmetry the symmetry is searched once.
+    """
+    cell = get_rock_salt_supercell(2)
+    meshes = [[n, n, n] for n in range(2, 12)]
+
+    def _reduce_meshes():
+        if reuse_symmetry:
+            symmetry = ReciprocalSymmetry.from_cell(cell)
+            for mesh in meshes:
+                _ = symmetry.get_ir_reciprocal_mesh(mesh)
+        else:
+            for mesh in meshes:
+                _ = get_ir_reciprocal_mesh(mesh, cell)
+
+    benchmark.pedantic(_reduce_meshes, rounds=4)
+
+
+@pytest.mark.benchmark(group="symmetrize")
+@pytest.mark.parametrize("native", [False, True])
+def test_symmetrize_forces(benchmark, get_rock_salt_supercell, native: bool):
+    """Benchmarking the permutation table and symmetrized forces of a supercell.
+
+    They are computed natively or by NumPy broadcasting over the atoms.
+    """
+    lattice, positions, numbers = get_rock_salt_supercell(2)
+    cell = (lattice, positions, numbers)
+    symmetry = get_symmetry(cell)
+    rotations, translations = symmetry["rotations"], symmetry["translations"]
+    forces = np.random.default_rng(0).random((len(positions), 3))
+
+    def _symmetrize_forces():
+        if native:
+            permutations = get_symmetry_permutations(cell, rotations, translations)
+            _ = symmetrize_vectors(forces, lattice, rotations, permutations)
+        else:
+            rotated = (
+                np.einsum("ijk,lk->ilj", rotations, positions) + translations[:, None]
+            )
+            permutations = np.empty((len(rotations), len(positions)), dtype=int)
+            for i, pos in enumerate(rotated):
+                diff = pos[:, None, :] - positions[None, :, :]
+                diff -= np.rint(diff)
+                permutations[i] = np.linalg.norm(diff @ lattice, axis=-1).argmin(axis=1)
+            rotations_cart = np.einsum(
+                "ji,njk,kl->nil", lattice, rotations, np.linalg.inv(lattice).T
+            )
+            symmetrized = np.zeros_like(forces)
+            for rot, perm in zip(rotations_cart, permutations):
+                symmetrized[perm] += forces @ rot.T
+            _ = symmetrized / len(rotations)
+
+    benchmark.pedantic(_symmetrize_forces, rounds=4)
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import itertools
+
 import numpy as np
+import pytest
 from spglib import (
+    SpglibError,
     SpglibMagneticDataset,
     get_magnetic_spacegroup_type_from_symmetry,
     get_magnetic_symmetry,
     get_magnetic_symmetry_dataset,
+    get_magnetic_symmetry_datasets,
+    get_magnetic_symmetry_from_database,
+    get_symmetry,
     get_symmetry_dataset,
+    get_symmetry_permutations,
+    iter_magnetic_configurations,
 )
 
 
@@ -773,6 +782,149 @@ def test_better_choice_of_orientation():
     np.testing.assert_allclose(std_lattice, lattice)
 
 
+def test_cubic_magnetic_spacegroup_types():
+    """All cubic magnetic space groups are identified from their operations."""
+    for uni_number in range(1503, 1652):
+        msg = get_magnetic_symmetry_from_database(uni_number)
+        msg_type = get_magnetic_spacegroup_type_from_symmetry(
+            rotations=msg["rotations"],
+            translations=msg["translations"],
+            time_reversals=msg["time_reversals"],
+        )
+        assert msg_type.uni_number == uni_number
+
+
+def test_permutations():
+    """Permutations found in the symmetry search map moments onto moments."""
+    lattice = np.diag([4.0, 4.0, 6.0])
+    positions = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [0.5, 0.5, 0.0],
+            [0.0, 0.5, 0.5],
+            [0.5, 0.0, 0.5],
+        ]
+    )
+    numbers = np.array([1, 1, 2, 2])
+    magmoms = np.array([1.0, -1.0, 0.0, 0.0])
+    cell = (lattice, positions, numbers, magmoms)
+
+    assert get_magnetic_symmetry_dataset(cell).permutations is None
+    dataset = get_magnetic_symmetry_dataset(cell, with_permutations=True)
+    permutations = dataset.permutations
+    assert permutations.shape == (dataset.n_operations, len(positions))
+    assert not permutations.flags.writeable
+    np.testing.assert_array_equal(
+        permutations,
+        get_symmetry_permutations(
+            (lattice, positions, numbers), dataset.rotations, dataset.translations
+        ),
+    )
+    signs = np.where(dataset.time_reversals, -1.0, 1.0)
+    np.testing.assert_allclose(magmoms[permutations], signs[:, None] * magmoms)
+
+
+def test_magnetic_datasets():
+    """Batch search agrees with the search of each configuration."""
+    lattice = np.diag([4.0, 4.0, 6.0])
+    positions = np.array(
+        [
+            [0.0, 0.0, 0.0],
+            [0.5, 0.5, 0.0],
+            [0.0, 0.5, 0.5],
+            [0.5, 0.0, 0.5],
+        ]
+    )
+    numbers = np.array([1, 1, 2, 2])
+    collinear = np.array(
+        [
+            [1.0, 1.0, 0.0, 0.0],
+            [1.0, -1.0, 0.0, 0.0],
+            [1.0, -1.0, 1.0, -1.0],
+            [1.0, 0.5, 0.0, 0.0],
+        ]
+    )
+    noncollinear = np.zeros((3, 4, 3))
+    noncollinear[0, :2, 2] = [1.0, 1.0]
+    noncollinear[1, :2, 2] = [1.0, -1.0]
+    noncollinear[2, :2, 0] = [1.0, -1.0]
+
+    for magmoms in (collinear, noncollinear):
+        datasets = get_magnetic_symmetry_datasets(
+            (lattice, positions, numbers), magmoms, with_permutations=True
+        )
+        assert len(datasets) == len(magmoms)
+        for dataset, config in zip(datasets, magmoms):
+            expected = get_magnetic_symmetry_dataset(
+                (lattice, positions, numbers, config), with_permutations=True
+            )
+            assert dataset.uni_number == expected.uni_number
+            np.testing.assert_array_equal(dataset.rotations, expected.rotations)
+            np.testing.assert_allclose(dataset.translations, expected.translations)
+            np.testing.assert_array_equal(
+                dataset.time_reversals, expected.time_reversals
+            )
+            np.testing.assert_array_equal(dataset.permutations, expected.permutations)
+
+    with pytest.raises(SpglibError, match="n_configs x n_atoms"):
+        get_magnetic_symmetry_datasets((lattice, positions, numbers), collinear[:, :3])
+
+    # The error of a failed configuration is kept when later ones succeed
+    datasets = get_magnetic_symmetry_datasets(
+        (lattice, positions, numbers),
+        [[np.nan, 1.0, 0.0, 0.0], [1.0, -1.0, 0.0, 0.0]],
+    )
+    assert isinstance(datasets[0], SpglibError)
+    assert str(datasets[0]) != "no error"
+    expected = get_magnetic_symmetry_dataset(
+        (lattice, positions, numbers, collinear[1])
+    )
+    assert datasets[1].uni_number == expected.uni_number
+
+
+def test_iter_magnetic_configurations(get_rock_salt_supercell):
+    """Inequivalent configurations agree with brute-force enumeration."""
+    # Rock-salt structure doubled along a
+    cell = get_rock_salt_supercell((2, 1, 1))
+    numbers = cell[2]
+    sites = np.nonzero(numbers == 1)[0]
+    symmetry = get_symmetry(cell)
+    permutations = get_symmetry_permutations(
+        cell, symmetry["rotations"], symmetry["translations"]
+    )
+    site_permutations = np.searchsorted(sites, permutations[:, sites])
+
+    def _get_orbit_labels(magmoms, values):
+        """Return the smallest code of the images of each configuration."""
+        digits = np.argmax(magmoms[:, sites, None] == values, axis=2)
+        weights = len(values) ** np.arange(len(sites))[::-1]
+        return (digits[:, site_permutations] @ weights).min(axis=1)
+
+    for values in ([1.0, -1.0], [1.0, 0.0, -1.0]):
+        configs = np.array(list(itertools.product(values, repeat=len(sites))))
+        magmoms = np.zeros((len(configs), len(numbers)))
+        magmoms[:, sites] = configs
+        expected = np.unique(_get_orbit_labels(magmoms, values), return_counts=True)
+
+        chunks = list(iter_magnetic_configurations(cell, sites, values, chunk_size=7))
+        assert all(len(multiplicities) <= 7 for _, multiplicities in chunks)
+        labels = _get_orbit_labels(np.concatenate([m for m, _ in chunks]), values)
+        multiplicities = np.concatenate([k for _, k in chunks])
+        order = np.argsort(labels)
+        np.testing.assert_array_equal(labels[order], expected[0])
+        np.testing.assert_array_equal(multiplicities[order], expected[1])
+
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        next(iter_magnetic_configurations(cell, sites, chunk_size=0))
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        next(iter_magnetic_configurations(cell, sites, chunk_size=-1))
+    with pytest.raises(ValueError, match="sites must be unique"):
+        next(iter_magnetic_configurations(cell, [0, 0]))
+    for bad_sites in ([0, len(numbers)], [-1]):
+        with pytest.raises(ValueError, match="sites must be indices of atoms"):
+            next(iter_magnetic_configurations(cell, bad_sites))
+
+
 # def _show_structure(
 #     lattice: NDArray, positions: NDArray, types: NDArray, magmoms: NDArray
 # ):
@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 from spglib import get_symmetry
 
 if TYPE_CHECKING:
@@ -1575,3 +1576,39 @@ def test_pure_trans(get_crystal_data):
                 break
 
     np.testing.assert_array_equal(np.sort(nums), np.arange(len(rot_ref)))
+
+
+@pytest.mark.parametrize("size", [(3, 2, 1), (2, 2, 2), (5, 1, 3)])
+def test_pure_trans_supercell(size):
+    """Pure translations of supercells generated by more than one translation."""
+    lattice = np.eye(3) * 5.6
+    positions = np.array(
+        [
+            [0, 0, 0],
+            [0, 0.5, 0.5],
+            [0.5, 0, 0.5],
+            [0.5, 0.5, 0],
+            [0.5, 0.5, 0.5],
+            [0.5, 0, 0],
+            [0, 0.5, 0],
+            [0, 0, 0.5],
+        ]
+    )
+    numbers = [1] * 4 + [2] * 4
+    shifts = np.array(list(np.ndindex(*size)))
+    supercell = (
+        lattice * size,
+        ((positions[None, :, :] + shifts[:, None, :]) / size).reshape(-1, 3),
+        np.tile(numbers, len(shifts)),
+    )
+    sym_ops = get_symmetry(supercell)
+
+    is_pure_trans = (sym_ops["rotations"] == np.eye(3, dtype=int)).all(axis=(1, 2))
+    pure_trans = sym_ops["translations"][is_pure_trans]
+    assert len(pure_trans) == 4 * np.prod(size)
+    # All pure translations are distinct lattice points of the fcc supercell
+    frac = np.rint(pure_trans * size * 2).astype(int) % (np.array(size) * 2)
+    assert len(np.unique(frac, axis=0)) == len(pure_trans)
+    np.testing.assert_allclose(
+        pure_trans * size * 2, np.rint(pure_trans * size * 2), atol=1e-5
+    )
@@ -4,12 +4,23 @@ from pathlib import Path
 import numpy as np
 import pytest
 from spglib import (
+    ReciprocalSymmetry,
+    SpglibError,
+    get_BZ_grid_point_table_by_rotations,
     get_BZ_grid_points_by_rotations,
+    get_double_grid_addresses,
+    get_grid_addresses_from_grid_points,
     get_grid_point_from_address,
+    get_grid_point_table_by_rotations,
     get_grid_points_by_rotations,
+    get_grid_points_from_addresses,
+    get_grid_points_from_double_addresses,
+    get_ir_grid_points,
     get_ir_reciprocal_mesh,
     get_stabilized_reciprocal_mesh,
     get_symmetry_dataset,
+    iter_ir_reciprocal_mesh,
+    iter_stabilized_reciprocal_mesh,
     relocate_BZ_grid_address,
 )
 
@@ -729,6 +740,127 @@ class TestReciprocalMesh:
         np.testing.assert_equal(data[:, 0], mapping_table)
         np.testing.assert_equal(data[:, 1:4], grid_address)
 
+    @pytest.mark.parametrize(
+        ("i", "mesh", "is_shift"),
+        [
+            (0, [20, 20, 20], [0, 0, 0]),
+            (1, [16, 16, 9], [0, 0, 1]),
+            (2, [19, 19, 19], [1, 1, 1]),
+            (1, [13, 21, 17], [0, 1, 0]),
+        ],
+    )
+    @pytest.mark.parametrize("num_threads", [0, 2, 3])
+    @pytest.mark.parametrize("is_dense", [False, True])
+    def test_get_ir_reciprocal_mesh_num_threads(
+        self, mesh_data, i, mesh, is_shift, num_threads, is_dense
+    ):
+        ref_mapping_table, ref_grid_address = get_ir_reciprocal_mesh(
+            mesh, mesh_data["cells"][i], is_shift=is_shift, is_dense=is_dense
+        )
+        mapping_table, grid_address = get_ir_reciprocal_mesh(
+            mesh,
+            mesh_data["cells"][i],
+            is_shift=is_shift,
+            is_dense=is_dense,
+            num_threads=num_threads,
+        )
+        assert mapping_table.dtype == ref_mapping_table.dtype
+        np.testing.assert_equal(mapping_table, ref_mapping_table)
+        np.testing.assert_equal(grid_address, ref_grid_address)
+
+    @pytest.mark.parametrize(
+        ("i", "mesh", "is_shift"),
+        [
+            (0, [4, 4, 4], [0, 0, 0]),
+            (1, [4, 4, 2], [0, 0, 1]),
+            (2, [3, 3, 3], [1, 1, 1]),
+            (0, [3, 4, 4], [0, 0, 0]),
+            (1, [3, 5, 1], [0, 1, 0]),
+        ],
+    )
+    def test_get_ir_grid_points(self, mesh_data, i, mesh, is_shift):
+        mapping_table, grid_address = get_ir_reciprocal_mesh(
+            mesh, mesh_data["cells"][i], is_shift=is_shift
+        )
+        ir_gps, weights = np.unique(mapping_table, return_counts=True)
+
+        ir_grid_address, ir_weights, star_address = get_ir_grid_points(
+            mesh, mesh_data["cells"][i], is_shift=is_shift, with_star=True
+        )
+        np.testing.assert_equal(ir_grid_address, grid_address[ir_gps])
+        np.testing.assert_equal(ir_weights, weights)
+        stars = np.split(star_address, np.cumsum(ir_weights)[:-1])
+        for gp, star in zip(ir_gps, stars):
+            np.testing.assert_equal(star[0], grid_address[gp])
+            star_gps = [get_grid_point_from_address(adrs, mesh) for adrs in star]
+            assert (mapping_table[star_gps] == gp).all()
+
+        ret = get_ir_grid_points(mesh, mesh_data["cells"][i], is_shift=is_shift)
+        assert len(ret) == 2
+        np.testing.assert_equal(ret[0], ir_grid_address)
+        np.testing.assert_equal(ret[1], ir_weights)
+
+        # Views of the C buffers are read-only
+        for array in (ir_grid_address, ir_weights, star_address):
+            assert not array.flags.writeable
+
+    @pytest.mark.parametrize(
+        ("i", "mesh", "is_shift"),
+        [
+            (0, [4, 4, 4], [0, 0, 0]),
+            (2, [3, 3, 3], [1, 1, 1]),
+            (1, [3, 5, 1], [0, 1, 0]),
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 2])
+    def test_iter_ir_reciprocal_mesh(self, mesh_data, i, mesh, is_shift, chunk_size):
+        mapping_table, _ = get_ir_reciprocal_mesh(
+            mesh, mesh_data["cells"][i], is_shift=is_shift, is_dense=True
+        )
+        chunks = list(
+            iter_ir_reciprocal_mesh(
+                mesh, mesh_data["cells"][i], is_shift=is_shift, chunk_size=chunk_size
+            )
+        )
+        assert len(chunks) == -(-mesh[2] // chunk_size)
+        grid_points = np.concatenate([gps for gps, _ in chunks])
+        np.testing.assert_equal(grid_points, np.arange(np.prod(mesh)))
+        ir_grid_points = np.concatenate([ir_gps for _, ir_gps in chunks])
+        np.testing.assert_equal(ir_grid_points, mapping_table)
+
+    @pytest.mark.parametrize("chunk_size", [0, -1])
+    def test_iter_ir_reciprocal_mesh_chunk_size(self, mesh_data, chunk_size):
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            next(
+                iter_ir_reciprocal_mesh(
+                    [4, 4, 4], mesh_data["cells"][0], chunk_size=chunk_size
+                )
+            )
+        with pytest.raises(ValueError, match="chunk_size must be positive"):
+            next(
+                iter_stabilized_reciprocal_mesh(
+                    [4, 4, 4], [np.eye(3, dtype="intc")], chunk_size=chunk_size
+                )
+            )
+
+    def test_iter_stabilized_reciprocal_mesh(self, mesh_data):
+        qpoints = [[0, 0.5, 0.5]]
+        for i in range(len(mesh_data["cells"])):
+            mesh = mesh_data["meshes"][i]
+            rotations = mesh_data["rotations"][i]
+            mapping_table, _ = get_stabilized_reciprocal_mesh(
+                mesh, rotations, qpoints=qpoints, is_dense=True
+            )
+            ir_grid_points = np.concatenate(
+                [
+                    ir_gps
+                    for _, ir_gps in iter_stabilized_reciprocal_mesh(
+                        mesh, rotations, qpoints=qpoints
+                    )
+                ]
+            )
+            np.testing.assert_equal(ir_grid_points, mapping_table)
+
     def test_get_stabilized_reciprocal_mesh(self, mesh_data):
         for i in range(len(mesh_data["cells"])):
             ir_rec_mesh = get_stabilized_reciprocal_mesh(
@@ -750,6 +882,66 @@ class TestReciprocalMesh:
             np.testing.assert_equal(data[:, 0], mapping_table)
             np.testing.assert_equal(data[:, 1:4], grid_address)
 
+    @pytest.mark.parametrize("is_time_reversal", [True, False])
+    def test_reciprocal_symmetry(self, mesh_data, is_time_reversal):
+        for cell, rotations in zip(mesh_data["cells"], mesh_data["rotations"]):
+            symmetry = ReciprocalSymmetry.from_cell(
+                cell, is_time_reversal=is_time_reversal
+            )
+            assert not symmetry.reciprocal_rotations.flags.writeable
+            np.testing.assert_equal(
+                ReciprocalSymmetry.from_dataset(
+                    get_symmetry_dataset(cell), is_time_reversal=is_time_reversal
+                ).reciprocal_rotations,
+                symmetry.reciprocal_rotations,
+            )
+            for mesh in ([4, 4, 4], [5, 6, 3]):
+                for is_shift in ([0, 0, 0], [1, 1, 1]):
+                    for is_dense in (False, True):
+                        mapping, grid_address = symmetry.get_ir_reciprocal_mesh(
+                            mesh, is_shift, is_dense=is_dense
+                        )
+                        ref_mapping, ref_grid_address = get_ir_reciprocal_mesh(
+                            mesh,
+                            cell,
+                            is_shift=is_shift,
+                            is_time_reversal=is_time_reversal,
+                            is_dense=is_dense,
+                        )
+                        assert mapping.dtype == ref_mapping.dtype
+                        np.testing.assert_equal(mapping, ref_mapping)
+                        np.testing.assert_equal(grid_address, ref_grid_address)
+                    for ir_grid_points, ref_ir_grid_points in zip(
+                        symmetry.get_ir_grid_points(mesh, is_shift, with_star=True),
+                        get_ir_grid_points(
+                            mesh,
+                            cell,
+                            is_shift=is_shift,
+                            is_time_reversal=is_time_reversal,
+                            with_star=True,
+                        ),
+                    ):
+                        np.testing.assert_equal(ir_grid_points, ref_ir_grid_points)
+
+            qpoints = [[0, 0.5, 0]]
+            symmetry_q = ReciprocalSymmetry.from_rotations(
+                rotations, is_time_reversal=is_time_reversal, qpoints=qpoints
+            )
+            np.testing.assert_equal(symmetry_q.qpoints, qpoints)
+            mapping, grid_address = symmetry_q.get_ir_reciprocal_mesh([4, 4, 4])
+            ref_mapping, ref_grid_address = get_stabilized_reciprocal_mesh(
+                [4, 4, 4],
+                rotations,
+                is_time_reversal=is_time_reversal,
+                qpoints=qpoints,
+            )
+            np.testing.assert_equal(mapping, ref_mapping)
+            np.testing.assert_equal(grid_address, ref_grid_address)
+
+    def test_reciprocal_symmetry_wrong_qpoints(self):
+        with pytest.raises(SpglibError, match="nx3"):
+            ReciprocalSymmetry.from_rotations([np.eye(3)], qpoints=[[0, 0]])
+
     def test_relocate_BZ_grid_address(self, mesh_data):
         for i, (cell, mesh, grid_address) in enumerate(
             zip(mesh_data["cells"], mesh_data["meshes"], mesh_data["grid_addresses"]),
@@ -789,6 +981,49 @@ class TestReciprocalMesh:
             np.testing.assert_equal(data_adrs, bz_grid_address)
             np.testing.assert_equal(data_map, bz_map)
 
+    @pytest.mark.parametrize(
+        "lattice",
+        [
+            [[1, 0, 0], [-0.5, 0.866, 0], [0, 0, 1.6]],
+            [[1, 0, 0], [0.9, 1, 0], [0.3, 0.7, 1.2]],
+            [[2, 0, 0], [1.7, 0.4, 0], [1.1, 0.2, 0.5]],
+        ],
+    )
+    @pytest.mark.parametrize("is_shift", [[0, 0, 0], [1, 1, 1]])
+    def test_relocate_BZ_grid_address_shortest(self, lattice, is_shift):
+        """Relocated grid addresses are the shortest images of the grid points.
+
+        Images are searched among the translations by up to two meshes along
+        each axis.
+        """
+        mesh = np.array([6, 5, 4])
+        reclat = np.linalg.inv(lattice)
+        _, grid_address = get_ir_reciprocal_mesh(
+            mesh, (lattice, [[0, 0, 0]], [1]), is_shift=is_shift
+        )
+        bz_grid_address, bz_map = relocate_BZ_grid_address(
+            grid_address, mesh, reclat, is_shift=is_shift, is_dense=True
+        )
+
+        def _distances(address):
+            q = (address * 2 + is_shift) / mesh / 2
+            return np.linalg.norm(q @ reclat.T, axis=-1)
+
+        translations = np.array(list(np.ndindex(5, 5, 5))) - 2
+        images = grid_address[:, None, :] + translations * mesh
+        shortest = _distances(images).min(axis=1)
+        np.testing.assert_allclose(
+            _distances(bz_grid_address[: len(grid_address)]), shortest
+        )
+        # The other images on the BZ surface are as short as the first one
+        # within the tolerance on the squared lengths.
+        tolerance = 0.01 * np.max(np.linalg.norm(reclat, axis=0) / mesh) ** 2
+        gps = get_grid_points_from_addresses(bz_grid_address, mesh)
+        assert (_distances(bz_grid_address) ** 2 < shortest[gps] ** 2 + tolerance).all()
+        address_double = bz_grid_address * 2 + is_shift
+        bz_gps = get_grid_points_from_double_addresses(address_double, mesh * 2)
+        np.testing.assert_equal(bz_map[bz_gps], np.arange(len(bz_grid_address)))
+
     def test_get_grid_points_and_bz_grid_points_by_rotations(self, mesh_data):
         # fmt: off
         data = [[21, 63, 29, 55, 31, 53, 23, 61, 61, 23, 63, 21, 55, 29, 53, 31, 21, 63,
@@ -886,6 +1121,64 @@ class TestReciprocalMesh:
             )
             np.testing.assert_equal(data_bz[i], bz_gps)
 
+    @pytest.mark.parametrize("num_threads", [1, 3])
+    def test_get_grid_point_table_by_rotations(self, mesh_data, num_threads):
+        for cell, mesh, grid_address, rotations in zip(
+            mesh_data["cells"],
+            mesh_data["meshes"],
+            mesh_data["grid_addresses"],
+            mesh_data["rotations"],
+        ):
+            rec_rots = [r.T for r in rotations]
+            for is_shift in ([0, 0, 0], [1, 1, 1]):
+                table = get_grid_point_table_by_rotations(
+                    None, rec_rots, mesh, is_shift, num_threads=num_threads
+                )
+                assert table.shape == (len(rotations), len(grid_address))
+                assert table.dtype == np.dtype("uintp")
+                np.testing.assert_equal(
+                    table,
+                    np.transpose(
+                        [
+                            get_grid_points_by_rotations(
+                                ga, rec_rots, mesh, is_shift, is_dense=True
+                            )
+                            for ga in grid_address
+                        ]
+                    ),
+                )
+                np.testing.assert_equal(
+                    get_grid_point_table_by_rotations(
+                        grid_address[::-1], rec_rots, mesh, is_shift
+                    ),
+                    table[:, ::-1],
+                )
+
+            bz_grid_address, bz_map = relocate_BZ_grid_address(
+                grid_address, mesh, np.linalg.inv(cell[0]), is_dense=True
+            )
+            bz_table = get_BZ_grid_point_table_by_rotations(
+                bz_grid_address, rec_rots, mesh, bz_map, num_threads=num_threads
+            )
+            assert bz_table.shape == (len(rotations), len(bz_grid_address))
+            np.testing.assert_equal(
+                bz_table,
+                np.transpose(
+                    [
+                        get_BZ_grid_points_by_rotations(
+                            ga, rec_rots, mesh, bz_map, is_dense=True
+                        )
+                        for ga in bz_grid_address
+                    ]
+                ),
+            )
+
+    def test_get_BZ_grid_point_table_by_rotations_wrong_bz_map(self):
+        with pytest.raises(SpglibError, match="BZ map"):
+            get_BZ_grid_point_table_by_rotations(
+                [[0, 0, 0]], [np.eye(3, dtype="intc")], [4, 4, 4], np.zeros(64)
+            )
+
     def test_get_grid_point_from_address(self):
         mesh = (5, 5, 5)
         # fmt: off
@@ -904,3 +1197,36 @@ class TestReciprocalMesh:
             for i, j, k in list(np.ndindex(mesh))
         ]
         np.testing.assert_equal(adrs_ref, adrs)
+
+    @pytest.mark.parametrize("is_shift", [[0, 0, 0], [1, 0, 1]])
+    def test_grid_address_conversions(self, is_shift):
+        mesh = [4, 5, 6]
+        num_gp = np.prod(mesh)
+        _, grid_address = get_ir_reciprocal_mesh(
+            mesh, (np.eye(3), [[0, 0, 0]], [1]), is_shift=is_shift
+        )
+
+        grid_points = np.arange(num_gp, dtype="uintp")
+        np.testing.assert_equal(
+            get_grid_addresses_from_grid_points(grid_points, mesh), grid_address
+        )
+        np.testing.assert_equal(
+            get_grid_points_from_addresses(grid_address, mesh), grid_points
+        )
+        # Addresses outside of the mesh are folded into it.
+        shifted_address = grid_address + np.array(mesh) * [1, -2, 3]
+        gps = get_grid_points_from_addresses(shifted_address, mesh)
+        assert gps.dtype == np.dtype("uintp")
+        np.testing.assert_equal(
+            gps, [get_grid_point_from_address(ga, mesh) for ga in shifted_address]
+        )
+
+        address_double = get_double_grid_addresses(grid_address, mesh, is_shift)
+        np.testing.assert_equal(address_double % 2, np.tile(is_shift, (num_gp, 1)))
+        np.testing.assert_equal(
+            get_grid_points_from_double_addresses(address_double, mesh), grid_points
+        )
+
+    def test_grid_address_conversions_wrong_shape(self):
+        with pytest.raises(SpglibError, match="nx3"):
+            get_grid_points_from_addresses([1, 2, 3], [4, 4, 4])
@@ -45,6 +45,9 @@ class TestGetOperationsWithSiteTensors(unittest.TestCase):
         self.assertEqual(16, len(sym2["rotations"]))
         self.assertEqual(16, len(sym2["translations"]))
         self.assertEqual(16, len(sym2["time_reversals"]))
+        self.assertEqual(sym2["rotations"].dtype, np.intc)
+        self.assertEqual(sym2["time_reversals"].dtype, np.bool_)
+        self.assertEqual(sym2["primitive_lattice"].shape, (3, 3))
 
     def test_get_symmetry_vectors(self):
         # Space group without magnetic moments
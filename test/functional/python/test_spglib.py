@@ -1,20 +1,39 @@
 from __future__ import annotations
 
+import dataclasses
+import gc
 import pathlib
+import pickle
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 from spglib import (
     MagneticSpaceGroupType,
+    SpglibDataset,
+    _spglib,
+    clear_dataset_cache,
     find_primitive,
+    get_dataset_cache_info,
     get_magnetic_spacegroup_type,
     get_magnetic_symmetry_from_database,
     get_pointgroup,
+    get_rotated_positions,
     get_spacegroup,
     get_spacegroup_type,
+    get_symmetry,
     get_symmetry_dataset,
+    get_symmetry_datasets,
+    get_symmetry_permutations,
+    set_dataset_cache_size,
     standardize_cell,
+    symmetrize_tensors,
+    symmetrize_vectors,
 )
+from spglib.error import SpglibError
 
 if TYPE_CHECKING:
     from conftest import CrystalData
@@ -75,6 +94,64 @@ def test_get_symmetry_dataset(crystal_data: CrystalData):
     assert wyckoffs == crystal_data.ref["wyckoffs"]
 
 
+@pytest.mark.parametrize("size", [(1, 1, 1), (2, 1, 1)])
+def test_get_symmetry(crystal_data: CrystalData, size: tuple[int, int, int]):
+    """get_symmetry gives the same operations and equivalent atoms as dataset."""
+    lattice, positions, numbers = crystal_data.cell
+    shifts = np.array(list(np.ndindex(*size)), dtype="double")
+    supercell = (
+        lattice * np.array(size)[:, None],
+        ((positions[None, :, :] + shifts[:, None, :]) / size).reshape(-1, 3),
+        np.tile(numbers, len(shifts)),
+    )
+    dataset = get_symmetry_dataset(supercell)
+    symmetry = get_symmetry(supercell)
+    np.testing.assert_array_equal(symmetry["rotations"], dataset.rotations)
+    np.testing.assert_allclose(
+        symmetry["translations"], dataset.translations, atol=1e-8
+    )
+    np.testing.assert_array_equal(
+        symmetry["equivalent_atoms"], dataset.equivalent_atoms
+    )
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "orthorhombic/unitcell_52",
+        "hexagonal/unitcell_183",
+        "hexagonal/unitcell_186",
+    ],
+)
+def test_get_symmetry_noisy_cell(get_crystal_data, name: str):
+    """get_symmetry gives the same equivalent atoms as dataset for noisy cells."""
+    lattice, positions, numbers = get_crystal_data(name).cell
+    rng = np.random.default_rng(0)
+    cell = (lattice, positions + rng.normal(0, 3e-3, positions.shape), numbers)
+    dataset = get_symmetry_dataset(cell, symprec=0.1)
+    symmetry = get_symmetry(cell, symprec=0.1)
+    np.testing.assert_array_equal(
+        symmetry["equivalent_atoms"], dataset.equivalent_atoms
+    )
+
+
+def test_symmetry_with_equivalent_atoms_short_array(get_crystal_data):
+    """A too short array of equivalent atoms is reported as such."""
+    lattice, positions, numbers = get_crystal_data("cubic/unitcell_225").cell
+    max_size = len(positions) * 48
+    with pytest.raises(SpglibError, match="Equivalent atoms array is shorter"):
+        _spglib.symmetry_with_equivalent_atoms(
+            np.empty((max_size, 3, 3), dtype="intc"),
+            np.empty((max_size, 3), dtype="double"),
+            np.empty(len(positions) - 1, dtype="intc"),
+            np.array(lattice, dtype="double", order="C"),
+            np.array(positions, dtype="double", order="C"),
+            np.array(numbers, dtype="intc"),
+            1e-5,
+            -1.0,
+        )
+
+
 def test_standardize_cell_and_pointgroup(crystal_data: CrystalData):
     spgnum = get_spgnum(crystal_data.name)
     symprec = 1e-5
@@ -162,6 +239,197 @@ def test_refine_cell(crystal_data_dataset):
     np.testing.assert_allclose(diff, 0, atol=symprec)
 
 
+def test_get_symmetry_dataset_threaded(get_crystal_data):
+    """Concurrent calls give the same result as serial ones.
+
+    The bindings release the GIL, so this exercises the C library from several
+    threads at once, including failing calls whose error state must not leak
+    into the other threads.
+    """
+    names = [
+        "cubic/unitcell_225",
+        "hexagonal/unitcell_194",
+        "monoclinic/unitcell_15",
+        "trigonal/unitcell_166",
+    ]
+    cells = [get_crystal_data(name).cell for name in names]
+    expected = [get_symmetry_dataset(cell, symprec=1e-5) for cell in cells]
+    bad_cell = (np.zeros((3, 3)), [[0.0, 0.0, 0.0]], [1])
+
+    def _get_numbers(i: int) -> int | None:
+        if i % 5 == 4:
+            with pytest.raises(SpglibError):
+                get_symmetry_dataset(bad_cell, symprec=1e-5)
+            return None
+        dataset = get_symmetry_dataset(cells[i % 5], symprec=1e-5)
+        return dataset.number
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        numbers = list(executor.map(_get_numbers, range(40)))
+    for i, number in enumerate(numbers):
+        if i % 5 == 4:
+            assert number is None
+        else:
+            assert number == expected[i % 5].number
+
+
+@pytest.mark.parametrize("num_threads", [1, 3])
+def test_get_symmetry_datasets(get_crystal_data, num_threads: int):
+    names = [
+        "cubic/unitcell_225",
+        "hexagonal/unitcell_194",
+        "monoclinic/unitcell_15",
+        "trigonal/unitcell_166",
+        "triclinic/unitcell_2",
+    ]
+    cells = [get_crystal_data(name).cell for name in names]
+    bad_cells = [
+        (np.zeros((3, 3)), [[0.0, 0.0, 0.0]], [1]),  # Fails in the C library
+        (np.eye(3), [[0.0, 0.0, 0.0]], [1, 2]),  # Fails in the python layer
+    ]
+    expected = [get_symmetry_dataset(cell, symprec=1e-5) for cell in cells]
+
+    datasets = get_symmetry_datasets(
+        cells[:2] + bad_cells + cells[2:], symprec=1e-5, num_threads=num_threads
+    )
+    assert len(datasets) == len(cells) + 2
+    for dataset in datasets[2:4]:
+        assert isinstance(dataset, SpglibError)
+    for dataset, ref in zip(datasets[:2] + datasets[4:], expected):
+        assert dataset.number == ref.number
+        np.testing.assert_array_equal(dataset.rotations, ref.rotations)
+        np.testing.assert_allclose(dataset.translations, ref.translations)
+        np.testing.assert_array_equal(dataset.equivalent_atoms, ref.equivalent_atoms)
+
+    # Ragged concatenated arrays
+    offsets = np.cumsum([0] + [len(cell[2]) for cell in cells])
+    datasets = get_symmetry_datasets(
+        (
+            [cell[0] for cell in cells],
+            np.concatenate([cell[1] for cell in cells]),
+            np.concatenate([cell[2] for cell in cells]),
+        ),
+        symprec=1e-5,
+        num_threads=num_threads,
+        offsets=offsets,
+    )
+    assert [dataset.number for dataset in datasets] == [ref.number for ref in expected]
+    assert get_symmetry_datasets([]) == []
+
+
+def test_dataset_cache(get_crystal_data):
+    cells = [
+        get_crystal_data(name).cell
+        for name in ["cubic/unitcell_225", "hexagonal/unitcell_194"]
+    ]
+    set_dataset_cache_size(2)
+    clear_dataset_cache()
+    try:
+        dataset = get_symmetry_dataset(cells[0], symprec=1e-5)
+        assert get_symmetry_dataset(cells[0], symprec=1e-5) is dataset
+        assert not dataset.rotations.flags.writeable
+        info = get_dataset_cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 1, 2, 1)
+
+        # Tolerances and slightly moved atoms are not mixed up
+        assert get_symmetry_dataset(cells[0], symprec=1e-3) is not dataset
+        lattice, positions, numbers = cells[0]
+        moved = (lattice, np.array(positions) + 1e-9, numbers)
+        assert get_symmetry_dataset(moved, symprec=1e-5) is not dataset
+        assert get_dataset_cache_info().currsize == 2
+
+        # The least recently used one is dropped
+        get_symmetry_dataset(cells[1], symprec=1e-5)
+        assert get_symmetry_dataset(cells[0], symprec=1e-5) is not dataset
+        assert get_dataset_cache_info().misses == 5
+
+        clear_dataset_cache()
+        info = get_dataset_cache_info()
+        assert (info.hits, info.misses, info.maxsize, info.currsize) == (0, 0, 2, 0)
+    finally:
+        set_dataset_cache_size(0)
+
+    assert get_symmetry_dataset(cells[0], symprec=1e-5) is not dataset
+    assert get_dataset_cache_info().currsize == 0
+
+
+def test_dataset_arrays_are_views(get_crystal_data):
+    """Arrays are read-only views keeping the native dataset alive."""
+    dataset = get_symmetry_dataset(
+        get_crystal_data("tetragonal/unitcell_139").cell, symprec=1e-5
+    )
+    rotations = dataset.rotations
+    std_positions = dataset.std_positions
+    for array in (rotations, std_positions, dataset.equivalent_atoms):
+        assert not array.flags.owndata
+        assert not array.flags.writeable
+    with pytest.raises(ValueError):
+        rotations[0, 0, 0] = 2
+    expected = (rotations.copy(), std_positions.copy())
+    del dataset
+    gc.collect()
+    np.testing.assert_array_equal(rotations, expected[0])
+    np.testing.assert_array_equal(std_positions, expected[1])
+
+
+def test_dataset_lazy_fields(get_crystal_data):
+    cell = get_crystal_data("tetragonal/unitcell_139").cell
+    dataset = get_symmetry_dataset(cell, symprec=1e-5)
+    assert "wyckoffs" not in vars(dataset)
+    assert (
+        dataset.wyckoffs == get_crystal_data("tetragonal/unitcell_139").ref["wyckoffs"]
+    )
+    assert "wyckoffs" in vars(dataset)
+
+    # Decoding on first access gives the same values as eager construction
+    eager = SpglibDataset(**dataclasses.asdict(dataset))
+    other = get_symmetry_dataset(cell, symprec=1e-5)
+    for field in dataclasses.fields(SpglibDataset):
+        np.testing.assert_equal(getattr(other, field.name), getattr(eager, field.name))
+    assert len(other) == len(dataclasses.fields(SpglibDataset))
+    with pytest.warns(DeprecationWarning):
+        assert other["std_types"].tolist() == eager.std_types.tolist()
+
+    restored = pickle.loads(pickle.dumps(get_symmetry_dataset(cell, symprec=1e-5)))
+    np.testing.assert_equal(restored.std_positions, eager.std_positions)
+    with pytest.raises(AttributeError):
+        _ = dataset.unknown_field
+
+    # Arrays of cached datasets decoded later are read-only as well
+    set_dataset_cache_size(1)
+    try:
+        cached = get_symmetry_dataset(cell, symprec=1e-5)
+        assert not cached.std_positions.flags.writeable
+    finally:
+        set_dataset_cache_size(0)
+
+
+def test_dataset_lazy_fields_threaded(get_crystal_data):
+    """Lazy fields are decoded once even when threads access them at once."""
+    cell = get_crystal_data("tetragonal/unitcell_139").cell
+    expected = get_symmetry_dataset(cell, symprec=1e-5)
+    num_threads = 8
+    barrier = threading.Barrier(num_threads)
+
+    def _decode(dataset: SpglibDataset) -> list:
+        barrier.wait()
+        return [getattr(dataset, name) for name in SpglibDataset._lazy_fields]
+
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            for _ in range(20):
+                dataset = get_symmetry_dataset(cell, symprec=1e-5)
+                results = list(executor.map(_decode, [dataset] * num_threads))
+                assert "_native" not in vars(dataset)
+                for values in results:
+                    for name, value in zip(SpglibDataset._lazy_fields, values):
+                        np.testing.assert_equal(value, getattr(expected, name))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+
 def test_get_spacegroup():
     cell = (
         [
@@ -204,6 +472,81 @@ def test_find_primitive(crystal_data_dataset):
     assert len(dataset.std_types) == len(primitive[2]) * multiplicity
 
 
+def test_get_symmetry_permutations(crystal_data_dataset):
+    """Operations map atoms onto atoms of the same type one-to-one."""
+    lattice, positions, numbers = crystal_data_dataset["crystal_data"].cell
+    dataset = crystal_data_dataset["dataset"]
+    rotations, translations = dataset.rotations, dataset.translations
+    rotated_positions = get_rotated_positions(rotations, translations, positions)
+    np.testing.assert_allclose(
+        rotated_positions,
+        np.einsum("ijk,lk->ilj", rotations, positions) + translations[:, None, :],
+        atol=1e-12,
+    )
+    wrapped = get_rotated_positions(rotations, translations, positions, wrap=True)
+    assert ((wrapped >= 0) & (wrapped < 1)).all()
+
+    permutations = get_symmetry_permutations(
+        crystal_data_dataset["crystal_data"].cell, rotations, translations
+    )
+    assert permutations.shape == (len(rotations), len(positions))
+    np.testing.assert_array_equal(
+        np.sort(permutations, axis=1),
+        np.tile(np.arange(len(positions)), (len(rotations), 1)),
+    )
+    np.testing.assert_array_equal(
+        np.array(numbers)[permutations], [numbers] * len(rotations)
+    )
+    diff = rotated_positions - np.array(positions)[permutations]
+    diff -= np.rint(diff)
+    assert (np.linalg.norm(diff @ lattice, axis=-1) < 1e-5).all()
+
+    assert dataset.permutations is None
+    with_permutations = get_symmetry_dataset(
+        crystal_data_dataset["crystal_data"].cell, with_permutations=True
+    )
+    np.testing.assert_array_equal(with_permutations.permutations, permutations)
+
+
+def test_symmetrize_vectors_and_tensors(get_crystal_data):
+    cell = get_crystal_data("hexagonal/unitcell_194").cell
+    lattice = np.array(cell[0])
+    dataset = get_symmetry_dataset(cell)
+    rotations = dataset.rotations
+    permutations = get_symmetry_permutations(cell, rotations, dataset.translations)
+    rotations_cart = np.einsum(
+        "ji,njk,kl->nil", lattice, rotations, np.linalg.inv(lattice).T
+    )
+    rng = np.random.default_rng(0)
+
+    vectors = symmetrize_vectors(
+        rng.random((len(cell[1]), 3)), lattice, rotations, permutations
+    )
+    for rot, perm in zip(rotations_cart, permutations):
+        np.testing.assert_allclose(vectors[perm], vectors @ rot.T, atol=1e-10)
+    np.testing.assert_allclose(
+        symmetrize_vectors(vectors, lattice, rotations, permutations), vectors
+    )
+
+    tensors = symmetrize_tensors(
+        rng.random((len(cell[1]), 3, 3)), lattice, rotations, permutations
+    )
+    for rot, perm in zip(rotations_cart, permutations):
+        np.testing.assert_allclose(tensors[perm], rot @ tensors @ rot.T, atol=1e-10)
+
+    # Without permutations, each tensor is invariant under the point group
+    tensor = symmetrize_tensors(rng.random((1, 3, 3)), lattice, rotations)[0]
+    np.testing.assert_allclose(tensor[0, 0], tensor[1, 1])
+    np.testing.assert_allclose(tensor[:2, 2], 0, atol=1e-12)
+
+    with pytest.raises(SpglibError, match="Permutations"):
+        symmetrize_vectors(vectors, lattice, rotations, permutations[:, :1])
+    with pytest.raises(SpglibError, match="Permutations out of range"):
+        symmetrize_vectors(vectors, lattice, rotations, permutations + 1)
+    with pytest.raises(SpglibError, match="symmetry operation search failed"):
+        get_symmetry_permutations(cell, rotations, dataset.translations + 0.1)
+
+
 def test_magnetic_spacegroup_type():
     # P 3 -2"
     actual1 = get_magnetic_spacegroup_type(1279)
@@ -2,6 +2,8 @@
 
 extern "C" {
 #include "cell.h"
+#include "mathfunc.h"
+#include "overlap.h"
 #include "symmetry.h"
 #include "utils.h"
 }
@@ -41,3 +43,57 @@ TEST(Symmetry, test_get_lattice_symmetry_layer) {
     cel_free_cell(cell);
     cell = nullptr;
 }
+
+TEST(Symmetry, test_overlap_checker_shared_by_operations) {
+    // Rock-salt type 2x2x2 supercell of a cubic cell with 2 atoms
+    int const size = 16;
+    double lattice[3][3] = {
+        {8, 0, 0},
+        {0, 8, 0},
+        {0, 0, 8},
+    };
+    double positions[16][3];
+    int types[16];
+    double const symprec = 1e-5;
+    double const angle_tolerance = -1;
+
+    for (int i = 0; i < 8; i++) {
+        for (int j = 0; j < 3; j++) {
+            positions[i][j] = 0.5 * ((i >> j) & 1);
+            positions[i + 8][j] = positions[i][j] + 0.25;
+        }
+        types[i] = 1;
+        types[i + 8] = 2;
+    }
+
+    Cell *cell = cel_alloc_cell(size, NOSPIN);
+    ASSERT_NE(cell, nullptr);
+    cel_set_cell(cell, lattice, positions, types);
+
+    // One OverlapChecker for all the rotations
+    int num_checkers = ovl_get_num_allocated_checkers();
+    Symmetry *symmetry = sym_get_operation(cell, symprec, angle_tolerance);
+    ASSERT_NE(symmetry, nullptr);
+    EXPECT_EQ(symmetry->size, 48 * 8);
+    EXPECT_EQ(ovl_get_num_allocated_checkers() - num_checkers, 1);
+
+    // One OverlapChecker for all the operations to be reduced
+    num_checkers = ovl_get_num_allocated_checkers();
+    Symmetry *sym_reduced =
+        sym_reduce_operation(cell, symmetry, symprec, angle_tolerance);
+    ASSERT_NE(sym_reduced, nullptr);
+    EXPECT_EQ(sym_reduced->size, symmetry->size);
+    EXPECT_EQ(ovl_get_num_allocated_checkers() - num_checkers, 1);
+
+    // One OverlapChecker for all the pure translations
+    num_checkers = ovl_get_num_allocated_checkers();
+    VecDBL *pure_trans = sym_get_pure_translation(cell, symprec);
+    ASSERT_NE(pure_trans, nullptr);
+    EXPECT_EQ(pure_trans->size, 8);
+    EXPECT_EQ(ovl_get_num_allocated_checkers() - num_checkers, 1);
+
+    mat_free_VecDBL(pure_trans);
+    sym_free_symmetry(sym_reduced);
+    sym_free_symmetry(symmetry);
+    cel_free_cell(cell);
+}